@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark image extraction on a synthetic image-heavy textbook.
+
+Builds a textbook out of chapters (50 pages each by default) in which every
+page carries the same header logo and every other page a unique captioned
+JPEG figure. Merging the chapters gives each chapter its own xref for the
+logo, so the logo is repeated both by xref and by content. It then runs
+AssetExtractor.extract_images:
+
+- as before deduplication: extract and PNG-convert every image placement,
+  with a page.get_images and a fresh get_text("dict") per image for the
+  bbox and a clipped get_text("text") for the caption;
+- with xref/content deduplication and the per-page layout cache, serially;
+- the same with PNG conversion on --workers processes.
+
+Captions, bboxes and image bytes of all runs are checked to be identical.
+Worker processes only pay off with several cores.
+
+Usage:
+    python scripts/benchmark_asset_extraction.py [--pages 500] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.asset_extractor import AssetExtractor, ExtractedAsset  # noqa: E402
+from algl_pdf_helper.pdf_session import PdfSession  # noqa: E402
+
+CHAPTER_PAGES = 50
+
+
+def jpeg(width: int, height: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    img = Image.new("RGB", (width, height), (255, 255, 255))
+    for _ in range(40):
+        x, y = rng.randrange(width), rng.randrange(height)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        img.paste(color, (x, y, min(width, x + 60), min(height, y + 40)))
+    out = io.BytesIO()
+    img.save(out, format="JPEG", quality=85)
+    return out.getvalue()
+
+
+def build_book(path: Path, pages: int) -> None:
+    logo = jpeg(300, 120, seed=0)
+    book = fitz.open()
+    for start in range(0, pages, CHAPTER_PAGES):
+        chapter = fitz.open()
+        for i in range(start, min(pages, start + CHAPTER_PAGES)):
+            page = chapter.new_page()
+            page.insert_image(fitz.Rect(72, 20, 222, 80), stream=logo)
+            page.insert_text((72, 100), f"Page {i + 1}: joins combine rows of two tables.", fontsize=10)
+            if i % 2 == 0:
+                page.insert_image(fitz.Rect(72, 120, 472, 387), stream=jpeg(600, 400, seed=i + 1))
+                page.insert_text((72, 400), f"Figure {i // 2 + 1}: Rows matched by the join key",
+                                 fontsize=9)
+        book.insert_pdf(chapter)
+        chapter.close()
+    book.save(str(path))
+    book.close()
+
+
+def legacy_extract_images(extractor: AssetExtractor, pdf_path: Path, doc_id: str) -> list[ExtractedAsset]:
+    """_extract_images_pymupdf before deduplication and the layout cache."""
+    extractor._reset_counters()
+    assets = []
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in range(doc.page_count):
+            page = doc.load_page(page_num)
+            for img in page.get_images(full=True):
+                xref = img[0]
+                base_image = doc.extract_image(xref)
+                image_bytes, image_ext = base_image["image"], base_image["ext"]
+                bbox = None
+                for other in page.get_images(full=True):
+                    if other[0] == xref:
+                        bbox = extractor._find_image_bbox(page, xref)
+                if bbox and (bbox[2] - bbox[0] < 50 or bbox[3] - bbox[1] < 50):
+                    continue
+                if image_ext != "png":
+                    image_bytes = extractor._convert_to_png(image_bytes)
+                assets.append(ExtractedAsset(
+                    id=extractor._generate_image_id(page_num + 1),
+                    type="image",
+                    page=page_num + 1,
+                    bbox=bbox or (0, 0, 0, 0),
+                    doc_id=doc_id,
+                    format="png",
+                    caption=extractor._find_caption(page, bbox) if bbox else "",
+                    content=image_bytes,
+                ))
+    finally:
+        doc.close()
+    return assets
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def summary(assets: list[ExtractedAsset]) -> list[tuple]:
+    return [(a.id, a.page, a.bbox, a.caption, a.content) for a in assets]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="algl_bench_") as tmp:
+        pdf_path = Path(tmp) / "book.pdf"
+        build_book(pdf_path, args.pages)
+        serial = AssetExtractor()
+        parallel = AssetExtractor(workers=args.workers)
+
+        before, before_s = timed(lambda: legacy_extract_images(serial, pdf_path, "bench"))
+        with PdfSession(pdf_path) as session:
+            after, after_s = timed(lambda: serial.extract_images(pdf_path, "bench", session=session))
+            decodes = session.decode_counts["dict"]
+        fanned, fanned_s = timed(lambda: parallel.extract_images(pdf_path, "bench"))
+        stored = serial.save_assets(after, Path(tmp) / "out")
+
+    print(f"Synthetic book: {args.pages} pages, {len(after)} image placements, "
+          f"{len(stored)} stored files\n")
+    print(f"{'image extraction':<40}{'seconds':>10}")
+    print(f"{'per placement (before)':<40}{before_s:>10.2f}")
+    print(f"{'deduplicated, layout cache, serial':<40}{after_s:>10.2f}")
+    print(f"{f'deduplicated, {args.workers} workers':<40}{fanned_s:>10.2f}")
+    print(f"\nlayout decodes with a session: {decodes} for {args.pages} pages")
+    print(f"identical: {summary(before) == summary(after) == summary(fanned)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark opening a JSON index vs the memory-mapped binary index.
+
+Writes a synthetic index (50,000 chunks by default) as chunks.json and as
+index-bin/, then opens each in a fresh interpreter and reports the open
+time and the resident memory it added, split into private heap and
+file-backed (page cache, reclaimable) pages. The binary reader also samples
+100 random chunks so the figure includes real reads, not just the mmap.
+
+Usage:
+    python scripts/benchmark_binary_index.py [--chunks 50000] [--dim 24]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+from algl_pdf_helper.binary_index import BinaryChunkIndex, write_binary_index  # noqa: E402
+from algl_pdf_helper.embedding import build_hash_embeddings  # noqa: E402
+from algl_pdf_helper.models import PdfIndexChunk  # noqa: E402
+from algl_pdf_helper.optimized_indexer import fast_json_dump  # noqa: E402
+
+
+def rss_kb(field: str = "RssAnon") -> int:
+    """Resident memory from /proc/self/status.
+
+    RssAnon is private heap; file-backed mmap pages show up in RssFile
+    instead and are shared with the page cache and reclaimable.
+    """
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1])
+    return 0
+
+
+def make_chunks(count: int, dim: int) -> list[PdfIndexChunk]:
+    rng = random.Random(0)
+    words = "select from where join group having order table index view null key".split()
+    texts = [" ".join(rng.choices(words, k=180)) for _ in range(count)]
+    embeddings = build_hash_embeddings(texts, dim).tolist()
+    return [
+        PdfIndexChunk(
+            chunkId=f"doc-{i // 5000}:p{i // 10 + 1}:c{i % 10 + 1}",
+            docId=f"doc-{i // 5000}",
+            page=i // 10 + 1,
+            text=text,
+            embedding=emb,
+        )
+        for i, (text, emb) in enumerate(zip(texts, embeddings))
+    ]
+
+
+def measure(kind: str, path: Path) -> dict[str, float]:
+    """Run inside a fresh interpreter: open the index and report cost."""
+    before_anon, before_file = rss_kb("RssAnon"), rss_kb("RssFile")
+    start = time.perf_counter()
+    if kind == "json":
+        chunks = json.loads((path / "chunks.json").read_text(encoding="utf-8"))
+        count = len(chunks)
+    else:
+        index = BinaryChunkIndex.open(path)
+        count = len(index)
+        rng = random.Random(1)
+        for i in rng.sample(range(count), min(100, count)):
+            index.text(i)
+            index.embeddings[i].sum()
+    elapsed = time.perf_counter() - start
+    return {
+        "count": count,
+        "seconds": elapsed,
+        "anon_mb": (rss_kb("RssAnon") - before_anon) / 1024,
+        "file_mb": (rss_kb("RssFile") - before_file) / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=24)
+    parser.add_argument("--measure", nargs=2, metavar=("KIND", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure[0], Path(args.measure[1]))))
+        return
+
+    with tempfile.TemporaryDirectory(prefix="algl_bench_") as tmp:
+        out = Path(tmp)
+        chunks = make_chunks(args.chunks, args.dim)
+        fast_json_dump([c.model_dump() for c in chunks], out / "chunks.json")
+        write_binary_index(chunks, out)
+        del chunks
+
+        json_mb = (out / "chunks.json").stat().st_size / 1024 ** 2
+        bin_mb = sum(p.stat().st_size for p in (out / "index-bin").iterdir()) / 1024 ** 2
+        print(f"{args.chunks:,} chunks, dim={args.dim}")
+        print(f"on disk: chunks.json {json_mb:.1f} MB, index-bin/ {bin_mb:.1f} MB\n")
+        print(f"{'':18}{'open (s)':>10}{'heap RSS (MB)':>15}{'mapped RSS (MB)':>17}")
+        for kind, label in (("json", "chunks.json"), ("binary", "index-bin (mmap)")):
+            result = json.loads(
+                subprocess.run(
+                    [sys.executable, __file__, "--measure", kind, str(out)],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+            )
+            print(
+                f"{label:18}{result['seconds']:>10.3f}"
+                f"{result['anon_mb']:>15.1f}{result['file_mb']:>17.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
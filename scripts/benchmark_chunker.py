@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark the chunker on very long pages.
+
+Builds a synthetic document of dense pages (20000 words each by default,
+like an OCR'd page of small print or a page-less text dump) and chunks it
+with each --chunk-words size:
+
+- as before PageWords: chunk_page_words_with_provenance re-joining the
+  page prefix for every chunk offset and snapping chunk ends with
+  find_sentence_boundary's character scan;
+- chunk_page_words_with_provenance page by page;
+- chunk_document over the whole document.
+
+Chunk ids, texts and offsets of all runs are checked to be identical.
+
+Usage:
+    python scripts/benchmark_chunker.py [--pages 10] [--page-words 20000] [--chunk-words 150 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.chunker import (  # noqa: E402
+    MIN_CHUNK_WORDS,
+    ChunkResult,
+    chunk_document,
+    chunk_page_words_with_provenance,
+    find_sentence_boundary,
+)
+
+VOCAB = (
+    "the query planner scans an index on the join key and filters rows with "
+    "a predicate before grouping results by department"
+).split()
+
+
+def build_pages(pages: int, page_words: int, seed: int = 0) -> list[tuple[int, str]]:
+    rng = random.Random(seed)
+    out = []
+    for page in range(1, pages + 1):
+        words = []
+        while len(words) < page_words:
+            sentence = [rng.choice(VOCAB) for _ in range(rng.randint(6, 30))]
+            sentence[-1] += rng.choice(".!?")
+            words.extend(sentence)
+        lines = [" ".join(words[i:i + 12]) for i in range(0, page_words, 12)]
+        out.append((page, "\n".join(lines)))
+    return out
+
+
+def legacy_chunk_page(doc_id: str, page: int, text: str, chunk_words: int,
+                      overlap_words: int) -> list[ChunkResult]:
+    """chunk_page_words_with_provenance before PageWords."""
+    words = [w for w in text.split() if w]
+    chunk_words = max(chunk_words, MIN_CHUNK_WORDS)
+    step = max(1, chunk_words - overlap_words)
+    out: list[ChunkResult] = []
+    start = 0
+    while start < len(words):
+        slice_words = words[start:start + chunk_words]
+        chunk_text = " ".join(slice_words)
+        actual_step = step
+        if len(slice_words) == chunk_words:
+            boundary_pos = find_sentence_boundary(chunk_text, len(chunk_text) - 20)
+            if boundary_pos < len(chunk_text) - 10:
+                actual_step = max(1, len(chunk_text[:boundary_pos].strip().split()) - overlap_words)
+        char_start = len(" ".join(words[:start])) + (1 if start > 0 else 0)
+        out.append(ChunkResult(f"{doc_id}:p{page}:c{len(out) + 1}", chunk_text, [],
+                               char_start, char_start + len(chunk_text), page))
+        if start + chunk_words >= len(words):
+            break
+        start += actual_step
+    return out
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--page-words", type=int, default=20000)
+    parser.add_argument("--chunk-words", type=int, nargs="+", default=[150, 1000])
+    parser.add_argument("--overlap-words", type=int, default=30)
+    args = parser.parse_args()
+
+    pages = build_pages(args.pages, args.page_words)
+    print(f"Synthetic document: {args.pages} pages of {args.page_words} words, "
+          f"overlap {args.overlap_words}\n")
+    print(f"{'chunk_words':>12}{'chunks':>8}{'before s':>10}{'per page s':>12}"
+          f"{'document s':>12}{'speedup':>9}  identical")
+    for chunk_words in args.chunk_words:
+        before, before_s = timed(lambda: [
+            r for page, text in pages
+            for r in legacy_chunk_page("bench", page, text, chunk_words, args.overlap_words)
+        ])
+        per_page, per_page_s = timed(lambda: [
+            r for page, text in pages
+            for r in chunk_page_words_with_provenance(
+                doc_id="bench", page=page, text=text,
+                chunk_words=chunk_words, overlap_words=args.overlap_words,
+            )
+        ])
+        whole, whole_s = timed(lambda: chunk_document(
+            doc_id="bench", pages=pages, chunk_words=chunk_words,
+            overlap_words=args.overlap_words,
+        ))
+        print(f"{chunk_words:>12}{len(whole):>8}{before_s:>10.2f}{per_page_s:>12.3f}"
+              f"{whole_s:>12.3f}{before_s / whole_s:>8.0f}x  {before == per_page == whole}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Benchmark concept-to-block mapping with and without the block text index.
+
+Generates a synthetic textbook (600 pages x 30 blocks by default) of
+headings, prose and SQL code drawn from the ontology's own vocabulary, then
+maps it against the full ConceptOntology twice: once with the previous
+per-concept substring scan and once with InstructionalPipeline._map_to_concepts
+(BlockTextIndex). The same is done for EvidenceTracker.create_evidence_map.
+Both results are checked to be identical, scores included.
+
+Usage:
+    python scripts/benchmark_concept_mapping.py [--pages 600] [--blocks-per-page 30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.instructional_pipeline import (  # noqa: E402
+    InstructionalPipeline,
+    PipelineConfig,
+)
+from algl_pdf_helper.section_extractor import BlockType, ContentBlock, EvidenceTracker  # noqa: E402
+from algl_pdf_helper.sql_ontology import ConceptOntology  # noqa: E402
+
+BLOCK_WEIGHTS = {
+    BlockType.HEADING: 2.0,
+    BlockType.SUBHEADING: 1.5,
+    BlockType.SQL_CODE: 1.3,
+    BlockType.EXPLANATORY_PROSE: 1.0,
+    BlockType.FIGURE: 0.8,
+    BlockType.SIDEBAR: 0.6,
+    BlockType.ADMIN_TEXT: 0.0,
+    BlockType.UNKNOWN: 0.3,
+}
+
+
+def make_blocks(pages: int, per_page: int, seed: int = 0) -> list[ContentBlock]:
+    rng = random.Random(seed)
+    ontology = ConceptOntology()
+    vocab: list[str] = []
+    for concept_id in ontology.list_all_concepts():
+        concept = ontology.get_concept(concept_id) or {}
+        vocab.extend(concept.get("title", "").split())
+        vocab.extend(concept.get("description", "").split())
+    filler = "the data rows table value result each can be used when we".split()
+    kinds = [
+        (BlockType.HEADING, 4),
+        (BlockType.SUBHEADING, 6),
+        (BlockType.SQL_CODE, 12),
+        (BlockType.FIGURE, 3),
+        (BlockType.SIDEBAR, 3),
+        (BlockType.ADMIN_TEXT, 2),
+    ]
+    blocks = []
+    for page in range(1, pages + 1):
+        for b in range(per_page):
+            kind, words = BlockType.EXPLANATORY_PROSE, 80
+            roll = rng.random()
+            for candidate, length in kinds:
+                if roll < 0.06:
+                    kind, words = candidate, length
+                    break
+                roll -= 0.06
+            text = " ".join(rng.choice(vocab if rng.random() < 0.3 else filler) for _ in range(words))
+            blocks.append(
+                ContentBlock(
+                    block_id=f"book:p{page}:b{b}",
+                    block_type=kind,
+                    page_number=page,
+                    char_start=0,
+                    char_end=len(text),
+                    text_content=text,
+                )
+            )
+    return blocks
+
+
+def legacy_map_to_concepts(pipeline: InstructionalPipeline, blocks: list[ContentBlock]) -> dict:
+    """The previous _map_to_concepts loop: every concept x block x keyword."""
+    ontology = ConceptOntology()
+    concept_blocks = {}
+    for concept_id in ontology.list_all_concepts():
+        concept = ontology.get_concept(concept_id)
+        if not concept:
+            continue
+        keywords = pipeline._extract_concept_keywords(concept)
+        scored_blocks = []
+        for block in blocks:
+            if block.block_type == BlockType.ADMIN_TEXT:
+                continue
+            block_text = block.text_content.lower()
+            keyword_matches = sum(1 for kw in keywords if kw in block_text)
+            base_score = keyword_matches / max(len(keywords), 1)
+            if block.block_type in (BlockType.HEADING, BlockType.SUBHEADING):
+                if any(kw in block_text for kw in keywords):
+                    base_score *= 2.0
+            if block.block_type == BlockType.SQL_CODE:
+                if concept_id.lower() in block_text:
+                    base_score *= 1.5
+            final_score = base_score * BLOCK_WEIGHTS.get(block.block_type, 0.5)
+            if final_score > 0.3:
+                scored_blocks.append((block, final_score))
+        scored_blocks.sort(key=lambda x: x[1], reverse=True)
+        concept_blocks[concept_id] = [b for b, s in scored_blocks[:15]]
+    return {k: v for k, v in concept_blocks.items() if v}
+
+
+def legacy_evidence_map(
+    tracker: EvidenceTracker, blocks: list[ContentBlock], concept_ids: list[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """The previous create_evidence_map: rescan and relower per concept and block."""
+    evidence_map = {}
+    for concept_id in concept_ids:
+        keywords = [kw.lower().strip() for kw in tracker._derive_keywords(concept_id)]
+        matching = {
+            i for i, block in enumerate(blocks)
+            if any(kw in block.text_content.lower() for kw in keywords)
+        }
+        expanded = sorted({
+            j for i in matching for j in range(i - 2, i + 3) if 0 <= j < len(blocks)
+        })
+        evidence_map[concept_id] = [
+            {
+                "block_id": blocks[i].block_id,
+                "relevance_score": tracker.calculate_relevance_score(blocks[i], concept_id),
+            }
+            for i in expanded
+        ]
+    return evidence_map
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=600)
+    parser.add_argument("--blocks-per-page", type=int, default=30)
+    args = parser.parse_args()
+
+    blocks = make_blocks(args.pages, args.blocks_per_page)
+    concept_ids = ConceptOntology().list_all_concepts()
+
+    with tempfile.TemporaryDirectory(prefix="algl_bench_") as tmp:
+        pdf_path = Path(tmp) / "book.pdf"
+        pdf_path.touch()
+        pipeline = InstructionalPipeline(PipelineConfig(pdf_path=pdf_path, output_dir=Path(tmp)))
+        pipeline._logger.disabled = True
+
+        legacy_map, legacy_map_s = timed(legacy_map_to_concepts, pipeline, blocks)
+        indexed_map, indexed_map_s = timed(pipeline._map_to_concepts, blocks)
+
+    tracker = EvidenceTracker()
+    legacy_ev, legacy_ev_s = timed(legacy_evidence_map, tracker, blocks, concept_ids)
+    indexed_ev, indexed_ev_s = timed(tracker.create_evidence_map, blocks, concept_ids)
+
+    same_map = {k: [b.block_id for b in v] for k, v in legacy_map.items()} == {
+        k: [b.block_id for b in v] for k, v in indexed_map.items()
+    }
+    same_ev = legacy_ev == {
+        k: [{"block_id": e["block_id"], "relevance_score": e["relevance_score"]} for e in v]
+        for k, v in indexed_ev.items()
+    }
+
+    print(f"{len(blocks):,} blocks, {len(concept_ids)} concepts\n")
+    print(f"{'':22}{'legacy (s)':>12}{'indexed (s)':>13}{'speedup':>10}{'identical':>11}")
+    for label, old_s, new_s, same in (
+        ("_map_to_concepts", legacy_map_s, indexed_map_s, same_map),
+        ("create_evidence_map", legacy_ev_s, indexed_ev_s, same_ev),
+    ):
+        print(f"{label:22}{old_s:>12.3f}{new_s:>13.3f}{old_s / new_s:>9.1f}x{str(same):>11}")
+    if not (same_map and same_ev):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark per-chunk vs batched hash embeddings.
+
+Generates synthetic textbook chunks (10,000 x 180 words by default), embeds
+them once with build_hash_embedding in a loop and once with the batched
+build_hash_embeddings, checks the vectors are bit-identical and prints
+throughput for both.
+
+Usage:
+    python scripts/benchmark_embedding.py [--chunks 10000] [--words 180] [--dim 24]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.embedding import build_hash_embedding, build_hash_embeddings  # noqa: E402
+
+
+def make_chunks(count: int, words: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    base = (
+        "select from where join inner outer left right group having order "
+        "insert update delete table index view primary foreign key constraint "
+        "null distinct aggregate count average subquery transaction commit"
+    ).split()
+    # Zipf-ish vocabulary: common SQL terms plus a long tail of rare words
+    vocab = base + [f"term{i}" for i in range(5000)]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    return [
+        " ".join(rng.choices(vocab, weights=weights, k=words)) + "."
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=10_000)
+    parser.add_argument("--words", type=int, default=180)
+    parser.add_argument("--dim", type=int, default=24)
+    args = parser.parse_args()
+
+    texts = make_chunks(args.chunks, args.words)
+
+    start = time.perf_counter()
+    scalar = [build_hash_embedding(t, args.dim) for t in texts]
+    scalar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = build_hash_embeddings(texts, args.dim)
+    batched_s = time.perf_counter() - start
+
+    exact = build_hash_embeddings(texts, args.dim, dtype=np.float64).tolist()
+    identical = exact == scalar and np.array_equal(
+        batched, np.asarray(scalar, dtype=np.float32)
+    )
+
+    print(f"{args.chunks} chunks x {args.words} words, dim={args.dim}\n")
+    print(f"{'':28}{'seconds':>10}{'chunks/s':>12}")
+    print(f"{'build_hash_embedding loop':28}{scalar_s:>10.3f}{args.chunks / scalar_s:>12,.0f}")
+    print(f"{'build_hash_embeddings':28}{batched_s:>10.3f}{args.chunks / batched_s:>12,.0f}")
+    print(f"\nspeedup: {scalar_s / batched_s:.1f}x   bit-identical: {identical}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark misconception detection latency per student submission.
+
+Classifies a synthetic batch of submissions (the example bad/good SQL of
+every pattern in COMMON_MISCONCEPTIONS plus random recombinations of their
+clauses) three ways:
+
+- the old MisconceptionBank.detect_in_student_code loop, which calls
+  re.compile for every pattern on every submission;
+- CompiledMisconceptionDetector.detect, one submission at a time;
+- CompiledMisconceptionDetector.detect_many, the whole batch at once.
+
+Results of all three are checked to be identical.
+
+Usage:
+    python scripts/benchmark_misconception_detection.py [--submissions 5000] [--concept select-basic]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.misconception_bank import (  # noqa: E402
+    COMMON_MISCONCEPTIONS,
+    CompiledMisconceptionDetector,
+    MisconceptionPattern,
+)
+
+
+def make_submissions(count: int, seed: int = 0) -> list[str]:
+    examples = [
+        sql
+        for pattern in COMMON_MISCONCEPTIONS
+        for sql in (pattern.example_bad_sql, pattern.example_good_sql)
+        if sql
+    ]
+    rng = random.Random(seed)
+    submissions = list(examples)
+    while len(submissions) < count:
+        words = [word for sql in rng.sample(examples, 3) for word in sql.split()]
+        start = rng.randrange(len(words))
+        submissions.append(" ".join(words[start:start + rng.randint(4, 24)]))
+    return submissions[:count]
+
+
+def old_detect(sql: str, concept_id: str | None) -> list[MisconceptionPattern]:
+    """detect_in_student_code before the compiled detector."""
+    matches = []
+    for pattern in COMMON_MISCONCEPTIONS:
+        if concept_id and pattern.concept_id != concept_id:
+            continue
+        try:
+            regex = re.compile(pattern.sql_pattern, re.IGNORECASE | re.MULTILINE)
+        except re.error:
+            continue
+        if regex.search(sql):
+            matches.append(pattern)
+    matches.sort(key=lambda p: p.remediation_order)
+    return matches
+
+
+def timed(fn, submissions: list[str]) -> tuple[list, list[float]]:
+    results, latencies = [], []
+    for sql in submissions:
+        start = time.perf_counter()
+        results.append(fn(sql))
+        latencies.append(time.perf_counter() - start)
+    return results, latencies
+
+
+def describe(name: str, latencies: list[float]) -> None:
+    us = sorted(x * 1e6 for x in latencies)
+    p95 = us[int(len(us) * 0.95)]
+    print(f"{name:<22}{statistics.fmean(us):>10.1f}{us[len(us) // 2]:>10.1f}{p95:>10.1f}{us[-1]:>11.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=5000)
+    parser.add_argument("--concept", default=None, help="Limit detection to one concept ID")
+    args = parser.parse_args()
+
+    submissions = make_submissions(args.submissions)
+    start = time.perf_counter()
+    detector = CompiledMisconceptionDetector(COMMON_MISCONCEPTIONS)
+    build_s = time.perf_counter() - start
+
+    old, old_lat = timed(lambda sql: old_detect(sql, args.concept), submissions)
+    new, new_lat = timed(lambda sql: detector.detect(sql, args.concept), submissions)
+    start = time.perf_counter()
+    batch = detector.detect_many(submissions, args.concept)
+    batch_s = time.perf_counter() - start
+
+    print(f"{len(submissions)} submissions, {len(COMMON_MISCONCEPTIONS)} patterns, "
+          f"concept={args.concept or 'all'}, detector built in {build_s * 1e3:.1f} ms")
+    print(f"{'per submission (us)':<22}{'mean':>10}{'p50':>10}{'p95':>10}{'max':>11}")
+    describe("re.compile per call", old_lat)
+    describe("compiled detect", new_lat)
+    print(f"{'compiled detect_many':<22}{batch_s / len(submissions) * 1e6:>10.1f}")
+    print(f"speedup (mean): {statistics.fmean(old_lat) / statistics.fmean(new_lat):.1f}x")
+    ids = lambda results: [[p.pattern_id for p in r] for r in results]  # noqa: E731
+    print(f"identical: {ids(old) == ids(new) == ids(batch)}")
+
+
+if __name__ == "__main__":
+    main()
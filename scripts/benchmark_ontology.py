@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Microbenchmark ConceptOntology prerequisite queries.
+
+Times the queries that unit generation, the quality gates and the exporters
+issue per concept, against every concept in SQL_CONCEPTS:
+
+- as before the indexes: get_prerequisites and get_hard_prerequisites
+  scanning PREREQUISITE_DAG, get_learning_path rescanning every edge for
+  each dequeued concept, and recursive _collect_prerequisites;
+- with the adjacency indexes, transitive closure and cached BFS links;
+- constructing ConceptOntology per use versus the shared get_ontology().
+
+Results of both versions are checked to be identical.
+
+Usage:
+    python scripts/benchmark_ontology.py [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.sql_ontology import ConceptOntology, get_ontology  # noqa: E402
+
+
+class ScanningOntology(ConceptOntology):
+    """ConceptOntology queries before the adjacency indexes."""
+
+    def get_prerequisites(self, concept_id: str) -> list[str]:
+        return [e["from"] for e in self._prereqs if e["to"] == concept_id]
+
+    def get_hard_prerequisites(self, concept_id: str) -> list[str]:
+        return [e["from"] for e in self._prereqs
+                if e["to"] == concept_id and e["type"] == "hard_prereq"]
+
+    def get_learning_path(self, start_concept: str, end_concept: str) -> list[str]:
+        if start_concept not in self._concepts or end_concept not in self._concepts:
+            return []
+        if start_concept == end_concept:
+            return [start_concept]
+        queue = deque([(start_concept, [start_concept])])
+        visited = {start_concept}
+        while queue:
+            current, path = queue.popleft()
+            for edge in self._prereqs:
+                if edge["from"] == current:
+                    next_concept = edge["to"]
+                    if next_concept == end_concept:
+                        return path + [next_concept]
+                    if next_concept not in visited:
+                        visited.add(next_concept)
+                        queue.append((next_concept, path + [next_concept]))
+        return []
+
+    def _collect_prerequisites(self, concept_id: str, collected: set[str]) -> None:
+        for prereq in self.get_prerequisites(concept_id):
+            if prereq not in collected and prereq in self._concepts:
+                collected.add(prereq)
+                self._collect_prerequisites(prereq, collected)
+
+
+def timed(fn, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def queries(ontology: ConceptOntology) -> dict[str, object]:
+    ids = ontology.list_all_concepts()
+    return {
+        "get_prerequisites": lambda: [ontology.get_prerequisites(c) for c in ids],
+        "get_hard_prerequisites": lambda: [ontology.get_hard_prerequisites(c) for c in ids],
+        "get_learning_path (all pairs)": lambda: [
+            ontology.get_learning_path(a, b) for a in ids for b in ids
+        ],
+        "get_recommended_learning_order": lambda: [
+            ontology.get_recommended_learning_order([c]) for c in ids
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    before, after = ScanningOntology(), ConceptOntology()
+    count = len(after.list_all_concepts())
+    print(f"{count} concepts, {len(after._prereqs)} prerequisite edges, "
+          f"mean of {args.repeat} runs\n")
+    print(f"{'query over every concept':<34}{'before ms':>11}{'indexed ms':>12}{'speedup':>9}")
+    identical = True
+    for (name, old), new in zip(queries(before).items(), queries(after).values()):
+        old_result, old_s = timed(old, args.repeat)
+        new_result, new_s = timed(new, args.repeat)
+        identical &= old_result == new_result
+        print(f"{name:<34}{old_s * 1e3:>11.2f}{new_s * 1e3:>12.3f}{old_s / new_s:>8.0f}x")
+
+    _, build_s = timed(ConceptOntology, args.repeat)
+    _, shared_s = timed(get_ontology, args.repeat)
+    print(f"\nConceptOntology(): {build_s * 1e3:.2f} ms, get_ontology(): {shared_s * 1e6:.2f} us")
+    print(f"identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
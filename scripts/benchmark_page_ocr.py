@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark page-level OCR against whole-document OCR on a mixed textbook.
+
+Builds a digital textbook (400 pages by default) with a scanned appendix
+(--scanned image-only pages at the end) and a few scanned figure pages in
+between, then reports:
+
+- how many pages each OCR mode sends to OCRmyPDF and how long the per-page
+  selection (select_pages_for_ocr) takes;
+- with ocrmypdf installed, the wall time of maybe_ocr_pdf in "document" and
+  "pages" mode, and that every digital page keeps its text and number.
+
+OCR time is roughly proportional to the number of pages OCR'd, so the page
+counts are the figure to compare where ocrmypdf (and Tesseract) are missing.
+
+Usage:
+    python scripts/benchmark_page_ocr.py [--pages 400] [--scanned 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.extract import (  # noqa: E402
+    check_extraction_quality,
+    cleanup_temp_pdf,
+    extract_pages_fitz,
+    maybe_ocr_pdf,
+    select_pages_for_ocr,
+)
+
+BODY = (
+    "A subquery is a query nested inside another statement. The outer query "
+    "uses its result to filter, compute or join rows."
+)
+
+
+def scanned_page_image(page_num: int) -> bytes:
+    img = Image.new("L", (1275, 1650), 255)
+    draw = ImageDraw.Draw(img)
+    for line in range(40):
+        draw.text((150, 150 + line * 34), f"Appendix page {page_num}, line {line}: {BODY[:60]}", fill=0)
+    out = io.BytesIO()
+    img.save(out, format="JPEG", quality=70)
+    return out.getvalue()
+
+
+def build_book(path: Path, pages: int, scanned: int) -> set[int]:
+    scanned_pages = set(range(pages - scanned + 1, pages + 1))
+    scanned_pages |= {n for n in range(50, pages - scanned, 100)}  # scanned figures
+    doc = fitz.open()
+    for page_num in range(1, pages + 1):
+        page = doc.new_page()
+        if page_num in scanned_pages:
+            page.insert_image(page.rect, stream=scanned_page_image(page_num))
+            continue
+        for line in range(30):
+            page.insert_text((72, 72 + line * 22), f"{page_num}.{line} {BODY[:80]}", fontsize=10)
+    doc.save(str(path))
+    doc.close()
+    return scanned_pages
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--scanned", type=int, default=20, help="Scanned appendix pages")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="algl_bench_") as tmp:
+        pdf_path = Path(tmp) / "book.pdf"
+        scanned = build_book(pdf_path, args.pages, args.scanned)
+        pages = extract_pages_fitz(pdf_path)
+        selected, select_s = timed(lambda: select_pages_for_ocr(pages))
+        quality = check_extraction_quality(pages)
+
+        print(f"Mixed textbook: {args.pages} pages, {len(scanned)} scanned\n")
+        print(f"{'mode':<40}{'pages OCRd':>12}{'scanned pages with text':>26}")
+        if quality["is_quality_good"]:
+            print(f"{'document, auto (quality check passes)':<40}{0:>12}{f'0/{len(scanned)}':>26}")
+        print(f"{'document, forced or check failing':<40}{args.pages:>12}"
+              f"{f'{len(scanned)}/{len(scanned)}':>26}")
+        covered = len(scanned & set(selected))
+        print(f"{'pages':<40}{len(selected):>12}{f'{covered}/{len(scanned)}':>26}")
+        print(f"\nper-page selection: {select_s * 1e3:.1f} ms, "
+              f"selects exactly the scanned pages: {set(selected) == scanned}")
+
+        try:
+            import ocrmypdf  # noqa: F401
+        except ImportError:
+            print("\nocrmypdf is not installed: OCR wall times skipped")
+            return
+
+        print(f"\n{'mode':<12}{'seconds':>10}")
+        for mode in ("document", "pages"):
+            (out_path, _), seconds = timed(
+                lambda: maybe_ocr_pdf(pdf_path, force=True, auto=True,
+                                      smart_skip_threshold=1.0, ocr_mode=mode)
+            )
+            print(f"{mode:<12}{seconds:>10.1f}")
+            if mode == "pages":
+                after = extract_pages_fitz(out_path)
+                kept = all(
+                    new == old
+                    for (n, old), (_, new) in zip(pages, after)
+                    if n not in scanned
+                )
+                print(f"page numbers stable: {[n for n, _ in after] == [n for n, _ in pages]}, "
+                      f"digital pages unchanged: {kept}")
+            cleanup_temp_pdf(out_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark page decodes with and without a shared PdfSession.
+
+Builds a synthetic textbook (600 pages by default) and runs the consumers
+that one index/process run touches -- OCR quality check, text extraction,
+hashing, asset extraction, block extraction and heading detection -- once
+with each consumer opening the PDF itself and once through one PdfSession.
+
+Usage:
+    python scripts/benchmark_pdf_session.py [--pages 600]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import fitz
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.asset_extractor import AssetExtractor  # noqa: E402
+from algl_pdf_helper.extract import extract_pages_fitz, maybe_ocr_pdf, sha256_file  # noqa: E402
+from algl_pdf_helper.pdf_session import PdfSession  # noqa: E402
+from algl_pdf_helper.section_extractor import SectionExtractor  # noqa: E402
+from algl_pdf_helper.structure_extractor import StructureExtractor  # noqa: E402
+
+
+def build_book(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    body = (
+        "A relational database stores data in tables. The SELECT statement "
+        "retrieves rows, WHERE filters them and ORDER BY sorts the result."
+    )
+    for i in range(1, pages + 1):
+        page = doc.new_page()
+        if i % 20 == 1:
+            page.insert_text((72, 72), f"Chapter {i // 20 + 1} Querying Data", fontsize=20)
+        y = 110
+        for _ in range(30):
+            page.insert_text((72, y), body[:95], fontsize=10)
+            y += 20
+    doc.save(str(path))
+    doc.close()
+
+
+class DecodeCounter:
+    """Count fitz.open calls and page decodes by output format."""
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+
+    def __enter__(self) -> "DecodeCounter":
+        self._orig_get_text = fitz.Page.get_text
+        self._orig_open = fitz.open
+        counts = self.counts
+        orig_get_text = self._orig_get_text
+        orig_open = self._orig_open
+
+        def get_text(page, option="text", *args, **kwargs):
+            if not kwargs.get("clip"):
+                counts[f"get_text({option})"] += 1
+            return orig_get_text(page, option, *args, **kwargs)
+
+        def open_(*args, **kwargs):
+            counts["fitz.open"] += 1
+            return orig_open(*args, **kwargs)
+
+        fitz.Page.get_text = get_text
+        fitz.open = open_
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        fitz.Page.get_text = self._orig_get_text
+        fitz.open = self._orig_open
+
+
+def run_separate(pdf_path: Path) -> None:
+    maybe_ocr_pdf(pdf_path, force=False, auto=True)
+    extract_pages_fitz(pdf_path)
+    sha256_file(pdf_path)
+    AssetExtractor().extract_images(pdf_path, "bench")
+    SectionExtractor().extract_blocks(pdf_path, "bench")
+    StructureExtractor().extract_headings(pdf_path)
+
+
+def run_shared(pdf_path: Path) -> None:
+    with PdfSession(pdf_path) as session:
+        maybe_ocr_pdf(pdf_path, force=False, auto=True, session=session)
+        extract_pages_fitz(pdf_path, session=session)
+        session.sha256
+        AssetExtractor().extract_images(pdf_path, "bench", session=session)
+        SectionExtractor().extract_blocks(pdf_path, "bench", session=session)
+        StructureExtractor().extract_headings(pdf_path, session=session)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=600)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="algl_bench_") as tmp:
+        pdf_path = Path(tmp) / "book.pdf"
+        build_book(pdf_path, args.pages)
+
+        results = {}
+        for label, fn in (("separate opens", run_separate), ("PdfSession", run_shared)):
+            with DecodeCounter() as counter:
+                start = time.perf_counter()
+                fn(pdf_path)
+                elapsed = time.perf_counter() - start
+            results[label] = (counter.counts, elapsed)
+
+    print(f"Synthetic book: {args.pages} pages\n")
+    keys = sorted({k for counts, _ in results.values() for k in counts})
+    print(f"{'':24}" + "".join(f"{label:>18}" for label in results))
+    for key in keys:
+        print(f"{key:24}" + "".join(f"{counts[key]:>18}" for counts, _ in results.values()))
+    print(f"{'wall time (s)':24}" + "".join(f"{t:>18.2f}" for _, t in results.values()))
+
+
+if __name__ == "__main__":
+    main()
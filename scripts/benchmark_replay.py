@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark learner-state reconstruction during trace replay.
+
+Replays synthetic traces (make_synthetic_trace) of growing length under
+the default policies, once recomputing the learner state from the start of
+the trace for every event (compute_learner_state, the old replay loop) and
+once with the incremental LearnerStateAccumulator that ReplayEngine uses
+now. Decision points of both runs are checked to be identical.
+
+Use a high --error-rate to check that state reconstruction stays linear
+in the number of error events as well.
+
+Usage:
+    python scripts/benchmark_replay.py [--problems 50 200 800] [--error-rate 0.6]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.experiment_flags import ExperimentFlags  # noqa: E402
+from algl_pdf_helper.policies import (  # noqa: E402
+    LearnerStateAccumulator,
+    compute_learner_state,
+    get_default_policies,
+)
+from algl_pdf_helper.replay import ReplayEngine  # noqa: E402
+from algl_pdf_helper.trace_schema import LearnerTrace, make_synthetic_trace  # noqa: E402
+
+
+def quadratic_decisions(trace: LearnerTrace, flags: ExperimentFlags) -> list[tuple]:
+    """The replay loop before LearnerStateAccumulator: a full rescan per event."""
+    decisions = []
+    for policy in get_default_policies():
+        for i, event in enumerate(trace.events):
+            state = compute_learner_state(trace.events, i, flags.apply_to_policy_context())
+            decision = policy.should_escalate(state)
+            prereq_violation = False
+            if event.concept_id and flags.enforce_prerequisites:
+                errors_on_concept = sum(
+                    1 for e in trace.events[:i + 1]
+                    if e.concept_id == event.concept_id and e.error_subtype
+                )
+                prereq_violation = errors_on_concept >= 3
+            if decision.action != "wait" or event.is_escalation_event():
+                decisions.append((policy.policy_id, i, decision.action, decision.target_level,
+                                  decision.rule_applied, prereq_violation))
+    return decisions
+
+
+def incremental_decisions(trace: LearnerTrace, flags: ExperimentFlags) -> list[tuple]:
+    engine = ReplayEngine(flags=flags)
+    return [
+        (dp.policy_id, dp.event_index, dp.action, dp.target_level,
+         dp.rule_applied, dp.prerequisite_violation_detected)
+        for result in engine.replay_trace(trace)
+        for dp in result.decision_points
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--problems", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--error-rate", type=float, default=0.6)
+    args = parser.parse_args()
+
+    flags = ExperimentFlags(enforce_prerequisites=True)
+    print(f"{'problems':>9}{'events':>9}{'rescan (s)':>12}{'incremental (s)':>17}"
+          f"{'state only (s)':>16}{'speedup':>10}{'identical':>11}")
+    for problems in args.problems:
+        trace = make_synthetic_trace(f"bench_{problems}", "benchmark", num_problems=problems,
+                                      error_rate=args.error_rate)
+
+        start = time.perf_counter()
+        before = quadratic_decisions(trace, flags)
+        before_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        after = incremental_decisions(trace, flags)
+        after_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        accumulator = LearnerStateAccumulator(flags.apply_to_policy_context())
+        for event in trace.events:
+            accumulator.advance(event)
+        state_s = time.perf_counter() - start
+
+        print(f"{problems:>9}{len(trace.events):>9}{before_s:>12.3f}{after_s:>17.3f}"
+              f"{state_s:>16.4f}{before_s / after_s:>9.1f}x{str(before == after):>11}")
+
+
+if __name__ == "__main__":
+    main()
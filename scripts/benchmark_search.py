@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark top-k chunk search: pure-Python scan vs ChunkSearchIndex.
+
+Builds synthetic indexes (10,000 and 100,000 chunks by default), runs the
+same query batch through the old per-chunk cosine loop with a full sort and
+through ChunkSearchIndex (one matrix multiply + argpartition per batch),
+checks both return the same top-k pages and prints queries/sec. The
+pure-Python scan is run on a sample of the queries since it is slow.
+
+Usage:
+    python scripts/benchmark_search.py [--sizes 10000 100000] [--queries 1000] [--top-k 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.embedding import build_hash_embeddings  # noqa: E402
+from algl_pdf_helper.search import ChunkSearchIndex  # noqa: E402
+
+VOCAB = (
+    "select from where join inner outer left right group having order "
+    "insert update delete table index view primary foreign key constraint "
+    "null distinct aggregate count average subquery transaction commit"
+).split() + [f"term{i}" for i in range(2000)]
+
+
+def make_texts(count: int, words: int, rng: random.Random) -> list[str]:
+    return [" ".join(rng.choices(VOCAB, k=words)) for _ in range(count)]
+
+
+def python_search(query: list[float], embeddings: list[list[float]], top_k: int) -> list[int]:
+    """The previous RetrievalSanityMetric.run_tests scan: score all, sort all."""
+    norm_q = sum(x * x for x in query) ** 0.5
+    scored = []
+    for row, emb in enumerate(embeddings):
+        dot = sum(x * y for x, y in zip(query, emb))
+        norm_e = sum(x * x for x in emb) ** 0.5
+        scored.append((dot / (norm_q * norm_e) if norm_q and norm_e else 0.0, row))
+    scored.sort(reverse=True, key=lambda x: x[0])
+    return [row for _, row in scored[:top_k]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--python-queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--dim", type=int, default=24)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    queries = make_texts(args.queries, 3, rng)
+    query_vectors = build_hash_embeddings(queries, args.dim)
+
+    print(f"{args.queries} queries, top_k={args.top_k}, dim={args.dim}\n")
+    print(f"{'chunks':>9}{'python q/s':>13}{'index q/s':>13}{'speedup':>10}{'same pages':>12}")
+    for size in args.sizes:
+        embeddings = build_hash_embeddings(make_texts(size, 120, rng), args.dim)
+        index = ChunkSearchIndex(
+            embeddings,
+            chunk_ids=[f"doc:p{i // 10 + 1}:c{i % 10 + 1}" for i in range(size)],
+            doc_names=["doc"],
+            doc_codes=np.zeros(size, dtype=np.int32),
+            pages=np.arange(size) // 10 + 1,
+            texts=[""] * size,
+        )
+
+        sample = query_vectors[: args.python_queries].tolist()
+        rows = embeddings.tolist()
+        start = time.perf_counter()
+        expected = [python_search(q, rows, args.top_k) for q in sample]
+        python_qps = len(sample) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        results = index.search(query_vectors, top_k=args.top_k)
+        index_qps = args.queries / (time.perf_counter() - start)
+
+        # Near-ties may legitimately swap rows; compare by page sets
+        same = all(
+            {index.pages[r] for r in exp} == {hit.page for hit in hits}
+            for exp, hits in zip(expected, results)
+        )
+        print(
+            f"{size:>9,}{python_qps:>13,.1f}{index_qps:>13,.0f}"
+            f"{index_qps / python_qps:>9,.0f}x{str(same):>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
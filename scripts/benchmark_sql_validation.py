@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Benchmark SQL example validation with and without pooled practice databases.
+
+Validates a mix of example queries (SELECTs, joins, aggregates, DML, DDL and
+broken SQL) against the practice schemas, once the way validation used to
+work (a freshly built SQLite database per query) and once with the
+schema-keyed template pool (a rolled-back copy per query). Reported for
+SQLValidator's execution layer, the full three-layer SQLValidator.validate
+and LearningQualityGates.validate_sql_executable. The results of both runs
+are checked to be identical.
+
+The batch section compares a validate() loop with SQLValidator.validate_many
+(de-duplication, result cache, optional worker processes).
+
+Usage:
+    python scripts/benchmark_sql_validation.py [--queries 3000] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper import learning_quality_gates  # noqa: E402
+from algl_pdf_helper.learning_quality_gates import LearningQualityGates  # noqa: E402
+from algl_pdf_helper.practice_db_pool import get_practice_db_pool  # noqa: E402
+from algl_pdf_helper.sql_validator import PracticeSchemaManager, SQLValidator  # noqa: E402
+
+QUERIES = [
+    "SELECT * FROM users WHERE age > {n};",
+    "SELECT name, city FROM users ORDER BY name LIMIT {n};",
+    "SELECT u.name, o.amount FROM users u JOIN orders o ON u.id = o.user_id WHERE o.amount > {n};",
+    "SELECT user_id, COUNT(*), SUM(amount) FROM orders GROUP BY user_id HAVING COUNT(*) > {m};",
+    "SELECT e.emp_name, d.dept_name FROM employees e LEFT JOIN departments d ON e.dept_id = d.dept_id;",
+    "SELECT category, AVG(price) FROM products GROUP BY category;",
+    "UPDATE products SET price = price * 1.{m} WHERE category = 'Electronics';",
+    "INSERT INTO departments (dept_id, dept_name) VALUES ({n} + 100, 'Research');",
+    "DELETE FROM orders WHERE amount < {n};",
+    "DROP TABLE orders;",
+    "SELECT missing_column FROM users;",
+    "SELECT * FROM no_such_table;",
+]
+
+GATE_SCHEMA = {
+    "users": {"columns": [("id", "INTEGER"), ("name", "TEXT"), ("age", "INTEGER"), ("city", "TEXT")]},
+    "orders": {"columns": [("order_id", "INTEGER"), ("user_id", "INTEGER"), ("amount", "REAL")]},
+    "products": {"columns": ["id", "name", "category", "price"]},
+}
+
+
+class RebuildingSchemaManager(PracticeSchemaManager):
+    """Validation before pooling: a new database built for every query."""
+
+    @contextmanager
+    def pooled_database(self, schema=None, *, reuse=True) -> Iterator[sqlite3.Connection]:
+        conn = self.setup_database(schema)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def rebuilding_gate_check(gates: LearningQualityGates, sql: str) -> str:
+    """validate_sql_executable's execution step before pooling."""
+    try:
+        conn = learning_quality_gates._build_schema_database(GATE_SCHEMA)
+        conn.execute(sql)
+        conn.close()
+        return "ok"
+    except sqlite3.Error as e:
+        return str(e)[:100]
+
+
+def pooled_gate_check(gates: LearningQualityGates, sql: str) -> str:
+    check = gates.validate_sql_executable(sql, GATE_SCHEMA)
+    return "ok" if check.passed else check.message.removeprefix("SQL execution error: ")
+
+
+def timed(fn, items: list[Any]) -> tuple[float, list[Any]]:
+    start = time.perf_counter()
+    results = [fn(item) for item in items]
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=3000)
+    parser.add_argument("--workers", type=int, default=4, help="worker processes for validate_many")
+    args = parser.parse_args()
+
+    queries = [
+        QUERIES[i % len(QUERIES)].format(n=i % 50, m=i % 3 + 1) for i in range(args.queries)
+    ]
+    gate_queries = [q for q in queries if "employees" not in q and "departments" not in q]
+    rebuilding = SQLValidator(schema_manager=RebuildingSchemaManager())
+    pooled = SQLValidator()
+    gates = LearningQualityGates()
+
+    def execution(validator: SQLValidator):
+        return lambda sql: validator._validate_execution(sql, validator.schema_manager.schemas)
+
+    cases = [
+        ("SQLValidator execution", execution(rebuilding), execution(pooled), queries),
+        ("SQLValidator.validate", lambda q: _result_summary(rebuilding.validate(q)),
+         lambda q: _result_summary(pooled.validate(q)), queries),
+        ("quality gate executable", lambda q: rebuilding_gate_check(gates, q),
+         lambda q: pooled_gate_check(gates, q), gate_queries),
+    ]
+    print(f"{'layer':<26}{'queries':>9}{'rebuild (/s)':>15}{'pooled (/s)':>14}{'speedup':>10}{'identical':>11}")
+    for name, before, after, items in cases:
+        after(items[0])  # build the template outside the timing
+        before_s, before_results = timed(before, items)
+        after_s, after_results = timed(after, items)
+        print(f"{name:<26}{len(items):>9}{len(items) / before_s:>15,.0f}{len(items) / after_s:>14,.0f}"
+              f"{before_s / after_s:>9.1f}x{str(before_results == after_results):>11}")
+    print(f"pool: {get_practice_db_pool().stats}")
+
+    # Batch validation: the same statements recur across units and exports
+    distinct = len(set(queries))
+    loop_s, loop_results = timed(lambda q: _result_summary(pooled.validate(q)), queries)
+    print(f"\n{'batch (' + str(len(queries)) + ' statements, ' + str(distinct) + ' distinct)':<44}"
+          f"{'seconds':>9}{'per sec':>10}{'identical':>11}")
+    print(f"{'validate() loop':<44}{loop_s:>9.2f}{len(queries) / loop_s:>10,.0f}{'':>11}")
+    for label, workers in (("validate_many", 1), (f"validate_many, {args.workers} workers", args.workers)):
+        validator = SQLValidator()
+        start = time.perf_counter()
+        results = validator.validate_many(queries, workers=workers)
+        batch_s = time.perf_counter() - start
+        same = [_result_summary(r) for r in results] == loop_results
+        print(f"{label:<44}{batch_s:>9.2f}{len(queries) / batch_s:>10,.0f}{str(same):>11}")
+    start = time.perf_counter()
+    validator.validate_many(queries)
+    cached_s = time.perf_counter() - start
+    print(f"{'validate_many, repeated (cached)':<44}{cached_s:>9.2f}{len(queries) / cached_s:>10,.0f}")
+
+
+def _result_summary(result) -> tuple:
+    return (
+        result.is_valid,
+        result.validation_level,
+        [e.message for e in result.errors],
+        result.warnings,
+        result.execution_result,
+        result.semantic_score,
+    )
+
+
+if __name__ == "__main__":
+    main()
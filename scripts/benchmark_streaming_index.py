@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark peak memory of in-memory vs streaming index builds.
+
+Generates synthetic corpora of growing size (100-page PDFs of ~500 words
+per page, the estimate_memory_usage default), then runs build_index on each
+in a fresh interpreter, once as a regular build and once with
+streaming=True. Reported memory is the peak resident set (VmHWM) above the
+interpreter's footprint after imports, next to estimate_memory_usage's
+figure for the same page count. The streaming build's output files are
+checked to be identical to the regular build's.
+
+Usage:
+    python scripts/benchmark_streaming_index.py [--pages 500 1000 2000 4000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import filecmp
+import json
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+
+import fitz  # noqa: E402
+
+from algl_pdf_helper.indexer import build_index  # noqa: E402
+from algl_pdf_helper.models import IndexBuildOptions  # noqa: E402
+from algl_pdf_helper.optimized_indexer import estimate_memory_usage  # noqa: E402
+
+WORDS_PER_PAGE = 500
+WORDS_PER_LINE = 12
+
+
+def proc_status_kb(field: str) -> int:
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(f"{field}:"):
+            return int(line.split()[1])
+    return 0
+
+
+def write_corpus(pdf_dir: Path, pages: int, pages_per_doc: int) -> None:
+    rng = random.Random(pages)
+    words = (
+        "select from where join group having order table index view null key "
+        "row column value query result predicate aggregate subquery schema"
+    ).split()
+    for doc_num, start in enumerate(range(0, pages, pages_per_doc)):
+        doc = fitz.open()
+        for _ in range(min(pages_per_doc, pages - start)):
+            page = doc.new_page(height=1100)
+            for line in range(WORDS_PER_PAGE // WORDS_PER_LINE):
+                text = " ".join(rng.choices(words, k=WORDS_PER_LINE))
+                page.insert_text((36, 40 + line * 24), text, fontsize=9)
+        doc.save(str(pdf_dir / f"book-{doc_num:03d}.pdf"))
+        doc.close()
+
+
+def measure(pdf_dir: Path, out_dir: Path, streaming: bool) -> dict[str, float]:
+    """Run inside a fresh interpreter: build the index and report its cost."""
+    before = proc_status_kb("VmRSS")
+    start = time.perf_counter()
+    doc = build_index(
+        pdf_dir,
+        out_dir,
+        options=IndexBuildOptions(),
+        extract_assets=False,
+        streaming=streaming,
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        "chunks": doc.chunkCount,
+        "seconds": elapsed,
+        "peak_mb": (proc_status_kb("VmHWM") - before) / 1024,
+    }
+
+
+def same_output(a: Path, b: Path) -> bool:
+    if not filecmp.cmp(a / "chunks.json", b / "chunks.json", shallow=False):
+        return False
+    left, right = (
+        re.sub(r'"createdAt": ?"[^"]*"', "", (d / "index.json").read_text(encoding="utf-8"))
+        for d in (a, b)
+    )
+    return left == right
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[500, 1000, 2000, 4000])
+    parser.add_argument("--pages-per-doc", type=int, default=100)
+    parser.add_argument("--measure", nargs=3, metavar=("PDF_DIR", "OUT", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        pdf_dir, out_dir, mode = args.measure
+        print(json.dumps(measure(Path(pdf_dir), Path(out_dir), mode == "streaming")))
+        return
+
+    print(f"{'pages':>6}{'chunks':>9}{'estimate (MB)':>15}"
+          f"{'in-memory (MB)':>16}{'streaming (MB)':>16}"
+          f"{'in-memory (s)':>15}{'streaming (s)':>15}{'identical':>11}")
+    for pages in args.pages:
+        with tempfile.TemporaryDirectory(prefix="algl_bench_") as tmp:
+            pdf_dir = Path(tmp) / "pdfs"
+            pdf_dir.mkdir()
+            write_corpus(pdf_dir, pages, args.pages_per_doc)
+            results = {}
+            for mode in ("memory", "streaming"):
+                results[mode] = json.loads(
+                    subprocess.run(
+                        [sys.executable, __file__, "--measure", str(pdf_dir), str(Path(tmp) / mode), mode],
+                        check=True,
+                        capture_output=True,
+                        text=True,
+                    ).stdout.strip().splitlines()[-1]
+                )
+            identical = same_output(Path(tmp) / "memory", Path(tmp) / "streaming")
+
+        estimate = estimate_memory_usage(pages, avg_words_per_page=WORDS_PER_PAGE)
+        memory, streaming = results["memory"], results["streaming"]
+        print(f"{pages:>6}{memory['chunks']:>9,}{estimate['total_estimate_mb']:>15.1f}"
+              f"{memory['peak_mb']:>16.1f}{streaming['peak_mb']:>16.1f}"
+              f"{memory['seconds']:>15.2f}{streaming['seconds']:>15.2f}{str(identical):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark heading detection on a large synthetic book.
+
+Builds a synthetic textbook (1000 pages by default: chapters, numbered
+sections, bold run-in headings and body text in a few font sizes) and runs
+StructureExtractor.extract_headings:
+
+- as before the span cache: two walks over every page's layout dict and
+  the body size taken as max(set(sizes), key=sizes.count);
+- single pass over the PdfSession span cache, serially;
+- single pass with page layouts decoded by --workers processes.
+
+It then extracts SectionExtractor blocks from the serial session to show
+the span cache being reused. Headings of all runs are checked to be
+identical. Worker processes only pay off with several cores.
+
+Usage:
+    python scripts/benchmark_structure_extraction.py [--pages 1000] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from algl_pdf_helper.clean import normalize_text  # noqa: E402
+from algl_pdf_helper.pdf_session import PdfSession  # noqa: E402
+from algl_pdf_helper.section_extractor import SectionExtractor  # noqa: E402
+from algl_pdf_helper.structure_extractor import Heading, StructureExtractor  # noqa: E402
+
+
+def build_book(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    body = (
+        "A relational database stores data in tables. The SELECT statement "
+        "retrieves rows, WHERE filters them and ORDER BY sorts the result."
+    )
+    for i in range(1, pages + 1):
+        page = doc.new_page()
+        chapter = i // 25 + 1
+        y = 72
+        if i % 25 == 1:
+            page.insert_text((72, y), f"Chapter {chapter} Querying Data", fontsize=20)
+            y += 40
+        if i % 5 == 0:
+            page.insert_text((72, y), f"{chapter}.{i % 25 // 5} Filtering Rows", fontsize=14)
+            y += 28
+        for line in range(30):
+            if line == 12:
+                page.insert_text((72, y), "Using Indexes Well", fontsize=11, fontname="hebo")
+            else:
+                page.insert_text((72, y), body[:95], fontsize=10 if line % 7 else 9)
+            y += 20
+            if y > 760:
+                break
+    doc.save(str(path))
+    doc.close()
+
+
+def two_pass_headings(extractor: StructureExtractor, session: PdfSession) -> list[Heading]:
+    """extract_headings before the span cache."""
+    font_sizes = []
+    for page_num in range(session.page_count):
+        for block in session.page_dict(page_num)["blocks"]:
+            if "lines" not in block:
+                continue
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    font_sizes.append(span["size"])
+    if not font_sizes:
+        return []
+    body_size = max(set(font_sizes), key=font_sizes.count)
+    heading_threshold = body_size * extractor.HEADING_SIZE_THRESHOLD
+
+    headings = []
+    for page_num in range(session.page_count):
+        for block in session.page_dict(page_num)["blocks"]:
+            if "lines" not in block:
+                continue
+            for line in block["lines"]:
+                line_text, max_font_size, is_bold = "", 0, False
+                for span in line["spans"]:
+                    line_text += span["text"]
+                    max_font_size = max(max_font_size, span["size"])
+                    if span["flags"] & 2**4:
+                        is_bold = True
+                line_text = normalize_text(line_text).strip()
+                if not line_text or len(line_text) > 200 or extractor._is_noise_text(line_text):
+                    continue
+                level, confidence = extractor._classify_heading(
+                    line_text, max_font_size, is_bold, heading_threshold, body_size
+                )
+                if level > 0:
+                    headings.append(Heading(level, line_text, page_num + 1, max_font_size,
+                                            is_bold, confidence))
+    return extractor._deduplicate_headings(headings)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="algl_bench_") as tmp:
+        pdf_path = Path(tmp) / "book.pdf"
+        build_book(pdf_path, args.pages)
+        serial = StructureExtractor()
+        parallel = StructureExtractor(workers=args.workers)
+
+        with PdfSession(pdf_path) as session:
+            before, before_s = timed(lambda: two_pass_headings(serial, session))
+        with PdfSession(pdf_path) as session:
+            after, after_s = timed(lambda: serial.extract_headings(pdf_path, session=session))
+            _, again_s = timed(lambda: serial.extract_headings(pdf_path, session=session))
+            _, blocks_s = timed(lambda: SectionExtractor().extract_blocks(pdf_path, "bench", session=session))
+            decodes = session.decode_counts["dict"]
+        with PdfSession(pdf_path) as session:
+            fanned, fanned_s = timed(lambda: parallel.extract_headings(pdf_path, session=session))
+
+        sizes = [size for page in range(args.pages) for size in (10.0,) * 25 + (9.0,) * 4 + (11.0,)]
+        sizes += [float(s) for s in range(12, 60)]  # a realistic spread of rare sizes
+        _, quadratic_s = timed(lambda: max(set(sizes), key=sizes.count))
+
+    print(f"Synthetic book: {args.pages} pages, {len(after)} headings\n")
+    print(f"{'heading detection':<40}{'seconds':>10}")
+    print(f"{'two passes, list mode (before)':<40}{before_s:>10.2f}")
+    print(f"{'span cache, serial':<40}{after_s:>10.2f}")
+    print(f"{f'span cache, {args.workers} workers':<40}{fanned_s:>10.2f}")
+    print(f"{'again on the same session':<40}{again_s:>10.3f}")
+    print(f"{'SectionExtractor blocks, same session':<40}{blocks_s:>10.2f}")
+    print(f"\nlayout decodes for headings + blocks on one session: {decodes} "
+          f"for {args.pages} pages")
+    print(f"list mode of {len(sizes)} span sizes: {quadratic_s * 1e3:.1f} ms (Counter: O(n))")
+    print(f"identical: {before == after == fanned}")
+
+
+if __name__ == "__main__":
+    main()
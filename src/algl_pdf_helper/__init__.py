@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 __all__ = [
     "__version__",
     "models",
@@ -15,34 +20,50 @@ __all__ = [
 
 __version__ = "0.1.0"
 
+# The package re-exports the names below for convenience, but importing them
+# pulls in PyMuPDF, pydantic models and the generation stack. They are
+# resolved on first attribute access (PEP 562) so that `import algl_pdf_helper`
+# (and with it every `algl-pdf` invocation) stays cheap.
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {}
+
+
+def _lazy(module: str, *names: str, **aliases: str) -> None:
+    for name in names:
+        _LAZY_ATTRS[name] = (module, name)
+    for alias, name in aliases.items():
+        _LAZY_ATTRS[alias] = (module, name)
+
+
 # =============================================================================
 # NEW PEDAGOGICAL GENERATION MODULES (Integrated 2026-02-27)
 # =============================================================================
 # These modules provide pedagogically structured content generation
 # with practice schema alignment for SQL-Adapt integration.
 
-from .pedagogical_generator import (
-    PedagogicalContentGenerator,
-    PRACTICE_SCHEMAS,
-    TEXTBOOK_TO_PRACTICE_MAPPING,
-    CONCEPT_TO_PROBLEMS,
+_lazy(
+    "pedagogical_generator",
+    "PedagogicalContentGenerator",
+    "PRACTICE_SCHEMAS",
+    "TEXTBOOK_TO_PRACTICE_MAPPING",
+    "CONCEPT_TO_PROBLEMS",
 )
 
-from .prompts import (
-    build_concept_prompt,
-    build_sql_example_prompt,
-    build_mistakes_prompt,
-    build_practice_prompt,
-    build_transformation_prompt,
-    build_linking_prompt,
-    build_batch_prompts,
-    format_schema_for_prompt,
-    format_examples_for_few_shot,
-    get_error_patterns_for_concept,
-    validate_difficulty_params,
-    ERROR_PATTERNS,
-    PRACTICE_SCHEMAS as PROMPT_PRACTICE_SCHEMAS,
-    DIFFICULTY_GUIDELINES,
+_lazy(
+    "prompts",
+    "build_concept_prompt",
+    "build_sql_example_prompt",
+    "build_mistakes_prompt",
+    "build_practice_prompt",
+    "build_transformation_prompt",
+    "build_linking_prompt",
+    "build_batch_prompts",
+    "format_schema_for_prompt",
+    "format_examples_for_few_shot",
+    "get_error_patterns_for_concept",
+    "validate_difficulty_params",
+    "ERROR_PATTERNS",
+    "DIFFICULTY_GUIDELINES",
+    PROMPT_PRACTICE_SCHEMAS="PRACTICE_SCHEMAS",
 )
 
 
@@ -53,41 +74,61 @@ from .prompts import (
 # quality gates, and multi-pass generation optimized for 8GB M1 Mac.
 
 # Pydantic models for structured output
-from .pedagogical_models import (
-    PedagogicalConcept,
-    SQLExample,
-    Mistake,
-    PracticeReference,
-    GenerationResult,
-    QualityGateResult,
-    QualityCheckResult,
-    get_pedagogical_concept_schema,
+_lazy(
+    "pedagogical_models",
+    "PedagogicalConcept",
+    "SQLExample",
+    "Mistake",
+    "PracticeReference",
+    "GenerationResult",
+    "QualityGateResult",
+    "QualityCheckResult",
+    "get_pedagogical_concept_schema",
 )
 
 # Validators for JSON and SQL
-from .validators import (
-    validate_concept_json,
-    validate_sql_snippet,
-    validate_practice_schema,
-    safe_parse_json,
-    extract_json_from_llm_output,
+_lazy(
+    "validators",
+    "validate_concept_json",
+    "validate_sql_snippet",
+    "validate_practice_schema",
+    "safe_parse_json",
+    "extract_json_from_llm_output",
 )
 
 # Multi-pass generation pipeline
-from .generation_pipeline import (
-    MultiPassGenerator,
-    check_model_compatibility,
-    get_recommended_model,
-    check_ollama_available,
-    list_available_models,
-    M1_8GB_MODELS,
-    OPTIONAL_7B_MODELS,
+_lazy(
+    "generation_pipeline",
+    "MultiPassGenerator",
+    "check_model_compatibility",
+    "get_recommended_model",
+    "check_ollama_available",
+    "list_available_models",
+    "M1_8GB_MODELS",
+    "OPTIONAL_7B_MODELS",
 )
 
 # Quality gates for content validation
-from .quality_gates import (
-    QualityGate,
-    QualityGateConfig,
-    generate_quality_report,
-    print_quality_report,
+_lazy(
+    "quality_gates",
+    "QualityGate",
+    "QualityGateConfig",
+    "generate_quality_report",
+    "print_quality_report",
 )
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        module_name, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    elif name in __all__:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_LAZY_ATTRS})
@@ -1,20 +1,91 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import re
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal, get_args
 
 import fitz  # PyMuPDF
 
+from .preflight import TableScanMode, scan_table_candidates
+
 if TYPE_CHECKING:
     from .models import AssetManifest, ExtractedAsset
+    from .pdf_session import PdfSession
 
 
 ASSET_TYPES = Literal["image", "table"]
 
+# Candidate pages per task when searching for tables over a process pool
+TABLE_SHARD_PAGES = 8
+
+
+def convert_to_png(image_bytes: bytes) -> bytes:
+    """Convert image bytes to PNG format.
+    
+    Handles various image modes including CMYK, RGBA, and palette-based images.
+    CMYK images are converted to RGB since PNG doesn't support CMYK.
+    """
+    try:
+        from PIL import Image
+        
+        img = Image.open(io.BytesIO(image_bytes))
+        
+        # Convert to RGB if necessary (PNG only supports RGB/RGBA/L modes)
+        # CMYK must be converted to RGB since PNG doesn't support CMYK
+        if img.mode == "RGBA":
+            # Preserve transparency by creating RGB with white background
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.split()[3])  # 3 is alpha channel
+            img = background
+        elif img.mode in ("CMYK", "P", "LA", "L"):
+            # Convert all other modes to RGB
+            img = img.convert("RGB")
+        
+        output = io.BytesIO()
+        img.save(output, format="PNG")
+        return output.getvalue()
+    except Exception:
+        # If conversion fails for any reason, return original bytes
+        # This ensures we don't lose data even if conversion fails
+        return image_bytes
+
+
+def _clip_layout_text(page_dict: dict[str, Any], clip: fitz.Rect) -> str | None:
+    """Text of a ``get_text("dict")`` layout inside ``clip``.
+    
+    Matches ``page.get_text("text", clip=clip)`` up to surrounding
+    whitespace. That clips per character, which the dict layout cannot
+    reproduce, so None is returned when a span crosses the clip border.
+    """
+    lines = []
+    for block in page_dict.get("blocks", []):
+        if block.get("type") != 0:
+            continue
+        for line in block.get("lines", []):
+            text = ""
+            for span in line.get("spans", []):
+                rect = fitz.Rect(span["bbox"])
+                if rect in clip:
+                    text += span["text"]
+                elif rect.intersects(clip):
+                    return None
+            if text:
+                lines.append(text)
+    return "\n".join(lines)
+
+
+def find_tables_on_pages(pdf_path: Path, indices: list[int]) -> list[list[dict[str, Any]]]:
+    """Process-pool task: tables found on each of the given 0-based pages."""
+    extractor = AssetExtractor()
+    with fitz.open(pdf_path) as doc:
+        return [extractor._find_page_tables(doc.load_page(i)) for i in indices]
+
 
 @dataclass
 class ExtractedAsset:
@@ -29,9 +100,16 @@ class ExtractedAsset:
     caption: str = ""
     content: bytes | str = field(default=b"")  # Image bytes or table HTML/markdown
     metadata: dict = field(default_factory=dict)
+    # Earlier asset with identical content; its stored file is shared
+    duplicate_of: ExtractedAsset | None = field(default=None, repr=False)
 
     def get_relative_path(self) -> str:
-        """Get the relative path for this asset following naming conventions."""
+        """Get the relative path for this asset following naming conventions.
+        
+        Duplicates point at the file stored for the asset they duplicate.
+        """
+        if self.duplicate_of is not None:
+            return self.duplicate_of.get_relative_path()
         return f"{self.get_asset_dir()}/{self.get_filename()}"
     
     def get_asset_dir(self) -> str:
@@ -87,13 +165,30 @@ class ExtractedAsset:
 class AssetExtractor:
     """Extracts images and tables from PDFs using PyMuPDF or Marker backends."""
     
-    def __init__(self, backend: Literal["pymupdf", "marker"] = "pymupdf"):
+    def __init__(
+        self,
+        backend: Literal["pymupdf", "marker"] = "pymupdf",
+        workers: int = 1,
+        table_scan: TableScanMode = "recall",
+    ):
         """Initialize the asset extractor.
         
         Args:
             backend: The extraction backend to use ("pymupdf" or "marker")
+            workers: Processes used to convert extracted images to PNG and
+                to search candidate pages for tables
+            table_scan: Which pages find_tables runs on (pymupdf backend):
+                "recall" skips only pages without vector graphics and finds
+                the same tables as "all"; "speed" also skips ruled pages
+                without a grid or columnar text (see preflight.TableScanMode)
         """
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if table_scan not in get_args(TableScanMode):
+            raise ValueError(f"Unknown table_scan mode: {table_scan}")
         self.backend = backend
+        self.workers = workers
+        self.table_scan = table_scan
         self._image_counter: dict[int, int] = {}
         self._table_counter: dict[int, int] = {}
     
@@ -118,6 +213,7 @@ class AssetExtractor:
         doc_id: str,
         min_width: int = 50,
         min_height: int = 50,
+        session: PdfSession | None = None,
     ) -> list[ExtractedAsset]:
         """Extract images from a PDF file.
         
@@ -126,6 +222,7 @@ class AssetExtractor:
             doc_id: Document ID for asset naming
             min_width: Minimum image width to extract (filters out icons)
             min_height: Minimum image height to extract
+            session: Optional open PdfSession for pdf_path (pymupdf backend)
             
         Returns:
             List of extracted image assets
@@ -133,7 +230,9 @@ class AssetExtractor:
         self._reset_counters()
         
         if self.backend == "pymupdf":
-            return self._extract_images_pymupdf(pdf_path, doc_id, min_width, min_height)
+            return self._extract_images_pymupdf(
+                pdf_path, doc_id, min_width, min_height, session=session
+            )
         elif self.backend == "marker":
             return self._extract_images_marker(pdf_path, doc_id, min_width, min_height)
         else:
@@ -145,10 +244,22 @@ class AssetExtractor:
         doc_id: str,
         min_width: int,
         min_height: int,
+        session: PdfSession | None = None,
     ) -> list[ExtractedAsset]:
-        """Extract images using PyMuPDF."""
+        """Extract images using PyMuPDF.
+        
+        Each xref is extracted once, and images with identical bytes (the
+        same logo embedded under several xrefs) are PNG-converted and stored
+        once: later placements become duplicates of the first one (see
+        ExtractedAsset.duplicate_of). Conversions of the unique images run on
+        ``self.workers`` processes.
+        """
         assets: list[ExtractedAsset] = []
-        doc = fitz.open(pdf_path)
+        doc = session.doc if session is not None else fitz.open(pdf_path)
+        # xref -> (sha256 of the raw bytes, original extension)
+        xref_digests: dict[int, tuple[str, str]] = {}
+        # sha256 -> raw bytes of every image that is still to be converted
+        raw_images: dict[str, bytes] = {}
         
         try:
             for page_num in range(doc.page_count):
@@ -157,19 +268,30 @@ class AssetExtractor:
                 
                 # Get image list
                 image_list = page.get_images(full=True)
+                if not image_list:
+                    continue
+                
+                # Layout dict shared by bbox and caption lookup of every image
+                page_dict = session.page_dict(page_num) if session is not None else None
                 
                 for img_index, img in enumerate(image_list):
                     xref = img[0]
                     
                     try:
-                        # Extract image
-                        base_image = doc.extract_image(xref)
-                        image_bytes = base_image["image"]
-                        image_ext = base_image["ext"]
+                        if xref not in xref_digests:
+                            base_image = doc.extract_image(xref)
+                            image_bytes = base_image["image"]
+                            digest = hashlib.sha256(image_bytes).hexdigest()
+                            xref_digests[xref] = (digest, base_image["ext"])
+                            raw_images.setdefault(digest, image_bytes)
+                        digest, image_ext = xref_digests[xref]
+                        
+                        if page_dict is None:
+                            page_dict = page.get_text("dict")
                         
                         # Get image dimensions from the page
                         # Try to find the bbox for this image
-                        bbox = self._find_image_bbox(page, xref)
+                        bbox = self._find_image_bbox(page, xref, page_dict=page_dict)
                         
                         # Skip small images (likely icons)
                         if bbox:
@@ -178,14 +300,10 @@ class AssetExtractor:
                             if width < min_width or height < min_height:
                                 continue
                         
-                        # Convert to PNG if needed
-                        if image_ext != "png":
-                            image_bytes = self._convert_to_png(image_bytes)
-                        
                         asset_id = self._generate_image_id(page_number)
                         
                         # Try to find caption
-                        caption = self._find_caption(page, bbox) if bbox else ""
+                        caption = self._find_caption(page, bbox, page_dict=page_dict) if bbox else ""
                         
                         asset = ExtractedAsset(
                             id=asset_id,
@@ -195,10 +313,10 @@ class AssetExtractor:
                             doc_id=doc_id,
                             format="png",
                             caption=caption,
-                            content=image_bytes,
                             metadata={
                                 "original_ext": image_ext,
                                 "xref": xref,
+                                "sha256": digest,
                             },
                         )
                         assets.append(asset)
@@ -208,7 +326,26 @@ class AssetExtractor:
                         continue
                         
         finally:
-            doc.close()
+            if session is None:
+                doc.close()
+        
+        # Convert each distinct image once; repeated placements share the bytes
+        stored: dict[str, ExtractedAsset] = {}
+        for asset in assets:
+            digest = asset.metadata["sha256"]
+            if digest in stored:
+                asset.duplicate_of = stored[digest]
+            else:
+                stored[digest] = asset
+        
+        to_convert = [
+            digest for digest, asset in stored.items()
+            if asset.metadata["original_ext"] != "png"
+        ]
+        converted = self._convert_many_to_png([raw_images[d] for d in to_convert])
+        png_bytes = {**raw_images, **dict(zip(to_convert, converted))}
+        for asset in assets:
+            asset.content = png_bytes[asset.metadata["sha256"]]
         
         return assets
     
@@ -216,63 +353,48 @@ class AssetExtractor:
         self,
         page: fitz.Page,
         xref: int,
+        page_dict: dict[str, Any] | None = None,
     ) -> tuple[float, float, float, float] | None:
-        """Find the bounding box of an image on a page."""
-        # Get all drawings and images on the page
-        rect = None
-        
-        # Check for images in page content
-        for img in page.get_images(full=True):
-            if img[0] == xref:
-                # Try to find the bbox from page blocks
-                blocks = page.get_text("dict")["blocks"]
-                for block in blocks:
-                    if block.get("type") == 1:  # Image block
-                        # This is an image block
-                        bbox = block.get("bbox")
-                        if bbox:
-                            return (bbox[0], bbox[1], bbox[2], bbox[3])
+        """Find the bounding box of an image on a page.
+        
+        ``xref`` must be one of the page's images. ``page_dict`` is an
+        already-decoded ``get_text("dict")`` for the page, used instead of
+        decoding the page layout again.
+        """
+        if page_dict is None:
+            page_dict = page.get_text("dict")
+        for block in page_dict["blocks"]:
+            if block.get("type") == 1:  # Image block
+                bbox = block.get("bbox")
+                if bbox:
+                    return (bbox[0], bbox[1], bbox[2], bbox[3])
         
         # Fallback: use page rect
         return None
     
     def _convert_to_png(self, image_bytes: bytes) -> bytes:
-        """Convert image bytes to PNG format.
-        
-        Handles various image modes including CMYK, RGBA, and palette-based images.
-        CMYK images are converted to RGB since PNG doesn't support CMYK.
-        """
-        try:
-            from PIL import Image
-            import io
-            
-            img = Image.open(io.BytesIO(image_bytes))
-            
-            # Convert to RGB if necessary (PNG only supports RGB/RGBA/L modes)
-            # CMYK must be converted to RGB since PNG doesn't support CMYK
-            if img.mode == "RGBA":
-                # Preserve transparency by creating RGB with white background
-                background = Image.new("RGB", img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[3])  # 3 is alpha channel
-                img = background
-            elif img.mode in ("CMYK", "P", "LA", "L"):
-                # Convert all other modes to RGB
-                img = img.convert("RGB")
-            
-            output = io.BytesIO()
-            img.save(output, format="PNG")
-            return output.getvalue()
-        except Exception:
-            # If conversion fails for any reason, return original bytes
-            # This ensures we don't lose data even if conversion fails
-            return image_bytes
+        """Convert image bytes to PNG format (see convert_to_png)."""
+        return convert_to_png(image_bytes)
+    
+    def _convert_many_to_png(self, images: list[bytes]) -> list[bytes]:
+        """Convert images to PNG, on ``self.workers`` processes if > 1."""
+        if self.workers > 1 and len(images) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                return list(pool.map(convert_to_png, images))
+        return [self._convert_to_png(image) for image in images]
     
     def _find_caption(
         self,
         page: fitz.Page,
         bbox: tuple[float, float, float, float] | None,
+        page_dict: dict[str, Any] | None = None,
     ) -> str:
-        """Try to find a caption for an image/table near the given bbox."""
+        """Try to find a caption for an image/table near the given bbox.
+        
+        With ``page_dict`` (the page's cached ``get_text("dict")``) the text
+        below the bbox is read from the layout; the page is only extracted
+        again, clipped to the caption area, when a text span crosses it.
+        """
         if not bbox:
             return ""
         
@@ -284,7 +406,11 @@ class AssetExtractor:
             bbox[3] + 30,  # 30 points below
         )
         
-        caption_text = page.get_text("text", clip=caption_area)
+        caption_text = None
+        if page_dict is not None:
+            caption_text = _clip_layout_text(page_dict, caption_area)
+        if caption_text is None:
+            caption_text = page.get_text("text", clip=caption_area)
         caption_text = caption_text.strip()
         
         # Look for common caption patterns
@@ -377,12 +503,14 @@ class AssetExtractor:
         self,
         pdf_path: Path,
         doc_id: str,
+        session: PdfSession | None = None,
     ) -> list[ExtractedAsset]:
         """Extract tables from a PDF file.
         
         Args:
             pdf_path: Path to the PDF file
             doc_id: Document ID for asset naming
+            session: Optional open PdfSession for pdf_path (pymupdf backend)
             
         Returns:
             List of extracted table assets
@@ -390,7 +518,7 @@ class AssetExtractor:
         self._reset_counters()
         
         if self.backend == "pymupdf":
-            return self._extract_tables_pymupdf(pdf_path, doc_id)
+            return self._extract_tables_pymupdf(pdf_path, doc_id, session=session)
         elif self.backend == "marker":
             return self._extract_tables_marker(pdf_path, doc_id)
         else:
@@ -400,59 +528,95 @@ class AssetExtractor:
         self,
         pdf_path: Path,
         doc_id: str,
+        session: PdfSession | None = None,
     ) -> list[ExtractedAsset]:
-        """Extract tables using PyMuPDF."""
+        """Extract tables using PyMuPDF.
+        
+        find_tables is by far the most expensive PyMuPDF call, so it only
+        runs on the pages a cheap scan of the whole document keeps (see
+        ``table_scan``); with ``workers`` > 1 those pages are searched by
+        worker processes in shards of TABLE_SHARD_PAGES.
+        """
         assets: list[ExtractedAsset] = []
-        doc = fitz.open(pdf_path)
+        doc = session.doc if session is not None else fitz.open(pdf_path)
         
         try:
-            for page_num in range(doc.page_count):
-                page = doc.load_page(page_num)
-                page_number = page_num + 1
-                
-                # Find tables
-                tables = page.find_tables()
-                
-                if tables and tables.tables:
-                    for table_idx, table in enumerate(tables.tables):
-                        try:
-                            # Extract table data
-                            df = table.to_pandas()
-                            
-                            # Convert to HTML
-                            html_content = self._dataframe_to_html(df, table_idx + 1)
-                            
-                            asset_id = self._generate_table_id(page_number)
-                            
-                            # Try to find caption
-                            bbox = table.bbox
-                            caption = self._find_caption(page, bbox) if bbox else ""
-                            
-                            asset = ExtractedAsset(
-                                id=asset_id,
-                                type="table",
-                                page=page_number,
-                                bbox=bbox if bbox else (0, 0, 0, 0),
-                                doc_id=doc_id,
-                                format="html",
-                                caption=caption,
-                                content=html_content,
-                                metadata={
-                                    "rows": len(df),
-                                    "cols": len(df.columns),
-                                    "source": "pymupdf",
-                                },
-                            )
-                            assets.append(asset)
-                            
-                        except Exception:
-                            continue
-                            
+            candidates = scan_table_candidates(doc, self.table_scan)
+            if self.workers > 1 and len(candidates) > TABLE_SHARD_PAGES:
+                shards = [
+                    candidates[i:i + TABLE_SHARD_PAGES]
+                    for i in range(0, len(candidates), TABLE_SHARD_PAGES)
+                ]
+                # Workers reopen the file the session (if any) has open
+                source = session.pdf_path if session is not None else pdf_path
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    futures = [pool.submit(find_tables_on_pages, source, shard) for shard in shards]
+                    found = [tables for future in futures for tables in future.result()]
+            else:
+                found = [self._find_page_tables(doc.load_page(i)) for i in candidates]
         finally:
-            doc.close()
+            if session is None:
+                doc.close()
+        
+        for page_num, tables in zip(candidates, found):
+            page_number = page_num + 1
+            for table in tables:
+                asset = ExtractedAsset(
+                    id=self._generate_table_id(page_number),
+                    type="table",
+                    page=page_number,
+                    bbox=table["bbox"],
+                    doc_id=doc_id,
+                    format="html",
+                    caption=table["caption"],
+                    content=table["html"],
+                    metadata={
+                        "rows": table["rows"],
+                        "cols": table["cols"],
+                        "source": "pymupdf",
+                    },
+                )
+                assets.append(asset)
         
         return assets
     
+    def _find_page_tables(self, page: fitz.Page) -> list[dict[str, Any]]:
+        """Run find_tables on one page and convert each table to HTML.
+        
+        Returns picklable dicts (bbox, html, caption, rows, cols) so worker
+        processes can send them back; tables that fail to convert are skipped.
+        """
+        results: list[dict[str, Any]] = []
+        
+        # Find tables
+        tables = page.find_tables()
+        
+        if tables and tables.tables:
+            for table_idx, table in enumerate(tables.tables):
+                try:
+                    # Extract table data
+                    df = table.to_pandas()
+                    
+                    # Convert to HTML
+                    html_content = self._dataframe_to_html(df, table_idx + 1)
+                    
+                    # Try to find caption
+                    bbox = table.bbox
+                    caption = self._find_caption(page, bbox) if bbox else ""
+                    
+                    results.append({
+                        "bbox": tuple(bbox) if bbox else (0, 0, 0, 0),
+                        "html": html_content,
+                        "caption": caption,
+                        "rows": len(df),
+                        "cols": len(df.columns),
+                    })
+                    
+                except Exception:
+                    continue
+        
+        return results
+    
     def _dataframe_to_html(self, df: "pandas.DataFrame", table_num: int) -> str:
         """Convert a pandas DataFrame to styled HTML table."""
         # Handle multi-index if present
@@ -570,11 +734,16 @@ class AssetExtractor:
             output_dir: Base output directory
             
         Returns:
-            List of paths to saved files
+            List of paths to saved files (one per stored file, so images
+            that duplicate an earlier asset add no entry)
         """
         saved_paths: list[Path] = []
         
         for asset in assets:
+            # Duplicates share the file written for the original
+            if asset.duplicate_of is not None:
+                continue
+            
             # Determine subdirectory based on type
             if asset.type == "image":
                 asset_dir = output_dir / "assets" / "images" / asset.doc_id
@@ -605,6 +774,7 @@ def extract_assets_from_pdf(
     backend: Literal["pymupdf", "marker"] = "pymupdf",
     extract_images: bool = True,
     extract_tables: bool = True,
+    workers: int = 1,
 ) -> dict[str, list[ExtractedAsset]]:
     """Convenience function to extract and save all assets from a PDF.
     
@@ -615,11 +785,12 @@ def extract_assets_from_pdf(
         backend: Extraction backend to use
         extract_images: Whether to extract images
         extract_tables: Whether to extract tables
+        workers: Worker processes for PNG conversion and table search
         
     Returns:
         Dictionary with "images" and "tables" keys containing extracted assets
     """
-    extractor = AssetExtractor(backend=backend)
+    extractor = AssetExtractor(backend=backend, workers=workers)
     result: dict[str, list[ExtractedAsset]] = {
         "images": [],
         "tables": [],
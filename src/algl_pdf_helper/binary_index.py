@@ -0,0 +1,399 @@
+"""
+Binary columnar layout for PDF indexes.
+
+``chunks.json``/``index.json`` store every chunk's text and embedding as JSON,
+so opening an index means parsing all of it. The binary layout splits the
+same data into memory-mappable columns under ``<out_dir>/index-bin/``:
+
+- ``header.json``: index id, embedding model, dimension, chunk and doc ids
+- ``embeddings.npy``: float32 matrix of shape (chunkCount, dim)
+- ``chunks.npy``: fixed-width table of (doc, page, text/id byte offsets)
+- ``text.bin``: all chunk texts, UTF-8, back to back
+- ``chunk_ids.bin``: all chunk ids, UTF-8, back to back
+
+``BinaryChunkIndex.open`` maps these files without reading them, so opening
+a large index costs a few page faults; chunks are decoded only when asked for.
+
+Example:
+    write_binary_index(chunks, out_dir, index_id=doc.indexId)
+    with BinaryChunkIndex.open(out_dir) as index:
+        print(len(index), index.text(0))
+        matrix = index.embeddings  # np.memmap, no copy
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import mmap
+import shutil
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .models import PdfIndexChunk
+
+
+BINARY_INDEX_FORMAT = "algl-binary-index-v1"
+BINARY_INDEX_DIRNAME = "index-bin"
+
+CHUNK_TABLE_DTYPE = np.dtype([
+    ("doc", "<i4"),
+    ("page", "<i4"),
+    ("text_start", "<i8"),
+    ("text_end", "<i8"),
+    ("id_start", "<i8"),
+    ("id_end", "<i8"),
+])
+
+
+def binary_index_dir(out_dir: Path) -> Path:
+    """Return the binary index directory inside an index output directory."""
+    return Path(out_dir) / BINARY_INDEX_DIRNAME
+
+
+def has_binary_index(out_dir: Path) -> bool:
+    return (binary_index_dir(out_dir) / "header.json").exists()
+
+
+def remove_binary_index(out_dir: Path) -> None:
+    """Delete the binary layout from an index output directory, if present."""
+    shutil.rmtree(binary_index_dir(out_dir), ignore_errors=True)
+
+
+def _start_binary_index(out_dir: Path) -> Path:
+    """Create the binary index directory and mark it incomplete.
+
+    header.json is written last, so an index being (re)written never has
+    one; a reader sees either the finished index or none at all.
+    """
+    bin_dir = binary_index_dir(out_dir)
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    (bin_dir / "header.json").unlink(missing_ok=True)
+    return bin_dir
+
+
+def _offsets(blobs: list[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    ends = np.cumsum([len(b) for b in blobs], dtype=np.int64)
+    starts = ends - np.fromiter((len(b) for b in blobs), dtype=np.int64, count=len(blobs))
+    return starts, ends
+
+
+def write_binary_index(
+    chunks: Sequence[PdfIndexChunk],
+    out_dir: Path,
+    *,
+    index_id: str = "",
+    embedding_model_id: str = "",
+    embedding_dim: int | None = None,
+) -> Path:
+    """Write chunks in the binary columnar layout.
+
+    Args:
+        chunks: Chunks in index order
+        out_dir: Index output directory; files go to out_dir/index-bin
+        index_id: Index id recorded in the header
+        embedding_model_id: Embedding model id recorded in the header
+        embedding_dim: Embedding width, required when there are no chunks
+            to infer it from
+
+    Returns:
+        Path of the binary index directory
+
+    Raises:
+        ValueError: If only some chunks have embeddings or widths differ
+    """
+    bin_dir = _start_binary_index(out_dir)
+
+    doc_ids: list[str] = []
+    doc_index: dict[str, int] = {}
+    for chunk in chunks:
+        if chunk.docId not in doc_index:
+            doc_index[chunk.docId] = len(doc_ids)
+            doc_ids.append(chunk.docId)
+
+    with_embedding = sum(1 for c in chunks if c.embedding is not None)
+    if with_embedding not in (0, len(chunks)):
+        raise ValueError("Either all chunks or none must have embeddings")
+    has_embeddings = bool(chunks) and with_embedding == len(chunks)
+    if has_embeddings:
+        embeddings = np.asarray([c.embedding for c in chunks], dtype=np.float32)
+        if embeddings.ndim != 2:
+            raise ValueError("All chunk embeddings must have the same dimension")
+        dim = embeddings.shape[1]
+    else:
+        dim = embedding_dim or 0
+        embeddings = np.zeros((len(chunks), dim), dtype=np.float32)
+
+    texts = [c.text.encode("utf-8") for c in chunks]
+    ids = [c.chunkId.encode("utf-8") for c in chunks]
+    table = np.empty(len(chunks), dtype=CHUNK_TABLE_DTYPE)
+    table["doc"] = [doc_index[c.docId] for c in chunks]
+    table["page"] = [c.page for c in chunks]
+    table["text_start"], table["text_end"] = _offsets(texts)
+    table["id_start"], table["id_end"] = _offsets(ids)
+
+    np.save(bin_dir / "embeddings.npy", embeddings)
+    np.save(bin_dir / "chunks.npy", table)
+    (bin_dir / "text.bin").write_bytes(b"".join(texts))
+    (bin_dir / "chunk_ids.bin").write_bytes(b"".join(ids))
+
+    _write_header(
+        bin_dir,
+        index_id=index_id,
+        embedding_model_id=embedding_model_id,
+        dim=dim,
+        has_embeddings=has_embeddings,
+        chunk_count=len(chunks),
+        doc_ids=doc_ids,
+    )
+    return bin_dir
+
+
+def write_binary_index_stream(
+    chunks: Iterable[PdfIndexChunk],
+    chunk_count: int,
+    out_dir: Path,
+    *,
+    index_id: str = "",
+    embedding_model_id: str = "",
+    embedding_dim: int | None = None,
+) -> Path:
+    """Write the binary layout from a chunk stream without holding it.
+
+    Produces the same files as write_binary_index, but columns are filled
+    in place (``.npy`` files via ``open_memmap``, blobs appended), so memory
+    stays flat however many chunks there are.
+
+    Args:
+        chunks: Chunks in index order, iterated once
+        chunk_count: Number of chunks the iterable yields
+        out_dir: Index output directory; files go to out_dir/index-bin
+        index_id: Index id recorded in the header
+        embedding_model_id: Embedding model id recorded in the header
+        embedding_dim: Embedding width, required when there are no chunks
+            or no embeddings to infer it from
+
+    Returns:
+        Path of the binary index directory
+
+    Raises:
+        ValueError: If only some chunks have embeddings, widths differ or
+            the stream length does not match chunk_count
+    """
+    bin_dir = _start_binary_index(out_dir)
+
+    stream = iter(chunks)
+    first = next(stream, None)
+    has_embeddings = first is not None and first.embedding is not None
+    dim = len(first.embedding) if has_embeddings else (embedding_dim or 0)
+
+    embeddings = np.lib.format.open_memmap(
+        bin_dir / "embeddings.npy", mode="w+", dtype=np.float32, shape=(chunk_count, dim)
+    )
+    table = np.lib.format.open_memmap(
+        bin_dir / "chunks.npy", mode="w+", dtype=CHUNK_TABLE_DTYPE, shape=(chunk_count,)
+    )
+    doc_ids: list[str] = []
+    doc_index: dict[str, int] = {}
+    written = 0
+    text_end = id_end = 0
+    with open(bin_dir / "text.bin", "wb") as text_file, open(bin_dir / "chunk_ids.bin", "wb") as id_file:
+        for row, chunk in enumerate(itertools.chain([first] if first is not None else [], stream)):
+            if row >= chunk_count:
+                raise ValueError("More chunks than chunk_count")
+            if (chunk.embedding is not None) != has_embeddings:
+                raise ValueError("Either all chunks or none must have embeddings")
+            if has_embeddings:
+                if len(chunk.embedding) != dim:
+                    raise ValueError("All chunk embeddings must have the same dimension")
+                embeddings[row] = chunk.embedding
+            if chunk.docId not in doc_index:
+                doc_index[chunk.docId] = len(doc_ids)
+                doc_ids.append(chunk.docId)
+            text = chunk.text.encode("utf-8")
+            chunk_id = chunk.chunkId.encode("utf-8")
+            text_file.write(text)
+            id_file.write(chunk_id)
+            table[row] = (
+                doc_index[chunk.docId],
+                chunk.page,
+                text_end,
+                text_end + len(text),
+                id_end,
+                id_end + len(chunk_id),
+            )
+            text_end += len(text)
+            id_end += len(chunk_id)
+            written += 1
+    if written != chunk_count:
+        raise ValueError(f"Expected {chunk_count} chunks, got {written}")
+    embeddings.flush()
+    table.flush()
+    del embeddings, table
+
+    _write_header(
+        bin_dir,
+        index_id=index_id,
+        embedding_model_id=embedding_model_id,
+        dim=dim,
+        has_embeddings=has_embeddings,
+        chunk_count=chunk_count,
+        doc_ids=doc_ids,
+    )
+    return bin_dir
+
+
+def _write_header(
+    bin_dir: Path,
+    *,
+    index_id: str,
+    embedding_model_id: str,
+    dim: int,
+    has_embeddings: bool,
+    chunk_count: int,
+    doc_ids: list[str],
+) -> None:
+    header = {
+        "format": BINARY_INDEX_FORMAT,
+        "indexId": index_id,
+        "embeddingModelId": embedding_model_id,
+        "embeddingDim": dim,
+        "hasEmbeddings": has_embeddings,
+        "chunkCount": chunk_count,
+        "docIds": doc_ids,
+    }
+    # Header last: its presence marks a complete index
+    (bin_dir / "header.json").write_text(json.dumps(header, indent=2), encoding="utf-8")
+
+
+class _Blob:
+    """Read-only memory map of a byte blob (empty files cannot be mapped)."""
+
+    def __init__(self, path: Path):
+        self._file = None
+        self._map: mmap.mmap | bytes = b""
+        if path.stat().st_size:
+            self._file = open(path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def decode(self, start: int, end: int) -> str:
+        return self._map[start:end].decode("utf-8")
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+
+
+class BinaryChunkIndex:
+    """Memory-mapped reader for the binary index layout.
+
+    Nothing but the header is read on open; ``embeddings`` and the chunk
+    table are ``np.memmap`` views and texts are decoded per access.
+    """
+
+    def __init__(self, bin_dir: Path):
+        self.bin_dir = Path(bin_dir)
+        header_path = self.bin_dir / "header.json"
+        if not header_path.exists():
+            raise FileNotFoundError(f"Binary index not found: {self.bin_dir}")
+        self.header: dict[str, Any] = json.loads(header_path.read_text(encoding="utf-8"))
+        if self.header.get("format") != BINARY_INDEX_FORMAT:
+            raise ValueError(
+                f"Unsupported binary index format: {self.header.get('format')!r}"
+            )
+        self.doc_ids: list[str] = list(self.header["docIds"])
+        self._embeddings = np.load(self.bin_dir / "embeddings.npy", mmap_mode="r")
+        self._table = np.load(self.bin_dir / "chunks.npy", mmap_mode="r")
+        self._texts = _Blob(self.bin_dir / "text.bin")
+        self._ids = _Blob(self.bin_dir / "chunk_ids.bin")
+        self._id_lookup: dict[str, int] | None = None
+
+    @classmethod
+    def open(cls, path: Path) -> BinaryChunkIndex:
+        """Open an index from its output directory or the index-bin directory."""
+        path = Path(path)
+        if not (path / "header.json").exists():
+            path = binary_index_dir(path)
+        return cls(path)
+
+    def __enter__(self) -> BinaryChunkIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._texts.close()
+        self._ids.close()
+
+    def __len__(self) -> int:
+        return int(self.header["chunkCount"])
+
+    @property
+    def index_id(self) -> str:
+        return self.header.get("indexId", "")
+
+    @property
+    def embedding_dim(self) -> int:
+        return int(self.header["embeddingDim"])
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """(chunkCount, dim) float32 matrix, memory-mapped."""
+        return self._embeddings
+
+    @property
+    def pages(self) -> np.ndarray:
+        return self._table["page"]
+
+    @property
+    def doc_indices(self) -> np.ndarray:
+        """Per-chunk index into ``doc_ids``."""
+        return self._table["doc"]
+
+    def text(self, i: int) -> str:
+        row = self._table[i]
+        return self._texts.decode(int(row["text_start"]), int(row["text_end"]))
+
+    def chunk_id(self, i: int) -> str:
+        row = self._table[i]
+        return self._ids.decode(int(row["id_start"]), int(row["id_end"]))
+
+    def doc_id(self, i: int) -> str:
+        return self.doc_ids[int(self._table[i]["doc"])]
+
+    def page(self, i: int) -> int:
+        return int(self._table[i]["page"])
+
+    def index_of(self, chunk_id: str) -> int:
+        """Row of a chunk id. The id lookup is built on first use."""
+        if self._id_lookup is None:
+            self._id_lookup = {self.chunk_id(i): i for i in range(len(self))}
+        try:
+            return self._id_lookup[chunk_id]
+        except KeyError:
+            raise KeyError(f"Chunk not found: {chunk_id}") from None
+
+    def get_chunk(self, i: int) -> PdfIndexChunk:
+        return PdfIndexChunk(
+            chunkId=self.chunk_id(i),
+            docId=self.doc_id(i),
+            page=self.page(i),
+            text=self.text(i),
+            embedding=(
+                self._embeddings[i].tolist() if self.header["hasEmbeddings"] else None
+            ),
+        )
+
+    def iter_chunks(self) -> Iterator[PdfIndexChunk]:
+        for i in range(len(self)):
+            yield self.get_chunk(i)
+
+    def chunk_dicts(self) -> list[dict[str, Any]]:
+        """All chunks as chunks.json-style dicts (embeddings are float32-rounded)."""
+        return [chunk.model_dump() for chunk in self.iter_chunks()]
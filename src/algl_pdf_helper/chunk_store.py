@@ -0,0 +1,115 @@
+"""
+Disk-backed chunk accumulator for streaming index builds.
+
+A regular build keeps every PdfIndexChunk in a list, sorts it and
+serializes it (twice: chunks.json and index.json), so peak memory is
+several copies of the corpus. ``ChunkRunStore`` stands in for that list:
+each batch of chunks handed to ``extend`` (one document, or one page shard
+of it) is sorted and written as a JSONL "run" file, then dropped.
+
+Reading merges the runs back in ``(docId, page, chunkId)`` order, exactly
+the order ``build_index`` sorts into: documents one at a time in docId
+order, and the runs of a document with ``heapq.merge``. Only one line per
+open run is in memory while writing the index files.
+
+Example:
+    with ChunkRunStore(out_dir) as store:
+        store.extend(chunks_of_one_document)
+        for encoded in store.iter_encoded():
+            array.write_encoded(encoded)
+"""
+
+from __future__ import annotations
+
+import heapq
+import shutil
+import tempfile
+import weakref
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from pathlib import Path
+
+from .models import PdfIndexChunk
+from .optimized_indexer import fast_json_dumps, fast_json_loads
+
+
+class ChunkRunStore:
+    """Chunks spilled to sorted JSONL runs in a temporary directory.
+
+    The directory is created under ``parent_dir`` (the index output
+    directory, so runs live on the same disk) and removed by ``close()``,
+    or when the store is garbage collected.
+
+    Run lines are ``<page>\\t<chunkId>\\t<compact chunk JSON>``; the prefix
+    is the merge key so lines are never parsed while merging. JSON escapes
+    tabs inside strings, so the first two tabs always delimit the key.
+    """
+
+    def __init__(self, parent_dir: Path):
+        Path(parent_dir).mkdir(parents=True, exist_ok=True)
+        self.run_dir = Path(tempfile.mkdtemp(prefix=".chunk-runs-", dir=parent_dir))
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self.run_dir, ignore_errors=True)
+        self._runs: dict[str, list[Path]] = {}
+        self._counts: dict[str, int] = {}
+        self._run_count = 0
+
+    def extend(self, chunks: Iterable[PdfIndexChunk]) -> None:
+        """Write a batch of chunks as one sorted run per document."""
+        by_doc: dict[str, list[PdfIndexChunk]] = {}
+        for chunk in chunks:
+            by_doc.setdefault(chunk.docId, []).append(chunk)
+        for doc_id, doc_chunks in by_doc.items():
+            doc_chunks.sort(key=lambda c: (c.page, c.chunkId))
+            path = self.run_dir / f"run-{self._run_count:06d}.jsonl"
+            self._run_count += 1
+            with open(path, "w", encoding="utf-8") as f:
+                for chunk in doc_chunks:
+                    f.write(f"{chunk.page}\t{chunk.chunkId}\t")
+                    f.write(fast_json_dumps(chunk.model_dump()))
+                    f.write("\n")
+            self._runs.setdefault(doc_id, []).append(path)
+            self._counts[doc_id] = self._counts.get(doc_id, 0) + len(doc_chunks)
+
+    def close(self) -> None:
+        """Delete the run files."""
+        self._cleanup()
+
+    def __enter__(self) -> ChunkRunStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    @property
+    def doc_ids(self) -> list[str]:
+        """Documents with at least one chunk, in index order."""
+        return sorted(doc_id for doc_id, n in self._counts.items() if n)
+
+    def iter_encoded(self, doc_id: str | None = None) -> Iterator[str]:
+        """Compact JSON of each chunk in index order (one document if given)."""
+        for current in self.doc_ids if doc_id is None else [doc_id]:
+            with ExitStack() as stack:
+                runs = [
+                    _read_run(stack.enter_context(open(path, encoding="utf-8")))
+                    for path in self._runs.get(current, [])
+                ]
+                for _, _, encoded in heapq.merge(*runs):
+                    yield encoded
+
+    def iter_chunks(self, doc_id: str | None = None) -> Iterator[PdfIndexChunk]:
+        """Chunks in index order (one document if given)."""
+        for encoded in self.iter_encoded(doc_id):
+            yield PdfIndexChunk(**fast_json_loads(encoded))
+
+
+def _read_run(f) -> Iterator[tuple[int, str, str]]:
+    for line in f:
+        page, chunk_id, encoded = line.rstrip("\n").split("\t", 2)
+        yield int(page), chunk_id, encoded
+
+
+# Where build_index collects chunks: a list, or runs on disk when streaming
+ChunkSink = list[PdfIndexChunk] | ChunkRunStore
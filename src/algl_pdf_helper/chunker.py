@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import Any
 
 
@@ -18,6 +22,7 @@ class ChunkResult:
     source_block_ids: list[str]
     char_offset_start: int
     char_offset_end: int
+    page: int | None = None
     
     def to_tuple(self) -> tuple[str, str]:
         """Convert to tuple for backward compatibility."""
@@ -37,6 +42,12 @@ MIN_CHUNK_WORDS = 20
 
 # Sentence-ending punctuation for boundary detection
 SENTENCE_ENDINGS = {'.', '!', '?', '。', '！', '？'}
+_SENTENCE_END_RE = re.compile("[" + re.escape("".join(sorted(SENTENCE_ENDINGS))) + "]")
+
+# find_sentence_boundary arguments used when snapping chunk ends
+_SNAP_BACK_CHARS = 20
+_SNAP_MIN_CUT_CHARS = 10
+_SNAP_MAX_SEARCH = 50
 
 
 def find_sentence_boundary(text: str, target_pos: int, max_search: int = 50) -> int:
@@ -151,68 +162,171 @@ def chunk_page_words_with_provenance(
     Returns:
         List of ChunkResult objects with full provenance
     """
-    words = [w for w in text.split() if w]
+    return _chunk_page(
+        PageWords.from_text(text),
+        doc_id=doc_id,
+        page=page,
+        chunk_words=chunk_words,
+        overlap_words=overlap_words,
+        source_block_ids=source_block_ids,
+        preserve_sentences=preserve_sentences,
+    )
+
+
+@dataclass(frozen=True)
+class PageWords:
+    """A page tokenized once for chunking.
+
+    ``joined`` is the page's words joined by single spaces, the string every
+    chunk text and character offset refers to. ``starts[i]`` is the offset
+    of word ``i`` in ``joined`` and ``sentence_ends`` the sorted offsets of
+    sentence-ending punctuation, so chunk offsets and sentence snapping are
+    lookups and bisects instead of re-joining and re-scanning the page.
+    """
+    words: list[str]
+    joined: str
+    starts: list[int]
+    sentence_ends: list[int]
+
+    @classmethod
+    def from_text(cls, text: str) -> PageWords:
+        words = text.split()
+        joined = " ".join(words)
+        starts = list(accumulate((len(w) + 1 for w in words[:-1]), initial=0)) if words else []
+        sentence_ends = [m.start() for m in _SENTENCE_END_RE.finditer(joined)]
+        return cls(words, joined, starts, sentence_ends)
+
+    def span(self, start: int, end: int) -> tuple[int, int]:
+        """Character span of words[start:end] in ``joined``."""
+        return self.starts[start], self.starts[end - 1] + len(self.words[end - 1])
+
+    def sentence_boundary(self, char_start: int, char_end: int, target_pos: int) -> int:
+        """find_sentence_boundary(joined[char_start:char_end], target_pos).
+
+        Positions are relative to ``char_start``. Words never contain
+        whitespace, so at most one space follows a sentence ending.
+        """
+        length = char_end - char_start
+        if target_pos >= length:
+            return length
+        target = char_start + target_pos
+        ends = self.sentence_ends
+
+        def after(end: int) -> int:
+            pos = end + 1
+            if pos < char_end and self.joined[pos] == " ":
+                pos += 1
+            return pos - char_start
+
+        forward_pos = backward_pos = target_pos
+        i = bisect_left(ends, target)
+        if i < len(ends) and ends[i] < char_start + min(length, target_pos + _SNAP_MAX_SEARCH):
+            forward_pos = after(ends[i])
+        i = bisect_right(ends, target) - 1
+        if i >= 0 and ends[i] > char_start + max(0, target_pos - _SNAP_MAX_SEARCH):
+            backward_pos = after(ends[i])
+
+        forward_dist = abs(forward_pos - target_pos)
+        backward_dist = abs(backward_pos - target_pos)
+        if forward_dist <= backward_dist and forward_dist <= _SNAP_MAX_SEARCH:
+            return forward_pos
+        if backward_dist <= _SNAP_MAX_SEARCH:
+            return backward_pos
+        return target_pos
+
+
+def _chunk_page(
+    page_words: PageWords,
+    *,
+    doc_id: str,
+    page: int,
+    chunk_words: int,
+    overlap_words: int,
+    source_block_ids: list[str] | None,
+    preserve_sentences: bool,
+) -> list[ChunkResult]:
+    """Chunk one tokenized page; see chunk_page_words_with_provenance."""
+    words = page_words.words
     if not words:
         return []
-    
+
     # Ensure chunk_words is at least MIN_CHUNK_WORDS
     chunk_words = max(chunk_words, MIN_CHUNK_WORDS)
-    
+
     # Ensure overlap is smaller than chunk size
     step = max(1, chunk_words - overlap_words)
+    # For now, associate all blocks with all chunks on the page
+    blocks = source_block_ids or []
     out: list[ChunkResult] = []
-    
+
     start = 0
-    chunk_index = 0
-    
     while start < len(words):
-        slice_words = words[start : start + chunk_words]
-        if not slice_words:
-            break
-        
-        chunk_index += 1
-        chunk_id = f"{doc_id}:p{page}:c{chunk_index}"
-        
-        # Join words into text
-        chunk_text = " ".join(slice_words)
-        
-        # Try to find sentence boundary if preserving sentences
-        if preserve_sentences and len(slice_words) == chunk_words:
-            adjusted_text = chunk_text
-            boundary_pos = find_sentence_boundary(chunk_text, len(chunk_text) - 20)
-            if boundary_pos < len(chunk_text) - 10:  # Only adjust if significant
-                adjusted_text = chunk_text[:boundary_pos].strip()
-                # Recalculate words for next iteration
-                adjusted_words = adjusted_text.split()
-                # Adjust step to account for shortened chunk
-                actual_step = max(1, len(adjusted_words) - overlap_words)
-            else:
-                actual_step = step
-        else:
-            actual_step = step
-        
-        # Calculate character offsets
-        char_start = len(" ".join(words[:start])) + (1 if start > 0 else 0)
-        char_end = char_start + len(chunk_text)
-        
-        # For now, associate all blocks with all chunks on the page
-        # In a more sophisticated implementation, we'd track which words
-        # came from which blocks
-        blocks = source_block_ids or []
-        
+        end = min(start + chunk_words, len(words))
+        char_start, char_end = page_words.span(start, end)
+
+        actual_step = step
+        if preserve_sentences and end - start == chunk_words:
+            length = char_end - char_start
+            boundary_pos = page_words.sentence_boundary(
+                char_start, char_end, length - _SNAP_BACK_CHARS
+            )
+            if boundary_pos < length - _SNAP_MIN_CUT_CHARS:  # Only adjust if significant
+                # Words (or word prefixes) before the boundary
+                kept = bisect_left(page_words.starts, char_start + boundary_pos, start, end) - start
+                actual_step = max(1, kept - overlap_words)
+
         out.append(ChunkResult(
-            chunk_id=chunk_id,
-            text=chunk_text,
+            chunk_id=f"{doc_id}:p{page}:c{len(out) + 1}",
+            text=page_words.joined[char_start:char_end],
             source_block_ids=blocks,
             char_offset_start=char_start,
             char_offset_end=char_end,
+            page=page,
         ))
-        
+
         if start + chunk_words >= len(words):
             break
-        
+
         start += actual_step
-    
+
+    return out
+
+
+def chunk_document(
+    *,
+    doc_id: str,
+    pages: Iterable[PageText | tuple[int, str]],
+    chunk_words: int,
+    overlap_words: int,
+    preserve_sentences: bool = True,
+) -> list[ChunkResult]:
+    """Chunk every page of a document in page order.
+
+    Equivalent to calling chunk_page_words_with_provenance on each page and
+    concatenating the results; each page is tokenized exactly once.
+
+    Args:
+        doc_id: Document identifier
+        pages: PageText objects or (page, text) tuples
+        chunk_words: Number of words per chunk
+        overlap_words: Number of words to overlap between chunks
+        preserve_sentences: Whether to try to end chunks at sentence boundaries
+
+    Returns:
+        List of ChunkResult objects for all pages
+    """
+    out: list[ChunkResult] = []
+    for item in pages:
+        page, text = (item.page, item.text) if isinstance(item, PageText) else item
+        out.extend(_chunk_page(
+            PageWords.from_text(text),
+            doc_id=doc_id,
+            page=page,
+            chunk_words=chunk_words,
+            overlap_words=overlap_words,
+            source_block_ids=None,
+            preserve_sentences=preserve_sentences,
+        ))
     return out
 
 
@@ -4,23 +4,19 @@ import json
 import os
 import warnings
 from pathlib import Path
+from typing import Literal
 
 import typer
 
-from .export_sqladapt import export_to_sqladapt, validate_handoff_integrity
-from .extract import (
-    check_extraction_quality,
-    check_text_coverage,
-    extract_pages_fitz,
-    extract_with_strategy,
-)
-from .indexer import build_index
-from .models import IndexBuildOptions, OutputConfig
-from .preflight import run_preflight, ExtractionStrategy
-from .quality_metrics import validate_text_quality
-from .structure_extractor import StructureExtractor
-from .mapping_generator import MappingGenerator
-from .mapping_workflow import MappingWorkflow
+from .extraction_cache import get_extraction_cache
+
+# Commands import the pipeline modules they need (PyMuPDF, pydantic models,
+# the generation stack) locally, so `algl-pdf --help` and light commands such
+# as `cache stats` do not pay for the rest; tests/test_import_time.py keeps
+# this in check.
+
+# Same values as preflight.ExtractionStrategy, which imports PyMuPDF
+ExtractionStrategy = Literal["direct", "ocrmypdf", "marker"]
 
 app = typer.Typer(add_completion=False)
 
@@ -31,7 +27,7 @@ try:
 except ImportError:
     pass  # Educational CLI is optional
 
-# Unit library commands are re-exported as top-level commands below (line ~1149)
+# Unit library commands are re-exported as top-level commands below
 
 
 def resolve_output_dir(output_dir: Path | None) -> Path:
@@ -43,6 +39,8 @@ def resolve_output_dir(output_dir: Path | None) -> Path:
     2. SQL_ADAPT_PUBLIC_DIR/textbook-static environment variable
     3. Error with helpful message
     """
+    from .models import OutputConfig
+
     config = OutputConfig(output_dir=output_dir)
     try:
         return config.resolve()
@@ -79,6 +77,44 @@ def index(
              "PDFs with text coverage above this threshold will skip OCR even when --ocr is used. "
              "Set to 1.0 to disable smart skip and always use OCR when requested.",
     ),
+    ocr_mode: str = typer.Option(
+        "document",
+        "--ocr-mode",
+        help="document: OCR the whole PDF when its text quality is poor; "
+             "pages: OCR only the pages without usable text (scanned pages, "
+             "broken encodings) and keep the rest",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Worker processes for extraction/chunking/embedding. "
+             "Documents and page-range shards are processed in parallel; "
+             "output is identical to the serial build.",
+    ),
+    extraction_cache: bool = typer.Option(
+        True,
+        help="Reuse cached text extraction and OCR output for unchanged PDFs "
+             "(see `algl-pdf cache`)",
+    ),
+    index_format: str = typer.Option(
+        "json",
+        "--index-format",
+        help="Index layout: json (chunks.json + index.json), binary "
+             "(memory-mappable index-bin/), or both",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Reuse the previous build in the output directory: unchanged PDFs "
+             "and unchanged pages are not re-processed (same indexId as a clean build)",
+    ),
+    streaming: bool = typer.Option(
+        False,
+        "--streaming",
+        help="Write chunks to disk as they are produced instead of holding the "
+             "whole corpus in memory (same output files)",
+    ),
 ):
     """Build PDF index to textbook-static format.
     
@@ -87,6 +123,18 @@ def index(
     OCR will be automatically skipped to avoid Tesseract errors on digital PDFs.
     Use --smart-skip-threshold=1.0 to force OCR regardless of quality.
     """
+    from .indexer import build_index
+    from .models import IndexBuildOptions
+
+    if index_format not in ("json", "binary", "both"):
+        typer.echo(f"❌ Unknown index format: {index_format}", err=True)
+        typer.echo("Valid formats: json, binary, both", err=True)
+        raise typer.Exit(1)
+    if ocr_mode not in ("document", "pages"):
+        typer.echo(f"❌ Unknown OCR mode: {ocr_mode}", err=True)
+        typer.echo("Valid modes: document, pages", err=True)
+        raise typer.Exit(1)
+
     out = resolve_output_dir(output_dir)
     
     opts = IndexBuildOptions(
@@ -104,6 +152,12 @@ def index(
         strip_headers=strip_headers,
         concepts_config=concepts_config,
         smart_skip_threshold=smart_skip_threshold,
+        ocr_mode=ocr_mode,
+        workers=workers,
+        cache=get_extraction_cache() if extraction_cache else None,
+        index_format=index_format,
+        incremental=incremental,
+        streaming=streaming,
     )
     typer.echo(f"✅ Wrote PDF index to: {out}")
     typer.echo(f"   Index ID: {doc.indexId}")
@@ -138,6 +192,10 @@ def check_quality(
     ),
 ):
     """Check text extraction quality of a PDF without processing."""
+    from .extract import check_extraction_quality, check_text_coverage, extract_pages_fitz
+    from .preflight import run_preflight
+    from .quality_metrics import validate_text_quality
+
     typer.echo(f"Checking quality of: {pdf_path.name}")
     typer.echo("")
     
@@ -249,6 +307,8 @@ def export(
     merge: bool = typer.Option(True, help="Merge with existing exports instead of overwriting"),
 ):
     """Export processed PDF to SQL-Adapt compatible format."""
+    from .export_sqladapt import export_to_sqladapt
+
     out = resolve_output_dir(output_dir)
     
     typer.echo(f"Exporting from: {input_dir}")
@@ -301,6 +361,8 @@ def validate_handoff(
     and all concept .md files are internally consistent.  Exits with code 1 if
     any fatal integrity violation is found.
     """
+    from .export_sqladapt import validate_handoff_integrity
+
     result = validate_handoff_integrity(output_dir)
 
     typer.echo(f"Validating: {output_dir}")
@@ -659,6 +721,8 @@ def preflight(
     ),
 ):
     """Run preflight analysis on a PDF to determine extraction strategy."""
+    from .preflight import run_preflight
+
     try:
         report = run_preflight(pdf_path)
         
@@ -704,6 +768,8 @@ def extract(
     ),
 ):
     """Extract text from PDF with quality validation."""
+    from .extract import extract_with_strategy
+
     typer.echo(f"Extracting: {pdf_path.name}")
     typer.echo(f"Strategy: {strategy}")
     typer.echo("")
@@ -743,6 +809,72 @@ def extract(
         raise typer.Exit(1)
 
 
+@app.command()
+def search(
+    index_dir: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        help="Index output directory (chunks.json or index-bin/)",
+    ),
+    queries: list[str] = typer.Argument(..., help="One or more search queries"),
+    top_k: int = typer.Option(5, "--top-k", "-k", min=1, help="Results per query"),
+    doc_id: list[str] | None = typer.Option(
+        None,
+        "--doc-id",
+        help="Only search chunks from this document (repeatable)",
+    ),
+    pages: str | None = typer.Option(
+        None,
+        "--pages",
+        help="Only search this page or page range, e.g. 12 or 10-20",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output results as JSON",
+    ),
+):
+    """Search an index for the chunks most similar to each query.
+    
+    All queries are scored in one batch against the normalized embedding
+    matrix. Binary indexes are memory-mapped rather than parsed.
+    
+    Example:
+        algl-pdf search ./output "inner join" "group by" --top-k 3
+        algl-pdf search ./output "null values" --pages 40-60 --json
+    """
+    from .search import ChunkSearchIndex, parse_page_range
+    
+    try:
+        page_range = parse_page_range(pages) if pages else None
+        with ChunkSearchIndex.load(index_dir) as search_index:
+            results = search_index.search_text(
+                queries, top_k=top_k, doc_ids=doc_id or None, page_range=page_range
+            )
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"❌ Error: {e}")
+        raise typer.Exit(1)
+    
+    if json_output:
+        payload = [
+            {"query": query, "hits": [hit.to_dict() for hit in hits]}
+            for query, hits in zip(queries, results)
+        ]
+        typer.echo(json.dumps(payload, indent=2, ensure_ascii=False))
+        return
+    
+    for query, hits in zip(queries, results):
+        typer.echo(f"🔎 {query}")
+        if not hits:
+            typer.echo("   (no matching chunks)")
+        for rank, hit in enumerate(hits, 1):
+            snippet = " ".join(hit.text.split())[:100]
+            typer.echo(f"   {rank}. [{hit.score:.3f}] {hit.chunkId} (p. {hit.page})")
+            typer.echo(f"      {snippet}")
+        typer.echo("")
+
+
 @app.command()
 def serve(
     host: str = typer.Option("127.0.0.1"),
@@ -796,6 +928,8 @@ def suggest_mapping(
         algl-pdf suggest-mapping ./textbook.pdf --output ./concepts.yaml
         algl-pdf suggest-mapping ./textbook.pdf --confidence-threshold 0.7
     """
+    from .mapping_generator import MappingGenerator
+
     typer.echo(f"🔍 Analyzing PDF structure: {pdf_path.name}")
     typer.echo(f"📊 Confidence threshold: {confidence_threshold}")
     
@@ -877,6 +1011,9 @@ def review_mapping(
     Example:
         algl-pdf review-mapping ./textbook.pdf --output ./review.json
     """
+    from .mapping_generator import MappingGenerator
+    from .mapping_workflow import MappingWorkflow
+
     typer.echo(f"🔍 Creating review package for: {pdf_path.name}")
     
     # Use default registry if not specified
@@ -928,6 +1065,12 @@ def review_mapping(
 @app.command()
 def extract_structure(
     pdf_path: Path = typer.Argument(..., exists=True, help="PDF file to analyze"),
+    workers: int = typer.Option(
+        1,
+        "--workers", "-w",
+        min=1,
+        help="Worker processes for decoding page layouts (large books)",
+    ),
 ):
     """Extract and display document structure (TOC, headings, chapters).
     
@@ -936,14 +1079,21 @@ def extract_structure(
     
     Example:
         algl-pdf extract-structure ./textbook.pdf
+        algl-pdf extract-structure ./textbook.pdf --workers 4
     """
+    from .pdf_session import PdfSession
+    from .structure_extractor import StructureExtractor
+
     typer.echo(f"🔍 Extracting structure from: {pdf_path.name}")
     typer.echo()
     
-    extractor = StructureExtractor()
+    extractor = StructureExtractor(workers=workers)
     
-    # Get full structure summary
-    summary = extractor.get_structure_summary(pdf_path)
+    # One session: every page layout is decoded once for all reports below
+    with PdfSession(pdf_path) as session:
+        summary = extractor.get_structure_summary(pdf_path, session=session)
+        toc = extractor.extract_toc(pdf_path, session=session)
+        headings = extractor.extract_headings(pdf_path, session=session)
     
     typer.echo("📊 Document Summary:")
     typer.echo(f"   Total pages: {summary['total_pages']}")
@@ -969,7 +1119,6 @@ def extract_structure(
             typer.echo(f"   ... and {len(summary['chapters']) - 10} more")
     
     # Show TOC if available
-    toc = extractor.extract_toc(pdf_path)
     if toc:
         typer.echo(f"\n📋 Table of Contents (first 10):")
         for entry in toc[:10]:
@@ -977,7 +1126,6 @@ def extract_structure(
             typer.echo(f"   {indent}• {entry.title[:40]} (p. {entry.page})")
     
     # Show sample headings
-    headings = extractor.extract_headings(pdf_path)
     if headings:
         typer.echo(f"\n📝 Sample Headings (first 10):")
         for h in headings[:10]:
@@ -1021,6 +1169,7 @@ def evaluate(
     This command runs quality checks on processed PDF output and optionally
     compares against a baseline. It checks:
     - Concept coverage
+    - Retrieval of each concept's pages by its title
     - Chunk quality
     - Schema version consistency
     - File completeness
@@ -1029,7 +1178,13 @@ def evaluate(
         algl-pdf evaluate ./output --threshold 0.75
         algl-pdf evaluate ./output --baseline ./baseline --output report.json
     """
-    from .metrics import EvaluationReport, CoverageMetric, QualityScore
+    from .metrics import (
+        EvaluationReport,
+        CoverageMetric,
+        QualityScore,
+        RetrievalSanityMetric,
+        concept_retrieval_queries,
+    )
     from .regression_detector import load_baseline
     from .embedding import build_hash_embedding
     
@@ -1092,10 +1247,23 @@ def evaluate(
         found_concepts=found_concepts,
     )
     
+    # Retrieval metric: concept titles should retrieve the concept's pages
+    retrieval_queries = concept_retrieval_queries(concept_manifest) if concept_manifest else []
+    embedding_dim = next((len(c.embedding) for c in document.chunks if c.embedding), 0)
+    if retrieval_queries and embedding_dim:
+        report.retrieval = RetrievalSanityMetric(test_queries=retrieval_queries)
+        report.retrieval.run_tests(
+            document.chunks, lambda text: build_hash_embedding(text, embedding_dim)
+        )
+        retrieval_score = report.retrieval.success_rate
+    else:
+        # No concept pages or embeddings to test against
+        retrieval_score = 1.0 if concept_manifest else 0.0
+    
     # Quality score
     report.quality = QualityScore(
         coverage_score=report.coverage.coverage_ratio,
-        retrieval_score=1.0 if concept_manifest else 0.0,  # Simplified
+        retrieval_score=retrieval_score,
     )
     report.calculate_chunk_quality(document.chunks)
     
@@ -1124,6 +1292,12 @@ def evaluate(
     typer.echo(f"   Overall: {report.quality.overall_score:.2f}")
     typer.echo(f"   Grade: {report.quality.grade}")
     typer.echo(f"   Coverage: {report.quality.coverage_score:.2f}")
+    if report.retrieval:
+        passed_queries = sum(1 for r in report.retrieval.results if r["found"])
+        typer.echo(
+            f"   Retrieval: {report.quality.retrieval_score:.2f} "
+            f"({passed_queries}/{len(report.retrieval.results)} concepts)"
+        )
     typer.echo(f"   Chunk Quality: {report.quality.chunk_quality_score:.2f}")
     typer.echo(f"")
     
@@ -1250,372 +1424,394 @@ def detect_regressions(
 # UNIT LIBRARY COMMANDS (re-exported from cli_unit_library)
 # =============================================================================
 
-try:
-    from .cli_unit_library import (
-        process_command as _process_cmd,
-        validate_command as _validate_cmd,
-        inspect_command as _inspect_cmd,
-        diagnose_command as _diagnose_cmd,
-        filter_command as _filter_cmd,
-        export_legacy_command as _export_legacy_cmd,
-    )
+def _unit_library_command(name: str):
+    """Import a cli_unit_library command when it is invoked.
+
+    cli_unit_library pulls in the whole unit generation stack, so it is not
+    imported until one of these commands actually runs.
+    """
+    try:
+        from . import cli_unit_library
+    except ImportError as e:
+        typer.echo(f"❌ Unit library commands not available: {e}", err=True)
+        raise typer.Exit(1)
+    return getattr(cli_unit_library, name)
+
+
+@app.command()
+def process(
+    pdf_path: Path = typer.Argument(
+        ...,
+        exists=True,
+        readable=True,
+        help="Path to the PDF file to process",
+    ),
+    output_dir: Path = typer.Option(
+        ...,
+        "--output-dir", "-o",
+        help="Output directory for the unit library (required)",
+    ),
+    doc_id: str | None = typer.Option(
+        None,
+        "--doc-id",
+        help="Document ID (auto-generated if not provided)",
+    ),
+    llm_provider: str = typer.Option(
+        os.getenv("ALGL_LLM_PROVIDER", "ollama"),
+        "--llm-provider",
+        help="LLM provider: ollama (default, local), grounded (no LLM), kimi, openai, or claude_local. Falls back to env var ALGL_LLM_PROVIDER.",
+    ),
+    llm_model: str | None = typer.Option(
+        None,
+        "--llm-model",
+        help="LLM model to use (only used with non-grounded providers)",
+    ),
+    filter_level: str = typer.Option(
+        "production",
+        "--filter-level",
+        help="Export filter level: strict, production (default), or development",
+    ),
+    skip_reinforcement: bool = typer.Option(
+        False,
+        "--skip-reinforcement",
+        help="Skip generating reinforcement items",
+    ),
+    skip_misconceptions: bool = typer.Option(
+        False,
+        "--skip-misconceptions",
+        help="Skip generating misconception units",
+    ),
+    validate_sql: bool = typer.Option(
+        True,
+        "--validate-sql/--no-validate-sql",
+        help="Validate SQL examples",
+    ),
+    skip_llm: bool = typer.Option(
+        False,
+        "--skip-llm",
+        help="Skip all LLM-based processing (extraction/repair only, no generation)",
+    ),
+    min_quality_score: float = typer.Option(
+        0.8,
+        "--min-quality-score",
+        min=0.0,
+        max=1.0,
+        help="Minimum quality score threshold",
+    ),
+    export_mode: str = typer.Option(
+        "prototype",
+        "--export-mode",
+        help="Export mode: prototype (allows placeholders, default) or student_ready (strict)",
+    ),
+    use_ollama_repair: bool = typer.Option(
+        True,
+        "--use-ollama-repair/--no-ollama-repair",
+        help="Use Ollama to repair weak L3 content (requires local Ollama server)",
+    ),
+    ollama_model: str = typer.Option(
+        "qwen3.5:9b-q8_0",
+        "--ollama-model",
+        help="Ollama model for repair (qwen3.5:9b-q8_0 recommended for RTX 4080, qwen3.5:27b-q4_K_M for better quality)",
+    ),
+    ollama_repair_threshold: float = typer.Option(
+        0.6,
+        "--ollama-repair-threshold",
+        min=0.0,
+        max=1.0,
+        help="Quality threshold below which to trigger Ollama repair",
+    ),
+    claude_local_base_url: str | None = typer.Option(
+        None,
+        "--claude-base-url",
+        help="Base URL for Claude local endpoint (defaults to CLAUDE_LOCAL_BASE_URL env var or http://localhost:8080)",
+    ),
+    claude_local_model: str | None = typer.Option(
+        None,
+        "--claude-model",
+        help="Claude local model name (defaults to CLAUDE_LOCAL_MODEL env var)",
+    ),
+    claude_local_api_key: str | None = typer.Option(
+        None,
+        "--claude-api-key",
+        help="API key for Claude local endpoint (defaults to CLAUDE_LOCAL_API_KEY env var)",
+    ),
+    page_range: str | None = typer.Option(
+        None,
+        "--page-range",
+        help="Process only specific pages (e.g., '1-100' or '50,75,100-120')",
+    ),
+    chapter_range: str | None = typer.Option(
+        None,
+        "--chapter-range",
+        help="Process only specific chapters (e.g., '1-5' or '3,4,7'). Note: Requires PDF bookmarks/table of contents",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Resume from last checkpoint (if available)",
+    ),
+    cache_extraction: bool = typer.Option(
+        True,
+        "--cache-extraction/--no-cache-extraction",
+        help="Cache and reuse PDF extraction (speeds up re-runs)",
+    ),
+    allow_offbook_curated: bool = typer.Option(
+        False,
+        "--allow-offbook-curated",
+        help="Allow off-book curated concepts not present in source PDF (opt-in augmentation)",
+    ),
+    clear_repair_cache: bool = typer.Option(
+        False,
+        "--clear-repair-cache",
+        help="Clear the repair cache before processing",
+    ),
+    llm_concurrency: int = typer.Option(
+        1,
+        "--llm-concurrency",
+        min=1,
+        help="Concepts and unit variants generated in parallel (LLM requests in flight); "
+             "output order is unchanged",
+    ),
+    sql_workers: int = typer.Option(
+        1,
+        "--sql-workers",
+        min=1,
+        help="Worker processes used to validate SQL examples",
+    ),
+    llm_cache: bool = typer.Option(
+        True,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM responses for prompts seen in earlier runs "
+             "(see `algl-pdf cache`)",
+    ),
+):
+    """Process a PDF into a unit library.
     
-    @app.command()
-    def process(
-        pdf_path: Path = typer.Argument(
-            ...,
-            exists=True,
-            readable=True,
-            help="Path to the PDF file to process",
-        ),
-        output_dir: Path = typer.Option(
-            ...,
-            "--output-dir", "-o",
-            help="Output directory for the unit library (required)",
-        ),
-        doc_id: str | None = typer.Option(
-            None,
-            "--doc-id",
-            help="Document ID (auto-generated if not provided)",
-        ),
-        llm_provider: str = typer.Option(
-            os.getenv("ALGL_LLM_PROVIDER", "ollama"),
-            "--llm-provider",
-            help="LLM provider: ollama (default, local), grounded (no LLM), kimi, openai, or claude_local. Falls back to env var ALGL_LLM_PROVIDER.",
-        ),
-        llm_model: str | None = typer.Option(
-            None,
-            "--llm-model",
-            help="LLM model to use (only used with non-grounded providers)",
-        ),
-        filter_level: str = typer.Option(
-            "production",
-            "--filter-level",
-            help="Export filter level: strict, production (default), or development",
-        ),
-        skip_reinforcement: bool = typer.Option(
-            False,
-            "--skip-reinforcement",
-            help="Skip generating reinforcement items",
-        ),
-        skip_misconceptions: bool = typer.Option(
-            False,
-            "--skip-misconceptions",
-            help="Skip generating misconception units",
-        ),
-        validate_sql: bool = typer.Option(
-            True,
-            "--validate-sql/--no-validate-sql",
-            help="Validate SQL examples",
-        ),
-        skip_llm: bool = typer.Option(
-            False,
-            "--skip-llm",
-            help="Skip all LLM-based processing (extraction/repair only, no generation)",
-        ),
-        min_quality_score: float = typer.Option(
-            0.8,
-            "--min-quality-score",
-            min=0.0,
-            max=1.0,
-            help="Minimum quality score threshold",
-        ),
-        export_mode: str = typer.Option(
-            "prototype",
-            "--export-mode",
-            help="Export mode: prototype (allows placeholders, default) or student_ready (strict)",
-        ),
-        use_ollama_repair: bool = typer.Option(
-            True,
-            "--use-ollama-repair/--no-ollama-repair",
-            help="Use Ollama to repair weak L3 content (requires local Ollama server)",
-        ),
-        ollama_model: str = typer.Option(
-            "qwen3.5:9b-q8_0",
-            "--ollama-model",
-            help="Ollama model for repair (qwen3.5:9b-q8_0 recommended for RTX 4080, qwen3.5:27b-q4_K_M for better quality)",
-        ),
-        ollama_repair_threshold: float = typer.Option(
-            0.6,
-            "--ollama-repair-threshold",
-            min=0.0,
-            max=1.0,
-            help="Quality threshold below which to trigger Ollama repair",
-        ),
-        claude_local_base_url: str | None = typer.Option(
-            None,
-            "--claude-base-url",
-            help="Base URL for Claude local endpoint (defaults to CLAUDE_LOCAL_BASE_URL env var or http://localhost:8080)",
-        ),
-        claude_local_model: str | None = typer.Option(
-            None,
-            "--claude-model",
-            help="Claude local model name (defaults to CLAUDE_LOCAL_MODEL env var)",
-        ),
-        claude_local_api_key: str | None = typer.Option(
-            None,
-            "--claude-api-key",
-            help="API key for Claude local endpoint (defaults to CLAUDE_LOCAL_API_KEY env var)",
-        ),
-        page_range: str | None = typer.Option(
-            None,
-            "--page-range",
-            help="Process only specific pages (e.g., '1-100' or '50,75,100-120')",
-        ),
-        chapter_range: str | None = typer.Option(
-            None,
-            "--chapter-range",
-            help="Process only specific chapters (e.g., '1-5' or '3,4,7'). Note: Requires PDF bookmarks/table of contents",
-        ),
-        resume: bool = typer.Option(
-            False,
-            "--resume",
-            help="Resume from last checkpoint (if available)",
-        ),
-        cache_extraction: bool = typer.Option(
-            True,
-            "--cache-extraction/--no-cache-extraction",
-            help="Cache and reuse PDF extraction (speeds up re-runs)",
-        ),
-        allow_offbook_curated: bool = typer.Option(
-            False,
-            "--allow-offbook-curated",
-            help="Allow off-book curated concepts not present in source PDF (opt-in augmentation)",
-        ),
-        clear_repair_cache: bool = typer.Option(
-            False,
-            "--clear-repair-cache",
-            help="Clear the repair cache before processing",
-        ),
-    ):
-        """Process a PDF into a unit library.
-        
-        This command extracts content from a PDF, maps concepts, generates
-        instructional units at all adaptive stages (L1-L4), and exports
-        the grounded instructional unit graph.
-        
-        The Ollama repair pass automatically improves weak L3 content using
-        a local Ollama instance (requires qwen3.5:9b-q8_0 or similar model).
-        
-        Export Modes:
-            prototype (default): Allows placeholder content with warnings.
-                Use for development and testing.
-            
-            student_ready: Strict mode, blocks all placeholder and weak content.
-                Use when exporting for actual student consumption.
-                Blocks: placeholder practice links, default L2 examples, 
-                synthetic-only L3, weak curated content.
-        
-        Page/Chapter Range:
-            Use --page-range to process specific pages (e.g., '1-100' or '50,75,100-120').
-            Use --chapter-range to process specific chapters (requires PDF bookmarks).
-            Use --resume to continue from a previous interrupted run.
-            Use --no-cache-extraction to force re-extraction of the PDF.
+    This command extracts content from a PDF, maps concepts, generates
+    instructional units at all adaptive stages (L1-L4), and exports
+    the grounded instructional unit graph.
+    
+    The Ollama repair pass automatically improves weak L3 content using
+    a local Ollama instance (requires qwen3.5:9b-q8_0 or similar model).
+    
+    Export Modes:
+        prototype (default): Allows placeholder content with warnings.
+            Use for development and testing.
         
-        Example:
-            algl-pdf process ./textbook.pdf --output-dir ./output
-            algl-pdf process ./textbook.pdf -o ./output --filter-level production
-            algl-pdf process ./textbook.pdf -o ./output --export-mode student_ready
-            algl-pdf process ./textbook.pdf -o ./output --skip-reinforcement
-            algl-pdf process ./textbook.pdf -o ./output --no-ollama-repair
-            algl-pdf process ./textbook.pdf -o ./output --page-range 1-50
-            algl-pdf process ./textbook.pdf -o ./output --chapter-range 1-3
-            algl-pdf process ./textbook.pdf -o ./output --resume
-        """
-        _process_cmd(
-            pdf_path=pdf_path,
-            output_dir=output_dir,
-            doc_id=doc_id,
-            llm_provider=llm_provider,
-            llm_model=llm_model,
-            filter_level=filter_level,
-            skip_reinforcement=skip_reinforcement,
-            skip_misconceptions=skip_misconceptions,
-            validate_sql=validate_sql,
-            skip_llm=skip_llm,
-            min_quality_score=min_quality_score,
-            export_mode=export_mode,
-            use_ollama_repair=use_ollama_repair,
-            ollama_model=ollama_model,
-            ollama_repair_threshold=ollama_repair_threshold,
-            claude_local_base_url=claude_local_base_url,
-            claude_local_model=claude_local_model,
-            claude_local_api_key=claude_local_api_key,
-            page_range=page_range,
-            chapter_range=chapter_range,
-            resume=resume,
-            cache_extraction=cache_extraction,
-            allow_offbook_curated=allow_offbook_curated,
-            clear_repair_cache=clear_repair_cache,
-        )
+        student_ready: Strict mode, blocks all placeholder and weak content.
+            Use when exporting for actual student consumption.
+            Blocks: placeholder practice links, default L2 examples, 
+            synthetic-only L3, weak curated content.
+    
+    Page/Chapter Range:
+        Use --page-range to process specific pages (e.g., '1-100' or '50,75,100-120').
+        Use --chapter-range to process specific chapters (requires PDF bookmarks).
+        Use --resume to continue from a previous interrupted run.
+        Use --no-cache-extraction to force re-extraction of the PDF.
+    
+    Example:
+        algl-pdf process ./textbook.pdf --output-dir ./output
+        algl-pdf process ./textbook.pdf -o ./output --filter-level production
+        algl-pdf process ./textbook.pdf -o ./output --export-mode student_ready
+        algl-pdf process ./textbook.pdf -o ./output --skip-reinforcement
+        algl-pdf process ./textbook.pdf -o ./output --no-ollama-repair
+        algl-pdf process ./textbook.pdf -o ./output --page-range 1-50
+        algl-pdf process ./textbook.pdf -o ./output --chapter-range 1-3
+        algl-pdf process ./textbook.pdf -o ./output --resume
+    """
+    _unit_library_command("process_command")(
+        pdf_path=pdf_path,
+        output_dir=output_dir,
+        doc_id=doc_id,
+        llm_provider=llm_provider,
+        llm_model=llm_model,
+        filter_level=filter_level,
+        skip_reinforcement=skip_reinforcement,
+        skip_misconceptions=skip_misconceptions,
+        validate_sql=validate_sql,
+        skip_llm=skip_llm,
+        min_quality_score=min_quality_score,
+        export_mode=export_mode,
+        use_ollama_repair=use_ollama_repair,
+        ollama_model=ollama_model,
+        ollama_repair_threshold=ollama_repair_threshold,
+        claude_local_base_url=claude_local_base_url,
+        claude_local_model=claude_local_model,
+        claude_local_api_key=claude_local_api_key,
+        page_range=page_range,
+        chapter_range=chapter_range,
+        resume=resume,
+        cache_extraction=cache_extraction,
+        allow_offbook_curated=allow_offbook_curated,
+        clear_repair_cache=clear_repair_cache,
+        llm_concurrency=llm_concurrency,
+        llm_cache=llm_cache,
+        sql_workers=sql_workers,
+    )
 
-    @app.command()
-    def validate(
-        library_dir: Path = typer.Argument(
-            ...,
-            exists=True,
-            file_okay=False,
-            dir_okay=True,
-            help="Path to unit library directory",
-        ),
-        detailed: bool = typer.Option(
-            False,
-            "--detailed",
-            help="Show detailed validation report",
-        ),
-        use_generated_report: bool = typer.Option(
-            False,
-            "--use-generated-report",
-            help="Use the quality report generated during export (if available)",
-        ),
-        recompute: bool = typer.Option(
-            False,
-            "--recompute",
-            help="Force recompute validation instead of using cached report",
-        ),
-    ):
-        """Validate an existing unit library.
-        
-        Runs all quality gates on the unit library and displays a quality report.
-        
-        Example:
-            algl-pdf validate ./output/unit-library/
-            algl-pdf validate ./output/unit-library/ --detailed
-        """
-        _validate_cmd(
-            library_dir=library_dir,
-            detailed=detailed,
-            use_generated_report=use_generated_report,
-            recompute=recompute,
-        )
+@app.command()
+def validate(
+    library_dir: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Path to unit library directory",
+    ),
+    detailed: bool = typer.Option(
+        False,
+        "--detailed",
+        help="Show detailed validation report",
+    ),
+    use_generated_report: bool = typer.Option(
+        False,
+        "--use-generated-report",
+        help="Use the quality report generated during export (if available)",
+    ),
+    recompute: bool = typer.Option(
+        False,
+        "--recompute",
+        help="Force recompute validation instead of using cached report",
+    ),
+):
+    """Validate an existing unit library.
+    
+    Runs all quality gates on the unit library and displays a quality report.
+    
+    Example:
+        algl-pdf validate ./output/unit-library/
+        algl-pdf validate ./output/unit-library/ --detailed
+    """
+    _unit_library_command("validate_command")(
+        library_dir=library_dir,
+        detailed=detailed,
+        use_generated_report=use_generated_report,
+        recompute=recompute,
+    )
 
-    @app.command()
-    def inspect(
-        library_dir: Path = typer.Argument(
-            ...,
-            exists=True,
-            file_okay=False,
-            dir_okay=True,
-            help="Path to unit library directory",
-        ),
-        concept: str = typer.Option(
-            ...,
-            "--concept", "-c",
-            help="Concept ID to inspect",
-        ),
-        show_sql: bool = typer.Option(
-            True,
-            "--show-sql/--no-show-sql",
-            help="Show SQL examples with syntax highlighting",
-        ),
-    ):
-        """Inspect units for a specific concept.
-        
-        Display all variants (L1-L4) for a concept with source evidence.
-        
-        Example:
-            algl-pdf inspect ./output/unit-library/ --concept select-basic
-            algl-pdf inspect ./output/unit-library/ -c join-operations --no-show-sql
-        """
-        _inspect_cmd(library_dir=library_dir, concept=concept, show_sql=show_sql)
-
-    @app.command(name="diagnose")
-    def diagnose(
-        library_dir: Path = typer.Argument(
-            ...,
-            exists=True,
-            file_okay=False,
-            dir_okay=True,
-            help="Path to unit library directory",
-        ),
-        detailed: bool = typer.Option(
-            False,
-            "--detailed",
-            help="Show detailed diagnostic report",
-        ),
-    ):
-        """Diagnose content gaps and quality issues in a unit library.
-        
-        Analyzes the library and reports:
-        - L3 coverage gaps (concepts missing explanations)
-        - L2 units using default examples
-        - Unresolved practice links
-        - Heading-like content in why_it_matters
-        - Missing evidence spans
-        
-        Example:
-            algl-pdf diagnose ./output/unit-library/
-            algl-pdf diagnose ./output/unit-library/ --detailed
-        """
-        _diagnose_cmd(library_dir=library_dir, detailed=detailed)
-
-    @app.command()
-    def filter(
-        library_dir: Path = typer.Argument(
-            ...,
-            exists=True,
-            file_okay=False,
-            dir_okay=True,
-            help="Path to unit library directory",
-        ),
-        level: str = typer.Option(
-            "strict",
-            "--level",
-            help="Export filter level: strict, production, or development",
-        ),
-        output_dir: Path | None = typer.Option(
-            None,
-            "--output-dir", "-o",
-            help="Output directory for filtered library (default: in-place)",
-        ),
-    ):
-        """Re-run export filters on existing library.
-        
-        Creates a filtered subset of the unit library based on the specified level.
-        
-        Example:
-            algl-pdf filter ./output/unit-library/ --level strict
-            algl-pdf filter ./output/unit-library/ -o ./output/filtered/ --level production
-        """
-        _filter_cmd(library_dir=library_dir, level=level, output_dir=output_dir)
-
-    @app.command(name="export-legacy")
-    def export_legacy(
-        concept_map_path: Path = typer.Argument(
-            ...,
-            exists=True,
-            readable=True,
-            help="Path to old concept-map.json file",
-        ),
-        output_dir: Path = typer.Option(
-            ...,
-            "--output-dir", "-o",
-            help="Output directory for new format (required)",
-        ),
-        filter_level: str = typer.Option(
-            "strict",
-            "--filter-level",
-            help="Export filter level: strict, production, or development",
-        ),
-    ):
-        """Convert old concept-map.json to new unit library format.
-        
-        Transforms the legacy concept map structure into the new grounded
-        instructional unit graph format.
-        
-        Example:
-            algl-pdf export-legacy ./old-output/concept-map.json --output-dir ./new-output/
-            algl-pdf export-legacy ./old/concept-map.json -o ./new/ --filter-level strict
-        """
-        _export_legacy_cmd(
-            concept_map_path=concept_map_path,
-            output_dir=output_dir,
-            filter_level=filter_level,
-        )
+@app.command()
+def inspect(
+    library_dir: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Path to unit library directory",
+    ),
+    concept: str = typer.Option(
+        ...,
+        "--concept", "-c",
+        help="Concept ID to inspect",
+    ),
+    show_sql: bool = typer.Option(
+        True,
+        "--show-sql/--no-show-sql",
+        help="Show SQL examples with syntax highlighting",
+    ),
+):
+    """Inspect units for a specific concept.
+    
+    Display all variants (L1-L4) for a concept with source evidence.
+    
+    Example:
+        algl-pdf inspect ./output/unit-library/ --concept select-basic
+        algl-pdf inspect ./output/unit-library/ -c join-operations --no-show-sql
+    """
+    _unit_library_command("inspect_command")(library_dir=library_dir, concept=concept, show_sql=show_sql)
 
+@app.command(name="diagnose")
+def diagnose(
+    library_dir: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Path to unit library directory",
+    ),
+    detailed: bool = typer.Option(
+        False,
+        "--detailed",
+        help="Show detailed diagnostic report",
+    ),
+):
+    """Diagnose content gaps and quality issues in a unit library.
+    
+    Analyzes the library and reports:
+    - L3 coverage gaps (concepts missing explanations)
+    - L2 units using default examples
+    - Unresolved practice links
+    - Heading-like content in why_it_matters
+    - Missing evidence spans
+    
+    Example:
+        algl-pdf diagnose ./output/unit-library/
+        algl-pdf diagnose ./output/unit-library/ --detailed
+    """
+    _unit_library_command("diagnose_command")(library_dir=library_dir, detailed=detailed)
 
-except ImportError:
-    pass  # Unit library commands not available
+@app.command()
+def filter(
+    library_dir: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Path to unit library directory",
+    ),
+    level: str = typer.Option(
+        "strict",
+        "--level",
+        help="Export filter level: strict, production, or development",
+    ),
+    output_dir: Path | None = typer.Option(
+        None,
+        "--output-dir", "-o",
+        help="Output directory for filtered library (default: in-place)",
+    ),
+):
+    """Re-run export filters on existing library.
+    
+    Creates a filtered subset of the unit library based on the specified level.
+    
+    Example:
+        algl-pdf filter ./output/unit-library/ --level strict
+        algl-pdf filter ./output/unit-library/ -o ./output/filtered/ --level production
+    """
+    _unit_library_command("filter_command")(library_dir=library_dir, level=level, output_dir=output_dir)
+
+@app.command(name="export-legacy")
+def export_legacy(
+    concept_map_path: Path = typer.Argument(
+        ...,
+        exists=True,
+        readable=True,
+        help="Path to old concept-map.json file",
+    ),
+    output_dir: Path = typer.Option(
+        ...,
+        "--output-dir", "-o",
+        help="Output directory for new format (required)",
+    ),
+    filter_level: str = typer.Option(
+        "strict",
+        "--filter-level",
+        help="Export filter level: strict, production, or development",
+    ),
+):
+    """Convert old concept-map.json to new unit library format.
+    
+    Transforms the legacy concept map structure into the new grounded
+    instructional unit graph format.
+    
+    Example:
+        algl-pdf export-legacy ./old-output/concept-map.json --output-dir ./new-output/
+        algl-pdf export-legacy ./old/concept-map.json -o ./new/ --filter-level strict
+    """
+    _unit_library_command("export_legacy_command")(
+        concept_map_path=concept_map_path,
+        output_dir=output_dir,
+        filter_level=filter_level,
+    )
 
 
 # Cache management command (always available)
@@ -1623,31 +1819,63 @@ except ImportError:
 def cache_command(
     action: str = typer.Argument(
         "stats",
-        help="Action: stats, clear, or show-path",
+        help="Action: stats, inspect, prune, clear, or show-path",
+    ),
+    max_size_mb: int | None = typer.Option(
+        None,
+        "--max-size-mb",
+        min=0,
+        help="Size bound for `prune` (defaults to the configured cache limit)",
+    ),
+    limit: int = typer.Option(
+        20,
+        "--limit",
+        min=1,
+        help="Number of extraction cache entries to list with `inspect`",
     ),
 ):
     """
-    Manage the Ollama repair cache.
+    Manage the Ollama repair cache, the LLM response cache and the PDF
+    extraction cache.
     
-    View cache statistics, clear cached repairs, or show cache directory.
+    View cache statistics, list or prune extraction cache entries,
+    clear cached data, or show cache directories.
     
     Example:
-        algl-pdf cache stats     # Show cache statistics
-        algl-pdf cache clear     # Clear all cached repairs
-        algl-pdf cache show-path # Show cache directory path
+        algl-pdf cache stats                   # Show cache statistics and hit rates
+        algl-pdf cache inspect --limit 50      # List recently used extraction entries
+        algl-pdf cache prune --max-size-mb 500 # Evict least recently used entries
+        algl-pdf cache clear                   # Clear repairs, LLM responses and extraction cache
+        algl-pdf cache show-path               # Show cache directory paths
     """
+    from datetime import datetime
+
+    from .llm_cache import get_llm_cache
+
+    extraction_cache = get_extraction_cache()
+    llm_cache = get_llm_cache()
     try:
         from .ollama_repair import RepairCache
-        
-        cache = RepairCache()
-        
-        if action == "clear":
-            count = cache.clear_cache()
+        repair_cache = RepairCache()
+    except ImportError:
+        repair_cache = None
+
+    if action == "clear":
+        if repair_cache is not None:
+            count = repair_cache.clear_cache()
             typer.echo(f"✅ Cleared {count} cached repairs")
-        elif action == "show-path":
-            typer.echo(f"Cache directory: {cache.cache_dir}")
-        elif action == "stats":
-            stats = cache.get_cache_stats()
+        count = llm_cache.clear_cache()
+        typer.echo(f"✅ Cleared {count} cached LLM responses")
+        count = extraction_cache.clear_cache()
+        typer.echo(f"✅ Cleared {count} extraction cache entries")
+    elif action == "show-path":
+        if repair_cache is not None:
+            typer.echo(f"Cache directory: {repair_cache.cache_dir}")
+        typer.echo(f"LLM response cache: {llm_cache.path}")
+        typer.echo(f"Extraction cache directory: {extraction_cache.cache_dir}")
+    elif action == "stats":
+        if repair_cache is not None:
+            stats = repair_cache.get_cache_stats()
             typer.echo("📊 Repair Cache Statistics:")
             typer.echo(f"  Cache directory: {stats['cache_dir']}")
             typer.echo(f"  Cached files: {stats['cached_files']}")
@@ -1656,13 +1884,56 @@ def cache_command(
                 typer.echo(f"  Cache hits: {stats['hits']}")
                 typer.echo(f"  Cache misses: {stats['misses']}")
                 typer.echo(f"  Hit rate: {stats['hit_rate']:.1%}")
-        else:
-            typer.echo(f"❌ Unknown action: {action}")
-            typer.echo("Valid actions: stats, clear, show-path")
-            raise typer.Exit(1)
-            
-    except ImportError:
-        typer.echo("❌ Error: RepairCache not available")
+        stats = llm_cache.get_cache_stats()
+        typer.echo("📊 LLM Response Cache Statistics:")
+        typer.echo(f"  Cache file: {stats['cache_path']}")
+        models = ", ".join(f"{k}: {v}" for k, v in stats["entries_by_model"].items())
+        typer.echo(f"  Entries: {stats['entries']}" + (f" ({models})" if models else ""))
+        typer.echo(
+            f"  Total size: {stats['total_size_bytes']:,} / {stats['max_bytes']:,} bytes"
+        )
+        lookups = stats["lifetime_hits"] + stats["lifetime_misses"]
+        if lookups:
+            typer.echo(f"  Cache hits: {stats['lifetime_hits']}")
+            typer.echo(f"  Cache misses: {stats['lifetime_misses']}")
+            typer.echo(f"  Hit rate: {stats['lifetime_hit_rate']:.1%}")
+        stats = extraction_cache.get_cache_stats()
+        typer.echo("📊 Extraction Cache Statistics:")
+        typer.echo(f"  Cache directory: {stats['cache_dir']}")
+        kinds = ", ".join(f"{k}: {v}" for k, v in stats["entries_by_kind"].items())
+        typer.echo(f"  Entries: {stats['cached_files']} ({kinds})")
+        typer.echo(
+            f"  Total size: {stats['total_size_bytes']:,} / {stats['max_bytes']:,} bytes"
+        )
+    elif action == "inspect":
+        entries = extraction_cache.entries()
+        typer.echo(
+            f"📦 Extraction cache: {len(entries)} entries in {extraction_cache.cache_dir}"
+        )
+        for entry in entries[:limit]:
+            last_used = datetime.fromtimestamp(entry.last_used).isoformat(timespec="seconds")
+            typer.echo(
+                f"  {entry.kind:<7} {entry.size_bytes:>12,} B  {last_used}  {entry.key}"
+            )
+        if len(entries) > limit:
+            typer.echo(f"  ... {len(entries) - limit} more (use --limit)")
+    elif action == "prune":
+        max_bytes = max_size_mb * 1024 ** 2 if max_size_mb is not None else None
+        count = llm_cache.prune(max_bytes=max_bytes)
+        stats = llm_cache.get_cache_stats()
+        typer.echo(
+            f"✅ Evicted {count} cached LLM responses "
+            f"({stats['total_size_bytes']:,} bytes remain)"
+        )
+        count = extraction_cache.prune(max_bytes=max_bytes)
+        stats = extraction_cache.get_cache_stats()
+        typer.echo(
+            f"✅ Evicted {count} extraction cache entries "
+            f"({stats['total_size_bytes']:,} bytes remain)"
+        )
+    else:
+        typer.echo(f"❌ Unknown action: {action}")
+        typer.echo("Valid actions: stats, inspect, prune, clear, show-path")
         raise typer.Exit(1)
 
 
@@ -1699,6 +1970,17 @@ def replay(
         "--run-id",
         help="Custom run identifier",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers", "-w",
+        min=1,
+        help="Worker processes replaying traces in parallel (artifacts are identical)",
+    ),
+    decision_points: bool = typer.Option(
+        False,
+        "--decision-points",
+        help="Also stream every decision point to decision_points.jsonl/.csv",
+    ),
 ):
     """
     Replay learner trace(s) under formal policies for comparison.
@@ -1710,6 +1992,10 @@ def replay(
     - replay_summary.json / replay_summary.csv
     - per_learner_metrics.csv
     - policy_comparison.csv
+    - decision_points.jsonl / decision_points.csv (with --decision-points)
+
+    Results are written as traces are replayed, so large cohorts can be
+    replayed with flat memory use; --workers spreads them over processes.
 
     Available policies:
     - fast_escalator: Aggressive early escalation
@@ -1720,6 +2006,7 @@ def replay(
         algl replay traces/ --output-dir outputs/day4
         algl replay trace.json -o out --policy fast_escalator --policy slow_escalator
         algl replay traces/ -o out --synthetic-fixture
+        algl replay cohort/ -o out --workers 8 --decision-points
     """
     from .replay import run_replay
     from .experiment_flags import ExperimentFlags, load_flags
@@ -1766,6 +2053,8 @@ def replay(
             flags=experiment_flags,
             policy_filter=policy if policy else None,
             run_id=run_id,
+            workers=workers,
+            export_decisions=decision_points,
         )
 
         typer.echo("\n✅ Replay complete! Artifacts generated:")
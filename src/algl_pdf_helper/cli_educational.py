@@ -19,9 +19,6 @@ except ImportError:
     HAS_TQDM = False
     tqdm = None
 
-from .educational_pipeline import EducationalNoteGenerator, LLMProvider
-from .concept_mapper import load_concepts_config, find_concepts_config
-
 app = typer.Typer(help="Generate educational notes from PDFs")
 
 
@@ -109,6 +106,8 @@ def generate(
     ),
 ):
     """Generate educational notes from PDF."""
+    from .educational_pipeline import EducationalNoteGenerator, LLMProvider
+    from .concept_mapper import load_concepts_config, find_concepts_config
     
     # Show cost estimate first
     if estimate_cost or not use_llm:
@@ -332,6 +331,8 @@ def status():
 @app.command()
 def cost():
     """Show cost comparison between LLM providers."""
+    from .educational_pipeline import EducationalNoteGenerator
+
     EducationalNoteGenerator.print_cost_comparison()
 
 
@@ -324,6 +324,25 @@ def process_command(
         "--allow-offbook-curated",
         help="Allow off-book curated concepts not present in source PDF (opt-in augmentation)",
     ),
+    llm_concurrency: int = typer.Option(
+        1,
+        "--llm-concurrency",
+        min=1,
+        help="Concepts and unit variants generated in parallel (LLM requests in flight); "
+             "output order is unchanged",
+    ),
+    sql_workers: int = typer.Option(
+        1,
+        "--sql-workers",
+        min=1,
+        help="Worker processes used to validate SQL examples",
+    ),
+    llm_cache: bool = typer.Option(
+        True,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM responses for prompts seen in earlier runs "
+             "(see `algl-pdf cache`)",
+    ),
 ):
     """
     Process a PDF into a unit library.
@@ -453,6 +472,9 @@ def process_command(
         resume_from_checkpoint=resume,
         cache_extraction=cache_extraction,
         allow_offbook_curated=allow_offbook_curated,
+        llm_concurrency=llm_concurrency,
+        cache_llm_responses=llm_cache,
+        sql_validation_workers=sql_workers,
     )
     
     # Run the pipeline with progress display
@@ -45,6 +45,7 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 from .extract import check_extraction_quality, extract_pages_fitz
+from .llm_transport import get_transport
 from .models import ConceptInfo, ConceptManifest
 from .kimi_assistant import KimiAssistant  # AI-assisted Phase 1 & 2
 from .concept_mapping_system import ConceptMappingSystem  # Three-layer mapping integration
@@ -825,67 +826,38 @@ class EducationalNoteGenerator:
     
     def _check_ollama_available(self) -> bool:
         """Check if Ollama is running and accessible."""
-        try:
-            import urllib.request
-            import urllib.error
-            req = urllib.request.Request(
-                f"{self.ollama_host}/api/tags",
-                method="GET",
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                return response.status == 200
-        except Exception:
-            return False
+        return get_transport(self.ollama_host).is_available(timeout=5)
     
     def _get_best_ollama_model(self) -> str | None:
         """Auto-select the best available Ollama model."""
-        try:
-            import urllib.request
-            import json
-            
-            req = urllib.request.Request(
-                f"{self.ollama_host}/api/tags",
-                method="GET",
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode("utf-8"))
-                models = data.get("models", [])
-                
-                if not models:
-                    return None
-                
-                # Priority order for educational content
-                priority_models = [
-                    "qwen2.5-coder:7b",  # Best for SQL/education
-                    "qwen2.5:7b",         # Good bilingual
-                    "phi4",               # Good reasoning
-                    "mistral:7b",         # Balanced
-                    "gemma2:9b",          # High quality
-                    "llama3.1:8b",        # General purpose
-                    "llama3.2:3b",        # Fast fallback
-                ]
-                
-                available = [m.get("name", "") for m in models]
-                
-                # Return first match from priority list
-                for preferred in priority_models:
-                    for model_name in available:
-                        if preferred in model_name:
-                            return model_name
-                
-                # Return first available if no priority match
-                return available[0]
-                
-        except Exception:
+        models = get_transport(self.ollama_host).list_models(timeout=5)
+        if not models:
             return None
+        
+        # Priority order for educational content
+        priority_models = [
+            "qwen2.5-coder:7b",  # Best for SQL/education
+            "qwen2.5:7b",         # Good bilingual
+            "phi4",               # Good reasoning
+            "mistral:7b",         # Balanced
+            "gemma2:9b",          # High quality
+            "llama3.1:8b",        # General purpose
+            "llama3.2:3b",        # Fast fallback
+        ]
+        
+        available = [m.get("name", "") for m in models]
+        
+        # Return first match from priority list
+        for preferred in priority_models:
+            for model_name in available:
+                if preferred in model_name:
+                    return model_name
+        
+        # Return first available if no priority match
+        return available[0]
     
     def _ollama_chat(self, messages: list[dict], temperature: float = 0.7) -> str:
         """Chat with Ollama local model."""
-        import urllib.request
-        import json
-        
         data = {
             "model": self.ollama_model,
             "messages": messages,
@@ -896,20 +868,12 @@ class EducationalNoteGenerator:
             },
         }
         
-        req = urllib.request.Request(
-            f"{self.ollama_host}/api/chat",
-            data=json.dumps(data).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        
         # Longer timeout for educational content generation
-        with urllib.request.urlopen(req, timeout=600) as response:
-            result = json.loads(response.read().decode("utf-8"))
-            content = result.get("message", {}).get("content", "")
-            if not content:
-                raise ValueError("Empty response from Ollama")
-            return content
+        result = get_transport(self.ollama_host).post_json("/api/chat", data, timeout=600)
+        content = result.get("message", {}).get("content", "")
+        if not content:
+            raise ValueError("Empty response from Ollama")
+        return content
     
     # =============================================================================
     # INTEGRATION: Pedagogical Content Generation Methods (Added 2026-02-27)
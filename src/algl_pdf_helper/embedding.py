@@ -2,19 +2,18 @@ from __future__ import annotations
 
 import math
 import re
+from collections.abc import Sequence
 
+import numpy as np
 
-_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+
+# Tokens are maximal [a-z0-9] runs of the lowercased text, at least 3 long
+# (equivalent to blanking every other non-space character and splitting)
+_TOKEN = re.compile(r"[a-z0-9]{3,}")
 
 
 def tokenize(text: str) -> list[str]:
-    cleaned = _NON_ALNUM.sub(" ", text.lower())
-    tokens = []
-    for tok in cleaned.split():
-        tok = tok.strip()
-        if len(tok) >= 3:
-            tokens.append(tok)
-    return tokens
+    return _TOKEN.findall(text.lower())
 
 
 def hash_token(token: str) -> int:
@@ -35,3 +34,53 @@ def build_hash_embedding(text: str, dim: int) -> list[float]:
         return vec
 
     return [v / norm for v in vec]
+
+
+class _BucketMap(dict):
+    """token -> embedding bucket, hashing each distinct token once."""
+
+    def __init__(self, dim: int):
+        super().__init__()
+        self.dim = dim
+
+    def __missing__(self, token: str) -> int:
+        idx = self[token] = hash_token(token) % self.dim
+        return idx
+
+
+def build_hash_embeddings(
+    texts: Sequence[str],
+    dim: int,
+    *,
+    dtype: type[np.floating] = np.float32,
+) -> np.ndarray:
+    """Embed many texts at once into a contiguous (len(texts), dim) matrix.
+
+    Row i is build_hash_embedding(texts[i], dim) cast to dtype. Counts are
+    small integers, so the float64 sum of squares is exact regardless of
+    summation order and the float64 result matches the scalar function bit
+    for bit; pass dtype=np.float64 where those exact values are needed.
+
+    Each distinct token is hashed once per call rather than once per
+    occurrence, counts are accumulated with a single bincount and every
+    row is normalized in one vectorized step.
+    """
+    if dim < 1:
+        raise ValueError(f"dim must be >= 1, got {dim}")
+
+    buckets = _BucketMap(dim)
+    cols: list[int] = []
+    lengths = np.zeros(len(texts), dtype=np.int64)
+    for row, text in enumerate(texts):
+        toks = tokenize(text)
+        lengths[row] = len(toks)
+        cols.extend(map(buckets.__getitem__, toks))
+
+    rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+    flat = rows * dim + np.asarray(cols, dtype=np.int64)
+    counts = np.bincount(flat, minlength=len(texts) * dim).astype(np.float64)
+    counts = counts.reshape(len(texts), dim)
+
+    norms = np.sqrt(np.einsum("ij,ij->i", counts, counts))[:, None]
+    np.divide(counts, norms, out=counts, where=norms != 0.0)
+    return np.ascontiguousarray(counts, dtype=dtype)
@@ -26,7 +26,7 @@ from enum import Enum
 from typing import Any, Callable
 
 from .instructional_models import InstructionalUnit, UnitLibraryExport, SourceSpan
-from .sql_ontology import ConceptOntology
+from .sql_ontology import ConceptOntology, get_ontology
 
 
 # =============================================================================
@@ -125,16 +125,9 @@ class UnitFilterResult:
 # PLACEHOLDER CHECK FUNCTIONS
 # =============================================================================
 
-# Cache for ontology instance
-_ontology_cache: ConceptOntology | None = None
-
-
 def _get_ontology() -> ConceptOntology:
-    """Get or create cached ConceptOntology instance."""
-    global _ontology_cache
-    if _ontology_cache is None:
-        _ontology_cache = ConceptOntology()
-    return _ontology_cache
+    """Get the shared ConceptOntology instance."""
+    return get_ontology()
 
 
 def _get_unit_title(unit: InstructionalUnit) -> str:
@@ -14,6 +14,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .binary_index import BinaryChunkIndex, has_binary_index
 from .learner_quality_audit import (
     audit_concept_markdown,
     build_learner_safe_key_points,
@@ -82,7 +83,14 @@ def load_source_metadata(input_dir: Path, source_doc_id: str) -> dict:
 
 
 def load_chunks(chunks_file: Path) -> list[dict]:
-    """Load chunks from JSON file."""
+    """Load chunks from JSON file.
+
+    Falls back to the binary index next to it when the index was built
+    with --index-format binary and no chunks.json exists.
+    """
+    if not chunks_file.exists() and has_binary_index(chunks_file.parent):
+        with BinaryChunkIndex.open(chunks_file.parent) as index:
+            return index.chunk_dicts()
     with open(chunks_file, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -747,7 +755,7 @@ def export_to_sqladapt(
     
     if not manifest_file.exists():
         raise FileNotFoundError(f"Concept manifest not found: {manifest_file}")
-    if not chunks_file.exists():
+    if not chunks_file.exists() and not has_binary_index(input_dir):
         raise FileNotFoundError(f"Chunks file not found: {chunks_file}")
     
     manifest = load_concept_manifest(manifest_file)
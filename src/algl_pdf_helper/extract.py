@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import os
 import re
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Literal
@@ -10,6 +11,8 @@ from typing import Literal
 import fitz  # PyMuPDF
 
 from .clean import normalize_text
+from .extraction_cache import ExtractionCache
+from .pdf_session import PdfSession
 from .quality_metrics import (
     QualityThresholds,
     TextCoverageAnalyzer,
@@ -27,6 +30,26 @@ MIN_TEXT_COVERAGE = 0.70
 
 ExtractionStrategy = Literal["direct", "ocrmypdf", "marker"]
 
+# "document": OCR every page once the document-level quality check fails.
+# "pages": OCR only the pages that fail the per-page check
+# (select_pages_for_ocr) and splice them back in place.
+OcrMode = Literal["document", "pages"]
+
+# Bump when a change alters extract_pages_fitz output or the OCR pipeline,
+# so stale extraction cache entries stop matching
+TEXT_EXTRACTOR_VERSION = "fitz-text-1"
+OCR_PIPELINE_VERSION = "ocrmypdf-1"
+
+# Minimal safe defaults: deskew + rotate pages.
+# force_ocr=True allows OCR on PDFs that already have text
+OCRMYPDF_OPTIONS = {
+    "deskew": True,
+    "rotate_pages": True,
+    "optimize": 1,
+    "output_type": "pdf",
+    "force_ocr": True,
+}
+
 
 def calculate_text_quality(text: str) -> dict:
     """Calculate quality metrics for extracted text.
@@ -169,6 +192,100 @@ def check_text_coverage(pages: list[tuple[int, str]], min_coverage: float = None
     }
 
 
+def select_pages_for_ocr(
+    pages: list[tuple[int, str]],
+    min_chars: int = QualityThresholds.MIN_PAGE_CHARS,
+    min_coverage: float = QualityThresholds.EMBEDDED_TEXT_OCR_FLOOR,
+) -> list[int]:
+    """Return the page numbers whose extracted text warrants OCR.
+    
+    A page needs OCR when it has fewer than ``min_chars`` non-blank
+    characters (a scanned or image-only page) or its text coverage is below
+    ``min_coverage`` (broken font encoding). The coverage floor is the
+    embedded-text OCR floor, so digital pages dominated by SQL code or
+    tables are not selected.
+    
+    Args:
+        pages: List of (page_number, text) tuples
+        min_chars: Minimum characters for a page to count as having text
+        min_coverage: Coverage below which a page's text is unusable
+        
+    Returns:
+        Sorted page numbers (as in ``pages``) to OCR
+    """
+    analyzer = TextCoverageAnalyzer()
+    return sorted(
+        page_num
+        for page_num, text in pages
+        if len(text.strip()) < min_chars or analyzer.calculate_coverage(text) < min_coverage
+    )
+
+
+def ocr_pdf_pages(pdf_path: Path, out_path: Path, page_numbers: list[int]) -> None:
+    """OCR only ``page_numbers`` (1-based) of a PDF, keeping every other page.
+    
+    The selected pages are copied into a sub-document, which OCRmyPDF
+    processes in parallel across pages (its ``jobs`` default: all CPUs).
+    The OCR'd pages then replace the originals in a copy of the PDF written
+    to ``out_path``, so page count and page numbers stay unchanged, and the
+    outline and internal links are restored to point at the same pages.
+    
+    Raises:
+        RuntimeError: If ocrmypdf is not installed
+        Exception: Whatever OCRmyPDF raises if OCR fails
+    """
+    try:
+        import ocrmypdf  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError(
+            "OCR requested but ocrmypdf is not installed. "
+            "Install with: pip install -e '.[ocr]'"
+        ) from e
+    
+    sub_path = out_path.with_name(out_path.stem + ".pages.pdf")
+    sub_ocr_path = out_path.with_name(out_path.stem + ".pages.ocr.pdf")
+    try:
+        with fitz.open(pdf_path) as src, fitz.open() as sub:
+            for page_num in page_numbers:
+                sub.insert_pdf(src, from_page=page_num - 1, to_page=page_num - 1)
+            sub.save(sub_path)
+        
+        ocrmypdf.ocr(
+            str(sub_path),
+            str(sub_ocr_path),
+            progress_bar=False,
+            **OCRMYPDF_OPTIONS,
+        )
+        
+        with fitz.open(pdf_path) as doc, fitz.open(sub_ocr_path) as ocr_doc:
+            # delete_page drops outline entries and links that point at the
+            # page, so both are saved here and restored after the splice
+            toc = doc.get_toc(simple=False)
+            goto_links = {
+                page.number: [l for l in page.get_links() if l["kind"] == fitz.LINK_GOTO]
+                for page in doc
+            }
+            for i, page_num in enumerate(page_numbers):
+                doc.delete_page(page_num - 1)
+                doc.insert_pdf(ocr_doc, from_page=i, to_page=i, start_at=page_num - 1)
+            if toc:
+                doc.set_toc(toc)
+            replaced = {page_num - 1 for page_num in page_numbers}
+            for page_index, links in goto_links.items():
+                if not links and page_index not in replaced:
+                    continue
+                page = doc.load_page(page_index)
+                for link in page.get_links():
+                    if link["kind"] == fitz.LINK_GOTO:
+                        page.delete_link(link)
+                for link in links:
+                    page.insert_link(link)
+            doc.save(out_path, garbage=1)
+    finally:
+        sub_path.unlink(missing_ok=True)
+        sub_ocr_path.unlink(missing_ok=True)
+
+
 def sha256_file(path: Path) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
@@ -179,7 +296,10 @@ def sha256_file(path: Path) -> str:
 
 def extract_pages_fitz(
     pdf_path: Path,
-    page_range: tuple[int, int] | list[int] | None = None
+    page_range: tuple[int, int] | list[int] | None = None,
+    *,
+    session: PdfSession | None = None,
+    cache: ExtractionCache | None = None,
 ) -> list[tuple[int, str]]:
     """Extract text pages from a PDF using PyMuPDF.
     
@@ -189,6 +309,10 @@ def extract_pages_fitz(
             - tuple (start, end): Extract pages from start to end (inclusive, 1-based)
             - list [p1, p2, ...]: Extract specific page numbers (1-based)
             - None: Extract all pages
+        session: Optional open PdfSession for pdf_path; pages already
+            decoded by another consumer are reused instead of re-read
+        cache: Optional ExtractionCache; a previous extraction of the same
+            file content and page range is returned without decoding
         
     Returns:
         List of (page_number, text) tuples
@@ -199,88 +323,23 @@ def extract_pages_fitz(
         RuntimeError: If the PDF is corrupted, invalid, or password-protected
         ValueError: If page_range contains invalid page numbers
     """
-    # Check if file exists
-    if not pdf_path.exists():
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-    
-    # Check if it's a file (not a directory)
-    if pdf_path.is_dir():
-        raise PermissionError(f"Path is a directory, not a file: {pdf_path}")
-    
-    try:
-        doc = fitz.open(pdf_path)
-    except fitz.FileDataError as e:
-        error_msg = str(e).lower()
-        if "password" in error_msg or "encrypted" in error_msg or "crypt" in error_msg:
-            raise RuntimeError(
-                f"PDF is password-protected or encrypted: {pdf_path}. "
-                f"Please provide a password or decrypt the file first."
-            ) from e
-        elif "no file" in error_msg or "is no file" in error_msg:
-            raise RuntimeError(
-                f"Invalid PDF file (may be corrupted or not a PDF): {pdf_path}. "
-                f"Please check the file format and try again."
-            ) from e
-        else:
-            raise RuntimeError(
-                f"Failed to open PDF file: {pdf_path}. Error: {e}"
-            ) from e
-    except Exception as e:
-        error_msg = str(e).lower()
-        if "password" in error_msg or "encrypted" in error_msg:
-            raise RuntimeError(
-                f"PDF is password-protected or encrypted: {pdf_path}"
-            ) from e
-        raise RuntimeError(
-            f"Failed to open PDF file: {pdf_path}. The file may be corrupted, "
-            f"truncated, or not a valid PDF. Error: {e}"
-        ) from e
-    
-    pages: list[tuple[int, str]] = []
-    try:
-        total_pages = doc.page_count
-        
-        # Determine which pages to extract
-        if page_range is None:
-            # Extract all pages
-            page_indices = range(total_pages)
-        elif isinstance(page_range, tuple):
-            # Extract range (start, end) - convert to 0-based indices
-            start, end = page_range
-            # Validate range
-            if start < 1:
-                doc.close()
-                raise ValueError(f"Page range start must be >= 1, got {start}")
-            if end > total_pages:
-                doc.close()
-                raise ValueError(f"Page range end ({end}) exceeds total pages ({total_pages})")
-            if start > end:
-                doc.close()
-                raise ValueError(f"Page range start ({start}) must be <= end ({end})")
-            page_indices = range(start - 1, end)  # Convert to 0-based
-        elif isinstance(page_range, list):
-            # Extract specific pages - convert to 0-based indices
-            page_indices = []
-            for p in page_range:
-                if p < 1:
-                    doc.close()
-                    raise ValueError(f"Page number must be >= 1, got {p}")
-                if p > total_pages:
-                    doc.close()
-                    raise ValueError(f"Page number {p} exceeds total pages ({total_pages})")
-                page_indices.append(p - 1)  # Convert to 0-based
-        else:
-            doc.close()
-            raise ValueError(f"Invalid page_range type: {type(page_range)}")
-        
-        for i in page_indices:
-            page = doc.load_page(i)
-            text = page.get_text("text")
-            text = normalize_text(text)
-            # Include empty pages to maintain stable page numbering
-            pages.append((i + 1, text))
-    finally:
-        doc.close()
+    cache_key = None
+    if cache is not None and pdf_path.is_file():
+        sha = session.sha256 if session is not None else sha256_file(pdf_path)
+        cache_key = cache.make_key("pages", sha, TEXT_EXTRACTOR_VERSION, page_range)
+        cached = cache.get_json(cache_key)
+        if cached is not None:
+            return [(page_num, text) for page_num, text in cached]
+
+    # Include empty pages to maintain stable page numbering
+    if session is not None:
+        pages = session.extract_pages(page_range)
+    else:
+        with PdfSession(pdf_path) as own_session:
+            pages = own_session.extract_pages(page_range)
+
+    if cache_key is not None:
+        cache.put_json(cache_key, pages)
     return pages
 
 
@@ -345,6 +404,9 @@ def maybe_ocr_pdf(
     auto: bool,
     min_total_chars: int = 800,
     smart_skip_threshold: float = 0.90,
+    session: PdfSession | None = None,
+    cache: ExtractionCache | None = None,
+    ocr_mode: OcrMode = "document",
 ) -> tuple[Path, bool]:
     """Return (path_to_use, did_ocr).
     
@@ -356,6 +418,17 @@ def maybe_ocr_pdf(
         smart_skip_threshold: Quality threshold above which OCR is skipped
                              even if force=True (0.0-1.0, default 0.90)
                              Set to 1.0 to disable smart skip.
+        session: Optional open PdfSession for pdf_path, so the quality
+                 check shares its page decodes with later extraction
+        cache: Optional ExtractionCache; the quality check reuses cached
+               pages and a previously OCR'd copy of the same file content
+               is returned instead of running OCR again
+        ocr_mode: "document" OCRs the whole PDF when quality is poor (or
+                  force is set). "pages" OCRs only the pages failing
+                  select_pages_for_ocr, whenever force or auto is set, and
+                  returns a copy with those pages replaced; the document
+                  level checks and smart skip do not apply, and no OCR runs
+                  if every page has usable text.
                              
     Returns:
         Tuple of (path_to_use, did_ocr)
@@ -370,7 +443,7 @@ def maybe_ocr_pdf(
 
     # Always check quality first to determine if OCR is actually needed
     try:
-        pages = extract_pages_fitz(pdf_path)
+        pages = extract_pages_fitz(pdf_path, session=session, cache=cache)
         quality = check_extraction_quality(pages)
         coverage = check_text_coverage(pages)
     except Exception:
@@ -378,14 +451,19 @@ def maybe_ocr_pdf(
         quality = {"is_quality_good": False, "total_chars": 0}
         coverage = {"coverage_score": 0.0, "meets_threshold": False}
 
-    if auto and not force:
+    ocr_page_numbers: list[int] | None = None
+    if ocr_mode == "pages" and pages:
+        ocr_page_numbers = select_pages_for_ocr(pages)
+        if not ocr_page_numbers:
+            return pdf_path, False
+    elif auto and not force:
         total = sum(len(t) for _, t in pages)
         if total >= min_total_chars and quality["is_quality_good"]:
             return pdf_path, False
 
     # SMART OCR SKIP: If PDF has excellent text quality, skip OCR even if forced
     # This prevents Tesseract errors on digital PDFs that don't need OCR
-    if force and coverage["coverage_score"] >= smart_skip_threshold:
+    if ocr_page_numbers is None and force and coverage["coverage_score"] >= smart_skip_threshold:
         import warnings
         warnings.warn(
             f"OCR was requested but PDF has excellent text quality "
@@ -396,7 +474,7 @@ def maybe_ocr_pdf(
         return pdf_path, False
     
     # Additional warning if OCR is forced on good quality PDF
-    if force and quality["is_quality_good"]:
+    if ocr_page_numbers is None and force and quality["is_quality_good"]:
         import warnings
         warnings.warn(
             f"OCR is being forced on a PDF that already has good text quality "
@@ -404,6 +482,25 @@ def maybe_ocr_pdf(
             f"This may cause Tesseract errors and is usually unnecessary for digital PDFs."
         )
 
+    cache_key = None
+    if cache is not None:
+        sha = session.sha256 if session is not None else sha256_file(pdf_path)
+        # Page-level OCR output also depends on which pages were OCR'd
+        extra = {} if ocr_page_numbers is None else {"ocr_pages": ocr_page_numbers}
+        cache_key = cache.make_key(
+            "ocr", sha, OCR_PIPELINE_VERSION, ocr_settings=OCRMYPDF_OPTIONS, **extra
+        )
+        cached_pdf = cache.get_file(cache_key)
+        if cached_pdf is not None:
+            tmp_dir = Path(tempfile.mkdtemp(prefix="algl_pdf_"))
+            out_path = tmp_dir / (pdf_path.stem + ".ocr.pdf")
+            try:
+                shutil.copyfile(cached_pdf, out_path)
+                return out_path, True
+            except OSError:
+                # Evicted by another process in the meantime; OCR again
+                cleanup_temp_pdf(out_path)
+
     try:
         import ocrmypdf  # type: ignore
     except Exception as e:  # pragma: no cover
@@ -415,19 +512,16 @@ def maybe_ocr_pdf(
     tmp_dir = Path(tempfile.mkdtemp(prefix="algl_pdf_"))
     out_path = tmp_dir / (pdf_path.stem + ".ocr.pdf")
 
-    # Minimal safe defaults: deskew + rotate pages.
-    # force_ocr=True allows OCR on PDFs that already have text
     try:
-        ocrmypdf.ocr(
-            str(pdf_path),
-            str(out_path),
-            deskew=True,
-            rotate_pages=True,
-            optimize=1,
-            output_type="pdf",
-            progress_bar=False,
-            force_ocr=True,
-        )
+        if ocr_page_numbers is not None:
+            ocr_pdf_pages(pdf_path, out_path, ocr_page_numbers)
+        else:
+            ocrmypdf.ocr(
+                str(pdf_path),
+                str(out_path),
+                progress_bar=False,
+                **OCRMYPDF_OPTIONS,
+            )
     except Exception as e:
         # Clean up temp directory on error
         cleanup_temp_pdf(out_path)
@@ -449,6 +543,8 @@ def maybe_ocr_pdf(
         else:
             raise RuntimeError(f"OCR failed: {e}") from e
 
+    if cache_key is not None:
+        cache.put_file(cache_key, out_path)
     return out_path, True
 
 
@@ -456,6 +552,7 @@ def ocr_pdf_with_validation(
     pdf_path: Path,
     min_coverage: float = None,
     smart_skip_threshold: float = 0.90,
+    ocr_mode: OcrMode = "document",
 ) -> tuple[Path, dict]:
     """OCR a PDF and validate the output quality.
     
@@ -470,6 +567,8 @@ def ocr_pdf_with_validation(
         min_coverage: Minimum text coverage threshold
         smart_skip_threshold: Quality threshold above which OCR is skipped
                              even if requested (default 0.90 = 90%)
+        ocr_mode: "pages" OCRs only the pages failing select_pages_for_ocr
+                  (instead of the smart skip check) and keeps the rest
         
     Returns:
         Tuple of (output_path, validation_result)
@@ -486,8 +585,14 @@ def ocr_pdf_with_validation(
     pages, _ = extract_pages_with_page_map(pdf_path)
     coverage_check = check_text_coverage(pages, min_coverage)
     
+    ocr_page_numbers = select_pages_for_ocr(pages) if ocr_mode == "pages" else None
+    if ocr_page_numbers == []:
+        coverage_check["skipped"] = True
+        coverage_check["skip_reason"] = "no_pages_need_ocr"
+        return pdf_path, coverage_check
+    
     # SMART SKIP: If PDF has excellent text quality, skip OCR
-    if coverage_check["coverage_score"] >= smart_skip_threshold:
+    if ocr_page_numbers is None and coverage_check["coverage_score"] >= smart_skip_threshold:
         import warnings
         warnings.warn(
             f"OCR skipped: PDF has excellent text quality "
@@ -510,19 +615,17 @@ def ocr_pdf_with_validation(
     tmp_dir = Path(tempfile.mkdtemp(prefix="algl_pdf_"))
     out_path = tmp_dir / (pdf_path.stem + ".ocr.pdf")
 
-    # OCR with safe defaults that preserve page structure
-    # force_ocr=True allows OCR on PDFs that already have text
+    # OCR with safe defaults that preserve page structure (OCRMYPDF_OPTIONS)
     try:
-        ocrmypdf.ocr(
-            str(pdf_path),
-            str(out_path),
-            deskew=True,
-            rotate_pages=True,
-            optimize=1,
-            output_type="pdf",
-            progress_bar=False,
-            force_ocr=True,
-        )
+        if ocr_page_numbers is not None:
+            ocr_pdf_pages(pdf_path, out_path, ocr_page_numbers)
+        else:
+            ocrmypdf.ocr(
+                str(pdf_path),
+                str(out_path),
+                progress_bar=False,
+                **OCRMYPDF_OPTIONS,
+            )
     except Exception as e:
         # Clean up temp directory on error
         cleanup_temp_pdf(out_path)
@@ -560,6 +663,7 @@ def extract_with_strategy(
     auto_ocr: bool = True,
     smart_skip_threshold: float = 0.90,
     page_range: tuple[int, int] | list[int] | None = None,
+    ocr_mode: OcrMode = "document",
 ) -> tuple[list[tuple[int, str]], dict]:
     """Extract PDF text using specified strategy with quality validation.
     
@@ -581,6 +685,7 @@ def extract_with_strategy(
         smart_skip_threshold: Quality threshold above which OCR is skipped
                              even if force_ocr=True (default 0.90 = 90%)
         page_range: Optional page range to extract (1-based indexing)
+        ocr_mode: "document" or "pages" (see ocr_pdf_with_validation)
         
     Returns:
         Tuple of (pages, extraction_info) where:
@@ -642,7 +747,7 @@ def extract_with_strategy(
                 )
                 
                 temp_pdf_path, ocr_validation = ocr_pdf_with_validation(
-                    pdf_path, min_coverage, smart_skip_threshold
+                    pdf_path, min_coverage, smart_skip_threshold, ocr_mode=ocr_mode
                 )
                 
                 # Check if OCR was skipped due to high quality
@@ -667,7 +772,7 @@ def extract_with_strategy(
             elif force_ocr and not extraction_info.get("ocr_skipped"):
                 # Force OCR even if direct extraction was okay (unless smart skip kicked in)
                 temp_pdf_path, ocr_validation = ocr_pdf_with_validation(
-                    pdf_path, min_coverage, smart_skip_threshold
+                    pdf_path, min_coverage, smart_skip_threshold, ocr_mode=ocr_mode
                 )
                 
                 # Check if OCR was skipped due to high quality
@@ -686,7 +791,7 @@ def extract_with_strategy(
         elif strategy == "ocrmypdf":
             # Always use OCR (but respect smart skip)
             temp_pdf_path, ocr_validation = ocr_pdf_with_validation(
-                pdf_path, min_coverage, smart_skip_threshold
+                pdf_path, min_coverage, smart_skip_threshold, ocr_mode=ocr_mode
             )
             
             # Check if OCR was skipped due to high quality
@@ -0,0 +1,314 @@
+"""
+Content-addressed on-disk cache for PDF extraction results.
+
+Entries are keyed by the SHA-256 of the source PDF plus everything else that
+can change the output: the extractor version (including the PyMuPDF build),
+the page range and the OCR settings. Because the key is derived from file
+content rather than path, the same textbook re-run through ``index`` or
+``process`` (or copied to another directory) hits the cache, and any edit to
+the PDF or bump of an extractor version simply misses.
+
+Three kinds of entries are stored:
+
+- ``pages``: ``extract_pages_fitz`` output, gzip-compressed compact JSON
+- ``blocks``: ``SectionExtractor.extract_blocks`` output, same format
+- ``ocr``: the OCR'd PDF written by ``maybe_ocr_pdf``
+
+The cache is size-bounded; when a write pushes it over ``max_bytes`` the
+least recently used entries (by file mtime, refreshed on every hit) are
+evicted first. Each instance keeps a running total of the cache size
+(scanned once, on its first write), so writes below the bound never list
+the cache directory.
+
+Example:
+    cache = get_extraction_cache()
+    pages = extract_pages_fitz(pdf_path, cache=cache)
+    print(cache.get_cache_stats())
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "algl_pdf_helper" / "extraction"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB
+
+# Suffix per entry kind; anything else in the cache directory is ignored
+_KIND_SUFFIXES = {
+    "pages": ".json.gz",
+    "blocks": ".json.gz",
+    "ocr": ".pdf",
+}
+
+
+@dataclass
+class CacheEntry:
+    """One file in the extraction cache."""
+    key: str
+    kind: str
+    path: Path
+    size_bytes: int
+    last_used: float
+
+
+class ExtractionCache:
+    """Size-bounded, content-addressed cache of extraction outputs.
+
+    Safe to share between processes: entries are written to a temporary
+    file and renamed into place, and a reader only ever sees complete files.
+    Instances are picklable so they can be handed to worker processes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Running total of entry sizes; None until the first write scans it
+        self._size_bytes: int | None = None
+        self._logger = logging.getLogger(__name__)
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        pdf_sha256: str,
+        extractor_version: str,
+        page_range: tuple[int, int] | list[int] | None = None,
+        ocr_settings: dict[str, Any] | None = None,
+        **extra: Any,
+    ) -> str:
+        """Derive the cache key for one extraction result.
+
+        Args:
+            kind: Entry kind ("pages", "blocks" or "ocr")
+            pdf_sha256: SHA-256 of the source PDF bytes
+            extractor_version: Version string of the producing extractor
+            page_range: Page range the result covers (None = all pages)
+            ocr_settings: OCR options that produced the source, if any
+            **extra: Further inputs that change the output (e.g. doc_id)
+        """
+        import fitz  # PyMuPDF; deferred so cache maintenance commands start fast
+
+        if kind not in _KIND_SUFFIXES:
+            raise ValueError(f"Unknown extraction cache kind: {kind}")
+        if isinstance(page_range, tuple):
+            range_spec: Any = ["range", *page_range]
+        elif isinstance(page_range, list):
+            range_spec = ["pages", *page_range]
+        else:
+            range_spec = None
+        payload = {
+            "kind": kind,
+            "pdf_sha256": pdf_sha256,
+            "extractor_version": extractor_version,
+            "pymupdf": fitz.VersionBind,
+            "page_range": range_spec,
+            "ocr_settings": ocr_settings or {},
+            "extra": extra,
+        }
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return f"{kind}-{digest}"
+
+    def _path_for(self, key: str) -> Path:
+        kind = key.split("-", 1)[0]
+        return self.cache_dir / key[len(kind) + 1 : len(kind) + 3] / f"{key}{_KIND_SUFFIXES[kind]}"
+
+    # ------------------------------------------------------------------
+    # Reads and writes
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: str) -> Path | None:
+        path = self._path_for(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # Mark as recently used for LRU eviction
+        except OSError:
+            pass
+        self.hits += 1
+        return path
+
+    def get_json(self, key: str) -> Any | None:
+        """Return the cached JSON value for key, or None on a miss."""
+        path = self._lookup(key)
+        if path is None:
+            return None
+        try:
+            return json.loads(gzip.decompress(path.read_bytes()))
+        except (OSError, ValueError, EOFError):
+            # Corrupt or truncated entry: drop it and treat as a miss
+            self.hits -= 1
+            self.misses += 1
+            path.unlink(missing_ok=True)
+            return None
+
+    def put_json(self, key: str, value: Any) -> Path:
+        """Store a JSON-serializable value under key."""
+        data = gzip.compress(
+            json.dumps(value, separators=(",", ":")).encode("utf-8"),
+            compresslevel=3,
+        )
+        return self._write(key, lambda f: f.write(data))
+
+    def get_file(self, key: str) -> Path | None:
+        """Return the path of a cached file for key, or None on a miss.
+
+        The returned path lives inside the cache and may be evicted later;
+        callers that need to keep it should copy it out.
+        """
+        return self._lookup(key)
+
+    def put_file(self, key: str, src: Path) -> Path:
+        """Copy src into the cache under key."""
+        def copy(f) -> None:
+            with open(src, "rb") as s:
+                shutil.copyfileobj(s, f, 1024 * 1024)
+        return self._write(key, copy)
+
+    def _write(self, key: str, writer) -> Path:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                writer(f)
+                size = f.tell()
+            try:
+                replaced = path.stat().st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        if self._size_bytes is None:
+            self._size_bytes = sum(e.size_bytes for e in self.entries())
+        else:
+            self._size_bytes += size - replaced
+        if self._size_bytes > self.max_bytes:
+            self.prune()
+        return path
+
+    # ------------------------------------------------------------------
+    # Inspection and eviction
+    # ------------------------------------------------------------------
+
+    def entries(self) -> list[CacheEntry]:
+        """List cache entries, most recently used first."""
+        if not self.cache_dir.exists():
+            return []
+        entries = []
+        for path in self.cache_dir.glob("*/*"):
+            kind = path.name.split("-", 1)[0]
+            suffix = _KIND_SUFFIXES.get(kind)
+            if suffix is None or not path.name.endswith(suffix):
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue  # Evicted by another process
+            entries.append(
+                CacheEntry(
+                    key=path.name[: -len(suffix)],
+                    kind=kind,
+                    path=path,
+                    size_bytes=st.st_size,
+                    last_used=st.st_mtime,
+                )
+            )
+        entries.sort(key=lambda e: e.last_used, reverse=True)
+        return entries
+
+    def prune(self, max_bytes: int | None = None) -> int:
+        """Evict least recently used entries until the cache fits max_bytes.
+
+        Args:
+            max_bytes: Size bound to enforce (defaults to self.max_bytes)
+
+        Returns:
+            Number of entries removed
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(e.size_bytes for e in entries)
+        removed = 0
+        while entries and total > limit:
+            entry = entries.pop()
+            try:
+                entry.path.unlink()
+            except OSError:
+                continue
+            total -= entry.size_bytes
+            removed += 1
+        if removed:
+            self._logger.debug(f"Evicted {removed} extraction cache entries")
+        self._size_bytes = total
+        return removed
+
+    def clear_cache(self) -> int:
+        """Remove every entry. Returns the number of entries removed."""
+        return self.prune(max_bytes=-1)
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Return size, entry counts per kind and hit/miss counters."""
+        entries = self.entries()
+        by_kind: dict[str, int] = {kind: 0 for kind in _KIND_SUFFIXES}
+        for entry in entries:
+            by_kind[entry.kind] += 1
+        lookups = self.hits + self.misses
+        return {
+            "cache_dir": str(self.cache_dir),
+            "cached_files": len(entries),
+            "entries_by_kind": by_kind,
+            "total_size_bytes": sum(e.size_bytes for e in entries),
+            "max_bytes": self.max_bytes,
+            "oldest_entry_age_s": (
+                time.time() - entries[-1].last_used if entries else None
+            ),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_default_cache: ExtractionCache | None = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Return the process-wide extraction cache.
+
+    The location and size bound can be overridden with the
+    ``ALGL_EXTRACTION_CACHE_DIR`` and ``ALGL_EXTRACTION_CACHE_MAX_MB``
+    environment variables.
+    """
+    global _default_cache
+    if _default_cache is None:
+        cache_dir = os.getenv("ALGL_EXTRACTION_CACHE_DIR")
+        max_mb = os.getenv("ALGL_EXTRACTION_CACHE_MAX_MB")
+        _default_cache = ExtractionCache(
+            cache_dir=Path(cache_dir) if cache_dir else None,
+            max_bytes=int(max_mb) * 1024 ** 2 if max_mb else DEFAULT_MAX_BYTES,
+        )
+    return _default_cache
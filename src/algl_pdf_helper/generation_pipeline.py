@@ -13,11 +13,9 @@ Optimized for 8GB M1 Mac with conservative memory usage.
 
 from __future__ import annotations
 
-import json
 import os
 import time
 import urllib.error
-import urllib.request
 from typing import Any, Callable
 
 from .pedagogical_models import (
@@ -38,6 +36,8 @@ from .prompts import (
     build_strict_mistakes_prompt,
     PRACTICE_SCHEMAS,
 )
+from .llm_cache import LLMResponseCache
+from .llm_transport import get_transport
 
 
 # =============================================================================
@@ -192,6 +192,7 @@ class MultiPassGenerator:
         max_attempts: Maximum regeneration attempts
         temperature: LLM temperature (0.0-1.0)
         timeout: Request timeout in seconds
+        response_cache: Cache of chat responses (None = always call Ollama)
     """
     
     DEFAULT_TIMEOUT = 180  # 3 minutes for small models
@@ -205,6 +206,7 @@ class MultiPassGenerator:
         max_attempts: int = MAX_ATTEMPTS,
         temperature: float = DEFAULT_TEMPERATURE,
         timeout: int = DEFAULT_TIMEOUT,
+        response_cache: LLMResponseCache | None = None,
     ):
         """
         Initialize the multi-pass generator.
@@ -215,12 +217,15 @@ class MultiPassGenerator:
             max_attempts: Maximum generation attempts (default: 3)
             temperature: LLM temperature (default: 0.3)
             timeout: Request timeout in seconds (default: 180)
+            response_cache: Optional cache of chat responses; identical
+                requests are answered from it instead of calling Ollama
         """
         self.ollama_host = ollama_host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
         self.model = model or get_recommended_model()
         self.max_attempts = max(1, min(max_attempts, 5))  # Clamp between 1-5
         self.temperature = max(0.0, min(temperature, 1.0))
         self.timeout = timeout
+        self.response_cache = response_cache
         
         # Check model compatibility
         is_compatible, warning = check_model_compatibility(self.model)
@@ -231,13 +236,29 @@ class MultiPassGenerator:
         elif warning:
             print(f"⚠️  {warning}")
     
-    def _ollama_chat(self, messages: list[dict], temperature: float | None = None) -> str:
+    def _chat_options(self, temperature: float | None) -> dict[str, Any]:
+        return {
+            "temperature": temperature if temperature is not None else self.temperature,
+            "num_predict": 4000,  # Reasonable limit for concept generation
+        }
+    
+    def _ollama_chat(
+        self,
+        messages: list[dict],
+        temperature: float | None = None,
+        *,
+        store: bool = True,
+    ) -> str:
         """
         Send chat request to Ollama.
         
         Args:
             messages: List of message dicts with "role" and "content"
             temperature: Optional override for temperature
+            store: Put the response in the response cache. Callers that
+                parse or validate the response pass False and call
+                _store_response once it is accepted, so a malformed
+                response is not replayed on every later run.
             
         Returns:
             Generated text content
@@ -246,31 +267,40 @@ class MultiPassGenerator:
             urllib.error.URLError: If connection fails
             TimeoutError: If request times out
         """
-        temp = temperature if temperature is not None else self.temperature
-        
         data = {
             "model": self.model,
             "messages": messages,
             "stream": False,
-            "options": {
-                "temperature": temp,
-                "num_predict": 4000,  # Reasonable limit for concept generation
-            },
+            "options": self._chat_options(temperature),
         }
         
-        req = urllib.request.Request(
-            f"{self.ollama_host}/api/chat",
-            data=json.dumps(data).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        if self.response_cache is not None:
+            cached = self.response_cache.get(
+                self.response_cache.make_key(self.model, messages, data["options"])
+            )
+            if cached is not None:
+                return cached
         
-        with urllib.request.urlopen(req, timeout=self.timeout) as response:
-            result = json.loads(response.read().decode("utf-8"))
-            content = result.get("message", {}).get("content", "")
-            if not content:
-                raise ValueError("Empty response from Ollama")
-            return content
+        result = get_transport(self.ollama_host).post_json(
+            "/api/chat", data, timeout=self.timeout
+        )
+        content = result.get("message", {}).get("content", "")
+        if not content:
+            raise ValueError("Empty response from Ollama")
+        if store:
+            self._store_response(messages, content, temperature)
+        return content
+    
+    def _store_response(
+        self,
+        messages: list[dict],
+        content: str,
+        temperature: float | None = None,
+    ) -> None:
+        """Cache an accepted _ollama_chat response (no-op without a cache)."""
+        if self.response_cache is not None:
+            key = self.response_cache.make_key(self.model, messages, self._chat_options(temperature))
+            self.response_cache.put(key, content, model=self.model)
     
     def generate_with_validation(
         self,
@@ -314,10 +344,9 @@ class MultiPassGenerator:
             _progress(f"Attempt {attempt}/{self.max_attempts}...")
             
             try:
-                # Generate content
-                response = self._ollama_chat([
-                    {"role": "user", "content": prompt}
-                ])
+                # Generate content; cached only once it validates
+                messages = [{"role": "user", "content": prompt}]
+                response = self._ollama_chat(messages, store=False)
                 
                 # Parse JSON
                 success, parsed_data, error_msg = safe_parse_json(response)
@@ -351,6 +380,7 @@ class MultiPassGenerator:
                     # Success! Return the validated concept
                     elapsed = time.time() - start_time
                     concept = PedagogicalConcept.model_validate(parsed_data)
+                    self._store_response(messages, response)
                     _progress("Validation passed!")
                     return GenerationResult(
                         success=True,
@@ -541,9 +571,8 @@ class MultiPassGenerator:
         )
         
         try:
-            response = self._ollama_chat([
-                {"role": "user", "content": prompt}
-            ])
+            messages = [{"role": "user", "content": prompt}]
+            response = self._ollama_chat(messages, store=False)
             
             parsed = extract_json_from_llm_output(response)
             if not parsed:
@@ -558,7 +587,9 @@ class MultiPassGenerator:
                     if not parsed["query"].endswith(";"):
                         parsed["query"] += ";"
             
-            return SQLExample.model_validate(parsed)
+            example = SQLExample.model_validate(parsed)
+            self._store_response(messages, response)
+            return example
             
         except Exception:
             return None
@@ -587,9 +618,8 @@ class MultiPassGenerator:
         )
         
         try:
-            response = self._ollama_chat([
-                {"role": "user", "content": prompt}
-            ])
+            messages = [{"role": "user", "content": prompt}]
+            response = self._ollama_chat(messages, store=False)
             
             parsed = extract_json_from_llm_output(response)
             if not parsed or not isinstance(parsed, list):
@@ -607,6 +637,8 @@ class MultiPassGenerator:
                 except Exception:
                     continue
             
+            if mistakes:
+                self._store_response(messages, response)
             return mistakes
             
         except Exception:
@@ -627,18 +659,7 @@ def check_ollama_available(host: str | None = None) -> bool:
     Returns:
         True if Ollama is available
     """
-    host = host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
-    
-    try:
-        req = urllib.request.Request(
-            f"{host}/api/tags",
-            method="GET",
-            headers={"Content-Type": "application/json"},
-        )
-        with urllib.request.urlopen(req, timeout=5) as response:
-            return response.status == 200
-    except Exception:
-        return False
+    return get_transport(host).is_available(timeout=5)
 
 
 def list_available_models(host: str | None = None) -> list[dict]:
@@ -651,16 +672,4 @@ def list_available_models(host: str | None = None) -> list[dict]:
     Returns:
         List of model information dictionaries
     """
-    host = host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
-    
-    try:
-        req = urllib.request.Request(
-            f"{host}/api/tags",
-            method="GET",
-            headers={"Content-Type": "application/json"},
-        )
-        with urllib.request.urlopen(req, timeout=5) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            return data.get("models", [])
-    except Exception:
-        return []
+    return get_transport(host).list_models(timeout=5)
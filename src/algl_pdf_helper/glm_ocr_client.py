@@ -24,17 +24,17 @@ Environment:
 from __future__ import annotations
 
 import base64
-import json
 import logging
 import tempfile
 import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import fitz  # PyMuPDF
 
+from .llm_transport import get_transport
+
 
 logger = logging.getLogger(__name__)
 
@@ -142,33 +142,21 @@ class GLMOCRClient:
     
     def _check_availability(self) -> bool:
         """Check if Ollama is running and GLM-OCR model is available."""
-        try:
-            req = urllib.request.Request(
-                f"{self.host}/api/tags",
-                method="GET",
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    models = data.get("models", [])
-                    model_names = [m.get("name", "") for m in models]
-                    
-                    # Check for our model
-                    if self.model in model_names:
-                        logger.info(f"GLM-OCR model '{self.model}' is available")
-                        return True
-                    else:
-                        logger.warning(
-                            f"GLM-OCR model '{self.model}' not found in Ollama. "
-                            f"Available models: {model_names}"
-                        )
-                        return False
-        except urllib.error.URLError as e:
-            logger.debug(f"Ollama not available at {self.host}: {e}")
-        except Exception as e:
-            logger.debug(f"Error checking Ollama availability: {e}")
+        transport = get_transport(self.host)
+        if not transport.is_available(timeout=5):
+            logger.debug(f"Ollama not available at {self.host}")
+            return False
+        
+        model_names = transport.model_names(timeout=5)
         
+        # Check for our model
+        if self.model in model_names:
+            logger.info(f"GLM-OCR model '{self.model}' is available")
+            return True
+        logger.warning(
+            f"GLM-OCR model '{self.model}' not found in Ollama. "
+            f"Available models: {model_names}"
+        )
         return False
     
     def ocr_pdf_slice(
@@ -304,7 +292,7 @@ class GLMOCRClient:
         Returns:
             Model response text
         """
-        data = json.dumps({
+        data = {
             "model": self.model,
             "prompt": prompt,
             "images": images_base64,
@@ -313,19 +301,13 @@ class GLMOCRClient:
                 "temperature": 0.0,  # Deterministic for OCR
                 "num_predict": 8000,  # Generous limit for long documents
             }
-        }).encode("utf-8")
-        
-        req = urllib.request.Request(
-            f"{self.host}/api/generate",
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        }
         
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return result.get("response", "")
+            result = get_transport(self.host).post_json(
+                "/api/generate", data, timeout=self.timeout
+            )
+            return result.get("response", "")
         except urllib.error.HTTPError as e:
             error_body = e.read().decode()
             raise RuntimeError(f"Ollama API error: {e.code} - {error_body}")
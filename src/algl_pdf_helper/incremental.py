@@ -0,0 +1,376 @@
+"""
+Incremental re-indexing support for build_index.
+
+A build records, next to manifest.json, a ``page-hashes.json`` file holding
+a fingerprint of the build settings and a SHA-256 of every page's extracted
+text per document. With ``build_index(..., incremental=True)`` the previous
+output is loaded and:
+
+- a document whose file SHA-256 (and doc ID) is unchanged is reused whole:
+  no OCR, extraction, chunking or embedding;
+- a changed document is re-extracted, but pages whose text hash matches the
+  previous build of the same file reuse their chunks (renamed to the new
+  doc ID); only the remaining pages are chunked and embedded.
+
+Chunks are a pure function of (doc ID, page number, page text, settings),
+so the result, and therefore the indexId, equals a clean build.
+
+Loading a previous build only records where each document's chunks are
+stored; a document's chunks are read when it is reused, so incremental
+and streaming builds keep their memory bounds.
+
+Example:
+    build_index(pdf_dir, out_dir, options=opts, incremental=True)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .binary_index import BinaryChunkIndex, has_binary_index
+from .embedding import build_hash_embeddings
+from .extract import OCR_PIPELINE_VERSION, TEXT_EXTRACTOR_VERSION
+from .models import AssetManifest, IndexBuildOptions, PdfIndexChunk, PdfSourceDoc
+
+
+PAGE_HASHES_FILENAME = "page-hashes.json"
+PAGE_HASHES_VERSION = "page-hashes-v1"
+
+# Characters read at a time when scanning the previous chunks.json
+_SCAN_BLOCK_CHARS = 1024 * 1024
+
+# (start, end) of runs of one document's chunks: byte offsets in
+# chunks.json, or row numbers in the binary layout
+Spans = list[tuple[int, int]]
+
+
+def build_settings_fingerprint(
+    options: IndexBuildOptions,
+    *,
+    strip_headers: bool,
+    ocr: bool,
+    auto_ocr: bool,
+    smart_skip_threshold: float,
+    ocr_mode: str = "document",
+    extract_assets: bool = True,
+    asset_backend: str = "pymupdf",
+) -> str:
+    """Hash of every setting that affects extracted text, chunks or assets."""
+    payload = {
+        "options": options.model_dump(),
+        "stripHeaders": strip_headers,
+        "ocr": ocr,
+        "autoOcr": auto_ocr,
+        "smartSkipThreshold": smart_skip_threshold,
+        "textExtractor": TEXT_EXTRACTOR_VERSION,
+        "ocrPipeline": OCR_PIPELINE_VERSION,
+    }
+    # Only recorded when not the default, so builds from before these
+    # settings existed keep their fingerprint
+    if ocr_mode != "document":
+        payload["ocrMode"] = ocr_mode
+    if not extract_assets:
+        payload["extractAssets"] = False
+    if asset_backend != "pymupdf":
+        payload["assetBackend"] = asset_backend
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def page_text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def page_hashes(pages: list[tuple[int, str]]) -> dict[int, str]:
+    """Map page number -> hash of the page's extracted text."""
+    return {page_num: page_text_hash(text) for page_num, text in pages}
+
+
+def rename_chunk(chunk: PdfIndexChunk, old_doc_id: str, new_doc_id: str) -> PdfIndexChunk:
+    """Move a chunk to another doc ID (chunk IDs are "<docId>:p<page>:c<n>")."""
+    if old_doc_id == new_doc_id:
+        return chunk
+    return chunk.model_copy(update={
+        "docId": new_doc_id,
+        "chunkId": new_doc_id + chunk.chunkId[len(old_doc_id):],
+    })
+
+
+def write_page_hashes(
+    out_dir: Path,
+    fingerprint: str,
+    source_docs: list[PdfSourceDoc],
+    hashes: dict[str, dict[int, str]],
+) -> None:
+    """Record per-page text hashes for the next incremental build."""
+    data = {
+        "schemaVersion": PAGE_HASHES_VERSION,
+        "settings": fingerprint,
+        "docs": {
+            doc.docId: {
+                "filename": doc.filename,
+                "sha256": doc.sha256,
+                "pages": {str(p): h for p, h in sorted(hashes.get(doc.docId, {}).items())},
+            }
+            for doc in source_docs
+        },
+    }
+    (out_dir / PAGE_HASHES_FILENAME).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+@dataclass
+class PreviousDoc:
+    """One document of the previous build.
+
+    Its chunks stay on disk until load_chunks() reads them, so a previous
+    build costs memory only for the documents actually reused.
+    """
+    source: PdfSourceDoc
+    page_hashes: dict[int, str]
+    asset_manifest: AssetManifest | None = None
+    chunk_reader: Callable[[], list[PdfIndexChunk]] = field(default=list, repr=False)
+
+    def load_chunks(self) -> list[PdfIndexChunk]:
+        """Read this document's chunks from the previous build."""
+        return self.chunk_reader()
+
+    def chunks_by_page(self) -> dict[int, list[PdfIndexChunk]]:
+        by_page: dict[int, list[PdfIndexChunk]] = {}
+        for chunk in self.load_chunks():
+            by_page.setdefault(chunk.page, []).append(chunk)
+        return by_page
+
+
+@dataclass
+class IncrementalStats:
+    """What an incremental build reused vs processed."""
+    docs_reused: int = 0
+    docs_processed: int = 0
+    pages_reused: int = 0
+    pages_processed: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "docs_reused": self.docs_reused,
+            "docs_processed": self.docs_processed,
+            "pages_reused": self.pages_reused,
+            "pages_processed": self.pages_processed,
+        }
+
+
+class PreviousIndex:
+    """The previous build's documents, chunks and page hashes."""
+
+    def __init__(self, docs: list[PreviousDoc]):
+        self.docs = docs
+        self._by_sha = {d.source.sha256: d for d in docs}
+        self._by_filename: dict[str, PreviousDoc] = {}
+        for d in docs:
+            self._by_filename.setdefault(d.source.filename, d)
+        self.stats = IncrementalStats()
+
+    @classmethod
+    def load(cls, out_dir: Path, fingerprint: str) -> PreviousIndex | None:
+        """Load the previous build from out_dir.
+
+        Returns None (meaning: do a full build) when there is no previous
+        build, it predates page hashes, or it used different settings.
+        """
+        manifest_path = out_dir / "manifest.json"
+        hashes_path = out_dir / PAGE_HASHES_FILENAME
+        if not manifest_path.exists() or not hashes_path.exists():
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            hashes = json.loads(hashes_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if hashes.get("schemaVersion") != PAGE_HASHES_VERSION or hashes.get("settings") != fingerprint:
+            return None
+
+        located = _locate_previous_chunks(out_dir)
+        if located is None:
+            return None
+        read_spans, by_doc = located
+
+        docs = []
+        for source_data in manifest.get("sourceDocs", []):
+            source = PdfSourceDoc(**source_data)
+            doc_hashes = hashes.get("docs", {}).get(source.docId)
+            if not doc_hashes or doc_hashes.get("sha256") != source.sha256:
+                continue
+            asset_manifest = None
+            asset_path = out_dir / f"asset-manifest-{source.docId}.json"
+            if asset_path.exists():
+                try:
+                    asset_manifest = AssetManifest(
+                        **json.loads(asset_path.read_text(encoding="utf-8"))
+                    )
+                except (OSError, ValueError):
+                    asset_manifest = None
+            docs.append(
+                PreviousDoc(
+                    source=source,
+                    page_hashes={int(p): h for p, h in doc_hashes.get("pages", {}).items()},
+                    asset_manifest=asset_manifest,
+                    chunk_reader=partial(read_spans, by_doc.get(source.docId, [])),
+                )
+            )
+        return cls(docs)
+
+    def reusable_doc(
+        self,
+        doc_id: str,
+        filename: str,
+        sha256: str,
+        *,
+        need_assets: bool,
+    ) -> PreviousDoc | None:
+        """The previous build of an unchanged file, if it can be reused whole."""
+        prev = self._by_sha.get(sha256)
+        if prev is None or prev.source.docId != doc_id or prev.source.filename != filename:
+            return None
+        if need_assets and prev.asset_manifest is None:
+            return None
+        return prev
+
+    def previous_version(self, filename: str) -> PreviousDoc | None:
+        """The previous build of a file with this name (for page reuse)."""
+        return self._by_filename.get(filename)
+
+
+def split_pages_for_reuse(
+    doc_id: str,
+    pages: list[tuple[int, str]],
+    hashes: dict[int, str],
+    previous: PreviousDoc | None,
+) -> tuple[list[PdfIndexChunk], list[tuple[int, str]]]:
+    """Split a changed document's pages into reused chunks and pages to chunk.
+
+    Returns:
+        Tuple of (reused chunks renamed to doc_id, pages still to process)
+    """
+    if previous is None:
+        return [], pages
+    prev_chunks = previous.chunks_by_page()
+    reused: list[PdfIndexChunk] = []
+    todo: list[tuple[int, str]] = []
+    for page_num, text in pages:
+        if previous.page_hashes.get(page_num) == hashes[page_num]:
+            reused.extend(
+                rename_chunk(c, previous.source.docId, doc_id)
+                for c in prev_chunks.get(page_num, [])
+            )
+        else:
+            todo.append((page_num, text))
+    return reused, todo
+
+
+def _locate_previous_chunks(
+    out_dir: Path,
+) -> tuple[Callable[[Spans], list[PdfIndexChunk]], dict[str, Spans]] | None:
+    """Find where each document's chunks are stored in the previous build.
+
+    Returns:
+        Tuple of (reader turning a document's spans into its chunks,
+        docId -> spans), or None if there is no readable previous index
+    """
+    chunks_path = out_dir / "chunks.json"
+    if chunks_path.exists():
+        by_doc: dict[str, Spans] = {}
+        last_doc: str | None = None
+        try:
+            for start, end, item in _scan_json_array(chunks_path):
+                doc_id = item["docId"]
+                if doc_id == last_doc:
+                    by_doc[doc_id][-1] = (by_doc[doc_id][-1][0], end)
+                else:
+                    by_doc.setdefault(doc_id, []).append((start, end))
+                last_doc = doc_id
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return partial(_read_json_chunks, chunks_path), by_doc
+    if has_binary_index(out_dir):
+        with BinaryChunkIndex.open(out_dir) as index:
+            doc_rows = np.asarray(index.doc_indices)
+            doc_ids = index.doc_ids
+        by_doc = {}
+        # Rows where the document changes delimit runs of one document
+        bounds = [0, *(np.flatnonzero(np.diff(doc_rows)) + 1).tolist(), len(doc_rows)]
+        for start, end in zip(bounds, bounds[1:]):
+            if end > start:
+                by_doc.setdefault(doc_ids[int(doc_rows[start])], []).append((start, end))
+        return partial(_read_binary_chunks, out_dir), by_doc
+    return None
+
+
+def _scan_json_array(path: Path) -> Iterator[tuple[int, int, Any]]:
+    """Yield (start byte, end byte, item) for each item of a JSON array file.
+
+    The file is read in blocks, so only one item is held at a time.
+
+    Raises:
+        ValueError: If the file is not a JSON array
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buf = f.read(_SCAN_BLOCK_CHARS)
+        pos = len(buf) - len(buf.lstrip())
+        if buf[pos:pos + 1] != "[":
+            raise ValueError(f"{path} is not a JSON array")
+        pos += 1
+        byte_pos = len(buf[:pos].encode("utf-8"))  # offset of buf[pos]
+        eof = False
+        while True:
+            skip = pos
+            while skip < len(buf) and buf[skip] in " \t\r\n,":
+                skip += 1
+            byte_pos += skip - pos  # separators are ASCII
+            pos = skip
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            try:
+                if pos == len(buf):
+                    raise json.JSONDecodeError("Need more data", buf, pos)
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more = f.read(_SCAN_BLOCK_CHARS)
+                eof = not more
+                buf, pos = buf[pos:] + more, 0
+                continue
+            size = len(buf[pos:end].encode("utf-8"))
+            yield byte_pos, byte_pos + size, item
+            byte_pos += size
+            pos = end
+
+
+def _read_json_chunks(chunks_path: Path, spans: Spans) -> list[PdfIndexChunk]:
+    chunks: list[PdfIndexChunk] = []
+    with open(chunks_path, "rb") as f:
+        for start, end in spans:
+            f.seek(start)
+            data = json.loads(b"[" + f.read(end - start) + b"]")
+            chunks.extend(PdfIndexChunk(**c) for c in data)
+    return chunks
+
+
+def _read_binary_chunks(out_dir: Path, spans: Spans) -> list[PdfIndexChunk]:
+    with BinaryChunkIndex.open(out_dir) as index:
+        chunks = [index.get_chunk(i) for start, end in spans for i in range(start, end)]
+    # The binary layout stores float32 embeddings; recompute the exact
+    # float64 values so reused chunks match a clean build
+    if chunks and chunks[0].embedding is not None:
+        dim = len(chunks[0].embedding)
+        embeddings = build_hash_embeddings([c.text for c in chunks], dim, dtype=np.float64)
+        for chunk, emb in zip(chunks, embeddings.tolist()):
+            chunk.embedding = emb
+    return chunks
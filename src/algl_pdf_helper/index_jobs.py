@@ -0,0 +1,192 @@
+"""
+Background indexing jobs for the HTTP server.
+
+``build_index`` is synchronous and CPU-bound (OCR, PyMuPDF, chunking), so
+running it inside an ``async`` request handler blocks every other request
+on the worker. ``IndexJobManager`` runs builds on a bounded process pool
+and keeps a small registry of jobs that handlers can poll:
+
+- ``submit`` queues a build of an uploaded PDF already saved to disk and
+  returns immediately; a full queue raises ``JobQueueFull``.
+- ``get`` returns the job; once it has succeeded, ``index_response`` turns
+  its in-memory document into the API payload (no re-reading of the JSON
+  files the build wrote).
+
+Each job owns a scratch directory (upload plus build output) that is
+removed when the job finishes.
+
+Example:
+    manager = IndexJobManager(max_workers=2)
+    job = manager.submit(work_dir, work_dir / "book.pdf", {"options": opts})
+    ...
+    if job.status == "succeeded":
+        payload = index_response(job.document)
+"""
+
+from __future__ import annotations
+
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+from .indexer import build_index
+from .models import PdfIndexDocument, PdfIndexManifest
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+DEFAULT_MAX_PENDING_JOBS = 16
+DEFAULT_MAX_FINISHED_JOBS = 100
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when too many jobs are already queued or running."""
+
+
+def run_index_job(work_dir: Path, pdf_path: Path, build_kwargs: dict[str, Any]) -> PdfIndexDocument:
+    """Build one index in a pool worker, then delete its scratch directory."""
+    try:
+        return build_index(pdf_path, work_dir / "pdf-index", **build_kwargs)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def index_response(document: PdfIndexDocument) -> dict[str, Any]:
+    """API payload for a finished build: document, manifest and chunks."""
+    data = document.model_dump()
+    manifest = {name: data[name] for name in PdfIndexManifest.model_fields}
+    return {"document": data, "manifest": manifest, "chunks": data["chunks"]}
+
+
+@dataclass
+class IndexJob:
+    """One queued, running or finished index build."""
+    id: str
+    filename: str
+    created_at: str
+    future: Future = field(repr=False)
+    finished_at: str | None = None
+
+    @property
+    def status(self) -> JobStatus:
+        if not self.future.done():
+            return "running" if self.future.running() else "queued"
+        return "failed" if self.error is not None else "succeeded"
+
+    @property
+    def document(self) -> PdfIndexDocument | None:
+        """The built index once the job has succeeded."""
+        if self.future.done() and self.error is None:
+            return self.future.result()
+        return None
+
+    @property
+    def error(self) -> str | None:
+        if not self.future.done():
+            return None
+        if self.future.cancelled():
+            return "cancelled"
+        exc = self.future.exception()
+        return None if exc is None else (str(exc) or type(exc).__name__)
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "jobId": self.id,
+            "status": self.status,
+            "filename": self.filename,
+            "createdAt": self.created_at,
+            "finishedAt": self.finished_at,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+class IndexJobManager:
+    """Run index builds on a bounded process pool and track their state.
+
+    Args:
+        max_workers: Worker processes, i.e. builds running at once
+        max_pending: Queued plus running jobs accepted before submit
+            raises JobQueueFull
+        max_finished: Finished jobs kept for polling; older ones are
+            forgotten first
+        executor_factory: Creates the pool from max_workers (tests can
+            pass a thread pool)
+
+    A custom ``runner`` passed to submit is called as
+    ``runner(work_dir, pdf_path, build_kwargs)`` like run_index_job.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING_JOBS,
+        max_finished: int = DEFAULT_MAX_FINISHED_JOBS,
+        executor_factory: Callable[[int], Executor] = ProcessPoolExecutor,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self._executor = executor_factory(max_workers)
+        self._jobs: OrderedDict[str, IndexJob] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        work_dir: Path,
+        pdf_path: Path,
+        build_kwargs: dict[str, Any],
+        *,
+        runner: Callable[..., PdfIndexDocument] = run_index_job,
+    ) -> IndexJob:
+        """Queue a build of pdf_path; work_dir is deleted when it finishes.
+
+        Raises:
+            JobQueueFull: If max_pending jobs are already queued or running
+        """
+        with self._lock:
+            pending = sum(1 for j in self._jobs.values() if not j.future.done())
+            if pending >= self.max_pending:
+                raise JobQueueFull(
+                    f"{pending} indexing jobs already queued; try again later"
+                )
+            future = self._executor.submit(runner, work_dir, pdf_path, build_kwargs)
+            job = IndexJob(
+                id=uuid.uuid4().hex,
+                filename=pdf_path.name,
+                created_at=_now(),
+                future=future,
+            )
+            self._jobs[job.id] = job
+        future.add_done_callback(lambda f: self._finish(job, work_dir))
+        return job
+
+    def get(self, job_id: str) -> IndexJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _finish(self, job: IndexJob, work_dir: Path) -> None:
+        # Runs on the pool's callback thread. The runner normally removed
+        # work_dir already; this catches jobs cancelled before they ran.
+        shutil.rmtree(work_dir, ignore_errors=True)
+        with self._lock:
+            job.finished_at = _now()
+            finished = [j for j in self._jobs.values() if j.finished_at is not None]
+            for old in finished[: max(0, len(finished) - self.max_finished)]:
+                del self._jobs[old.id]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -3,32 +3,50 @@ from __future__ import annotations
 import hashlib
 import json
 import warnings
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
 
+import numpy as np
 import typer
 
 from .optimized_indexer import (
+    StreamingJsonArray,
     fast_json_dump,
     fast_json_dumps,
+    fast_json_loads,
+    open_json_object_array,
     optimize_for_large_document,
 )
 
-from .chunker import chunk_for_learning, chunk_page_words
+from .binary_index import remove_binary_index, write_binary_index, write_binary_index_stream
+from .chunk_store import ChunkRunStore, ChunkSink
+from .chunker import chunk_document, chunk_for_learning
 from .clean import (
     clean_pages_for_students,
     normalize_text,
     strip_repeated_headers_footers,
 )
-from .embedding import build_hash_embedding
+from .embedding import build_hash_embeddings
 from .extract import (
+    OcrMode,
     check_extraction_quality,
     cleanup_temp_pdf,
     extract_pages_fitz,
     maybe_ocr_pdf,
     sha256_file,
 )
+from .extraction_cache import ExtractionCache
+from .incremental import (
+    PreviousDoc,
+    PreviousIndex,
+    build_settings_fingerprint,
+    page_hashes,
+    split_pages_for_reuse,
+    write_page_hashes,
+)
+from .pdf_session import PdfSession
 from .concept_mapper import (
     build_concept_manifest,
     find_concepts_config,
@@ -128,6 +146,9 @@ def extract_and_save_assets(
     backend: Literal["pymupdf", "marker"] = "pymupdf",
     extract_images: bool = True,
     extract_tables: bool = True,
+    session: PdfSession | None = None,
+    table_scan: Literal["all", "recall", "speed"] = "recall",
+    workers: int = 1,
 ) -> AssetManifest | None:
     """Extract and save assets from a PDF.
     
@@ -138,6 +159,11 @@ def extract_and_save_assets(
         backend: Extraction backend to use
         extract_images: Whether to extract images
         extract_tables: Whether to extract tables
+        session: Optional open PdfSession for pdf_path
+        table_scan: Which pages to search for tables (see AssetExtractor)
+        workers: Worker processes for PNG conversion and table search
+                 (see AssetExtractor); keep at 1 when already running on
+                 a process-pool worker
         
     Returns:
         AssetManifest if extraction successful, None otherwise
@@ -146,16 +172,18 @@ def extract_and_save_assets(
         return None
     
     try:
-        extractor = AssetExtractor(backend=backend)
+        extractor = AssetExtractor(
+            backend=backend, workers=workers, table_scan=table_scan
+        )
         
         images: list[ExtractedAsset] = []
         tables: list[ExtractedAsset] = []
         
         if extract_images:
-            images = extractor.extract_images(pdf_path, doc_id)
+            images = extractor.extract_images(pdf_path, doc_id, session=session)
         
         if extract_tables:
-            tables = extractor.extract_tables(pdf_path, doc_id)
+            tables = extractor.extract_tables(pdf_path, doc_id, session=session)
         
         # Save assets to disk
         extractor.save_assets(images, out_dir)
@@ -225,6 +253,493 @@ def save_asset_manifest(
     fast_json_dump(manifest.model_dump(), out_path, indent=True)
 
 
+# Pages per shard when a document's pages are fanned out over the worker pool
+DEFAULT_SHARD_PAGES = 50
+
+
+def _extract_pdf_pages(
+    pdf_path: Path,
+    *,
+    ocr: bool,
+    auto_ocr: bool,
+    smart_skip_threshold: float,
+    session: PdfSession | None = None,
+    cache: ExtractionCache | None = None,
+    ocr_mode: OcrMode = "document",
+) -> tuple[Path, bool, list[tuple[int, str]]]:
+    """Run the OCR decision and text extraction for one PDF.
+
+    When a session for pdf_path is given, the OCR quality check and the
+    final extraction share its page decodes. With a cache, an unchanged
+    PDF is served from previously cached pages and OCR output.
+
+    Returns:
+        Tuple of (pdf_to_use, did_ocr, pages). When did_ocr is True the
+        caller owns the temporary OCR'd PDF and must clean it up.
+    """
+    did_ocr = False
+    pdf_to_use = pdf_path
+    filename = pdf_path.name
+
+    try:
+        # Step 1: Try without OCR first (unless force OCR)
+        # SMART SKIP: High quality PDFs skip OCR even when ocr=True
+        try:
+            pdf_to_use, did_ocr = maybe_ocr_pdf(
+                pdf_path,
+                force=ocr,
+                auto=auto_ocr,
+                smart_skip_threshold=smart_skip_threshold,
+                session=session,
+                cache=cache,
+                ocr_mode=ocr_mode,
+            )
+        except RuntimeError as e:
+            if "ocrmypdf is not installed" in str(e):
+                if ocr:
+                    typer.echo(f"❌ Error: {e}", err=True)
+                    typer.echo("Install with: pip install -e '.[ocr]'", err=True)
+                    raise typer.Exit(1)
+                else:
+                    # Auto-OCR was triggered but ocrmypdf not installed
+                    warnings.warn(
+                        f"Low quality text detected but ocrmypdf not installed. "
+                        f"Install with: pip install -e '.[ocr]'"
+                    )
+                    pdf_to_use = pdf_path
+                    did_ocr = False
+            else:
+                raise
+
+        pages = extract_pages_fitz(
+            pdf_to_use,
+            session=session if pdf_to_use == pdf_path else None,
+            cache=cache,
+        )
+
+        # Step 2: Check quality of extracted text
+        quality_info = check_extraction_quality(pages)
+
+        # Step 3: If quality is poor and we didn't OCR yet, retry with OCR
+        if not quality_info["is_quality_good"] and not did_ocr and not ocr:
+            warnings.warn(
+                f"Low quality extraction for '{filename}': {quality_info['reason']}. "
+                f"Retrying with OCR..."
+            )
+
+            # Clean up temp if we created one
+            if pdf_to_use != pdf_path:
+                cleanup_temp_pdf(pdf_to_use)
+
+            # Force OCR (but still respect smart skip for very high quality)
+            try:
+                pdf_to_use, did_ocr = maybe_ocr_pdf(
+                    pdf_path,
+                    force=True,
+                    auto=False,
+                    smart_skip_threshold=1.0,  # Disable smart skip when we really need OCR
+                    session=session,
+                    cache=cache,
+                    ocr_mode=ocr_mode,
+                )
+            except RuntimeError as e:
+                if "ocrmypdf is not installed" in str(e):
+                    warnings.warn(
+                        f"OCR recommended but ocrmypdf not installed. "
+                        f"Install with: pip install -e '.[ocr]'"
+                    )
+                    pdf_to_use = pdf_path
+                    did_ocr = False
+                else:
+                    raise
+
+            # Re-extract with OCR
+            pages = extract_pages_fitz(
+                pdf_to_use,
+                session=session if pdf_to_use == pdf_path else None,
+                cache=cache,
+            )
+            quality_info = check_extraction_quality(pages)
+
+            if quality_info["is_quality_good"]:
+                warnings.warn(f"OCR improved quality for '{filename}'!")
+
+        if not pages:
+            raise RuntimeError(
+                f"No text extracted from '{filename}'. "
+                "Try --ocr or check the PDF is not corrupted."
+            )
+    except BaseException:
+        if did_ocr:
+            cleanup_temp_pdf(pdf_to_use)
+        raise
+
+    return pdf_to_use, did_ocr, pages
+
+
+def _prepare_pdf(
+    pdf_path: Path,
+    *,
+    ocr: bool,
+    auto_ocr: bool,
+    smart_skip_threshold: float,
+    cache: ExtractionCache | None = None,
+    ocr_mode: OcrMode = "document",
+) -> tuple[str, Path, bool, list[tuple[int, str]]]:
+    """Worker entry point: hash and extract one PDF.
+
+    Returns:
+        Tuple of (sha256, pdf_to_use, did_ocr, pages)
+    """
+    with PdfSession(pdf_path) as session:
+        pdf_to_use, did_ocr, pages = _extract_pdf_pages(
+            pdf_path,
+            ocr=ocr,
+            auto_ocr=auto_ocr,
+            smart_skip_threshold=smart_skip_threshold,
+            session=session,
+            cache=cache,
+            ocr_mode=ocr_mode,
+        )
+        return session.sha256, pdf_to_use, did_ocr, pages
+
+
+def _chunk_pages(
+    doc_id: str,
+    pages: list[tuple[int, str]],
+    *,
+    options: IndexBuildOptions,
+    strip_headers: bool,
+) -> list[PdfIndexChunk]:
+    """Clean, chunk and embed a run of pages from one document.
+
+    Every step is page-local, so any page-range shard of a document
+    yields exactly the chunks the whole document would for those pages.
+    """
+    if strip_headers:
+        # Use student-optimized cleaning
+        pages = clean_pages_for_students(pages)
+
+    page_chunks = [
+        (r.page, r.chunk_id, r.text)
+        for r in chunk_document(
+            doc_id=doc_id,
+            pages=pages,
+            chunk_words=options.chunkWords,
+            overlap_words=options.overlapWords,
+        )
+    ]
+
+    # One batched pass; float64 rows equal build_hash_embedding exactly
+    embeddings = build_hash_embeddings(
+        [text for _, _, text in page_chunks], options.embeddingDim, dtype=np.float64
+    ).tolist()
+
+    return [
+        PdfIndexChunk(
+            chunkId=chunk_id,
+            docId=doc_id,
+            page=page_num,
+            text=chunk_text,
+            embedding=emb,
+        )
+        for (page_num, chunk_id, chunk_text), emb in zip(page_chunks, embeddings)
+    ]
+
+
+def _assign_doc_id(
+    filename: str,
+    sha: str,
+    used_doc_ids: set[str],
+    use_aliases: bool,
+) -> str:
+    if use_aliases:
+        base_id = get_doc_alias(filename)
+        return unique_doc_id(base_id, used_doc_ids)
+    # Upload-mode doc IDs: match main app
+    return f"doc-{sha[:12]}"
+
+
+def _index_pdfs_serial(
+    pdfs: list[Path],
+    out_dir: Path,
+    *,
+    options: IndexBuildOptions,
+    ocr: bool,
+    auto_ocr: bool,
+    use_aliases: bool,
+    strip_headers: bool,
+    extract_assets: bool,
+    asset_backend: Literal["pymupdf", "marker"],
+    smart_skip_threshold: float,
+    ocr_mode: OcrMode,
+    cache: ExtractionCache | None,
+    previous: PreviousIndex | None,
+    page_hashes_out: dict[str, dict[int, str]],
+    chunks: ChunkSink,
+) -> tuple[list[PdfSourceDoc], ChunkSink, dict[str, AssetManifest]]:
+    used_doc_ids: set[str] = set()
+    source_docs: list[PdfSourceDoc] = []
+    asset_manifests: dict[str, AssetManifest] = {}  # doc_id -> manifest
+    need_assets = extract_assets and ASSET_EXTRACTION_AVAILABLE
+
+    for pdf_path in pdfs:
+        # One open document shared by the OCR check, hashing, text and assets
+        with PdfSession(pdf_path) as session:
+            sha = session.sha256
+            doc_id = _assign_doc_id(pdf_path.name, sha, used_doc_ids, use_aliases)
+
+            if previous is not None:
+                prev = previous.reusable_doc(
+                    doc_id, pdf_path.name, sha, need_assets=need_assets
+                )
+                if prev is not None:
+                    _reuse_document(
+                        prev, source_docs, chunks, asset_manifests, page_hashes_out,
+                        need_assets=need_assets,
+                    )
+                    previous.stats.docs_reused += 1
+                    continue
+
+            pdf_to_use, did_ocr, pages = _extract_pdf_pages(
+                pdf_path,
+                ocr=ocr,
+                auto_ocr=auto_ocr,
+                smart_skip_threshold=smart_skip_threshold,
+                session=session,
+                cache=cache,
+                ocr_mode=ocr_mode,
+            )
+            try:
+                source_docs.append(
+                    PdfSourceDoc(
+                        docId=doc_id,
+                        filename=pdf_path.name,
+                        sha256=sha,
+                        pageCount=len(pages),
+                    )
+                )
+
+                # Step 4: Extract assets (images and tables) if enabled
+                if need_assets:
+                    asset_manifest = extract_and_save_assets(
+                        pdf_path=pdf_to_use,
+                        doc_id=doc_id,
+                        out_dir=out_dir,
+                        backend=asset_backend,
+                        extract_images=True,
+                        extract_tables=True,
+                        session=session if pdf_to_use == pdf_path else None,
+                    )
+                    if asset_manifest:
+                        asset_manifests[doc_id] = asset_manifest
+
+                reused, pages = _split_changed_pages(
+                    doc_id, pdf_path.name, pages, previous, page_hashes_out
+                )
+                chunks.extend(reused)
+                chunks.extend(
+                    _chunk_pages(doc_id, pages, options=options, strip_headers=strip_headers)
+                )
+            finally:
+                if did_ocr:
+                    cleanup_temp_pdf(pdf_to_use)
+
+    return source_docs, chunks, asset_manifests
+
+
+def _reuse_document(
+    prev: PreviousDoc,
+    source_docs: list[PdfSourceDoc],
+    chunks: ChunkSink,
+    asset_manifests: dict[str, AssetManifest],
+    page_hashes_out: dict[str, dict[int, str]],
+    *,
+    need_assets: bool,
+) -> None:
+    """Carry an unchanged document over from the previous build."""
+    doc_id = prev.source.docId
+    source_docs.append(prev.source)
+    chunks.extend(prev.load_chunks())
+    page_hashes_out[doc_id] = prev.page_hashes
+    if need_assets and prev.asset_manifest is not None:
+        asset_manifests[doc_id] = prev.asset_manifest
+
+
+def _split_changed_pages(
+    doc_id: str,
+    filename: str,
+    pages: list[tuple[int, str]],
+    previous: PreviousIndex | None,
+    page_hashes_out: dict[str, dict[int, str]],
+) -> tuple[list[PdfIndexChunk], list[tuple[int, str]]]:
+    """Hash a processed document's pages and pick out the unchanged ones.
+
+    Returns:
+        Tuple of (chunks reused from the previous build, pages to chunk)
+    """
+    hashes = page_hashes(pages)
+    page_hashes_out[doc_id] = hashes
+    if previous is None:
+        return [], pages
+    reused, todo = split_pages_for_reuse(
+        doc_id, pages, hashes, previous.previous_version(filename)
+    )
+    previous.stats.docs_processed += 1
+    previous.stats.pages_reused += len(pages) - len(todo)
+    previous.stats.pages_processed += len(todo)
+    return reused, todo
+
+
+def _drain_chunk_futures(futures: list[Future], chunks: ChunkSink, *, wait: bool) -> None:
+    """Move finished (or, with wait, all) shard results into chunks."""
+    pending = []
+    for future in futures:
+        if wait or future.done():
+            chunks.extend(future.result())
+        else:
+            pending.append(future)
+    futures[:] = pending
+
+
+def _index_pdfs_parallel(
+    pdfs: list[Path],
+    out_dir: Path,
+    *,
+    workers: int,
+    shard_pages: int,
+    options: IndexBuildOptions,
+    ocr: bool,
+    auto_ocr: bool,
+    use_aliases: bool,
+    strip_headers: bool,
+    extract_assets: bool,
+    asset_backend: Literal["pymupdf", "marker"],
+    smart_skip_threshold: float,
+    ocr_mode: OcrMode,
+    cache: ExtractionCache | None,
+    previous: PreviousIndex | None,
+    page_hashes_out: dict[str, dict[int, str]],
+    chunks: ChunkSink,
+) -> tuple[list[PdfSourceDoc], ChunkSink, dict[str, AssetManifest]]:
+    """Fan documents, then page-range shards, out over a process pool.
+
+    Doc IDs are still assigned in discovery order in this process, so
+    alias de-duplication matches the serial path exactly. In incremental
+    mode files are hashed here first and unchanged documents are never
+    submitted.
+    """
+    used_doc_ids: set[str] = set()
+    source_docs: list[PdfSourceDoc] = []
+    asset_manifests: dict[str, AssetManifest] = {}  # doc_id -> manifest
+    prepared: list[Future] = []
+    need_assets = extract_assets and ASSET_EXTRACTION_AVAILABLE
+
+    # doc_id and reusable previous build per PDF (incremental mode only)
+    plan: list[tuple[str | None, PreviousDoc | None]] = [(None, None)] * len(pdfs)
+    if previous is not None:
+        plan = []
+        for pdf_path in pdfs:
+            sha = sha256_file(pdf_path)
+            doc_id = _assign_doc_id(pdf_path.name, sha, used_doc_ids, use_aliases)
+            plan.append((
+                doc_id,
+                previous.reusable_doc(doc_id, pdf_path.name, sha, need_assets=need_assets),
+            ))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Phase 1: OCR decision + extraction, one task per document
+            prepared_by_pdf: dict[int, Future] = {
+                i: pool.submit(
+                    _prepare_pdf,
+                    pdf_path,
+                    ocr=ocr,
+                    auto_ocr=auto_ocr,
+                    smart_skip_threshold=smart_skip_threshold,
+                    cache=cache,
+                    ocr_mode=ocr_mode,
+                )
+                for i, pdf_path in enumerate(pdfs)
+                if plan[i][1] is None
+            }
+            prepared = list(prepared_by_pdf.values())
+
+            # Phase 2: assets per document, clean/chunk/embed per page shard
+            asset_futures: dict[str, Future] = {}
+            chunk_futures: list[Future] = []
+            for i, pdf_path in enumerate(pdfs):
+                doc_id, prev = plan[i]
+                if prev is not None:
+                    _reuse_document(
+                        prev, source_docs, chunks, asset_manifests, page_hashes_out,
+                        need_assets=need_assets,
+                    )
+                    previous.stats.docs_reused += 1
+                    continue
+
+                sha, pdf_to_use, _, pages = prepared_by_pdf[i].result()
+                if doc_id is None:
+                    doc_id = _assign_doc_id(pdf_path.name, sha, used_doc_ids, use_aliases)
+
+                source_docs.append(
+                    PdfSourceDoc(
+                        docId=doc_id,
+                        filename=pdf_path.name,
+                        sha256=sha,
+                        pageCount=len(pages),
+                    )
+                )
+
+                if need_assets:
+                    asset_futures[doc_id] = pool.submit(
+                        extract_and_save_assets,
+                        pdf_path=pdf_to_use,
+                        doc_id=doc_id,
+                        out_dir=out_dir,
+                        backend=asset_backend,
+                        extract_images=True,
+                        extract_tables=True,
+                        # Already on a pool worker: a nested pool per task
+                        # would run about workers**2 processes at once
+                        workers=1,
+                    )
+
+                reused, pages = _split_changed_pages(
+                    doc_id, pdf_path.name, pages, previous, page_hashes_out
+                )
+                chunks.extend(reused)
+                # Collect finished shards as we go so results are not all
+                # held by their futures (the final sort fixes the order)
+                _drain_chunk_futures(chunk_futures, chunks, wait=False)
+                for start in range(0, len(pages), shard_pages):
+                    chunk_futures.append(
+                        pool.submit(
+                            _chunk_pages,
+                            doc_id,
+                            pages[start : start + shard_pages],
+                            options=options,
+                            strip_headers=strip_headers,
+                        )
+                    )
+
+            _drain_chunk_futures(chunk_futures, chunks, wait=True)
+            for doc_id, future in asset_futures.items():
+                asset_manifest = future.result()
+                if asset_manifest:
+                    asset_manifests[doc_id] = asset_manifest
+    finally:
+        # The pool has drained, so no asset task still reads the OCR'd PDFs
+        for future in prepared:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            _, pdf_to_use, did_ocr, _ = future.result()
+            if did_ocr:
+                cleanup_temp_pdf(pdf_to_use)
+
+    return source_docs, chunks, asset_manifests
+
+
 def build_index(
     input_path: Path,
     out_dir: Path,
@@ -238,6 +753,13 @@ def build_index(
     extract_assets: bool = True,
     asset_backend: Literal["pymupdf", "marker"] = "pymupdf",
     smart_skip_threshold: float = 0.90,
+    ocr_mode: OcrMode = "document",
+    workers: int = 1,
+    shard_pages: int = DEFAULT_SHARD_PAGES,
+    cache: ExtractionCache | None = None,
+    index_format: Literal["json", "binary", "both"] = "json",
+    incremental: bool = False,
+    streaming: bool = False,
 ) -> PdfIndexDocument:
     """Build index from PDF(s).
     
@@ -254,161 +776,95 @@ def build_index(
         asset_backend: Backend to use for asset extraction
         smart_skip_threshold: Quality threshold above which OCR is skipped
                              even if ocr=True (default 0.90 = 90%)
+        ocr_mode: "document" OCRs whole PDFs whose text quality is poor;
+                  "pages" OCRs only the pages without usable text and
+                  splices them back in place (see maybe_ocr_pdf)
+        workers: Number of worker processes. Values above 1 fan documents
+                 and page-range shards out over a process pool, with each
+                 document's asset extraction as one task on it; the output
+                 is identical to the serial (workers=1) build.
+        shard_pages: Pages per shard when fanning out with workers > 1
+        cache: Optional content-addressed extraction cache; re-indexing an
+               unchanged PDF then skips text extraction and OCR
+        index_format: "json" writes chunks.json and index.json (the
+                      SQL-Adapt handoff), "binary" writes the memory-mappable
+                      index-bin/ layout instead, "both" writes both.
+                      manifest.json is always written.
+        incremental: Reuse the previous build in out_dir: unchanged PDFs
+                     (same sha256) are carried over without extraction, and
+                     unchanged pages of changed PDFs keep their chunks. The
+                     result, including indexId, equals a clean build. Falls
+                     back to a full build when out_dir has no compatible
+                     previous build.
+        streaming: Spill chunks to sorted run files in out_dir as each
+                   document (or page shard) is chunked, and write
+                   chunks.json, index.json and index-bin/ by merging the
+                   runs, so memory does not grow with corpus size. The
+                   files are byte-identical to a regular build; the
+                   returned document has an empty ``chunks`` list (its
+                   ``chunkCount`` is still set).
         
     Returns:
         The generated index document
     """
     options.validate_pair()
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if shard_pages < 1:
+        raise ValueError("shard_pages must be >= 1")
+    if index_format not in ("json", "binary", "both"):
+        raise ValueError(f"Unknown index_format: {index_format}")
+    if ocr_mode not in ("document", "pages"):
+        raise ValueError(f"Unknown ocr_mode: {ocr_mode}")
 
     pdfs = discover_pdfs(input_path)
     if not pdfs:
         raise FileNotFoundError(f"No PDF files found at: {input_path}")
 
-    used_doc_ids: set[str] = set()
-    source_docs: list[PdfSourceDoc] = []
-    chunks: list[PdfIndexChunk] = []
-    asset_manifests: dict[str, AssetManifest] = {}  # doc_id -> manifest
-
-    for pdf_path in pdfs:
-        did_ocr = False
-        pdf_to_use = pdf_path
-        quality_info = None
-        
-        try:
-            # Step 1: Try without OCR first (unless force OCR)
-            # SMART SKIP: High quality PDFs skip OCR even when ocr=True
-            try:
-                pdf_to_use, did_ocr = maybe_ocr_pdf(
-                    pdf_path,
-                    force=ocr,
-                    auto=auto_ocr,
-                    smart_skip_threshold=smart_skip_threshold,
-                )
-            except RuntimeError as e:
-                if "ocrmypdf is not installed" in str(e):
-                    if ocr:
-                        typer.echo(f"❌ Error: {e}", err=True)
-                        typer.echo("Install with: pip install -e '.[ocr]'", err=True)
-                        raise typer.Exit(1)
-                    else:
-                        # Auto-OCR was triggered but ocrmypdf not installed
-                        warnings.warn(
-                            f"Low quality text detected but ocrmypdf not installed. "
-                            f"Install with: pip install -e '.[ocr]'"
-                        )
-                        pdf_to_use = pdf_path
-                        did_ocr = False
-                else:
-                    raise
-
-            sha = sha256_file(pdf_path)
-            filename = pdf_path.name
-
-            if use_aliases:
-                base_id = get_doc_alias(filename)
-                doc_id = unique_doc_id(base_id, used_doc_ids)
-            else:
-                # Upload-mode doc IDs: match main app
-                doc_id = f"doc-{sha[:12]}"
-
-            pages = extract_pages_fitz(pdf_to_use)
-            
-            # Step 2: Check quality of extracted text
-            quality_info = check_extraction_quality(pages)
-            
-            # Step 3: If quality is poor and we didn't OCR yet, retry with OCR
-            if not quality_info["is_quality_good"] and not did_ocr and not ocr:
-                warnings.warn(
-                    f"Low quality extraction for '{filename}': {quality_info['reason']}. "
-                    f"Retrying with OCR..."
-                )
-                
-                # Clean up temp if we created one
-                if pdf_to_use != pdf_path:
-                    cleanup_temp_pdf(pdf_to_use)
-                
-                # Force OCR (but still respect smart skip for very high quality)
-                try:
-                    pdf_to_use, did_ocr = maybe_ocr_pdf(
-                        pdf_path,
-                        force=True,
-                        auto=False,
-                        smart_skip_threshold=1.0,  # Disable smart skip when we really need OCR
-                    )
-                except RuntimeError as e:
-                    if "ocrmypdf is not installed" in str(e):
-                        warnings.warn(
-                            f"OCR recommended but ocrmypdf not installed. "
-                            f"Install with: pip install -e '.[ocr]'"
-                        )
-                        pdf_to_use = pdf_path
-                        did_ocr = False
-                    else:
-                        raise
-                
-                # Re-extract with OCR
-                pages = extract_pages_fitz(pdf_to_use)
-                quality_info = check_extraction_quality(pages)
-                
-                if quality_info["is_quality_good"]:
-                    warnings.warn(f"OCR improved quality for '{filename}'!")
-            
-            if not pages:
-                raise RuntimeError(
-                    f"No text extracted from '{filename}'. "
-                    "Try --ocr or check the PDF is not corrupted."
-                )
-
-            if strip_headers:
-                # Use student-optimized cleaning
-                pages = clean_pages_for_students(pages)
-
-            source_docs.append(
-                PdfSourceDoc(
-                    docId=doc_id,
-                    filename=filename,
-                    sha256=sha,
-                    pageCount=len(pages),
-                )
-            )
-
-            # Step 4: Extract assets (images and tables) if enabled
-            if extract_assets and ASSET_EXTRACTION_AVAILABLE:
-                asset_manifest = extract_and_save_assets(
-                    pdf_path=pdf_to_use,
-                    doc_id=doc_id,
-                    out_dir=out_dir,
-                    backend=asset_backend,
-                    extract_images=True,
-                    extract_tables=True,
-                )
-                if asset_manifest:
-                    asset_manifests[doc_id] = asset_manifest
+    fingerprint = build_settings_fingerprint(
+        options,
+        strip_headers=strip_headers,
+        ocr=ocr,
+        auto_ocr=auto_ocr,
+        smart_skip_threshold=smart_skip_threshold,
+        ocr_mode=ocr_mode,
+        extract_assets=extract_assets,
+        asset_backend=asset_backend,
+    )
+    previous = PreviousIndex.load(out_dir, fingerprint) if incremental else None
+    if incremental and previous is None:
+        typer.echo("ℹ️  No compatible previous build found; doing a full build")
+    page_hashes_out: dict[str, dict[int, str]] = {}
+    # Streaming mode: chunks go to sorted run files instead of a list
+    run_store = ChunkRunStore(out_dir) if streaming else None
 
-            for page_num, page_text in pages:
-                for chunk_id, chunk_text in chunk_page_words(
-                    doc_id=doc_id,
-                    page=page_num,
-                    text=page_text,
-                    chunk_words=options.chunkWords,
-                    overlap_words=options.overlapWords,
-                ):
-                    emb = build_hash_embedding(chunk_text, options.embeddingDim)
-                    chunks.append(
-                        PdfIndexChunk(
-                            chunkId=chunk_id,
-                            docId=doc_id,
-                            page=page_num,
-                            text=chunk_text,
-                            embedding=emb,
-                        )
-                    )
-        finally:
-            if did_ocr:
-                cleanup_temp_pdf(pdf_to_use)
+    index_kwargs = dict(
+        options=options,
+        ocr=ocr,
+        auto_ocr=auto_ocr,
+        use_aliases=use_aliases,
+        strip_headers=strip_headers,
+        extract_assets=extract_assets,
+        asset_backend=asset_backend,
+        smart_skip_threshold=smart_skip_threshold,
+        ocr_mode=ocr_mode,
+        cache=cache,
+        previous=previous,
+        page_hashes_out=page_hashes_out,
+        chunks=run_store if run_store is not None else [],
+    )
+    if workers > 1:
+        source_docs, chunks, asset_manifests = _index_pdfs_parallel(
+            pdfs, out_dir, workers=workers, shard_pages=shard_pages, **index_kwargs
+        )
+    else:
+        source_docs, chunks, asset_manifests = _index_pdfs_serial(
+            pdfs, out_dir, **index_kwargs
+        )
 
     source_docs.sort(key=lambda d: d.docId)
-    chunks.sort(key=lambda c: (c.docId, c.page, c.chunkId))
+    if run_store is None:
+        chunks.sort(key=lambda c: (c.docId, c.page, c.chunkId))
 
     created_at = datetime.now(timezone.utc).isoformat()
 
@@ -457,7 +913,7 @@ def build_index(
         sourceDocs=source_docs,
         docCount=len(source_docs),
         chunkCount=len(chunks),
-        chunks=chunks,
+        chunks=chunks if run_store is None else [],
     )
 
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -469,8 +925,37 @@ def build_index(
     
     # Use fast JSON serialization
     fast_json_dump(manifest.model_dump(), out_dir / "manifest.json", indent=not use_compact)
-    fast_json_dump([c.model_dump() for c in chunks], out_dir / "chunks.json", indent=not use_compact)
-    fast_json_dump(document.model_dump(), out_dir / "index.json", indent=not use_compact)
+    write_page_hashes(out_dir, fingerprint, source_docs, page_hashes_out)
+    if previous is not None:
+        stats = previous.stats
+        typer.echo(
+            f"♻️  Incremental: reused {stats.docs_reused} unchanged document(s); "
+            f"{stats.docs_processed} changed document(s) with "
+            f"{stats.pages_reused} page(s) reused, {stats.pages_processed} re-chunked"
+        )
+    # Only the requested layouts may remain: readers prefer index-bin/ and
+    # the export loader chunks.json, so a stale one would shadow the rebuild
+    if index_format == "json":
+        remove_binary_index(out_dir)
+    elif index_format == "binary":
+        for name in ("chunks.json", "index.json"):
+            (out_dir / name).unlink(missing_ok=True)
+    if index_format in ("json", "both"):
+        if run_store is not None:
+            _write_json_index_streaming(run_store, document, out_dir, indent=not use_compact)
+        else:
+            fast_json_dump([c.model_dump() for c in chunks], out_dir / "chunks.json", indent=not use_compact)
+            fast_json_dump(document.model_dump(), out_dir / "index.json", indent=not use_compact)
+    if index_format in ("binary", "both"):
+        binary_kwargs = dict(
+            index_id=index_id,
+            embedding_model_id=options.embeddingModelId,
+            embedding_dim=options.embeddingDim,
+        )
+        if run_store is not None:
+            write_binary_index_stream(run_store.iter_chunks(), len(run_store), out_dir, **binary_kwargs)
+        else:
+            write_binary_index(chunks, out_dir, **binary_kwargs)
 
     # Save asset manifests
     if asset_manifests:
@@ -492,10 +977,14 @@ def build_index(
             
             # Use first source doc as primary
             primary_doc_id = source_docs[0].docId if source_docs else ""
+            concept_chunks = chunks
+            if run_store is not None:
+                # Concepts only reference the primary doc's chunks
+                concept_chunks = list(run_store.iter_chunks(primary_doc_id))
             
             concept_manifest = build_concept_manifest(
                 concepts_config=concepts_cfg,
-                chunks=chunks,
+                chunks=concept_chunks,
                 source_doc_id=primary_doc_id,
                 created_at=created_at,
             )
@@ -513,7 +1002,7 @@ def build_index(
             concepts_dir = out_dir / "concepts"
             generate_all_concept_markdowns(
                 concept_manifest,
-                chunks,
+                concept_chunks,
                 concepts_dir,
                 asset_manifest=combined_asset_manifest,
             )
@@ -529,4 +1018,33 @@ def build_index(
             # Log warning but don't fail the whole index build
             warnings.warn(f"Failed to generate concepts: {e}")
 
+    if run_store is not None:
+        run_store.close()
     return document
+
+
+def _write_json_index_streaming(
+    chunks: ChunkRunStore,
+    document: PdfIndexDocument,
+    out_dir: Path,
+    *,
+    indent: bool,
+) -> None:
+    """Write chunks.json and index.json in one pass over the merged runs.
+
+    ``document`` carries the index.json header; its own chunks list is
+    ignored. Output matches fast_json_dump of the in-memory build.
+    """
+    header = document.model_dump(exclude={"chunks"})
+    with open(out_dir / "chunks.json", "w", encoding="utf-8") as chunks_file, \
+            open(out_dir / "index.json", "w", encoding="utf-8") as index_file:
+        chunk_array = StreamingJsonArray(chunks_file, indent=indent)
+        index_array = open_json_object_array(index_file, header, "chunks", indent=indent)
+        for encoded in chunks.iter_encoded():
+            if indent:
+                # Runs hold compact JSON; re-encode with indentation
+                encoded = fast_json_dumps(fast_json_loads(encoded), indent=True)
+            chunk_array.write_encoded(encoded)
+            index_array.write_encoded(encoded)
+        chunk_array.close()
+        index_array.close()
@@ -44,14 +44,19 @@ import hashlib
 import json
 import logging
 import os
+import functools
 import time
 import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
 from pathlib import Path
 from typing import Any, ClassVar, Literal
 
+import numpy as np
+
 from .instructional_models import (
     InstructionalUnit,
     MisconceptionUnit,
@@ -63,10 +68,18 @@ from .instructional_models import (
     ConceptUnitEntry,
     ConceptUnitsReport,
 )
-from .section_extractor import SectionExtractor, ContentBlock, ContentFilter, BlockType
+from .section_extractor import (
+    SectionExtractor,
+    ContentBlock,
+    ContentFilter,
+    BlockType,
+    BlockTextIndex,
+)
+from .extraction_cache import ExtractionCache, get_extraction_cache
+from .pdf_session import PdfSession
 from .pedagogy_extractor import PedagogyExtractor, PedagogyIntegrator
 from .pedagogy_models import NavigationIndex
-from .sql_ontology import ConceptOntology
+from .sql_ontology import ConceptOntology, get_ontology
 from .unit_generator import UnitGenerator, GenerationConfig as UnitGenerationConfig
 from .misconception_bank import MisconceptionBank, GenerationConfig as MisconceptionConfig
 from .reinforcement_bank import ReinforcementBank, ReinforcementConfig
@@ -95,6 +108,7 @@ from .fallback_router import FallbackRouter, RoutingArtifact, SliceRoutingDecisi
 from .extract import check_extraction_quality
 from .quality_metrics import TextCoverageAnalyzer
 from .glm_ocr_client import GLMOCRFallback, create_glm_ocr_result_storage
+from .llm_transport import transport_stats
 
 
 # =============================================================================
@@ -191,6 +205,12 @@ class PipelineConfig:
         ollama_model: Ollama model for repair (qwen3.5:9b-q8_0 recommended for RTX 4080)
         ollama_repair_threshold: Confidence threshold below which to trigger repair
         ollama_host: Ollama API host URL
+        llm_concurrency: Concepts (and variants within a concept) generated
+            in parallel during unit generation; 1 keeps generation serial
+        cache_llm_responses: Reuse LLM responses for identical prompts from
+            earlier runs (persistent cache, see `algl-pdf cache stats`)
+        sql_validation_workers: Worker processes used to validate SQL
+            examples; 1 validates in-process
     """
     
     pdf_path: Path
@@ -217,6 +237,9 @@ class PipelineConfig:
 
     # LLM configuration
     skip_llm: bool = False  # Skip all LLM-based processing
+    llm_concurrency: int = 1  # Concepts/variants generated in parallel (LLM calls in flight)
+    cache_llm_responses: bool = True
+    sql_validation_workers: int = 1
 
     # Ollama repair configuration
     use_ollama_repair: bool = True
@@ -264,6 +287,12 @@ class PipelineConfig:
         if not 0.0 <= self.min_quality_score <= 1.0:
             raise ValueError("min_quality_score must be between 0.0 and 1.0")
         
+        if self.llm_concurrency < 1:
+            raise ValueError("llm_concurrency must be >= 1")
+        
+        if self.sql_validation_workers < 1:
+            raise ValueError("sql_validation_workers must be >= 1")
+        
         # Check PDF exists
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {self.pdf_path}")
@@ -469,6 +498,8 @@ class PipelineProgressTracker:
     def __init__(self):
         """Initialize the progress tracker."""
         self.stage_timings: dict[PipelineStage, tuple[float, float | None]] = {}
+        # Seconds per named part of a stage, keyed "<STAGE>.<name>"
+        self.substage_timings: dict[str, float] = {}
         self.current_stage: PipelineStage | None = None
         self.stage_start_time: float | None = None
         self._logger = logging.getLogger(__name__)
@@ -544,6 +575,22 @@ class PipelineProgressTracker:
                 durations[stage.name] = time.time() - self.stage_start_time
         return durations
     
+    def record_substage(self, stage: PipelineStage, name: str, seconds: float) -> None:
+        """
+        Add time spent in a named part of a stage.
+        
+        Repeated calls for the same name accumulate, so per-item timings
+        (e.g. one per generated variant) sum to the stage total. Work done
+        on several threads at once can therefore sum to more than the
+        stage's wall time.
+        """
+        key = f"{stage.name}.{name}"
+        self.substage_timings[key] = self.substage_timings.get(key, 0.0) + seconds
+    
+    def get_substage_durations(self) -> dict[str, float]:
+        """Get accumulated durations for recorded substages."""
+        return dict(self.substage_timings)
+    
     def get_progress_report(self) -> str:
         """Generate a human-readable progress report."""
         progress = self.get_current_progress()
@@ -557,6 +604,9 @@ class PipelineProgressTracker:
             lines.append(f"Current: {progress['current_stage']}")
             lines.append(f"ETA: {progress['eta_seconds']:.1f}s")
         
+        for name, seconds in self.substage_timings.items():
+            lines.append(f"  {name}: {seconds:.2f}s")
+        
         lines.append("-" * 50)
         return "\n".join(lines)
 
@@ -580,10 +630,6 @@ class CheckpointManager:
         """Get the checkpoint file path for this document."""
         return self.checkpoint_dir / f"{self.doc_id}.checkpoint.json"
     
-    def _get_cache_path(self, pdf_hash: str) -> Path:
-        """Get the extraction cache file path for this PDF hash."""
-        return self.checkpoint_dir / f"extraction_{pdf_hash[:16]}.cache.json"
-    
     def save_checkpoint(self, state: dict[str, Any]) -> None:
         """Save the current pipeline state to checkpoint file."""
         checkpoint_path = self._get_checkpoint_path()
@@ -609,40 +655,6 @@ class CheckpointManager:
         checkpoint_path = self._get_checkpoint_path()
         if checkpoint_path.exists():
             checkpoint_path.unlink()
-    
-    def save_extraction_cache(
-        self, 
-        pdf_hash: str, 
-        pages: list[tuple[int, str]], 
-        metadata: dict[str, Any]
-    ) -> None:
-        """Save extracted pages to cache."""
-        cache_path = self._get_cache_path(pdf_hash)
-        cache_data = {
-            "pdf_hash": pdf_hash,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "pages": pages,
-            "metadata": metadata,
-        }
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2)
-    
-    def load_extraction_cache(self, pdf_hash: str) -> tuple[list[tuple[int, str]], dict[str, Any]] | None:
-        """Load cached extraction if it exists and hash matches."""
-        cache_path = self._get_cache_path(pdf_hash)
-        if cache_path.exists():
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-                if cache_data.get("pdf_hash") == pdf_hash:
-                    pages = [(p[0], p[1]) for p in cache_data["pages"]]
-                    return pages, cache_data.get("metadata", {})
-        return None
-    
-    def clear_extraction_cache(self, pdf_hash: str) -> None:
-        """Clear the extraction cache for a given PDF hash."""
-        cache_path = self._get_cache_path(pdf_hash)
-        if cache_path.exists():
-            cache_path.unlink()
 
 
 def compute_pdf_hash(pdf_path: Path) -> str:
@@ -682,6 +694,7 @@ class InstructionalPipeline:
         self.config = config
         self.progress = PipelineProgressTracker()
         self._ontology: ConceptOntology | None = None
+        self._block_index: BlockTextIndex | None = None
         self._extractor: SectionExtractor | None = None
         self._unit_generator: UnitGenerator | None = None
         self._misconception_bank: MisconceptionBank | None = None
@@ -748,6 +761,14 @@ class InstructionalPipeline:
             "pages_extracted": 0,
         }
 
+        # Shared open PDF so extraction and segmentation decode each page once
+        self._pdf_session: PdfSession | None = None
+
+        # Content-addressed extraction cache shared with `algl-pdf index`
+        self._extraction_cache: ExtractionCache | None = (
+            get_extraction_cache() if config.cache_extraction else None
+        )
+
         # GLM-OCR fallback handler (new)
         self._ocr_fallback: GLMOCRFallback | None = None
         self._ocr_result: dict[str, Any] | None = None
@@ -945,11 +966,24 @@ class InstructionalPipeline:
             # Clear checkpoint on successful completion
             if result.success and self.config.resume_from_checkpoint:
                 self._checkpoint_manager.clear_checkpoint()
+
+            self._close_pdf_session()
             
             self._logger.info(f"Pipeline completed in {result.elapsed_time_seconds:.2f}s")
         
         return result
     
+    def _get_pdf_session(self) -> PdfSession:
+        """Open the source PDF once and share it across pipeline stages."""
+        if self._pdf_session is None:
+            self._pdf_session = PdfSession(self.config.pdf_path)
+        return self._pdf_session
+
+    def _close_pdf_session(self) -> None:
+        if self._pdf_session is not None:
+            self._pdf_session.close()
+            self._pdf_session = None
+
     def _save_checkpoint(self) -> None:
         """Save current checkpoint state."""
         try:
@@ -991,26 +1025,17 @@ class InstructionalPipeline:
         Stage 1: Extract raw text from PDF with caching and page range support.
         
         Uses SectionExtractor to extract text with layout preservation.
-        Supports extraction caching and page range filtering.
+        Supports page range filtering; with cache_extraction enabled, blocks
+        come from the shared content-addressed extraction cache when this
+        PDF (same bytes, doc_id and range) has been extracted before.
         
         Returns:
             Tuple of (raw_text, metadata)
         """
         self._logger.info("Stage 1: Extracting PDF content")
         
-        # Check extraction cache if enabled
-        pdf_hash = self._checkpoint_state.get("pdf_hash")
-        if self.config.cache_extraction and pdf_hash:
-            cached = self._checkpoint_manager.load_extraction_cache(pdf_hash)
-            if cached:
-                pages, cache_metadata = cached
-                self._logger.info(f"Using cached extraction: {len(pages)} pages")
-                self._cache_stats["extraction_cache_hit"] = True
-                self._cache_stats["pages_from_cache"] = len(pages)
-                # Convert cached pages to blocks
-                return self._process_extracted_pages(pages, from_cache=True)
-        
         self._extractor = SectionExtractor()
+        hits_before = self._extraction_cache.hits if self._extraction_cache else 0
         
         # Extract with page range support if specified
         page_range = self.config.page_range
@@ -1027,15 +1052,25 @@ class InstructionalPipeline:
                 self.config.pdf_path,
                 self.config.doc_id,
                 page_range=page_range,
+                session=self._get_pdf_session(),
+                cache=self._extraction_cache,
             )
             self._logger.info(f"Extracted with page range: {page_range}")
         else:
             # Extract all pages
             blocks = self._extractor.extract_blocks(
                 self.config.pdf_path,
-                self.config.doc_id
+                self.config.doc_id,
+                session=self._get_pdf_session(),
+                cache=self._extraction_cache,
             )
         
+        if self._extraction_cache is not None and self._extraction_cache.hits > hits_before:
+            pages_cached = len({b.page_number for b in blocks})
+            self._logger.info(f"Using cached extraction: {pages_cached} pages")
+            self._cache_stats["extraction_cache_hit"] = True
+            self._cache_stats["pages_from_cache"] = pages_cached
+        
         return self._process_extracted_blocks(blocks)
     
     def _resolve_chapter_range(
@@ -1165,40 +1200,11 @@ class InstructionalPipeline:
         # Run fallback router to classify extraction quality (new)
         self._run_fallback_router()
         
-        # Save to cache if enabled
-        if self.config.cache_extraction and self._checkpoint_state.get("pdf_hash"):
-            # Convert blocks to pages format for caching
-            pages = self._blocks_to_pages(blocks)
-            if pages:
-                self._checkpoint_manager.save_extraction_cache(
-                    self._checkpoint_state["pdf_hash"],
-                    pages,
-                    self._extraction_metadata
-                )
-                self._cache_stats["extraction_cache_saved"] = True
-                self._logger.info(f"Saved extraction cache: {len(pages)} pages")
+        if self._extraction_cache is not None:
+            self._cache_stats["extraction_cache_saved"] = True
         
         return self._raw_text, self._extraction_metadata
     
-    def _process_extracted_pages(
-        self, 
-        pages: list[tuple[int, str]], 
-        from_cache: bool = False
-    ) -> tuple[str, dict]:
-        """Process cached pages and reconstruct blocks."""
-        # For cached pages, we need to re-create blocks
-        # This is simplified - in production, you'd store block structure in cache
-        self._extractor = SectionExtractor()
-        
-        # Re-extract to get proper block structure
-        blocks = self._extractor.extract_blocks(
-            self.config.pdf_path,
-            self.config.doc_id,
-            page_range=[p[0] for p in pages] if pages else None,
-        )
-        
-        return self._process_extracted_blocks(blocks)
-    
     def _blocks_to_pages(self, blocks: list[ContentBlock]) -> list[tuple[int, str]]:
         """Convert blocks back to page format for caching."""
         pages_dict: dict[int, list[str]] = {}
@@ -1798,7 +1804,9 @@ class InstructionalPipeline:
         
         self._content_blocks = self._extractor.extract_blocks(
             self.config.pdf_path,
-            self.config.doc_id
+            self.config.doc_id,
+            session=self._get_pdf_session(),
+            cache=self._extraction_cache,
         )
         
         self._logger.info(f"Segmented into {len(self._content_blocks)} content blocks")
@@ -1849,7 +1857,7 @@ class InstructionalPipeline:
             blocks = self._teaching_blocks
         
         # Initialize ontology
-        self._ontology = ConceptOntology()
+        self._ontology = get_ontology()
         
         # Block type weights for scoring
         BLOCK_WEIGHTS = {
@@ -1863,6 +1871,18 @@ class InstructionalPipeline:
             BlockType.UNKNOWN: 0.3,
         }
         
+        # Lower and index block text once; every concept queries the index
+        block_index = BlockTextIndex(blocks)
+        self._block_index = block_index
+        
+        block_types = [block.block_type for block in blocks]
+        weights = np.array([BLOCK_WEIGHTS.get(t, 0.5) for t in block_types])
+        is_admin = np.array([t == BlockType.ADMIN_TEXT for t in block_types], dtype=bool)
+        is_heading = np.array(
+            [t in (BlockType.HEADING, BlockType.SUBHEADING) for t in block_types], dtype=bool
+        )
+        is_sql = np.array([t == BlockType.SQL_CODE for t in block_types], dtype=bool)
+        
         concept_blocks = {}
         
         for concept_id in self._ontology.list_all_concepts():
@@ -1873,38 +1893,30 @@ class InstructionalPipeline:
             # Get keywords from concept title + aliases
             keywords = self._extract_concept_keywords(concept)
             
-            scored_blocks = []
-            for block in blocks:
-                # Skip admin blocks
-                if block.block_type == BlockType.ADMIN_TEXT:
-                    continue
-                
-                # Base score from keyword overlap
-                block_text = block.text_content.lower()
-                keyword_matches = sum(1 for kw in keywords if kw in block_text)
-                base_score = keyword_matches / max(len(keywords), 1)
-                
-                # Boost for headings containing keywords
-                if block.block_type in (BlockType.HEADING, BlockType.SUBHEADING):
-                    if any(kw in block_text for kw in keywords):
-                        base_score *= 2.0
-                
-                # Boost for SQL code blocks near concept examples
-                if block.block_type == BlockType.SQL_CODE:
-                    concept_id_lower = concept_id.lower()
-                    if concept_id_lower in block_text:
-                        base_score *= 1.5
-                
-                # Apply block type weight
-                weight = BLOCK_WEIGHTS.get(block.block_type, 0.5)
-                final_score = base_score * weight
-                
-                if final_score > 0.3:  # Threshold
-                    scored_blocks.append((block, final_score))
+            # Only blocks containing a keyword can score above zero; admin
+            # blocks are skipped
+            keyword_matches = block_index.keyword_hits(keywords)
+            rows = np.flatnonzero((keyword_matches > 0) & ~is_admin)
+            
+            # Base score from keyword overlap
+            base_score = keyword_matches[rows] / max(len(keywords), 1)
+            
+            # Boost for headings containing keywords
+            base_score = np.where(is_heading[rows], base_score * 2.0, base_score)
+            
+            # Boost for SQL code blocks near concept examples
+            sql_boost = is_sql[rows] & block_index.mask(concept_id.lower())[rows]
+            base_score = np.where(sql_boost, base_score * 1.5, base_score)
+            
+            # Apply block type weight
+            final_score = base_score * weights[rows]
+            
+            passing = final_score > 0.3  # Threshold
+            rows, final_score = rows[passing], final_score[passing]
             
-            # Sort by score and take top blocks
-            scored_blocks.sort(key=lambda x: x[1], reverse=True)
-            concept_blocks[concept_id] = [b for b, s in scored_blocks[:15]]
+            # Sort by score (ties keep block order) and take top blocks
+            top = rows[np.argsort(-final_score, kind="stable")[:15]]
+            concept_blocks[concept_id] = [blocks[i] for i in top.tolist()]
         
         # Filter to concepts with actual content
         self._concept_blocks = {k: v for k, v in concept_blocks.items() if v}
@@ -2087,6 +2099,7 @@ class InstructionalPipeline:
             enable_ollama_repair=self.config.use_ollama_repair,
             repair_threshold=self.config.ollama_repair_threshold,
             ollama_model=self.config.ollama_model,
+            cache_llm_responses=self.config.cache_llm_responses,
         )
         
         # Initialize misconception bank for error subtype lookup
@@ -2138,6 +2151,9 @@ class InstructionalPipeline:
         self._fallback_unit_ids = []
         self._repaired_unit_ids = []
         
+        # Collect per-concept inputs up front (ontology and misconception
+        # lookups are cheap and not thread-safe to share)
+        work: list[tuple[str, list[ContentBlock], list[str], list[str]]] = []
         for concept_id, blocks in concept_blocks.items():
             if not blocks:
                 continue
@@ -2153,45 +2169,81 @@ class InstructionalPipeline:
             
             # Get error subtypes for this concept from misconception bank
             error_subtypes = self._get_error_subtypes_for_concept(concept_id)
+            work.append((concept_id, blocks, prereqs, error_subtypes))
+        
+        def generate_concept(item, executor: Executor | None = None) -> dict[str, InstructionalUnit]:
+            concept_id, blocks, prereqs, error_subtypes = item
+            return self._unit_generator.generate_all_variants(
+                concept_id=concept_id,
+                source_blocks=blocks,
+                config=gen_config,
+                prerequisites=prereqs,
+                error_subtypes=error_subtypes,
+                executor=executor,
+            )
+        
+        concurrency = self.config.llm_concurrency
+        stage = PipelineStage.UNIT_GENERATION
+        l3_repair_seconds = 0.0
+        generation_start = time.perf_counter()
+        with ExitStack() as stack:
+            if concurrency > 1:
+                # Concepts run on one pool and their variants on another, so a
+                # concept waiting on its variants never holds the threads they
+                # need. Results are consumed in concept order below, which keeps
+                # the unit order (and all bookkeeping) identical to a serial run.
+                concept_pool = ThreadPoolExecutor(concurrency, thread_name_prefix="unit-concept")
+                variant_pool = ThreadPoolExecutor(concurrency, thread_name_prefix="unit-variant")
+                for pool in (variant_pool, concept_pool):
+                    stack.callback(pool.shutdown, wait=True, cancel_futures=True)
+                pending = [concept_pool.submit(generate_concept, item, variant_pool) for item in work]
+                results = (future.result for future in pending)
+            else:
+                results = (functools.partial(generate_concept, item) for item in work)
             
-            try:
-                # Generate all variants
-                variants = self._unit_generator.generate_all_variants(
-                    concept_id=concept_id,
-                    source_blocks=blocks,
-                    config=gen_config,
-                    prerequisites=prereqs,
-                    error_subtypes=error_subtypes,
-                )
-                
-                # Add generated units with optional L3 repair
-                for variant_name, unit in variants.items():
-                    if unit.target_stage in self.config.generate_variants:
-                        # Apply structured repair for weak L3 content
-                        if (
-                            unit.target_stage == "L3_explanation"
-                            and repair_client
-                            and unit.content
-                        ):
-                            unit = self._repair_l3_if_needed(
-                                unit, concept_id, blocks, repair_client
-                            )
-
-                        self._instructional_units.append(unit)
-
-                        # Track fallback units
-                        if unit.content.get("_metadata", {}).get("is_fallback"):
-                            self._fallback_unit_ids.append(unit.unit_id)
-
-                        # Track repaired units (provider-agnostic check)
-                        content = unit.content or {}
-                        if content.get("_repaired_by_ollama") or content.get("_repaired_by_claude_local"):
-                            self._repaired_unit_ids.append(unit.unit_id)
-                            self._repair_status["repaired_units"].append(unit.unit_id)
-                
-            except Exception as e:
-                self._logger.warning(f"Failed to generate units for {concept_id}: {e}")
-                continue
+            for (concept_id, blocks, _, _), result in zip(work, results):
+                try:
+                    # Generate all variants
+                    variants = result()
+                    
+                    # Add generated units with optional L3 repair
+                    for variant_name, unit in variants.items():
+                        if unit.target_stage in self.config.generate_variants:
+                            # Apply structured repair for weak L3 content
+                            if (
+                                unit.target_stage == "L3_explanation"
+                                and repair_client
+                                and unit.content
+                            ):
+                                repair_start = time.perf_counter()
+                                unit = self._repair_l3_if_needed(
+                                    unit, concept_id, blocks, repair_client
+                                )
+                                l3_repair_seconds += time.perf_counter() - repair_start
+
+                            self._instructional_units.append(unit)
+
+                            # Track fallback units
+                            if unit.content.get("_metadata", {}).get("is_fallback"):
+                                self._fallback_unit_ids.append(unit.unit_id)
+
+                            # Track repaired units (provider-agnostic check)
+                            content = unit.content or {}
+                            if content.get("_repaired_by_ollama") or content.get("_repaired_by_claude_local"):
+                                self._repaired_unit_ids.append(unit.unit_id)
+                                self._repair_status["repaired_units"].append(unit.unit_id)
+                    
+                except Exception as e:
+                    self._logger.warning(f"Failed to generate units for {concept_id}: {e}")
+                    continue
+        
+        self.progress.record_substage(
+            stage, "concepts", time.perf_counter() - generation_start - l3_repair_seconds
+        )
+        self.progress.record_substage(stage, "l3_repair", l3_repair_seconds)
+        for variant, seconds in self._unit_generator.variant_timings.items():
+            self.progress.record_substage(stage, f"variant.{variant}", seconds)
+        curated_start = time.perf_counter()
         
         # Generate L3 units for concepts with curated content but no blocks
         # This ensures high-quality curated content is included even for concepts
@@ -2272,6 +2324,8 @@ class InstructionalPipeline:
                 offbook_excluded.append(concept_id)
                 continue
         
+        self.progress.record_substage(stage, "curated_l3", time.perf_counter() - curated_start)
+        
         # Store off-book tracking for manifest
         self._offbook_tracking = {
             "included": offbook_included,
@@ -2670,46 +2724,37 @@ class InstructionalPipeline:
             "details": {},
         }
         
+        # Extract SQL examples from unit content, then validate them as one
+        # batch (duplicates across units are validated once)
+        batch: list[tuple[InstructionalUnit, str]] = []
         for unit in units:
-            unit_results = []
-            
-            # Extract SQL examples from unit content
             content = unit.content or {}
-            examples = content.get("examples", [])
-            
-            for ex in examples:
+            for ex in content.get("examples", []):
                 sql = ex.get("sql", "") if isinstance(ex, dict) else ""
-                if not sql:
-                    continue
-                
-                try:
-                    result = self._sql_validator.validate(
-                        sql=sql,
-                        expected_concept=unit.concept_id,
-                    )
-                    unit_results.append({
-                        "sql": sql[:100],
-                        "is_valid": result.is_valid,
-                        "semantic_score": result.semantic_score,
-                        "errors": [e.message for e in result.errors],
-                    })
-                    
-                    if result.is_valid:
-                        self._validation_results["valid_units"] += 1
-                    else:
-                        self._validation_results["invalid_units"] += 1
-                        
-                except Exception as e:
-                    unit_results.append({
-                        "sql": sql[:100],
-                        "is_valid": False,
-                        "error": str(e),
-                    })
-                    self._validation_results["invalid_units"] += 1
-            
-            if unit_results:
-                self._validation_results["details"][unit.unit_id] = unit_results
+                if sql:
+                    batch.append((unit, sql))
+        
+        results = self._sql_validator.validate_many(
+            [sql for _, sql in batch],
+            expected_concept=[unit.concept_id for unit, _ in batch],
+            workers=self.config.sql_validation_workers,
+        )
+        
+        for (unit, sql), result in zip(batch, results):
+            unit_results = self._validation_results["details"].setdefault(unit.unit_id, [])
+            if not unit_results:
                 self._validation_results["validated_units"] += 1
+            unit_results.append({
+                "sql": sql[:100],
+                "is_valid": result.is_valid,
+                "semantic_score": result.semantic_score,
+                "errors": [e.message for e in result.errors],
+            })
+            
+            if result.is_valid:
+                self._validation_results["valid_units"] += 1
+            else:
+                self._validation_results["invalid_units"] += 1
         
         self._logger.info(
             f"Validated SQL: {self._validation_results['valid_units']} valid, "
@@ -3218,6 +3263,8 @@ class InstructionalPipeline:
             "fallback_units": fallback_count,
             "repaired_units": repaired_count,
             "stage_timings": self.progress.get_stage_durations(),
+            "substage_timings": self.progress.get_substage_durations(),
+            "llm_transport": transport_stats(),
             # Pedagogy statistics (new)
             "chapters": len(chapters),
             "exercises": len(exercises),
@@ -40,7 +40,8 @@ from .instructional_models import (
     UnitLibraryExport,
     SourceSpan,
 )
-from .sql_ontology import ConceptOntology
+from .practice_db_pool import checkout_options, get_practice_db_pool, schema_fingerprint
+from .sql_ontology import ConceptOntology, get_ontology
 from .validators import validate_sql_snippet
 
 
@@ -252,9 +253,9 @@ class LearningQualityGates:
         
         Args:
             ontology: Optional ConceptOntology instance. If not provided,
-                     a new one will be created.
+                     the shared instance is used.
         """
-        self.ontology = ontology or ConceptOntology()
+        self.ontology = ontology or get_ontology()
         self._error_subtype_cache: set[str] | None = None
         self._boilerplate_cache: set[str] = set()  # Track repeated boilerplate
     
@@ -843,25 +844,16 @@ class LearningQualityGates:
                 severity=Severity.BLOCKING,
             )
         
-        # Try to execute against provided schema (in-memory SQLite)
+        # Try to execute against provided schema (in-memory SQLite). The
+        # tables are built once per schema and reused via rolled-back copies.
         if schema:
             try:
-                conn = sqlite3.connect(":memory:")
-                cursor = conn.cursor()
-                
-                # Create schema tables
-                for table_name, table_def in schema.items():
-                    if isinstance(table_def, dict) and "columns" in table_def:
-                        cols = table_def["columns"]
-                        if cols and isinstance(cols[0], tuple):
-                            col_defs = ", ".join(f"{c[0]} {c[1]}" for c in cols)
-                        else:
-                            col_defs = ", ".join(f"{c} TEXT" for c in cols)
-                        cursor.execute(f"CREATE TABLE {table_name} ({col_defs});")
-                
-                # Try to execute the SQL
-                cursor.execute(sql)
-                conn.close()
+                with get_practice_db_pool().connection(
+                    schema_fingerprint(schema, "quality-gates"),
+                    lambda: _build_schema_database(schema),
+                    **checkout_options(sql),
+                ) as conn:
+                    conn.execute(sql)
                 
             except sqlite3.Error as e:
                 return QualityCheck(
@@ -2955,6 +2947,21 @@ class LearningQualityGates:
         )
 
 
+def _build_schema_database(schema: dict[str, Any]) -> sqlite3.Connection:
+    """Create the tables of an ad-hoc schema definition (no rows)."""
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    for table_name, table_def in schema.items():
+        if isinstance(table_def, dict) and "columns" in table_def:
+            cols = table_def["columns"]
+            if cols and isinstance(cols[0], tuple):
+                col_defs = ", ".join(f"{c[0]} {c[1]}" for c in cols)
+            else:
+                col_defs = ", ".join(f"{c} TEXT" for c in cols)
+            cursor.execute(f"CREATE TABLE {table_name} ({col_defs});")
+    return conn
+
+
 # =============================================================================
 # LIBRARY-LEVEL VALIDATION
 # =============================================================================
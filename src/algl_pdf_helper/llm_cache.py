@@ -0,0 +1,295 @@
+"""
+Persistent cache of LLM responses, keyed by prompt.
+
+Unit generation sends hundreds of prompts per book (L1-L4 variants,
+examples, misconceptions), and re-running ``process`` on the same book used
+to pay for every one of them again. ``LLMResponseCache`` stores each raw
+response under a hash of everything that determines it: model, request
+options (temperature, token limit, ...), the prompt or chat messages and a
+prompt version that can be bumped to invalidate old entries.
+
+Entries live in a single SQLite file, so lookups are one indexed query and
+concurrent writers (threads or ``process`` runs) are serialized by SQLite.
+The cache is size-bounded; when a write pushes it over ``max_bytes`` the
+least recently used entries are evicted first. Lifetime hit/miss counters
+are stored in the file as well, which is what ``algl-pdf cache stats``
+reports.
+
+Example:
+    cache = get_llm_cache()
+    key = cache.make_key(model, messages, options={"temperature": 0.3})
+    response = cache.get(key)
+    if response is None:
+        response = call_llm(...)
+        cache.put(key, response, model=model)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .prompts import PROMPT_VERSION
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "algl_pdf_helper" / "llm" / "responses.sqlite3"
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2  # 512 MiB
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class LLMResponseCache:
+    """Size-bounded SQLite cache of raw LLM responses.
+
+    Thread-safe (one connection shared under a lock) and safe to use from
+    several processes at once. Responses are stored as returned by the
+    model, before any parsing, so changes to post-processing never need a
+    cache flush.
+    """
+
+    def __init__(self, path: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._logger = logging.getLogger(__name__)
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str | list[dict[str, Any]],
+        options: dict[str, Any] | None = None,
+        prompt_version: str = PROMPT_VERSION,
+    ) -> str:
+        """Derive the cache key for one request.
+
+        Args:
+            model: Model name the request is sent to
+            prompt: Prompt text, or the chat messages
+            options: Request options that change the output (temperature,
+                token limit, response format, ...)
+            prompt_version: Version of the prompt templates
+        """
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "options": options or {},
+            "prompt_version": prompt_version,
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Reads and writes
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with self._lock held
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                row = conn.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    _bump(conn, "misses")
+                    return None
+                conn.execute(
+                    "UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                    (time.time(), key),
+                )
+                self.hits += 1
+                _bump(conn, "hits")
+                return row[0]
+
+    def put(self, key: str, response: str, *, model: str) -> None:
+        """Store a response under key, evicting old entries if needed."""
+        size = len(key) + len(response.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, response, size, created, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, size, now, now),
+                )
+                _bump(conn, "bytes", size - (old[0] if old else 0))
+            self._prune_locked(self.max_bytes)
+
+    # ------------------------------------------------------------------
+    # Inspection and eviction
+    # ------------------------------------------------------------------
+
+    def prune(self, max_bytes: int | None = None) -> int:
+        """Evict least recently used entries until the cache fits max_bytes.
+
+        Args:
+            max_bytes: Size bound to enforce (defaults to self.max_bytes)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._prune_locked(self.max_bytes if max_bytes is None else max_bytes)
+
+    def _prune_locked(self, limit: int) -> int:
+        conn = self._connect()
+        removed = 0
+        with conn:
+            total = _counter(conn, "bytes")
+            while total > limit:
+                rows = conn.execute(
+                    "SELECT key, size FROM responses ORDER BY last_used LIMIT 256"
+                ).fetchall()
+                if not rows:
+                    break
+                for key, size in rows:
+                    if total <= limit:
+                        break
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    _bump(conn, "bytes", -size)
+                    total -= size
+                    removed += 1
+        if removed:
+            self._logger.debug(f"Evicted {removed} LLM cache entries")
+        return removed
+
+    def clear_cache(self) -> int:
+        """Remove every entry and reset the counters. Returns entries removed."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                removed = conn.execute("DELETE FROM responses").rowcount
+                conn.execute("DELETE FROM counters")
+            conn.execute("VACUUM")
+        self.hits = self.misses = 0
+        return removed
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Return size, entry counts per model and hit/miss counters.
+
+        ``hits``/``misses`` count lookups made through this instance;
+        ``lifetime_hits``/``lifetime_misses`` count every lookup recorded in
+        the cache file, across runs.
+        """
+        with self._lock:
+            conn = self._connect()
+            by_model = dict(conn.execute(
+                "SELECT model, COUNT(*) FROM responses GROUP BY model ORDER BY model"
+            ).fetchall())
+            lifetime_hits = _counter(conn, "hits")
+            lifetime_misses = _counter(conn, "misses")
+            total_bytes = _counter(conn, "bytes")
+        lookups = self.hits + self.misses
+        lifetime_lookups = lifetime_hits + lifetime_misses
+        return {
+            "cache_path": str(self.path),
+            "entries": sum(by_model.values()),
+            "entries_by_model": by_model,
+            "total_size_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "lifetime_hits": lifetime_hits,
+            "lifetime_misses": lifetime_misses,
+            "lifetime_hit_rate": lifetime_hits / lifetime_lookups if lifetime_lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker processes open their own connection
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_lock"] = None
+        state["_logger"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+
+def _bump(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+    conn.execute(
+        "INSERT INTO counters (name, value) VALUES (?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+        (name, amount),
+    )
+
+
+def _counter(conn: sqlite3.Connection, name: str) -> int:
+    row = conn.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else 0
+
+
+_default_cache: LLMResponseCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Return the process-wide LLM response cache.
+
+    The location and size bound can be overridden with the
+    ``ALGL_LLM_CACHE_PATH`` and ``ALGL_LLM_CACHE_MAX_MB`` environment
+    variables.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            path = os.getenv("ALGL_LLM_CACHE_PATH")
+            max_mb = os.getenv("ALGL_LLM_CACHE_MAX_MB")
+            _default_cache = LLMResponseCache(
+                path=Path(path) if path else None,
+                max_bytes=int(max_mb) * 1024 ** 2 if max_mb else DEFAULT_MAX_BYTES,
+            )
+        return _default_cache
@@ -0,0 +1,341 @@
+"""
+Shared HTTP transport for local LLM servers (Ollama).
+
+Generation, repair and OCR clients used to build a fresh
+``urllib.request.Request`` per call, so every prompt paid for a new TCP
+connection, and every client instance re-ran its own ``/api/tags``
+availability and model-list probe. ``LLMTransport`` is the one place those
+requests go through:
+
+- Keep-alive connections: idle ``http.client`` connections are pooled per
+  server and reused by the next request (a connection the server closed
+  while idle is retried once on a fresh one).
+- Cached probes: the ``/api/tags`` response (or the failure to get one) is
+  kept for ``probe_ttl`` seconds and shared by every client of the server.
+- Counters: requests, errors, connections opened/reused, probe cache hits
+  and per-endpoint latency, via ``stats()`` or ``transport_stats()``.
+
+Errors are raised the way ``urllib.request.urlopen`` raises them
+(``HTTPError`` for error statuses, ``URLError`` when the server cannot be
+reached, ``TimeoutError`` for timeouts), so callers keep their existing
+error handling.
+
+Usage:
+    from algl_pdf_helper.llm_transport import get_transport
+
+    transport = get_transport("http://localhost:11434")
+    if transport.is_available():
+        result = transport.post_json("/api/generate", payload, timeout=120)
+"""
+
+from __future__ import annotations
+
+import http.client
+import io
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_TTL = 30.0  # seconds an /api/tags result is reused
+DEFAULT_MAX_IDLE = 8  # idle keep-alive connections kept per server
+DEFAULT_OLLAMA_HOST = "http://localhost:11434"
+DEFAULT_OLLAMA_PORT = 11434
+
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+def normalize_base_url(base_url: str) -> str:
+    """Server URL with a scheme, accepting OLLAMA_HOST forms like Ollama does.
+
+    ``localhost:11434`` becomes ``http://localhost:11434``; a bare host
+    gets Ollama's default port and an empty host means 127.0.0.1. URLs that
+    already have a scheme are returned unchanged (minus a trailing slash).
+    """
+    url = base_url.strip().rstrip("/")
+    if "://" in url:
+        return url
+    host, sep, rest = url.partition("/")
+    if not host.startswith("["):  # leave IPv6 literals alone
+        name, _, port = host.partition(":")
+        host = f"{name or '127.0.0.1'}:{port or DEFAULT_OLLAMA_PORT}"
+    return f"http://{host}{sep}{rest}".rstrip("/")
+
+
+class LLMTransport:
+    """
+    Keep-alive JSON client for one LLM server.
+
+    Thread-safe: each request checks a connection out of the idle pool (or
+    opens one) and returns it afterwards, so concurrent requests use
+    separate connections.
+
+    Args:
+        base_url: Server URL, e.g. http://localhost:11434 (or localhost:11434,
+            see normalize_base_url)
+        max_idle: Idle connections kept for reuse
+        probe_ttl: Seconds a model-list probe result is cached
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_idle: int = DEFAULT_MAX_IDLE,
+        probe_ttl: float = DEFAULT_PROBE_TTL,
+    ):
+        self.base_url = normalize_base_url(base_url)
+        parts = urllib.parse.urlsplit(self.base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported LLM server URL: {base_url!r}")
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self.max_idle = max_idle
+        self.probe_ttl = probe_ttl
+
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        # (monotonic time, models) — models is None when the server was down
+        self._probe: tuple[float, list[dict[str, Any]] | None] | None = None
+        # Why the last probe failed (None after a successful one)
+        self.probe_error: str | None = None
+        self._stats: dict[str, Any] = {
+            "requests": 0,
+            "errors": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "probe_hits": 0,
+            "probe_misses": 0,
+            "seconds": 0.0,
+            "endpoints": {},
+        }
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def post_json(
+        self,
+        path: str,
+        payload: Any,
+        *,
+        timeout: float,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """POST a JSON payload and return the decoded JSON response."""
+        body = json.dumps(payload).encode("utf-8")
+        return self.request_json("POST", path, body, timeout=timeout, headers=headers)
+
+    def get_json(self, path: str, *, timeout: float, headers: dict[str, str] | None = None) -> Any:
+        """GET a path and return the decoded JSON response."""
+        return self.request_json("GET", path, None, timeout=timeout, headers=headers)
+
+    def request_json(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None,
+        *,
+        timeout: float,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """
+        Send a request and decode its JSON response.
+
+        Raises:
+            urllib.error.HTTPError: For 4xx/5xx responses
+            urllib.error.URLError: If the server cannot be reached
+            TimeoutError: If the server does not answer within timeout
+            json.JSONDecodeError: If the response body is not JSON
+        """
+        all_headers = {**_JSON_HEADERS, **(headers or {})}
+        start = time.perf_counter()
+        ok = False
+        try:
+            status, reason, data = self._send(method, path, body, all_headers, timeout)
+            if status >= 400:
+                raise urllib.error.HTTPError(
+                    self.base_url + path, status, reason, None, io.BytesIO(data)
+                )
+            ok = True
+        finally:
+            self._record(path, time.perf_counter() - start, ok)
+        return json.loads(data.decode("utf-8")) if data else {}
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, str, bytes]:
+        """Send one request on a pooled connection; return (status, reason, body)."""
+        for attempt in range(2):
+            conn, reused = self._acquire(timeout)
+            try:
+                conn.request(method, self._prefix + path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except TimeoutError:
+                conn.close()
+                raise
+            except (ConnectionResetError, BrokenPipeError, http.client.BadStatusLine) as e:
+                conn.close()
+                # The server dropped an idle keep-alive connection; retry fresh
+                if reused and attempt == 0:
+                    continue
+                raise urllib.error.URLError(e) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise urllib.error.URLError(e) from e
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return response.status, response.reason, data
+        raise AssertionError("unreachable")
+
+    def _acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+            self._stats["connections_reused" if conn else "connections_opened"] += 1
+        if conn is None:
+            cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            return cls(self._host, self._port, timeout=timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _record(self, path: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            stats = self._stats
+            stats["requests"] += 1
+            stats["errors"] += not ok
+            stats["seconds"] += seconds
+            endpoint = stats["endpoints"].setdefault(path, {"requests": 0, "seconds": 0.0})
+            endpoint["requests"] += 1
+            endpoint["seconds"] += seconds
+
+    # ------------------------------------------------------------------
+    # Cached probes
+    # ------------------------------------------------------------------
+
+    def list_models(self, *, timeout: float = 5.0, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        Model entries from ``/api/tags`` (cached for probe_ttl seconds).
+
+        Returns an empty list when the server is unreachable.
+        """
+        return self._tags(timeout, refresh) or []
+
+    def model_names(self, *, timeout: float = 5.0, refresh: bool = False) -> list[str]:
+        """Names of the installed models (cached like list_models)."""
+        return [m.get("name", "") for m in self.list_models(timeout=timeout, refresh=refresh)]
+
+    def is_available(self, *, timeout: float = 3.0, refresh: bool = False) -> bool:
+        """Whether the server answered the last ``/api/tags`` probe."""
+        return self._tags(timeout, refresh) is not None
+
+    def _tags(self, timeout: float, refresh: bool) -> list[dict[str, Any]] | None:
+        # One probe at a time, so threads starting together share its result
+        with self._probe_lock:
+            cached = self._probe
+            if cached is not None and not refresh and time.monotonic() - cached[0] < self.probe_ttl:
+                with self._lock:
+                    self._stats["probe_hits"] += 1
+                return cached[1]
+            with self._lock:
+                self._stats["probe_misses"] += 1
+            try:
+                models = self.get_json("/api/tags", timeout=timeout).get("models", [])
+            except Exception as e:
+                logger.debug(f"LLM server not available at {self.base_url}: {e}")
+                models = None
+                self.probe_error = str(e)
+            else:
+                self.probe_error = None
+            self._probe = (time.monotonic(), models)
+            return models
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the request, connection and probe counters."""
+        with self._lock:
+            stats = {**self._stats, "endpoints": {k: dict(v) for k, v in self._stats["endpoints"].items()}}
+        stats["mean_seconds"] = stats["seconds"] / stats["requests"] if stats["requests"] else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Close idle connections and forget the cached probe."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+        self._probe = None
+
+
+_transports: dict[str, LLMTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(base_url: str | None = None) -> LLMTransport:
+    """
+    Shared transport for a server (default: OLLAMA_HOST or localhost).
+
+    Every client talking to the same URL gets the same instance, so they
+    share its connection pool, probe cache and counters.
+    """
+    url = normalize_base_url(base_url or os.getenv("OLLAMA_HOST") or DEFAULT_OLLAMA_HOST)
+    with _transports_lock:
+        transport = _transports.get(url)
+        if transport is None:
+            transport = _transports[url] = LLMTransport(url)
+        return transport
+
+
+def transport_stats() -> dict[str, dict[str, Any]]:
+    """Counters of every transport created in this process, by server URL."""
+    with _transports_lock:
+        transports = list(_transports.values())
+    return {t.base_url: t.stats() for t in transports}
+
+
+def reset_transports() -> None:
+    """Close and forget all shared transports (counters start over)."""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
+
+
+def _forget_transports_after_fork() -> None:
+    # A forked child must not share keep-alive sockets with its parent
+    global _transports_lock
+    _transports.clear()
+    _transports_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_transports_after_fork)
@@ -13,7 +13,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from .models import PdfIndexDocument, PdfIndexChunk, ConceptManifest
+from .search import ChunkSearchIndex
 
 
 @dataclass
@@ -57,7 +60,11 @@ class RetrievalSanityMetric:
     """Tests if known queries retrieve expected chunks/pages."""
     
     test_queries: list[dict[str, Any]] = field(default_factory=list)
-    """Each query: {"query": str, "expected_page": int, "expected_chunk_id": str}"""
+    """Each query: {"query": str, "expected_page": int, "expected_chunk_id": str}.
+
+    "expected_pages": list[int] may be given instead of (or with)
+    "expected_page"; a hit on any of them counts.
+    """
     
     results: list[dict[str, Any]] = field(default_factory=list)
     
@@ -67,65 +74,42 @@ class RetrievalSanityMetric:
         embedding_fn: callable,
         top_k: int = 5,
     ) -> None:
-        """Run all retrieval tests using the provided embedding function."""
+        """Run all retrieval tests using the provided embedding function.
+
+        Queries are scored together against a ChunkSearchIndex (one matrix
+        multiply for the whole batch); ties rank in chunk order.
+        """
         self.results = []
-        
-        for test in self.test_queries:
-            query = test["query"]
+        if not self.test_queries:
+            return
+
+        index = ChunkSearchIndex.from_chunks(chunks, dtype=np.float64)
+        query_embs = [embedding_fn(test["query"]) for test in self.test_queries]
+        hits_per_query = index.search(query_embs, top_k=top_k)
+
+        for test, hits in zip(self.test_queries, hits_per_query):
             expected_page = test.get("expected_page")
+            expected_pages = set(test.get("expected_pages") or ())
+            if expected_page:
+                expected_pages.add(expected_page)
             expected_chunk_id = test.get("expected_chunk_id")
-            
-            # Get query embedding
-            query_emb = embedding_fn(query)
-            
-            # Simple cosine similarity search
-            scored_chunks = []
-            for chunk in chunks:
-                if chunk.embedding:
-                    score = self._cosine_similarity(query_emb, chunk.embedding)
-                    scored_chunks.append((score, chunk))
-            
-            # Sort by score
-            scored_chunks.sort(reverse=True, key=lambda x: x[0])
-            top_results = scored_chunks[:top_k]
-            
+
             # Check if expected content is in results
-            found_expected = False
-            found_page = None
-            found_chunk_id = None
-            
-            for score, chunk in top_results:
-                if expected_page and chunk.page == expected_page:
-                    found_expected = True
-                    found_page = chunk.page
-                if expected_chunk_id and chunk.chunkId == expected_chunk_id:
-                    found_expected = True
-                    found_chunk_id = chunk.chunkId
-            
+            found_expected = any(
+                hit.page in expected_pages
+                or (expected_chunk_id and hit.chunkId == expected_chunk_id)
+                for hit in hits
+            )
+
             self.results.append({
-                "query": query,
+                "query": test["query"],
                 "expected_page": expected_page,
                 "expected_chunk_id": expected_chunk_id,
                 "found": found_expected,
-                "top_score": round(top_results[0][0], 4) if top_results else 0,
-                "retrieved_pages": [c.page for _, c in top_results],
+                "top_score": round(hits[0].score, 4) if hits else 0,
+                "retrieved_pages": [hit.page for hit in hits],
             })
     
-    @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        if len(a) != len(b) or not a:
-            return 0.0
-        
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-        
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        
-        return dot_product / (norm_a * norm_b)
-    
     @property
     def success_rate(self) -> float:
         """Ratio of successful retrievals to total tests."""
@@ -334,6 +318,23 @@ class EvaluationReport:
         return report
 
 
+def concept_retrieval_queries(concept_manifest: ConceptManifest) -> list[dict[str, Any]]:
+    """Build retrieval test queries from a concept manifest.
+
+    Each concept's title is a query; a hit on any page the concept
+    references (pageReferences or section pageNumbers) counts as found.
+    Concepts without page information are skipped.
+    """
+    queries = []
+    for concept in concept_manifest.concepts.values():
+        pages = set(concept.pageReferences)
+        for section in concept.sections.values():
+            pages.update(section.pageNumbers)
+        if concept.title and pages:
+            queries.append({"query": concept.title, "expected_pages": sorted(pages)})
+    return queries
+
+
 def run_evaluation(
     document: PdfIndexDocument,
     concept_manifest: ConceptManifest | None,
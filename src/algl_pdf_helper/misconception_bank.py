@@ -23,10 +23,20 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import re
+import threading
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from typing import Any, Protocol
 
+try:  # Python 3.11+
+    from re import _constants as _sre_constants
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_constants as _sre_constants
+    import sre_parse as _sre_parse
+
 from .instructional_models import (
     InstructionalUnit,
     MisconceptionUnit,
@@ -68,6 +78,16 @@ class GenerationConfig:
 # Misconception Pattern Definition
 # =============================================================================
 
+_SQL_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_sql_pattern(sql_pattern: str) -> re.Pattern | None:
+    try:
+        return re.compile(sql_pattern, _SQL_PATTERN_FLAGS)
+    except re.error:
+        return None
+
 
 @dataclass
 class MisconceptionPattern:
@@ -106,11 +126,8 @@ class MisconceptionPattern:
     related_patterns: list[str] = field(default_factory=list)
     
     def get_compiled_regex(self) -> re.Pattern | None:
-        """Compile the SQL pattern regex for matching."""
-        try:
-            return re.compile(self.sql_pattern, re.IGNORECASE | re.MULTILINE)
-        except re.error:
-            return None
+        """Compile the SQL pattern regex for matching (compiled once per pattern string)."""
+        return _compile_sql_pattern(self.sql_pattern)
     
     def matches(self, sql_code: str) -> bool:
         """Check if the given SQL code matches this misconception pattern."""
@@ -2563,6 +2580,175 @@ DESIGN_CONCEPTS_NO_SUBTYPES = {
 }
 
 
+# =============================================================================
+# Compiled Detection
+# =============================================================================
+
+_REPEAT_OPCODES = {
+    _sre_constants.MAX_REPEAT,
+    _sre_constants.MIN_REPEAT,
+    getattr(_sre_constants, "POSSESSIVE_REPEAT", _sre_constants.MAX_REPEAT),
+}
+
+
+def required_literals(sql_pattern: str) -> tuple[str, ...]:
+    r"""
+    Lower-cased literal substrings that every match of a SQL pattern contains.
+    
+    Only mandatory parts of the regex count: alternations, optional repeats,
+    character classes and lookarounds (e.g. the WHERE in ``(?!.*WHERE)``) are
+    skipped. An empty tuple means nothing could be derived.
+    
+    Example:
+        required_literals(r"SELECT\s+\w+\s+\w+\s+FROM")  # ("select", "from")
+    """
+    try:
+        parsed = _sre_parse.parse(sql_pattern, _SQL_PATTERN_FLAGS)
+    except re.error:
+        return ()
+    literals: list[str] = []
+    _collect_literals(parsed, literals)
+    return tuple(dict.fromkeys(literals))
+
+
+def _collect_literals(items: Iterable[tuple[Any, Any]], literals: list[str]) -> None:
+    run: list[str] = []
+    for op, av in items:
+        if op is _sre_constants.LITERAL and chr(av).isascii():
+            run.append(chr(av).lower())
+            continue
+        if run:
+            literals.append("".join(run))
+            run = []
+        if op is _sre_constants.SUBPATTERN:
+            _collect_literals(av[-1], literals)
+        elif op in _REPEAT_OPCODES and av[0] >= 1:
+            _collect_literals(av[2], literals)
+    if run:
+        literals.append("".join(run))
+
+
+# (literals to look up, groups of (required literal ids, ((pattern index, regex), ...)))
+_DetectorScope = tuple[
+    tuple[tuple[int, str], ...],
+    tuple[tuple[frozenset[int], tuple[tuple[int, re.Pattern], ...]], ...],
+]
+
+
+class CompiledMisconceptionDetector:
+    """
+    Matches student SQL against a fixed list of misconception patterns.
+    
+    Regexes are compiled once, when the detector is built. Patterns are
+    grouped by the keywords they require (see required_literals); each
+    keyword is looked up once per submission and only groups whose keywords
+    are all present run their regexes. Results are identical to calling
+    MisconceptionPattern.matches on every pattern.
+    
+    Example:
+        detector = CompiledMisconceptionDetector(COMMON_MISCONCEPTIONS)
+        detector.detect("SELECT a b FROM t", concept_id="select-basic")
+        detector.detect_many(submissions)
+    """
+    
+    def __init__(self, patterns: Iterable[MisconceptionPattern]):
+        self._patterns: list[MisconceptionPattern] = list(patterns)
+        self._sort_keys = [(p.remediation_order, i) for i, p in enumerate(self._patterns)]
+        self._literals: dict[str, int] = {}
+        
+        entries: dict[str | None, list[tuple[int, re.Pattern, frozenset[int]]]] = {None: []}
+        for index, pattern in enumerate(self._patterns):
+            regex = _compile_sql_pattern(pattern.sql_pattern)
+            if regex is None:
+                continue  # invalid regex: never matches
+            literal_ids = frozenset(
+                self._literals.setdefault(literal, len(self._literals))
+                for literal in required_literals(pattern.sql_pattern)
+            )
+            entry = (index, regex, literal_ids)
+            entries[None].append(entry)
+            entries.setdefault(pattern.concept_id, []).append(entry)
+        
+        literal_text = list(self._literals)
+        self._scopes: dict[str | None, _DetectorScope] = {}
+        for concept_id, scope_entries in entries.items():
+            groups: dict[frozenset[int], list[tuple[int, re.Pattern]]] = {}
+            for index, regex, literal_ids in scope_entries:
+                groups.setdefault(literal_ids, []).append((index, regex))
+            used = sorted(frozenset().union(*groups))
+            self._scopes[concept_id] = (
+                tuple((i, literal_text[i]) for i in used),
+                tuple((ids, tuple(members)) for ids, members in groups.items()),
+            )
+    
+    def _match_indexes(self, sql: str, scope: _DetectorScope) -> list[int]:
+        literals, groups = scope
+        present: set[int] | None = None
+        if sql.isascii():
+            # Outside ASCII, IGNORECASE folds more than str.lower() does
+            # (e.g. "ſ" matches "s"), so every regex runs
+            lowered = sql.lower()
+            present = {i for i, literal in literals if literal in lowered}
+        hits: list[int] = []
+        for literal_ids, members in groups:
+            if present is not None and not literal_ids <= present:
+                continue
+            hits.extend(index for index, regex in members if regex.search(sql))
+        return hits
+    
+    def detect(self, sql: str, concept_id: str | None = None) -> list[MisconceptionPattern]:
+        """
+        Detect misconceptions in one SQL submission.
+        
+        Args:
+            sql: The SQL code submitted by the student
+            concept_id: Optional concept ID to limit search scope
+            
+        Returns:
+            Matching patterns, ordered by remediation_order (ties keep pattern order)
+        """
+        scope = self._scopes.get(concept_id) if concept_id else self._scopes[None]
+        if scope is None:
+            return []
+        hits = self._match_indexes(sql, scope)
+        hits.sort(key=self._sort_keys.__getitem__)
+        return [self._patterns[i] for i in hits]
+    
+    def detect_many(
+        self,
+        sqls: Sequence[str],
+        concept_id: str | Sequence[str | None] | None = None,
+    ) -> list[list[MisconceptionPattern]]:
+        """
+        Detect misconceptions in a batch of submissions.
+        
+        Identical (submission, concept) pairs are matched once.
+        
+        Args:
+            sqls: SQL submissions
+            concept_id: One concept ID for the whole batch, or one per submission
+            
+        Returns:
+            One list of matching patterns per submission, in input order
+        """
+        if concept_id is None or isinstance(concept_id, str):
+            concept_ids: Sequence[str | None] = [concept_id] * len(sqls)
+        else:
+            concept_ids = concept_id
+            if len(concept_ids) != len(sqls):
+                raise ValueError(
+                    f"Got {len(concept_ids)} concept IDs for {len(sqls)} SQL submissions"
+                )
+        seen: dict[tuple[str, str | None], list[MisconceptionPattern]] = {}
+        results = []
+        for sql, concept in zip(sqls, concept_ids):
+            key = (sql, concept)
+            if key not in seen:
+                seen[key] = self.detect(sql, concept)
+            results.append(list(seen[key]))
+        return results
+
+
 # =============================================================================
 # Misconception Bank
 # =============================================================================
@@ -2603,9 +2789,8 @@ class MisconceptionBank:
         self._pattern_index: dict[str, MisconceptionPattern] = {}
         self._error_subtype_index: dict[str, list[MisconceptionPattern]] = {}
         self._concept_index: dict[str, list[MisconceptionPattern]] = {}
-        
-        if patterns:
-            self._rebuild_indexes()
+        self._detector: CompiledMisconceptionDetector
+        self._rebuild_indexes()
     
     def _rebuild_indexes(self) -> None:
         """Rebuild internal indexes for fast lookups."""
@@ -2626,6 +2811,9 @@ class MisconceptionBank:
             if pattern.concept_id not in self._concept_index:
                 self._concept_index[pattern.concept_id] = []
             self._concept_index[pattern.concept_id].append(pattern)
+        
+        # Compile regexes and keyword prefilters once per pattern set
+        self._detector = CompiledMisconceptionDetector(self._patterns)
     
     @classmethod
     def load_default(cls) -> MisconceptionBank:
@@ -2664,23 +2852,25 @@ class MisconceptionBank:
         Returns:
             List of matching misconception patterns, ordered by remediation_order
         """
-        matches: list[MisconceptionPattern] = []
-        
-        # Determine which patterns to check
-        if concept_id:
-            patterns_to_check = self.get_patterns_for_concept(concept_id)
-        else:
-            patterns_to_check = self._patterns
-        
-        # Check each pattern
-        for pattern in patterns_to_check:
-            if pattern.matches(student_sql):
-                matches.append(pattern)
-        
-        # Sort by remediation order (lower = more basic)
-        matches.sort(key=lambda p: p.remediation_order)
+        return self._detector.detect(student_sql, concept_id)
+    
+    def detect_many(
+        self,
+        student_sqls: Sequence[str],
+        concept_id: str | Sequence[str | None] | None = None,
+    ) -> list[list[MisconceptionPattern]]:
+        """
+        Detect likely misconceptions in many student submissions at once.
         
-        return matches
+        Args:
+            student_sqls: SQL codes submitted by students
+            concept_id: One concept ID for the whole batch, or one per submission
+            
+        Returns:
+            One list of matching patterns per submission (as returned by
+            detect_in_student_code), in input order
+        """
+        return self._detector.detect_many(student_sqls, concept_id)
     
     def generate_for_concept(
         self,
@@ -3360,6 +3550,19 @@ class ErrorLinkedTagging:
 # Convenience Functions
 # =============================================================================
 
+_default_bank: MisconceptionBank | None = None
+_default_bank_lock = threading.Lock()
+
+
+def get_default_misconception_bank() -> MisconceptionBank:
+    """Return the process-wide default bank (patterns compiled once)."""
+    global _default_bank
+    with _default_bank_lock:
+        if _default_bank is None:
+            _default_bank = MisconceptionBank.load_default()
+        return _default_bank
+
+
 def create_misconception_bank(patterns: list[MisconceptionPattern] | None = None) -> MisconceptionBank:
     """Create a new misconception bank with optional custom patterns."""
     if patterns is None:
@@ -3376,8 +3579,7 @@ def detect_misconceptions(
     
     Uses the default misconception bank.
     """
-    bank = MisconceptionBank.load_default()
-    return bank.detect_in_student_code(sql_code, concept_id)
+    return get_default_misconception_bank().detect_in_student_code(sql_code, concept_id)
 
 
 def get_remediation(
@@ -3389,8 +3591,7 @@ def get_remediation(
     
     Uses the default misconception bank.
     """
-    bank = MisconceptionBank.load_default()
-    return bank.get_remediation_for_error(error_subtype, concept_id)
+    return get_default_misconception_bank().get_remediation_for_error(error_subtype, concept_id)
 
 
 # =============================================================================
@@ -3409,11 +3610,14 @@ __all__ = [
     
     # Classes
     "MisconceptionBank",
+    "CompiledMisconceptionDetector",
     "MisconceptionContentGenerator",
     "ErrorLinkedTagging",
     
     # Convenience functions
     "create_misconception_bank",
+    "get_default_misconception_bank",
     "detect_misconceptions",
+    "required_literals",
     "get_remediation",
 ]
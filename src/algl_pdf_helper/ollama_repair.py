@@ -27,8 +27,6 @@ import hashlib
 import json
 import logging
 import socket
-import urllib.error
-import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -48,6 +46,7 @@ except ImportError:
         pass
 
 from algl_pdf_helper.instructional_models import InstructionalUnit
+from algl_pdf_helper.llm_transport import get_transport
 
 
 logger = logging.getLogger(__name__)
@@ -343,6 +342,29 @@ class RepairCache:
             return cache_file
         except IOError:
             return cache_file
+    
+    def clear_cache(self) -> int:
+        """Remove every cached repair. Returns the number of files removed."""
+        count = 0
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_file.unlink()
+                count += 1
+            except OSError:
+                pass
+        return count
+    
+    def get_cache_stats(self) -> dict[str, Any]:
+        files = list(self.cache_dir.glob("*.json"))
+        lookups = self.hits + self.misses
+        return {
+            "cache_dir": str(self.cache_dir),
+            "cached_files": len(files),
+            "total_size_bytes": sum(f.stat().st_size for f in files),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
 
 
 # =============================================================================
@@ -412,32 +434,15 @@ class OllamaRepair:
         Returns:
             Tuple of (available, message)
         """
-        try:
-            host = "http://localhost:11434"
-            req = urllib.request.Request(
-                f"{host}/api/tags",
-                method="GET",
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=3) as response:
-                if response.status == 200:
-                    return True, "Ollama available"
-                return False, f"Ollama returned status {response.status}"
-        except Exception as e:
-            return False, f"Ollama not reachable: {e}"
+        host = "http://localhost:11434"
+        transport = get_transport(host)
+        if transport.is_available(timeout=3):
+            return True, "Ollama available"
+        return False, f"Ollama not reachable at {host}: {transport.probe_error}"
     
     def _check_availability(self) -> bool:
         """Check if Ollama server is reachable."""
-        try:
-            req = urllib.request.Request(
-                f"{self.host}/api/tags",
-                method="GET",
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=3) as response:
-                return response.status == 200
-        except Exception:
-            return False
+        return get_transport(self.host).is_available(timeout=3)
     
     def _resolve_model(self, requested_model: str) -> str:
         """Resolve model name, falling back to available models if needed."""
@@ -463,19 +468,7 @@ class OllamaRepair:
     
     def _list_available_models(self) -> list[str]:
         """List available Ollama models."""
-        try:
-            req = urllib.request.Request(
-                f"{self.host}/api/tags",
-                method="GET",
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    return [m.get("name", "") for m in data.get("models", [])]
-        except Exception:
-            pass
-        return []
+        return get_transport(self.host).model_names(timeout=5)
     
     def repair_l3_content_structured(
         self,
@@ -659,7 +652,7 @@ Generate the repair JSON now:"""
         """Call Ollama with JSON format enforcement."""
         config = get_model_config(self.model)
         
-        data = json.dumps({
+        data = {
             "model": self.model,
             "prompt": prompt,
             "stream": False,
@@ -671,19 +664,13 @@ Generate the repair JSON now:"""
                 "top_k": config.get("top_k", 20),
                 "num_ctx": config.get("context_window", 4096),
             }
-        }).encode("utf-8")
-        
-        req = urllib.request.Request(
-            f"{self.host}/api/generate",
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        }
         
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                return result.get("response", "")
+            result = get_transport(self.host).post_json(
+                "/api/generate", data, timeout=self.timeout
+            )
+            return result.get("response", "")
         except socket.timeout:
             raise OllamaRepairError(f"Timeout calling Ollama model '{self.model}'")
         except Exception as e:
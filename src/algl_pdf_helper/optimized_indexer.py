@@ -9,7 +9,11 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, TextIO
+
+import numpy as np
+
+from .embedding import build_hash_embedding, build_hash_embeddings
 
 # Try to use orjson for faster JSON serialization
 try:
@@ -38,6 +42,13 @@ def fast_json_dumps(obj: Any, indent: bool = False) -> str:
         return json.dumps(obj, indent=indent_val)
 
 
+def fast_json_loads(text: str | bytes) -> Any:
+    """Parse JSON using orjson if available."""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 def fast_json_dump(obj: Any, path: Path, indent: bool = False) -> None:
     """Fast JSON file write using orjson if available.
     
@@ -120,40 +131,123 @@ def estimate_memory_usage(
     }
 
 
+def _json_item_separator(indent: bool) -> str:
+    """Separator between array items, as fast_json_dumps would write it."""
+    if indent:
+        return ","
+    return "," if HAS_ORJSON else ", "
+
+
+class StreamingJsonArray:
+    """Write a JSON array item by item.
+
+    The text written is byte-identical to what fast_json_dump would write
+    for the whole list (same serializer, separators and indentation), but
+    only one item is held in memory at a time.
+
+    Args:
+        f: Text file opened for writing, positioned where the array starts
+        indent: Whether to pretty-print with indentation
+        level: Nesting depth of the array (1 for a value of a top-level key)
+        suffix: Text written after the closing bracket
+    """
+
+    def __init__(self, f: TextIO, *, indent: bool = False, level: int = 0, suffix: str = ""):
+        self._f = f
+        self._indent = indent
+        self._pad = "  " * level
+        self._suffix = suffix
+        self._sep = _json_item_separator(indent)
+        self.count = 0
+        f.write("[")
+
+    def write(self, item: Any) -> None:
+        """Serialize and write one item (pydantic models are dumped first)."""
+        if hasattr(item, "model_dump"):
+            item = item.model_dump()
+        self.write_encoded(fast_json_dumps(item, indent=self._indent))
+
+    def write_encoded(self, text: str) -> None:
+        """Write one item already serialized by fast_json_dumps (same indent)."""
+        if self._indent:
+            item_pad = self._pad + "  "
+            self._f.write(",\n" if self.count else "\n")
+            self._f.write(item_pad + text.replace("\n", "\n" + item_pad))
+        else:
+            if self.count:
+                self._f.write(self._sep)
+            self._f.write(text)
+        self.count += 1
+
+    def close(self) -> None:
+        if self._indent and self.count:
+            self._f.write("\n" + self._pad)
+        self._f.write("]" + self._suffix)
+
+
+def open_json_object_array(
+    f: TextIO,
+    fields: dict[str, Any],
+    array_key: str,
+    *,
+    indent: bool = False,
+) -> StreamingJsonArray:
+    """Start a JSON object whose last value is a streamed array.
+
+    Writes ``fields`` in order followed by ``array_key``; items are then
+    written to the returned array, and closing it also closes the object.
+    The result matches fast_json_dump of ``{**fields, array_key: items}``.
+    """
+    sep = _json_item_separator(indent)
+    colon = ":" if HAS_ORJSON and not indent else ": "
+    first = "\n  " if indent else ""
+    between = ",\n  " if indent else sep
+
+    f.write("{" + first)
+    for key, value in fields.items():
+        text = fast_json_dumps(value, indent=indent)
+        if indent:
+            text = text.replace("\n", "\n  ")
+        f.write(fast_json_dumps(key) + colon + text + between)
+    f.write(fast_json_dumps(array_key) + colon)
+    return StreamingJsonArray(
+        f, indent=indent, level=1, suffix="\n}" if indent else "}"
+    )
+
+
 def streaming_json_write(
-    chunks: list[Any],
+    chunks: Iterable[Any],
     output_path: Path,
     batch_size: int = 1000,
-) -> None:
+    *,
+    indent: bool = False,
+) -> int:
     """Write chunks to JSON file in a streaming manner.
     
     This reduces peak memory usage by writing chunks incrementally
-    rather than building the entire JSON structure in memory.
+    rather than building the entire JSON structure in memory. Any
+    iterable works, so chunks can come straight from a generator; the
+    file is identical to fast_json_dump of the same list.
     
     Args:
-        chunks: List of chunk objects
+        chunks: Iterable of chunk objects (pydantic models or dicts)
         output_path: Output JSON file path
         batch_size: Number of chunks to buffer before writing
+        indent: Whether to pretty-print with indentation
+        
+    Returns:
+        Number of chunks written
     """
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('[\n')
-        
-        for i, chunk in enumerate(chunks):
-            if hasattr(chunk, 'model_dump'):
-                chunk_dict = chunk.model_dump()
-            else:
-                chunk_dict = chunk
-            
-            # Write chunk
-            if i > 0:
-                f.write(',\n')
-            json.dump(chunk_dict, f)
+        array = StreamingJsonArray(f, indent=indent)
+        for chunk in chunks:
+            array.write(chunk)
             
             # Optional: flush periodically
-            if i % batch_size == 0:
+            if array.count % batch_size == 0:
                 f.flush()
-        
-        f.write('\n]\n')
+        array.close()
+    return array.count
 
 
 class MemoryEfficientChunkProcessor:
@@ -195,18 +289,22 @@ class MemoryEfficientChunkProcessor:
         self,
         texts: list[str],
         embedding_dim: int,
-        embedding_func: Callable[[str, int], list[float]],
+        embedding_func: Callable[[str, int], list[float]] | None = None,
     ) -> list[list[float]]:
         """Generate embeddings for a batch of texts.
         
         Args:
             texts: List of text strings
             embedding_dim: Embedding dimension
-            embedding_func: Function to generate embedding from text
+            embedding_func: Function to generate embedding from text.
+                Defaults to the hash embedding, which is computed for the
+                whole batch at once via build_hash_embeddings.
             
         Returns:
             List of embeddings
         """
+        if embedding_func is None or embedding_func is build_hash_embedding:
+            return build_hash_embeddings(texts, embedding_dim, dtype=np.float64).tolist()
         return [embedding_func(text, embedding_dim) for text in texts]
 
 
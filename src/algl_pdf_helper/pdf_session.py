@@ -0,0 +1,311 @@
+"""
+Shared single-open PDF session.
+
+A PdfSession opens a ``fitz.Document`` once and memoizes every per-page
+decode (plain text, layout dict, span summary, TOC, file hash) so that the
+OCR quality check, text extraction, asset extraction and structure detection
+can all work from the same pass over the document instead of each reopening
+it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import fitz  # PyMuPDF
+
+from .clean import normalize_text
+
+
+PageRange = tuple[int, int] | list[int] | None
+
+# Pages per task when summarizing spans over a process pool
+SPAN_SHARD_PAGES = 32
+
+# Layout dicts kept per session; the least recently used is dropped beyond
+# this (span summaries and plain text stay cached for every page)
+DICT_CACHE_PAGES = 32
+
+
+@dataclass(frozen=True)
+class SpanLine:
+    """One text line of a page layout, reduced to what heading detection needs."""
+    text: str  # raw (un-normalized) concatenation of the line's span texts
+    size: float  # largest span font size in the line (0.0 without spans)
+    is_bold: bool
+
+
+@dataclass(frozen=True)
+class PageSpans:
+    """Span-level summary of one page's ``get_text("dict")`` layout."""
+    font_sizes: Counter[float]  # span font size -> number of spans
+    lines: tuple[SpanLine, ...]
+
+
+def summarize_page_dict(page_dict: dict[str, Any]) -> PageSpans:
+    """Reduce a ``get_text("dict")`` layout to its font histogram and lines."""
+    font_sizes: Counter[float] = Counter()
+    lines = []
+    for block in page_dict.get("blocks", []):
+        if "lines" not in block:
+            continue
+        for line in block["lines"]:
+            text = ""
+            max_size = 0.0
+            is_bold = False
+            for span in line.get("spans", []):
+                size = span.get("size", 12)
+                font_sizes[size] += 1
+                text += span.get("text", "")
+                max_size = max(max_size, size)
+                if span.get("flags", 0) & 2**4:  # Bold flag
+                    is_bold = True
+            lines.append(SpanLine(text=text, size=max_size, is_bold=is_bold))
+    return PageSpans(font_sizes=font_sizes, lines=tuple(lines))
+
+
+def body_font_size(font_sizes: Counter[float]) -> float | None:
+    """Most common span font size (the body text size), or None without spans.
+
+    ``font_sizes`` must list sizes in first-seen order (as Counters filled
+    page by page do); ties then resolve exactly as the former
+    ``max(set(sizes), key=sizes.count)`` over the full list of span sizes.
+    """
+    if not font_sizes:
+        return None
+    return max(set(font_sizes), key=font_sizes.__getitem__)
+
+
+def summarize_pages(pdf_path: Path, indices: list[int]) -> list[PageSpans]:
+    """Open ``pdf_path`` and summarize the given pages (process pool task)."""
+    with PdfSession(pdf_path) as session:
+        return [summarize_page_dict(session.load_page(i).get_text("dict")) for i in indices]
+
+
+def open_pdf_document(pdf_path: Path) -> fitz.Document:
+    """Open a PDF with the same validation and error messages as extraction.
+
+    Raises:
+        FileNotFoundError: If the PDF file does not exist
+        PermissionError: If the path is a directory
+        RuntimeError: If the PDF is corrupted, invalid, or password-protected
+    """
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+    if pdf_path.is_dir():
+        raise PermissionError(f"Path is a directory, not a file: {pdf_path}")
+
+    try:
+        return fitz.open(pdf_path)
+    except fitz.FileDataError as e:
+        error_msg = str(e).lower()
+        if "password" in error_msg or "encrypted" in error_msg or "crypt" in error_msg:
+            raise RuntimeError(
+                f"PDF is password-protected or encrypted: {pdf_path}. "
+                f"Please provide a password or decrypt the file first."
+            ) from e
+        elif "no file" in error_msg or "is no file" in error_msg:
+            raise RuntimeError(
+                f"Invalid PDF file (may be corrupted or not a PDF): {pdf_path}. "
+                f"Please check the file format and try again."
+            ) from e
+        else:
+            raise RuntimeError(
+                f"Failed to open PDF file: {pdf_path}. Error: {e}"
+            ) from e
+    except Exception as e:
+        error_msg = str(e).lower()
+        if "password" in error_msg or "encrypted" in error_msg:
+            raise RuntimeError(
+                f"PDF is password-protected or encrypted: {pdf_path}"
+            ) from e
+        raise RuntimeError(
+            f"Failed to open PDF file: {pdf_path}. The file may be corrupted, "
+            f"truncated, or not a valid PDF. Error: {e}"
+        ) from e
+
+
+def resolve_page_indices(page_range: PageRange, total_pages: int) -> list[int]:
+    """Convert a 1-based page range spec into 0-based page indices.
+
+    Args:
+        page_range: Optional page range:
+            - tuple (start, end): pages start to end (inclusive, 1-based)
+            - list [p1, p2, ...]: specific page numbers (1-based)
+            - None: all pages
+        total_pages: Number of pages in the document
+
+    Raises:
+        ValueError: If page_range contains invalid page numbers
+    """
+    if page_range is None:
+        return list(range(total_pages))
+    if isinstance(page_range, tuple):
+        start, end = page_range
+        if start < 1:
+            raise ValueError(f"Page range start must be >= 1, got {start}")
+        if end > total_pages:
+            raise ValueError(f"Page range end ({end}) exceeds total pages ({total_pages})")
+        if start > end:
+            raise ValueError(f"Page range start ({start}) must be <= end ({end})")
+        return list(range(start - 1, end))
+    if isinstance(page_range, list):
+        indices = []
+        for p in page_range:
+            if p < 1:
+                raise ValueError(f"Page number must be >= 1, got {p}")
+            if p > total_pages:
+                raise ValueError(f"Page number {p} exceeds total pages ({total_pages})")
+            indices.append(p - 1)
+        return indices
+    raise ValueError(f"Invalid page_range type: {type(page_range)}")
+
+
+class PdfSession:
+    """One open PDF plus lazily-filled per-page caches.
+
+    Each page is decoded at most once per output format; ``decode_counts``
+    records how many real PyMuPDF decodes were performed so callers (and
+    benchmarks) can see what the cache saved.
+
+    Example:
+        with PdfSession(pdf_path) as session:
+            pages = extract_pages_fitz(pdf_path, session=session)
+            blocks = SectionExtractor().extract_blocks(pdf_path, doc_id, session=session)
+
+    An already-open ``doc`` may be passed in; the session then takes
+    ownership of it and closes it on ``close()``.
+
+    Layout dicts are by far the largest decode, so only the
+    ``dict_cache_pages`` most recently used ones are kept.
+    """
+
+    def __init__(
+        self,
+        pdf_path: Path | str,
+        doc: fitz.Document | None = None,
+        dict_cache_pages: int = DICT_CACHE_PAGES,
+    ):
+        if dict_cache_pages < 1:
+            raise ValueError("dict_cache_pages must be >= 1")
+        self.pdf_path = Path(pdf_path)
+        self._doc: fitz.Document | None = (
+            doc if doc is not None else open_pdf_document(self.pdf_path)
+        )
+        self._text: dict[int, str] = {}
+        self._dicts: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._dict_cache_pages = dict_cache_pages
+        self._spans: dict[int, PageSpans] = {}
+        self._toc: list[list[Any]] | None = None
+        self._sha256: str | None = None
+        self.decode_counts: Counter[str] = Counter()
+
+    def __enter__(self) -> PdfSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+    @property
+    def doc(self) -> fitz.Document:
+        if self._doc is None:
+            raise RuntimeError(f"PdfSession for {self.pdf_path} is closed")
+        return self._doc
+
+    @property
+    def page_count(self) -> int:
+        return self.doc.page_count
+
+    @property
+    def sha256(self) -> str:
+        """SHA-256 of the file bytes, computed once per session."""
+        if self._sha256 is None:
+            h = hashlib.sha256()
+            with self.pdf_path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(chunk)
+            self._sha256 = h.hexdigest()
+        return self._sha256
+
+    def load_page(self, index: int) -> fitz.Page:
+        return self.doc.load_page(index)
+
+    def page_text(self, index: int) -> str:
+        """Normalized ``get_text("text")`` for a 0-based page index."""
+        text = self._text.get(index)
+        if text is None:
+            text = normalize_text(self.load_page(index).get_text("text"))
+            self._text[index] = text
+            self.decode_counts["text"] += 1
+        return text
+
+    def page_dict(self, index: int) -> dict[str, Any]:
+        """``get_text("dict")`` layout for a 0-based page index.
+
+        The returned dict is shared between consumers and must not be mutated.
+        """
+        data = self._dicts.get(index)
+        if data is None:
+            data = self.load_page(index).get_text("dict")
+            self._dicts[index] = data
+            self.decode_counts["dict"] += 1
+            if len(self._dicts) > self._dict_cache_pages:
+                self._dicts.popitem(last=False)
+        else:
+            self._dicts.move_to_end(index)
+        return data
+
+    def page_spans(self, index: int) -> PageSpans:
+        """Font histogram and text lines for a 0-based page index.
+
+        Built from the cached layout dict (or by load_page_spans); shared
+        between consumers and must not be mutated.
+        """
+        spans = self._spans.get(index)
+        if spans is None:
+            spans = summarize_page_dict(self.page_dict(index))
+            self._spans[index] = spans
+        return spans
+
+    def load_page_spans(self, indices: Iterable[int], workers: int = 1) -> list[PageSpans]:
+        """Span summaries for many pages, decoding missing ones in parallel.
+
+        With workers > 1, pages that are not cached yet are summarized in
+        shards of SPAN_SHARD_PAGES by worker processes that each open the
+        file; only the summaries travel back, not the layout dicts.
+        """
+        indices = list(indices)
+        missing = [i for i in dict.fromkeys(indices) if i not in self._spans and i not in self._dicts]
+        if workers > 1 and len(missing) > SPAN_SHARD_PAGES:
+            shards = [missing[i:i + SPAN_SHARD_PAGES] for i in range(0, len(missing), SPAN_SHARD_PAGES)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(summarize_pages, self.pdf_path, shard) for shard in shards]
+                for shard, future in zip(shards, futures):
+                    self._spans.update(zip(shard, future.result()))
+            self.decode_counts["dict"] += len(missing)
+        return [self.page_spans(i) for i in indices]
+
+    def get_toc(self) -> list[list[Any]]:
+        if self._toc is None:
+            self._toc = self.doc.get_toc()
+            self.decode_counts["toc"] += 1
+        return self._toc
+
+    def page_indices(self, page_range: PageRange = None) -> list[int]:
+        return resolve_page_indices(page_range, self.page_count)
+
+    def extract_pages(self, page_range: PageRange = None) -> list[tuple[int, str]]:
+        """Return (page_number, text) tuples, including empty pages."""
+        return [(i + 1, self.page_text(i)) for i in self.page_indices(page_range)]
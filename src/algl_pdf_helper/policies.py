@@ -19,8 +19,10 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence, Set
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from typing import Any, Callable
 
 
@@ -74,7 +76,7 @@ class LearnerState:
     total_errors: int = 0
     consecutive_errors: int = 0
     current_error_subtype: str | None = None
-    error_subtypes_seen: list[str] = field(default_factory=list)
+    error_subtypes_seen: Sequence[str] = field(default_factory=list)
     repeated_same_subtype: bool = False  # Same error twice in a row
 
     # Time tracking (seconds)
@@ -95,7 +97,7 @@ class LearnerState:
     # Session context
     problems_attempted: int = 0
     problems_solved: int = 0
-    concepts_attempted: set[str] = field(default_factory=set)
+    concepts_attempted: Set[str] = field(default_factory=set)
 
     # Experimental flags (from session config)
     flags: dict[str, Any] = field(default_factory=dict)
@@ -611,73 +613,177 @@ def compute_learner_state(
     if not events or current_index >= len(events):
         return state
 
-    current_event = events[current_index]
+    accumulator = LearnerStateAccumulator(flags)
+    for evt in events[: current_index + 1]:
+        state = accumulator.advance(evt)
 
-    # Set identifiers from current event
-    state.learner_id = current_event.learner_id
-    state.session_id = getattr(current_event, "session_id", "")
-    state.problem_id = current_event.problem_id
-    state.concept_id = getattr(current_event, "concept_id", None)
+    return state
+
+
+class _SubtypeHistory(Sequence[str]):
+    """Read-only view of the first ``length`` items of an append-only list.
+
+    Every state an accumulator returns shares the accumulator's list, so
+    advancing does not copy the growing error history.
+    """
+
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, items: list[str], length: int):
+        self._items = items
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._items[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("error subtype index out of range")
+        return self._items[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(other) == self._length and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _ConceptsSeen(Set[str]):
+    """Read-only view of the first ``length`` concepts of an ordered index.
+
+    ``order`` maps each concept to the position it was first seen at and
+    only ever grows, so, like _SubtypeHistory, a view never changes.
+    """
 
-    # Process all events up to current
-    prev_error_subtype: str | None = None
-    recovery_streak = 0
+    __slots__ = ("_order", "_length")
 
-    for i, evt in enumerate(events[: current_index + 1]):
+    def __init__(self, order: dict[str, int], length: int):
+        self._order = order
+        self._length = length
+
+    def __contains__(self, concept: object) -> bool:
+        position = self._order.get(concept)  # type: ignore[arg-type]
+        return position is not None and position < self._length
+
+    def __iter__(self) -> Iterator[str]:
+        return islice(self._order, self._length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class LearnerStateAccumulator:
+    """
+    Learner state folded in one trace event at a time.
+
+    Calling compute_learner_state once per event would rescan the trace
+    up to that event each time, which is quadratic in the trace length.
+    The accumulator keeps the running totals instead; the state returned
+    by advance() for the i-th event equals
+    compute_learner_state(events, i, flags).
+
+    Usage:
+        accumulator = LearnerStateAccumulator(flags)
+        for event in trace.events:
+            state = accumulator.advance(event)
+            decision = policy.should_escalate(state)
+    """
+
+    def __init__(self, flags: dict[str, Any] | None = None):
+        self.flags = flags or {}
+        # Running totals; identifiers are taken from each current event
+        self._totals = LearnerState(flags=self.flags)
+        self._prev_error_subtype: str | None = None
+        self._recovery_streak = 0
+        # concept -> order first seen; shared by every returned state
+        self._concepts: dict[str, int] = {}
+
+    def advance(self, evt: Any) -> LearnerState:
+        """
+        Fold in the next event and return the learner state at it.
+
+        Each returned state is a separate object, so earlier states are not
+        changed by later calls. Its error history and concept set are
+        fixed-length views of the accumulator's own, so advancing costs the
+        same however long the trace already is.
+        """
+        totals = self._totals
         event_type = getattr(evt, "event_type", "")
         error_subtype = getattr(evt, "error_subtype", None)
 
-        # Track concepts
         concept = getattr(evt, "concept_id", None)
         if concept:
-            state.concepts_attempted.add(concept)
+            self._concepts.setdefault(concept, len(self._concepts))
 
-        # Track problems
         if event_type == "problem_attempt":
-            state.problems_attempted += 1
+            totals.problems_attempted += 1
         elif event_type == "problem_solved":
-            state.problems_solved += 1
-            recovery_streak += 1
-            if recovery_streak >= 1 and state.consecutive_errors > 0:
-                state.prior_recovery_count += 1
-            state.consecutive_errors = 0
+            totals.problems_solved += 1
+            self._recovery_streak += 1
+            if self._recovery_streak >= 1 and totals.consecutive_errors > 0:
+                totals.prior_recovery_count += 1
+            totals.consecutive_errors = 0
         elif event_type == "problem_abandoned":
-            state.consecutive_errors = 0
-            recovery_streak = 0
+            totals.consecutive_errors = 0
+            self._recovery_streak = 0
 
-        # Track errors
         if error_subtype:
-            state.total_errors += 1
-            state.consecutive_errors += 1
-            state.error_subtypes_seen.append(error_subtype)
+            totals.total_errors += 1
+            totals.consecutive_errors += 1
+            totals.error_subtypes_seen.append(error_subtype)
+            if self._prev_error_subtype == error_subtype:
+                totals.repeated_same_subtype = True
+            self._prev_error_subtype = error_subtype
+            self._recovery_streak = 0
 
-            # Check for repeated subtype
-            if prev_error_subtype == error_subtype:
-                state.repeated_same_subtype = True
-            prev_error_subtype = error_subtype
-            recovery_streak = 0
-
-        # Track hints/escalation
         if event_type in ("hint_requested", "hint_shown"):
-            state.hints_requested += 1
+            totals.hints_requested += 1
         if event_type in ("hint_shown", "explanation_shown"):
-            state.hints_shown += 1
+            totals.hints_shown += 1
         if event_type == "explanation_shown":
-            state.explanations_shown += 1
+            totals.explanations_shown += 1
 
-        # Track escalation level
         escalation = getattr(evt, "escalation_level", None)
         if escalation:
-            state.current_escalation_level = escalation
+            totals.current_escalation_level = escalation
 
-        # Track time
         time_stuck = getattr(evt, "time_stuck", 0.0)
         if time_stuck:
-            state.time_stuck = time_stuck
+            totals.time_stuck = time_stuck
         time_on = getattr(evt, "time_since_start", 0.0)
         if time_on:
-            state.time_on_problem = time_on
-
-    state.current_error_subtype = getattr(current_event, "error_subtype", None)
-
-    return state
+            totals.time_on_problem = time_on
+
+        return LearnerState(
+            learner_id=evt.learner_id,
+            session_id=getattr(evt, "session_id", ""),
+            problem_id=evt.problem_id,
+            concept_id=concept,
+            total_errors=totals.total_errors,
+            consecutive_errors=totals.consecutive_errors,
+            current_error_subtype=error_subtype,
+            error_subtypes_seen=_SubtypeHistory(
+                totals.error_subtypes_seen, len(totals.error_subtypes_seen)
+            ),
+            repeated_same_subtype=totals.repeated_same_subtype,
+            time_on_problem=totals.time_on_problem,
+            time_stuck=totals.time_stuck,
+            hints_requested=totals.hints_requested,
+            hints_shown=totals.hints_shown,
+            explanations_shown=totals.explanations_shown,
+            current_escalation_level=totals.current_escalation_level,
+            prior_recovery_count=totals.prior_recovery_count,
+            problems_attempted=totals.problems_attempted,
+            problems_solved=totals.problems_solved,
+            concepts_attempted=_ConceptsSeen(self._concepts, len(self._concepts)),
+            flags=self.flags,
+        )
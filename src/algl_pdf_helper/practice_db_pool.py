@@ -0,0 +1,226 @@
+"""
+Reusable pre-built SQLite databases for SQL example validation.
+
+Validating an example means running it against the practice schema, and
+building that database (CREATE TABLE for every table plus the sample rows)
+costs far more than running a typical example query. ``PracticeDatabasePool``
+builds each distinct schema once, as a template, and hands out copies:
+
+- A copy is made with the SQLite backup API (a page copy of the in-memory
+  template, no SQL re-executed).
+- Each checkout runs inside ``BEGIN`` ... ``ROLLBACK``. SQLite DDL is
+  transactional, so even ``DROP TABLE`` in an example is undone, and the
+  copy goes back to an idle list for the next validation.
+- A copy whose transaction the example ended itself (``COMMIT``, an error
+  that forced a rollback) is closed rather than reused.
+- Statements that control transactions or the connection itself (``BEGIN``,
+  ``VACUUM``, ``ATTACH``, ``PRAGMA`` ...) cannot run inside that transaction
+  or outlive its rollback. ``checkout_options(sql)`` selects a fresh copy
+  without the transaction for them, which is closed afterwards.
+
+Templates are keyed by a fingerprint of the schema definition, so custom
+schemas get their own templates and the least recently used ones are
+dropped once ``max_templates`` is exceeded.
+
+Example:
+    pool = get_practice_db_pool()
+    with pool.connection(schema_fingerprint(schema), lambda: build(schema),
+                         **checkout_options(sql)) as conn:
+        rows = conn.execute(sql).fetchall()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+DEFAULT_MAX_TEMPLATES = 32
+DEFAULT_MAX_IDLE = 8  # idle copies kept per template
+
+# Leading keywords of statements run on an unwrapped, discarded copy
+UNWRAPPED_STATEMENTS = frozenset({
+    "BEGIN", "COMMIT", "ROLLBACK", "END", "SAVEPOINT", "RELEASE",
+    "VACUUM", "ATTACH", "DETACH", "PRAGMA",
+})
+_LEADING_KEYWORD = re.compile(r"(?:\s+|--[^\n]*|/\*.*?\*/)*([A-Za-z]+)", re.DOTALL)
+
+
+def schema_fingerprint(schema: Any, namespace: str = "") -> str:
+    """Stable key for a schema definition (dicts, lists and tuples of scalars)."""
+    encoded = json.dumps(schema, sort_keys=True, default=repr).encode("utf-8")
+    return f"{namespace}:{hashlib.sha256(encoded).hexdigest()}"
+
+
+def checkout_options(sql: str) -> dict[str, bool]:
+    """Keyword arguments for PracticeDatabasePool.connection() to run sql.
+
+    Transaction-control and connection-level statements get a fresh copy
+    outside the rollback transaction that is not reused; everything else a
+    reusable copy inside it. Leading whitespace and comments are skipped.
+    """
+    match = _LEADING_KEYWORD.match(sql)
+    unwrapped = bool(match) and match.group(1).upper() in UNWRAPPED_STATEMENTS
+    return {"reuse": not unwrapped, "transaction": not unwrapped}
+
+
+class _Template:
+    def __init__(self, db: sqlite3.Connection, row_factory: Any, foreign_keys: bool):
+        self.db = db
+        self.row_factory = row_factory
+        self.foreign_keys = foreign_keys
+        self.idle: list[sqlite3.Connection] = []
+        self.lock = threading.Lock()
+
+
+class PracticeDatabasePool:
+    """Schema-keyed templates and rolled-back copies of practice databases.
+
+    Thread-safe. A connection handed out by ``connection()`` is used by one
+    thread at a time and may be returned from a different one.
+
+    Args:
+        max_templates: Distinct schemas kept built; least recently used
+            templates (and their idle copies) are dropped first
+        max_idle: Idle copies kept per template
+    """
+
+    def __init__(self, max_templates: int = DEFAULT_MAX_TEMPLATES, max_idle: int = DEFAULT_MAX_IDLE):
+        self.max_templates = max_templates
+        self.max_idle = max_idle
+        self._templates: OrderedDict[str, _Template] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"templates_built": 0, "copies_made": 0, "copies_reused": 0, "copies_discarded": 0}
+
+    @contextmanager
+    def connection(
+        self,
+        key: str,
+        build: Callable[[], sqlite3.Connection],
+        *,
+        reuse: bool = True,
+        transaction: bool = True,
+    ) -> Iterator[sqlite3.Connection]:
+        """Check out a copy of the template for key, building it if needed.
+
+        Args:
+            key: Template key, usually from schema_fingerprint()
+            build: Creates and populates a fresh database for key
+            reuse: Return the copy to the pool afterwards; pass False for
+                statements that change connection state outside the
+                transaction (e.g. PRAGMA)
+            transaction: Wrap the checkout in BEGIN ... ROLLBACK; pass False
+                for statements that cannot run inside a transaction. An
+                unwrapped copy is never reused.
+
+        See checkout_options() for both flags. Everything done inside the
+        transaction is rolled back on exit.
+        """
+        conn = None
+        while conn is None:  # None if the template was evicted meanwhile
+            template = self._template(key, build)
+            conn = self._checkout(template)
+        try:
+            if transaction:
+                conn.execute("BEGIN")
+            yield conn
+        finally:
+            self._checkin(template, conn, reuse and transaction)
+
+    def clear(self) -> None:
+        """Close every template and idle copy."""
+        with self._lock:
+            templates = list(self._templates.values())
+            self._templates.clear()
+        for template in templates:
+            _close_template(template)
+
+    def _template(self, key: str, build: Callable[[], sqlite3.Connection]) -> _Template:
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                return template
+        built = build()
+        try:
+            db = sqlite3.connect(":memory:", check_same_thread=False)
+            built.commit()
+            built.backup(db)
+            foreign_keys = bool(built.execute("PRAGMA foreign_keys").fetchone()[0])
+            template = _Template(db, built.row_factory, foreign_keys)
+        finally:
+            built.close()
+        with self._lock:
+            existing = self._templates.get(key)
+            if existing is not None:
+                # Another thread built it first
+                _close_template(template)
+                return existing
+            self._templates[key] = template
+            self.stats["templates_built"] += 1
+            evicted = []
+            while len(self._templates) > self.max_templates:
+                evicted.append(self._templates.popitem(last=False)[1])
+        for old in evicted:
+            _close_template(old)
+        return template
+
+    def _checkout(self, template: _Template) -> sqlite3.Connection | None:
+        with template.lock:
+            if template.db is None:
+                return None
+            if template.idle:
+                with self._lock:
+                    self.stats["copies_reused"] += 1
+                return template.idle.pop()
+            conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+            template.db.backup(conn)
+        conn.row_factory = template.row_factory
+        if template.foreign_keys:
+            conn.execute("PRAGMA foreign_keys = ON")
+        with self._lock:
+            self.stats["copies_made"] += 1
+        return conn
+
+    def _checkin(self, template: _Template, conn: sqlite3.Connection, reuse: bool) -> None:
+        # Not in a transaction: the statement committed or ended it itself
+        clean = conn.in_transaction
+        if clean:
+            conn.execute("ROLLBACK")
+        if clean and reuse:
+            with template.lock:
+                if template.db is not None and len(template.idle) < self.max_idle:
+                    template.idle.append(conn)
+                    return
+        with self._lock:
+            self.stats["copies_discarded"] += 1
+        conn.close()
+
+
+def _close_template(template: _Template) -> None:
+    with template.lock:
+        idle, template.idle = template.idle, []
+        db, template.db = template.db, None
+    for conn in idle:
+        conn.close()
+    if db is not None:
+        db.close()
+
+
+_default_pool: PracticeDatabasePool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_practice_db_pool() -> PracticeDatabasePool:
+    """Return the process-wide practice database pool."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = PracticeDatabasePool()
+        return _default_pool
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
@@ -15,6 +17,22 @@ _EMBEDDED_TEXT_OCR_FLOOR = QualityThresholds.EMBEDDED_TEXT_OCR_FLOOR
 
 ExtractionStrategy = Literal["direct", "ocrmypdf", "marker"]
 
+# Which pages table extraction runs find_tables on:
+# - "all": every page
+# - "recall": pages with any vector graphics. find_tables (line strategy)
+#   builds cells only from vector paths, so this finds the same tables.
+# - "speed": pages whose rulings form a grid, or that have rulings and
+#   columnar text; may miss sparsely ruled tables.
+TableScanMode = Literal["all", "recall", "speed"]
+
+# Position tolerance (points) for a line to count as horizontal/vertical,
+# matching find_tables' default snap tolerance
+_RULING_SNAP = 3.0
+# Rulings that make a page a grid candidate in "speed" mode (a one-row,
+# one-column bordered table has 3 horizontal and 2 vertical edges)
+_GRID_MIN_HORIZONTAL = 3
+_GRID_MIN_VERTICAL = 2
+
 
 @dataclass
 class PreflightReport:
@@ -251,19 +269,7 @@ def detect_tables_on_page(page: fitz.Page) -> list[dict]:
             return tables
         
         # Look for aligned text patterns suggesting columns
-        y_positions = {}
-        for block in blocks:
-            if len(block) >= 5:
-                y_pos = round(block[1], 1)  # y0 coordinate
-                if y_pos not in y_positions:
-                    y_positions[y_pos] = []
-                y_positions[y_pos].append(block)
-        
-        # Find rows with multiple blocks (potential table rows)
-        table_rows = 0
-        for y_pos, row_blocks in y_positions.items():
-            if len(row_blocks) >= 3:  # At least 3 columns
-                table_rows += 1
+        table_rows = count_aligned_rows(block for block in blocks if len(block) >= 5)
         
         # If we have 3+ aligned rows, it's likely a table
         if table_rows >= 3:
@@ -278,6 +284,76 @@ def detect_tables_on_page(page: fitz.Page) -> list[dict]:
     return tables
 
 
+def count_aligned_rows(block_bboxes: Iterable[Sequence[float]]) -> int:
+    """Count rows of at least 3 blocks sharing a top edge (table-like columns).
+    
+    Args:
+        block_bboxes: (x0, y0, x1, y1, ...) of the page's text blocks
+    """
+    row_sizes: Counter[float] = Counter(round(bbox[1], 1) for bbox in block_bboxes)
+    return sum(1 for size in row_sizes.values() if size >= 3)
+
+
+def count_rulings(drawings: list[dict]) -> tuple[int, int]:
+    """Count horizontal and vertical ruling edges in ``page.get_cdrawings()``.
+    
+    Lines count once, rectangles and quads contribute their four sides;
+    curves and slanted lines are ignored.
+    """
+    horizontal = vertical = 0
+    for path in drawings:
+        for item in path.get("items", ()):
+            kind = item[0]
+            if kind == "l":
+                (x0, y0), (x1, y1) = item[1], item[2]
+                if abs(y1 - y0) <= _RULING_SNAP:
+                    horizontal += 1
+                elif abs(x1 - x0) <= _RULING_SNAP:
+                    vertical += 1
+            elif kind in ("re", "qu"):
+                horizontal += 2
+                vertical += 2
+    return horizontal, vertical
+
+
+def is_table_candidate(page: fitz.Page, mode: TableScanMode = "recall") -> bool:
+    """Cheap check whether find_tables could find a table on a page.
+    
+    Only the page's vector graphics are listed; text blocks are read in
+    "speed" mode for pages with rulings that do not form a grid.
+    """
+    if mode == "all":
+        return True
+    drawings = page.get_cdrawings()
+    if not drawings:
+        return False
+    if mode == "recall":
+        return True
+    
+    horizontal, vertical = count_rulings(drawings)
+    if horizontal >= _GRID_MIN_HORIZONTAL and vertical >= _GRID_MIN_VERTICAL:
+        return True
+    if horizontal + vertical == 0:
+        return False
+    return count_aligned_rows(page.get_text("blocks")) >= 3
+
+
+def scan_table_candidates(doc: fitz.Document, mode: TableScanMode = "recall") -> list[int]:
+    """Return the 0-based indices of pages worth running find_tables on.
+    
+    Args:
+        doc: Open PyMuPDF document
+        mode: See TableScanMode
+    """
+    if mode == "all":
+        return list(range(doc.page_count))
+    return [
+        index
+        for index in range(doc.page_count)
+        if is_table_candidate(doc.load_page(index), mode)
+    ]
+
+
 def detect_figures_on_page(page: fitz.Page) -> list[dict]:
     """Detect potential figures on a page.
     
@@ -35,6 +35,12 @@ from __future__ import annotations
 from typing import Any
 
 
+# Part of every LLM response cache key (see llm_cache). Bump it to make
+# cached responses miss after a change the prompt text alone doesn't show,
+# e.g. a model behaviour fix that needs fresh generations.
+PROMPT_VERSION = "1"
+
+
 # =============================================================================
 # ERROR PATTERNS LIBRARY
 # =============================================================================
@@ -7,36 +7,54 @@ across traces. It produces research-ready artifacts:
 - per_learner_metrics.csv
 - policy_comparison.csv
 
+- decision_points.jsonl / decision_points.csv (optional)
+
 IMPORTANT: This is replay evidence, NOT live online adaptation.
 All outputs are deterministic from trace data + policy rules.
 
+run_replay streams: traces are replayed one at a time (or in shards
+across worker processes) and each result is written out by
+ReplayExportWriter as it is produced, keeping only per-policy totals.
+
 Usage:
     from replay import ReplayEngine, run_replay
 
     engine = ReplayEngine(policies=get_default_policies())
     results = engine.replay_trace(trace)
     engine.export_results(output_dir)
+
+    run_replay(Path("cohort/"), output_dir, workers=8, export_decisions=True)
 """
 
 from __future__ import annotations
 
 import csv
 import json
-from dataclasses import asdict, dataclass, field
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from .trace_schema import LearnerTrace, TraceEvent, EventType, load_traces_from_directory
+from .trace_schema import (
+    LearnerTrace,
+    TraceEvent,
+    EventType,
+    list_trace_paths,
+    load_trace,
+    load_trace_or_none,
+)
 from .policies import (
     EscalationPolicy,
     LearnerState,
     EscalationDecision,
-    compute_learner_state,
+    LearnerStateAccumulator,
     get_default_policies,
 )
 from .experiment_flags import ExperimentFlags, flags_from_trace_context
-from .replay_metrics import compute_all_metrics, AllMetrics
+from .replay_metrics import compute_all_metrics, AllMetrics, MetricsAggregate
 
 
 # =============================================================================
@@ -89,7 +107,11 @@ class ReplayDecisionPoint:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # Same as asdict(self), without its per-field deep copies (this
+        # runs once per decision point when streaming them out)
+        data = {name: getattr(self, name) for name in _DECISION_POINT_FIELDS}
+        data["missing_prerequisites"] = list(self.missing_prerequisites)
+        return data
 
     def to_csv_row(self) -> dict[str, Any]:
         """Convert to flat dictionary for CSV export."""
@@ -122,6 +144,9 @@ class ReplayDecisionPoint:
         }
 
 
+_DECISION_POINT_FIELDS = tuple(f.name for f in fields(ReplayDecisionPoint))
+
+
 @dataclass
 class ReplayResult:
     """Complete replay result for a single trace under one policy."""
@@ -246,8 +271,11 @@ class ReplayEngine:
         if policy_filter:
             policies_to_run = [p for p in self.policies if p.policy_id in policy_filter]
 
+        # Trace metrics do not depend on the policy; compute them once
+        metrics = compute_all_metrics(trace) if policies_to_run else None
+
         for policy in policies_to_run:
-            result = self._replay_single_policy(trace, policy, merged_flags)
+            result = self._replay_single_policy(trace, policy, merged_flags, metrics)
             results.append(result)
             self.results.append(result)
 
@@ -258,8 +286,9 @@ class ReplayEngine:
         trace: LearnerTrace,
         policy: EscalationPolicy,
         flags: ExperimentFlags,
+        metrics: AllMetrics | None = None,
     ) -> ReplayResult:
-        """Replay trace under a single policy."""
+        """Replay trace under a single policy (metrics: precomputed trace metrics)."""
         started_at = datetime.now(timezone.utc).isoformat()
 
         result = ReplayResult(
@@ -277,12 +306,15 @@ class ReplayEngine:
         # Track prerequisite violations for this replay
         concept_attempts: dict[str, int] = {}  # concept -> count
         concept_successes: dict[str, int] = {}
+        concept_errors: dict[str, int] = {}
+
+        # Learner state is advanced one event at a time (linear in the trace)
+        accumulator = LearnerStateAccumulator(flags.apply_to_policy_context())
 
         # Process each event
         for i, event in enumerate(trace.events):
             # Compute learner state at this point
-            flags_dict = flags.apply_to_policy_context()
-            learner_state = compute_learner_state(trace.events, i, flags_dict)
+            learner_state = accumulator.advance(event)
 
             # Apply policy
             decision = policy.should_escalate(learner_state)
@@ -292,16 +324,14 @@ class ReplayEngine:
                 concept_attempts[event.concept_id] = concept_attempts.get(event.concept_id, 0) + 1
                 if event.event_type == EventType.PROBLEM_SOLVED.value:
                     concept_successes[event.concept_id] = concept_successes.get(event.concept_id, 0) + 1
+                if event.error_subtype:
+                    concept_errors[event.concept_id] = concept_errors.get(event.concept_id, 0) + 1
 
             # Check for prerequisite violation (simplified: if concept has many errors)
             prereq_violation = False
             missing_prereqs: list[str] = []
             if event.concept_id and flags.enforce_prerequisites:
-                errors_on_concept = sum(
-                    1 for e in trace.events[:i+1]
-                    if e.concept_id == event.concept_id and e.error_subtype
-                )
-                if errors_on_concept >= 3:
+                if concept_errors.get(event.concept_id, 0) >= 3:
                     prereq_violation = True
                     missing_prereqs.append(f"prereq_for_{event.concept_id}")
 
@@ -334,7 +364,7 @@ class ReplayEngine:
                     result.escalation_count += 1
 
         # Compute metrics
-        result.metrics = compute_all_metrics(trace)
+        result.metrics = replace(metrics) if metrics is not None else compute_all_metrics(trace)
         result.metrics.policy_id = policy.policy_id
         result.metrics.trace_id = trace.trace_id
         result.metrics.computed_at = datetime.now(timezone.utc).isoformat()
@@ -360,254 +390,290 @@ class ReplayEngine:
         Returns:
             Dict mapping artifact name to file path
         """
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        with ReplayExportWriter(
+            output_dir, [p.policy_id for p in self.policies], run_id=run_id,
+        ) as writer:
+            for result in self.results:
+                writer.add(result)
+        return writer.artifacts
 
-        run_id = run_id or f"replay_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
 
-        exported: dict[str, Path] = {}
+# =============================================================================
+# Streaming Export
+# =============================================================================
 
-        # 1. replay_summary.json
-        summary_json = self._export_summary_json(output_dir, run_id)
-        exported["replay_summary_json"] = summary_json
+SUMMARY_CSV_FIELDS = [
+    "run_id",
+    "trace_id",
+    "policy_id",
+    "learner_id",
+    "is_synthetic",
+    "total_events",
+    "escalation_count",
+    "unique_problems",
+    "hdi",
+    "csi",
+    "aps",
+    "persistence",
+    "coverage",
+    "time_to_success",
+    "rqs",
+    "replay_started",
+    "replay_completed",
+]
+
+PER_LEARNER_CSV_FIELDS = [
+    "run_id",
+    "trace_id",
+    "learner_id",
+    "policy_id",
+    "total_problems",
+    "problems_solved",
+    "total_errors",
+    "hints_requested",
+    "explanations_shown",
+    "hdi",
+    "csi",
+    "aps",
+    "persistence",
+    "coverage",
+    "time_to_success_norm",
+    "avg_solve_time_seconds",
+    "has_notes",
+    "rqs",
+]
+
+POLICY_COMPARISON_CSV_FIELDS = [
+    "run_id",
+    "policy_id",
+    "strategy_label",
+    "total_traces_replayed",
+    "avg_hdi",
+    "avg_csi",
+    "avg_aps",
+    "avg_persistence",
+    "avg_coverage",
+    "avg_time_to_success",
+    "total_escalations",
+    "avg_escalations_per_trace",
+    "total_decision_points",
+]
+
+DECISION_POINT_CSV_FIELDS = ["run_id", "trace_id", *_DECISION_POINT_FIELDS]
 
-        # 2. replay_summary.csv
-        summary_csv = self._export_summary_csv(output_dir, run_id)
-        exported["replay_summary_csv"] = summary_csv
 
-        # 3. per_learner_metrics.csv
-        learner_csv = self._export_per_learner_metrics(output_dir, run_id)
-        exported["per_learner_metrics_csv"] = learner_csv
+@dataclass
+class _PolicyTotals:
+    """Per-policy running totals for the summary and comparison artifacts."""
+
+    metrics: MetricsAggregate = field(default_factory=MetricsAggregate)
+    escalations: int = 0
+    decision_points: int = 0
+
 
-        # 4. policy_comparison.csv
-        comparison_csv = self._export_policy_comparison(output_dir, run_id)
-        exported["policy_comparison_csv"] = comparison_csv
+class ReplayExportWriter:
+    """
+    Writes replay artifacts while results are still being produced.
+
+    Per-result rows (replay_summary.csv, per_learner_metrics.csv and,
+    optionally, every decision point as decision_points.jsonl/.csv) are
+    written as each ReplayResult is added; only per-policy running totals
+    are kept, and replay_summary.json and policy_comparison.csv are
+    written from them on close(). Memory use therefore does not grow with
+    the number of traces or decision points.
+
+    Usage:
+        with ReplayExportWriter(output_dir, policy_ids, decision_points=True) as writer:
+            for result in results:
+                writer.add(result)
+        writer.artifacts  # artifact name -> path
+    """
 
-        return exported
+    def __init__(
+        self,
+        output_dir: Path,
+        policy_ids: list[str],
+        run_id: str | None = None,
+        decision_points: bool = False,
+    ):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.policy_ids = list(policy_ids)
+        self.run_id = run_id or f"replay_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+        self.results_written = 0
+        self.artifacts: dict[str, Path] = {
+            "replay_summary_json": self.output_dir / "replay_summary.json",
+            "replay_summary_csv": self.output_dir / "replay_summary.csv",
+            "per_learner_metrics_csv": self.output_dir / "per_learner_metrics.csv",
+            "policy_comparison_csv": self.output_dir / "policy_comparison.csv",
+        }
+        if decision_points:
+            self.artifacts["decision_points_jsonl"] = self.output_dir / "decision_points.jsonl"
+            self.artifacts["decision_points_csv"] = self.output_dir / "decision_points.csv"
+
+        self._trace_ids: dict[str, None] = {}  # insertion-ordered set
+        self._totals: dict[str, _PolicyTotals] = {}  # first-seen policy order
+        self._files = []
+        self._summary = self._open_csv("replay_summary_csv", SUMMARY_CSV_FIELDS)
+        self._per_learner = self._open_csv("per_learner_metrics_csv", PER_LEARNER_CSV_FIELDS)
+        self._decisions_jsonl = None
+        self._decisions_csv = None
+        if decision_points:
+            self._decisions_jsonl = open(self.artifacts["decision_points_jsonl"], "w", encoding="utf-8")
+            self._files.append(self._decisions_jsonl)
+            self._decisions_csv = self._open_csv("decision_points_csv", DECISION_POINT_CSV_FIELDS)
+
+    def _open_csv(self, artifact: str, fieldnames: list[str]) -> csv.DictWriter:
+        f = open(self.artifacts[artifact], "w", newline="", encoding="utf-8")
+        self._files.append(f)
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        return writer
+
+    def __enter__(self) -> ReplayExportWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(write_summaries=exc_type is None)
+
+    def add(self, r: ReplayResult) -> None:
+        """Write one result's rows and fold it into the running totals."""
+        self._trace_ids.setdefault(r.trace_id)
+        totals = self._totals.setdefault(r.policy_id, _PolicyTotals())
+        totals.metrics.add(r.metrics)
+        totals.escalations += r.escalation_count
+        totals.decision_points += len(r.decision_points)
+        self.results_written += 1
+
+        self._summary.writerow(self._summary_row(r))
+        self._per_learner.writerow(self._per_learner_row(r))
+
+        if self._decisions_jsonl is not None:
+            for dp in r.decision_points:
+                self._decisions_jsonl.write(
+                    json.dumps({"run_id": self.run_id, "trace_id": r.trace_id, **dp.to_dict()},
+                               ensure_ascii=False) + "\n"
+                )
+                self._decisions_csv.writerow({"run_id": self.run_id, "trace_id": r.trace_id, **dp.to_csv_row()})
+
+    def close(self, write_summaries: bool = True) -> dict[str, Path]:
+        """Write the aggregate artifacts and close all files."""
+        for f in self._files:
+            f.close()
+        self._files = []
+        if write_summaries:
+            self._write_summary_json()
+            self._write_policy_comparison()
+        return self.artifacts
+
+    def _summary_row(self, r: ReplayResult) -> dict[str, Any]:
+        """Row of replay_summary.csv (one per trace-policy pair)."""
+        row = {
+            "run_id": self.run_id,
+            "trace_id": r.trace_id,
+            "policy_id": r.policy_id,
+            "learner_id": r.learner_id,
+            "is_synthetic": r.is_synthetic,
+            "total_events": r.total_events,
+            "escalation_count": r.escalation_count,
+            "unique_problems": r.unique_problems,
+            "replay_started": r.replay_started_at,
+            "replay_completed": r.replay_completed_at,
+        }
 
-    def _export_summary_json(self, output_dir: Path, run_id: str) -> Path:
-        """Export replay_summary.json."""
-        # Group results by trace
-        traces_by_id: dict[str, list[ReplayResult]] = {}
-        for r in self.results:
-            traces_by_id.setdefault(r.trace_id, []).append(r)
+        if r.metrics:
+            row["hdi"] = r.metrics.hdi.value
+            row["csi"] = r.metrics.csi.value
+            row["aps"] = r.metrics.aps.value
+            row["persistence"] = r.metrics.persistence.value
+            row["coverage"] = r.metrics.coverage.value
+            row["time_to_success"] = r.metrics.time_to_success.value
+            row["rqs"] = r.metrics.rqs.value if r.metrics.rqs.value is not None else ""
+
+        return row
+
+    def _per_learner_row(self, r: ReplayResult) -> dict[str, Any]:
+        """Row of per_learner_metrics.csv."""
+        row = {
+            "run_id": self.run_id,
+            "trace_id": r.trace_id,
+            "learner_id": r.learner_id,
+            "policy_id": r.policy_id,
+            "total_problems": r.unique_problems,
+        }
 
+        if r.metrics:
+            row["hdi"] = round(r.metrics.hdi.value, 4)
+            row["csi"] = round(r.metrics.csi.value, 4)
+            row["aps"] = round(r.metrics.aps.value, 4)
+            row["persistence"] = round(r.metrics.persistence.value, 4)
+            row["coverage"] = round(r.metrics.coverage.value, 4)
+            row["time_to_success_norm"] = round(r.metrics.time_to_success.value, 4)
+            row["avg_solve_time_seconds"] = r.metrics.time_to_success.average_seconds
+            row["has_notes"] = r.metrics.rqs.note_count > 0
+            row["rqs"] = round(r.metrics.rqs.value, 4) if r.metrics.rqs.value is not None else ""
+
+            # Derive additional counts from trace if available
+            # (These would come from actual trace analysis)
+            row["problems_solved"] = r.metrics.time_to_success.total_solved
+            row["total_errors"] = r.metrics.hdi.post_explanation_penalty  # proxy
+
+        return row
+
+    def _write_summary_json(self) -> None:
+        """Write replay_summary.json."""
         summary = ReplaySummary(
-            replay_run_id=run_id,
-            total_traces=len(traces_by_id),
-            total_policies=len(self.policies),
-            traces=list(traces_by_id.keys()),
-            policies=[p.policy_id for p in self.policies],
+            replay_run_id=self.run_id,
+            total_traces=len(self._trace_ids),
+            total_policies=len(self.policy_ids),
+            traces=list(self._trace_ids),
+            policies=self.policy_ids,
         )
 
         # Aggregate metrics by policy
-        for policy in self.policies:
-            policy_results = [r for r in self.results if r.policy_id == policy.policy_id]
-            if policy_results:
-                hdi_values = [r.metrics.hdi.value for r in policy_results if r.metrics]
-                csi_values = [r.metrics.csi.value for r in policy_results if r.metrics]
-                aps_values = [r.metrics.aps.value for r in policy_results if r.metrics]
-
-                summary.policy_metrics[policy.policy_id] = {
-                    "avg_hdi": round(sum(hdi_values) / len(hdi_values), 4) if hdi_values else 0,
-                    "avg_csi": round(sum(csi_values) / len(csi_values), 4) if csi_values else 0,
-                    "avg_aps": round(sum(aps_values) / len(aps_values), 4) if aps_values else 0,
-                    "total_decisions": sum(len(r.decision_points) for r in policy_results),
-                }
-
-        path = output_dir / "replay_summary.json"
-        with open(path, "w", encoding="utf-8") as f:
+        for policy_id in self.policy_ids:
+            totals = self._totals.get(policy_id)
+            if totals is None:
+                continue
+            metrics = totals.metrics
+            summary.policy_metrics[policy_id] = {
+                "avg_hdi": round(metrics.mean("hdi"), 4) if metrics.with_metrics else 0,
+                "avg_csi": round(metrics.mean("csi"), 4) if metrics.with_metrics else 0,
+                "avg_aps": round(metrics.mean("aps"), 4) if metrics.with_metrics else 0,
+                "total_decisions": totals.decision_points,
+            }
+
+        with open(self.artifacts["replay_summary_json"], "w", encoding="utf-8") as f:
             json.dump(summary.to_dict(), f, indent=2, ensure_ascii=False)
 
-        return path
-
-    def _export_summary_csv(self, output_dir: Path, run_id: str) -> Path:
-        """Export replay_summary.csv with one row per trace-policy pair."""
-        path = output_dir / "replay_summary.csv"
-
-        fieldnames = [
-            "run_id",
-            "trace_id",
-            "policy_id",
-            "learner_id",
-            "is_synthetic",
-            "total_events",
-            "escalation_count",
-            "unique_problems",
-            "hdi",
-            "csi",
-            "aps",
-            "persistence",
-            "coverage",
-            "time_to_success",
-            "rqs",
-            "replay_started",
-            "replay_completed",
-        ]
-
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+    def _write_policy_comparison(self) -> None:
+        """Write policy_comparison.csv."""
+        with open(self.artifacts["policy_comparison_csv"], "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=POLICY_COMPARISON_CSV_FIELDS)
             writer.writeheader()
 
-            for r in self.results:
-                row = {
-                    "run_id": run_id,
-                    "trace_id": r.trace_id,
-                    "policy_id": r.policy_id,
-                    "learner_id": r.learner_id,
-                    "is_synthetic": r.is_synthetic,
-                    "total_events": r.total_events,
-                    "escalation_count": r.escalation_count,
-                    "unique_problems": r.unique_problems,
-                    "replay_started": r.replay_started_at,
-                    "replay_completed": r.replay_completed_at,
-                }
-
-                if r.metrics:
-                    row["hdi"] = r.metrics.hdi.value
-                    row["csi"] = r.metrics.csi.value
-                    row["aps"] = r.metrics.aps.value
-                    row["persistence"] = r.metrics.persistence.value
-                    row["coverage"] = r.metrics.coverage.value
-                    row["time_to_success"] = r.metrics.time_to_success.value
-                    row["rqs"] = r.metrics.rqs.value if r.metrics.rqs.value is not None else ""
-
-                writer.writerow(row)
-
-        return path
-
-    def _export_per_learner_metrics(self, output_dir: Path, run_id: str) -> Path:
-        """Export per_learner_metrics.csv."""
-        path = output_dir / "per_learner_metrics.csv"
-
-        fieldnames = [
-            "run_id",
-            "trace_id",
-            "learner_id",
-            "policy_id",
-            "total_problems",
-            "problems_solved",
-            "total_errors",
-            "hints_requested",
-            "explanations_shown",
-            "hdi",
-            "csi",
-            "aps",
-            "persistence",
-            "coverage",
-            "time_to_success_norm",
-            "avg_solve_time_seconds",
-            "has_notes",
-            "rqs",
-        ]
-
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            for policy_id, totals in self._totals.items():
+                count = totals.metrics.results
+                metrics = totals.metrics
 
-            for r in self.results:
-                row = {
-                    "run_id": run_id,
-                    "trace_id": r.trace_id,
-                    "learner_id": r.learner_id,
-                    "policy_id": r.policy_id,
-                    "total_problems": r.unique_problems,
-                }
-
-                if r.metrics:
-                    row["hdi"] = round(r.metrics.hdi.value, 4)
-                    row["csi"] = round(r.metrics.csi.value, 4)
-                    row["aps"] = round(r.metrics.aps.value, 4)
-                    row["persistence"] = round(r.metrics.persistence.value, 4)
-                    row["coverage"] = round(r.metrics.coverage.value, 4)
-                    row["time_to_success_norm"] = round(r.metrics.time_to_success.value, 4)
-                    row["avg_solve_time_seconds"] = r.metrics.time_to_success.average_seconds
-                    row["has_notes"] = r.metrics.rqs.note_count > 0
-                    row["rqs"] = round(r.metrics.rqs.value, 4) if r.metrics.rqs.value is not None else ""
-
-                    # Derive additional counts from trace if available
-                    # (These would come from actual trace analysis)
-                    row["problems_solved"] = r.metrics.time_to_success.total_solved
-                    row["total_errors"] = r.metrics.hdi.post_explanation_penalty  # proxy
-
-                writer.writerow(row)
-
-        return path
-
-    def _export_policy_comparison(self, output_dir: Path, run_id: str) -> Path:
-        """Export policy_comparison.csv."""
-        path = output_dir / "policy_comparison.csv"
-
-        fieldnames = [
-            "run_id",
-            "policy_id",
-            "strategy_label",
-            "total_traces_replayed",
-            "avg_hdi",
-            "avg_csi",
-            "avg_aps",
-            "avg_persistence",
-            "avg_coverage",
-            "avg_time_to_success",
-            "total_escalations",
-            "avg_escalations_per_trace",
-            "total_decision_points",
-        ]
-
-        # Aggregate by policy
-        policy_stats: dict[str, dict[str, Any]] = {}
-        for r in self.results:
-            if r.policy_id not in policy_stats:
-                policy_stats[r.policy_id] = {
-                    "traces": 0,
-                    "hdi_sum": 0.0,
-                    "csi_sum": 0.0,
-                    "aps_sum": 0.0,
-                    "persistence_sum": 0.0,
-                    "coverage_sum": 0.0,
-                    "tts_sum": 0.0,
-                    "escalations": 0,
-                    "decision_points": 0,
-                    "strategy_label": "",
-                }
-
-            stats = policy_stats[r.policy_id]
-            stats["traces"] += 1
-            stats["escalations"] += r.escalation_count
-            stats["decision_points"] += len(r.decision_points)
-
-            if r.metrics:
-                stats["hdi_sum"] += r.metrics.hdi.value
-                stats["csi_sum"] += r.metrics.csi.value
-                stats["aps_sum"] += r.metrics.aps.value
-                stats["persistence_sum"] += r.metrics.persistence.value
-                stats["coverage_sum"] += r.metrics.coverage.value
-                stats["tts_sum"] += r.metrics.time_to_success.value
-
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+                def avg(name: str) -> float:
+                    return round(metrics.mean(name, over_results=True), 4) if count else 0
 
-            for policy_id, stats in policy_stats.items():
-                count = stats["traces"]
-                row = {
-                    "run_id": run_id,
+                writer.writerow({
+                    "run_id": self.run_id,
                     "policy_id": policy_id,
-                    "strategy_label": stats["strategy_label"],
+                    "strategy_label": "",
                     "total_traces_replayed": count,
-                    "avg_hdi": round(stats["hdi_sum"] / count, 4) if count else 0,
-                    "avg_csi": round(stats["csi_sum"] / count, 4) if count else 0,
-                    "avg_aps": round(stats["aps_sum"] / count, 4) if count else 0,
-                    "avg_persistence": round(stats["persistence_sum"] / count, 4) if count else 0,
-                    "avg_coverage": round(stats["coverage_sum"] / count, 4) if count else 0,
-                    "avg_time_to_success": round(stats["tts_sum"] / count, 4) if count else 0,
-                    "total_escalations": stats["escalations"],
-                    "avg_escalations_per_trace": round(stats["escalations"] / count, 2) if count else 0,
-                    "total_decision_points": stats["decision_points"],
-                }
-                writer.writerow(row)
-
-        return path
+                    "avg_hdi": avg("hdi"),
+                    "avg_csi": avg("csi"),
+                    "avg_aps": avg("aps"),
+                    "avg_persistence": avg("persistence"),
+                    "avg_coverage": avg("coverage"),
+                    "avg_time_to_success": avg("time_to_success"),
+                    "total_escalations": totals.escalations,
+                    "avg_escalations_per_trace": round(totals.escalations / count, 2) if count else 0,
+                    "total_decision_points": totals.decision_points,
+                })
 
 
 # =============================================================================
@@ -621,10 +687,17 @@ def run_replay(
     flags: ExperimentFlags | None = None,
     policy_filter: list[str] | None = None,
     run_id: str | None = None,
+    workers: int = 1,
+    export_decisions: bool = False,
 ) -> dict[str, Path]:
     """
     Run replay on traces and export results.
 
+    Traces are loaded and replayed one at a time (or, with workers > 1, in
+    shards across worker processes) and each result is written out as soon
+    as it is produced, so memory use does not grow with the cohort size.
+    Artifacts are identical for any number of workers.
+
     Args:
         trace_input: Path to trace file or directory
         output_dir: Directory for output artifacts
@@ -632,30 +705,105 @@ def run_replay(
         flags: Optional experiment flags
         policy_filter: Optional list of policy IDs to run
         run_id: Optional run identifier
+        workers: Worker processes replaying traces in parallel
+        export_decisions: Also write every decision point to
+            decision_points.jsonl / decision_points.csv
 
     Returns:
         Dict mapping artifact names to file paths
     """
     engine = ReplayEngine(policies=policies, flags=flags)
 
-    # Load traces
-    traces: list[LearnerTrace] = []
     trace_path = Path(trace_input)
-
     if trace_path.is_dir():
-        traces = load_traces_from_directory(trace_path)
+        paths = list_trace_paths(trace_path)
     elif trace_path.exists():
-        traces = [LearnerTrace.from_dict(json.loads(trace_path.read_text(encoding="utf-8")))]
+        paths = [trace_path]
+    else:
+        paths = []
 
-    if not traces:
+    if not paths:
         raise ValueError(f"No traces found at {trace_input}")
 
-    # Replay each trace
-    for trace in traces:
-        engine.replay_trace(trace, policy_filter=policy_filter)
+    if workers > 1 and len(paths) > 1:
+        results = _replay_parallel(engine, paths, policy_filter, workers)
+    else:
+        results = _replay_paths(engine, paths, policy_filter, strict=not trace_path.is_dir())
 
-    # Export results
-    return engine.export_results(output_dir, run_id)
+    # Only create artifacts once a trace has loaded and replayed
+    first = next(results, None)
+    if first is None:
+        raise ValueError(f"No traces found at {trace_input}")
+
+    with ReplayExportWriter(
+        output_dir,
+        [p.policy_id for p in engine.policies],
+        run_id=run_id,
+        decision_points=export_decisions,
+    ) as writer:
+        writer.add(first)
+        for result in results:
+            writer.add(result)
+
+    return writer.artifacts
+
+
+# Trace files handed to a worker process per task
+REPLAY_SHARD_SIZE = 16
+
+
+def _replay_paths(
+    engine: ReplayEngine,
+    paths: list[Path],
+    policy_filter: list[str] | None,
+    strict: bool = False,
+) -> Iterator[ReplayResult]:
+    """Replay trace files one by one, yielding results without keeping them.
+
+    Invalid trace files are skipped unless strict is set.
+    """
+    for path in paths:
+        trace = load_trace(path) if strict else load_trace_or_none(path)
+        if trace is None:
+            continue
+        yield from engine.replay_trace(trace, policy_filter=policy_filter)
+        engine.results.clear()
+
+
+def _replay_shard(
+    engine: ReplayEngine,
+    paths: list[Path],
+    policy_filter: list[str] | None,
+) -> list[ReplayResult]:
+    """Replay a shard of trace files (runs in a worker process)."""
+    return list(_replay_paths(engine, paths, policy_filter))
+
+
+def _replay_parallel(
+    engine: ReplayEngine,
+    paths: list[Path],
+    policy_filter: list[str] | None,
+    workers: int,
+) -> Iterator[ReplayResult]:
+    """Replay shards of trace files across processes, yielding results in input order.
+
+    At most two shards per worker are in flight, so finished results never
+    pile up faster than they are written.
+    """
+    shards = [paths[i:i + REPLAY_SHARD_SIZE] for i in range(0, len(paths), REPLAY_SHARD_SIZE)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future] = deque()
+        shard_iter = iter(shards)
+        for shard in shard_iter:
+            pending.append(pool.submit(_replay_shard, engine, shard, policy_filter))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            results = pending.popleft().result()
+            next_shard = next(shard_iter, None)
+            if next_shard is not None:
+                pending.append(pool.submit(_replay_shard, engine, next_shard, policy_filter))
+            yield from results
 
 
 # Re-export for convenience
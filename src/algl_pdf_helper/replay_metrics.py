@@ -745,3 +745,54 @@ def compute_all_metrics(
         rqs=RQSMetric.compute(trace),
         trace_id=trace.trace_id,
     )
+
+
+# =============================================================================
+# Streaming Aggregation
+# =============================================================================
+
+# Metric values averaged across replays, by AllMetrics attribute
+AGGREGATED_METRICS = ("hdi", "csi", "aps", "persistence", "coverage", "time_to_success")
+
+
+@dataclass
+class MetricsAggregate:
+    """
+    Running totals of metric values across many replays.
+
+    Lets cohort-level averages be computed as results stream past, without
+    keeping every AllMetrics (or the results holding them) in memory.
+
+    Usage:
+        aggregate = MetricsAggregate()
+        for metrics in stream_of_metrics:
+            aggregate.add(metrics)
+        aggregate.mean("hdi")
+    """
+
+    results: int = 0  # results added, with or without metrics
+    with_metrics: int = 0
+    sums: dict[str, float] = field(
+        default_factory=lambda: {name: 0.0 for name in AGGREGATED_METRICS}
+    )
+
+    def add(self, metrics: AllMetrics | None) -> None:
+        """Add one replay's metrics (None counts toward results only)."""
+        self.results += 1
+        if metrics is None:
+            return
+        self.with_metrics += 1
+        for name in AGGREGATED_METRICS:
+            self.sums[name] += getattr(metrics, name).value
+
+    def mean(self, name: str, *, over_results: bool = False) -> float:
+        """
+        Average of a metric value.
+
+        Args:
+            name: One of AGGREGATED_METRICS
+            over_results: Divide by every result added instead of only the
+                results that had metrics
+        """
+        count = self.results if over_results else self.with_metrics
+        return self.sums[name] / count if count else 0.0
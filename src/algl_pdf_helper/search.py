@@ -0,0 +1,305 @@
+"""
+Top-k similarity search over the hash-embedding chunk index.
+
+ChunkSearchIndex holds every chunk embedding as one row-normalized matrix,
+so a batch of queries is scored with a single matrix multiply and the best
+k rows per query are picked with ``argpartition`` instead of sorting every
+chunk. Scores are cosine similarities; ties keep index order.
+
+Example:
+    index = ChunkSearchIndex.load(Path("./output"))
+    for hit in index.search_text(["inner join"], top_k=5)[0]:
+        print(hit.score, hit.chunkId, hit.page)
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Collection, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from .binary_index import BinaryChunkIndex, has_binary_index
+from .embedding import build_hash_embeddings
+from .models import PdfIndexChunk
+
+
+# Queries scored per matrix multiply; bounds the (queries x chunks) score block
+QUERY_BATCH_SIZE = 256
+
+
+def parse_page_range(spec: str) -> tuple[int, int]:
+    """Parse "N" or "START-END" into an inclusive page range.
+
+    Raises:
+        ValueError: If the spec is malformed or START > END
+    """
+    start_s, sep, end_s = spec.strip().partition("-")
+    try:
+        start = int(start_s)
+        end = int(end_s) if sep else start
+    except ValueError:
+        raise ValueError(f"Invalid page range {spec!r}; expected N or START-END") from None
+    if start > end:
+        raise ValueError(f"Invalid page range {spec!r}; start is after end")
+    return start, end
+
+
+@dataclass
+class SearchHit:
+    """One retrieved chunk."""
+    score: float
+    row: int
+    chunkId: str
+    docId: str
+    page: int
+    text: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _LazyColumn(Sequence):
+    """Sequence view that fetches items on demand (e.g. from an mmap)."""
+
+    def __init__(self, length: int, getter: Callable[[int], Any]):
+        self._length = length
+        self._getter = getter
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i):  # type: ignore[override]
+        return self._getter(i)
+
+
+class ChunkSearchIndex:
+    """Normalized embedding matrix plus the chunk columns needed for hits.
+
+    Args:
+        embeddings: (n, dim) chunk embeddings; rows are L2-normalized here
+        chunk_ids: Per-row chunk IDs
+        doc_names: Distinct doc IDs
+        doc_codes: Per-row index into doc_names
+        pages: Per-row page numbers
+        texts: Per-row chunk texts
+        dtype: Matrix dtype; float32 halves memory, float64 keeps full
+            score precision
+    """
+
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        *,
+        chunk_ids: Sequence[str],
+        doc_names: Sequence[str],
+        doc_codes: np.ndarray,
+        pages: np.ndarray,
+        texts: Sequence[str],
+        dtype: type[np.floating] = np.float32,
+    ):
+        matrix = np.array(embeddings, dtype=dtype, copy=True, ndmin=2)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        self.matrix = matrix
+        self.chunk_ids = chunk_ids
+        self.doc_names = list(doc_names)
+        self.doc_codes = np.asarray(doc_codes, dtype=np.int32)
+        self.pages = np.asarray(pages, dtype=np.int32)
+        self.texts = texts
+        # Binary index backing the lazy columns; closed by close()
+        self._source: BinaryChunkIndex | None = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Sequence[PdfIndexChunk],
+        dtype: type[np.floating] = np.float32,
+    ) -> ChunkSearchIndex:
+        """Build from chunk models. Chunks without embeddings are skipped."""
+        chunks = [c for c in chunks if c.embedding]
+        doc_names: list[str] = []
+        doc_index: dict[str, int] = {}
+        for chunk in chunks:
+            doc_index.setdefault(chunk.docId, len(doc_names))
+            if len(doc_index) > len(doc_names):
+                doc_names.append(chunk.docId)
+        dim = len(chunks[0].embedding) if chunks else 0
+        return cls(
+            np.asarray([c.embedding for c in chunks], dtype=dtype).reshape(len(chunks), dim),
+            chunk_ids=[c.chunkId for c in chunks],
+            doc_names=doc_names,
+            doc_codes=np.array([doc_index[c.docId] for c in chunks], dtype=np.int32),
+            pages=np.array([c.page for c in chunks], dtype=np.int32),
+            texts=[c.text for c in chunks],
+            dtype=dtype,
+        )
+
+    @classmethod
+    def from_binary_index(
+        cls,
+        index: BinaryChunkIndex,
+        dtype: type[np.floating] = np.float32,
+    ) -> ChunkSearchIndex:
+        """Build from a memory-mapped binary index; texts stay on disk.
+
+        The search index takes ownership of ``index``: close() closes it.
+        """
+        search = cls(
+            index.embeddings,
+            chunk_ids=_LazyColumn(len(index), index.chunk_id),
+            doc_names=index.doc_ids,
+            doc_codes=index.doc_indices,
+            pages=index.pages,
+            texts=_LazyColumn(len(index), index.text),
+            dtype=dtype,
+        )
+        search._source = index
+        return search
+
+    @classmethod
+    def load(cls, index_dir: Path, dtype: type[np.floating] = np.float32) -> ChunkSearchIndex:
+        """Load from an index output directory (binary layout or chunks.json).
+
+        Raises:
+            FileNotFoundError: If the directory holds neither layout
+        """
+        index_dir = Path(index_dir)
+        if has_binary_index(index_dir):
+            return cls.from_binary_index(BinaryChunkIndex.open(index_dir), dtype=dtype)
+        chunks_path = index_dir / "chunks.json"
+        if not chunks_path.exists():
+            raise FileNotFoundError(f"No chunks.json or index-bin/ found in {index_dir}")
+        data = json.loads(chunks_path.read_text(encoding="utf-8"))
+        return cls.from_chunks([PdfIndexChunk(**c) for c in data], dtype=dtype)
+
+    def __enter__(self) -> ChunkSearchIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory maps of a binary index (no-op for JSON)."""
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    @property
+    def dim(self) -> int:
+        return self.matrix.shape[1]
+
+    def _candidate_rows(
+        self,
+        doc_ids: Collection[str] | None,
+        page_range: tuple[int, int] | None,
+    ) -> np.ndarray | None:
+        """Rows passing the filters, or None when nothing is filtered."""
+        if doc_ids is None and page_range is None:
+            return None
+        mask = np.ones(len(self), dtype=bool)
+        if doc_ids is not None:
+            wanted = set(doc_ids)
+            codes = [i for i, name in enumerate(self.doc_names) if name in wanted]
+            mask &= np.isin(self.doc_codes, codes)
+        if page_range is not None:
+            start, end = page_range
+            mask &= (self.pages >= start) & (self.pages <= end)
+        return np.flatnonzero(mask)
+
+    def search(
+        self,
+        query_vectors: np.ndarray | Sequence[Sequence[float]],
+        top_k: int = 5,
+        *,
+        doc_ids: Collection[str] | None = None,
+        page_range: tuple[int, int] | None = None,
+    ) -> list[list[SearchHit]]:
+        """Return the top_k hits for each query vector, best first.
+
+        Args:
+            query_vectors: (q, dim) query embeddings (need not be normalized)
+            top_k: Hits per query
+            doc_ids: Only search chunks from these documents
+            page_range: Only search chunks on pages start..end (inclusive)
+
+        Raises:
+            ValueError: If the query dimension does not match the index
+        """
+        queries = np.array(query_vectors, dtype=self.matrix.dtype, ndmin=2)
+        if len(self) and queries.shape[1] != self.dim:
+            raise ValueError(
+                f"Query dimension {queries.shape[1]} does not match index dimension {self.dim}"
+            )
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        np.divide(queries, norms, out=queries, where=norms > 0)
+
+        rows = self._candidate_rows(doc_ids, page_range)
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        k = min(top_k, matrix.shape[0])
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        results: list[list[SearchHit]] = []
+        for start in range(0, len(queries), QUERY_BATCH_SIZE):
+            scores = queries[start : start + QUERY_BATCH_SIZE] @ matrix.T
+            if k < scores.shape[1]:
+                kth_col = np.argpartition(-scores, k - 1, axis=1)[:, k - 1 : k]
+                kth = np.take_along_axis(scores, kth_col, axis=1)[:, 0]
+            else:
+                kth = scores.min(axis=1)
+            for q_scores, q_kth in zip(scores, kth):
+                results.append([
+                    self._hit(int(row if rows is None else rows[row]), float(q_scores[row]))
+                    for row in self._rank(q_scores, q_kth, k)
+                ])
+        return results
+
+    def _rank(self, scores: np.ndarray, kth: float, k: int) -> np.ndarray:
+        """Top k positions, best first; near-equal scores keep index order.
+
+        Scores within a few ulps are treated as ties, so exact ties in the
+        underlying cosine are not reordered by floating-point noise.
+        """
+        tol = float(np.finfo(scores.dtype).eps) * 16
+        candidates = np.flatnonzero(scores >= kth - tol)
+        by_score = candidates[np.argsort(-scores[candidates], kind="stable")]
+        steps = np.diff(scores[by_score]) < -tol
+        groups = np.concatenate(([0], np.cumsum(steps)))
+        return by_score[np.lexsort((by_score, groups))][:k]
+
+    def search_text(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        *,
+        doc_ids: Collection[str] | None = None,
+        page_range: tuple[int, int] | None = None,
+    ) -> list[list[SearchHit]]:
+        """Embed queries with the hash embedding and search."""
+        vectors = build_hash_embeddings(queries, max(self.dim, 1), dtype=self.matrix.dtype)
+        return self.search(vectors, top_k, doc_ids=doc_ids, page_range=page_range)
+
+    def _hit(self, row: int, score: float) -> SearchHit:
+        return SearchHit(
+            score=score,
+            row=row,
+            chunkId=self.chunk_ids[row],
+            docId=self.doc_names[int(self.doc_codes[row])],
+            page=int(self.pages[row]),
+            text=self.texts[row],
+        )
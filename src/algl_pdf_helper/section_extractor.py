@@ -9,14 +9,26 @@ into an instructional unit graph for adaptive learning systems.
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
 from typing import Any
 
 import fitz  # PyMuPDF
+import numpy as np
 
 from .clean import normalize_text
+from .extract import sha256_file
+from .extraction_cache import ExtractionCache
+from .pdf_session import PdfSession, body_font_size
+
+
+# Bump when a change alters extract_blocks output, so stale extraction
+# cache entries stop matching
+BLOCK_EXTRACTOR_VERSION = "blocks-1"
 
 
 # =============================================================================
@@ -151,6 +163,15 @@ class ContentBlock:
         )
 
 
+def _block_from_cache(data: dict[str, Any]) -> ContentBlock:
+    """Rebuild a cached block, restoring the tuple bbox lost to JSON."""
+    block = ContentBlock.from_dict(data)
+    bbox = block.metadata.get("bbox")
+    if isinstance(bbox, list):
+        block.metadata["bbox"] = tuple(bbox)
+    return block
+
+
 # =============================================================================
 # SECTION EXTRACTOR CLASS
 # =============================================================================
@@ -264,6 +285,8 @@ class SectionExtractor:
         pdf_path: Path | str,
         doc_id: str,
         page_range: tuple[int, int] | list[int] | None = None,
+        session: PdfSession | None = None,
+        cache: ExtractionCache | None = None,
     ) -> list[ContentBlock]:
         """
         Extract content blocks from a PDF with pedagogical structure awareness.
@@ -279,6 +302,11 @@ class SectionExtractor:
                 - tuple (start, end): Extract pages from start to end (inclusive, 1-based)
                 - list [p1, p2, ...]: Extract specific page numbers (1-based)
                 - None: Extract all pages
+            session: Optional open PdfSession for pdf_path; each page's
+                layout dict is decoded once and shared with other consumers
+            cache: Optional ExtractionCache; blocks previously extracted from
+                the same file content, doc_id and page range are returned
+                without opening the PDF
             
         Returns:
             List of ContentBlock objects with type annotations
@@ -290,71 +318,70 @@ class SectionExtractor:
         """
         pdf_path = Path(pdf_path)
         
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-        
-        if pdf_path.is_dir():
-            raise PermissionError(f"Path is a directory, not a file: {pdf_path}")
-        
-        try:
-            doc = fitz.open(pdf_path)
-        except fitz.FileDataError as e:
-            error_msg = str(e).lower()
-            if "password" in error_msg or "encrypted" in error_msg:
-                raise RuntimeError(
-                    f"PDF is password-protected: {pdf_path}"
-                ) from e
-            raise RuntimeError(f"Invalid PDF file: {pdf_path}") from e
+        cache_key = None
+        if cache is not None and pdf_path.is_file():
+            sha = session.sha256 if session is not None else sha256_file(pdf_path)
+            cache_key = cache.make_key(
+                "blocks", sha, BLOCK_EXTRACTOR_VERSION, page_range, doc_id=doc_id
+            )
+            cached = cache.get_json(cache_key)
+            if cached is not None:
+                return [_block_from_cache(data) for data in cached]
+        
+        owns_session = session is None
+        if owns_session:
+            if not pdf_path.exists():
+                raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+            
+            if pdf_path.is_dir():
+                raise PermissionError(f"Path is a directory, not a file: {pdf_path}")
+            
+            try:
+                doc = fitz.open(pdf_path)
+            except fitz.FileDataError as e:
+                error_msg = str(e).lower()
+                if "password" in error_msg or "encrypted" in error_msg:
+                    raise RuntimeError(
+                        f"PDF is password-protected: {pdf_path}"
+                    ) from e
+                raise RuntimeError(f"Invalid PDF file: {pdf_path}") from e
+            session = PdfSession(pdf_path, doc=doc)
         
         blocks: list[ContentBlock] = []
         
-        # Determine which pages to extract
-        total_pages = doc.page_count
-        if page_range is None:
-            page_indices = list(range(total_pages))
-        elif isinstance(page_range, tuple):
-            start, end = page_range
-            if start < 1 or end > total_pages or start > end:
-                doc.close()
-                raise ValueError(
-                    f"Invalid page range: {page_range} "
-                    f"(document has {total_pages} pages)"
-                )
-            page_indices = list(range(start - 1, end))  # Convert to 0-based
-        elif isinstance(page_range, list):
-            if not page_range:
-                doc.close()
-                raise ValueError("Page range list is empty")
-            invalid = [p for p in page_range if p < 1 or p > total_pages]
-            if invalid:
-                doc.close()
-                raise ValueError(
-                    f"Invalid page numbers: {invalid} "
-                    f"(document has {total_pages} pages)"
-                )
-            page_indices = [p - 1 for p in page_range]  # Convert to 0-based
-        else:
-            doc.close()
-            raise ValueError(f"Invalid page_range type: {type(page_range)}")
-        
         try:
-            # First pass: collect font statistics to determine body text size
-            font_sizes = []
-            for page_num in page_indices:
-                page = doc.load_page(page_num)
-                text_dict = page.get_text("dict")
-                
-                for block in text_dict.get("blocks", []):
-                    if "lines" not in block:
-                        continue
-                    for line in block["lines"]:
-                        for span in line.get("spans", []):
-                            font_sizes.append(span.get("size", 12))
-            
-            # Calculate body text size (mode of font sizes)
-            if font_sizes:
-                body_size = max(set(font_sizes), key=font_sizes.count)
+            # Determine which pages to extract
+            total_pages = session.page_count
+            if page_range is None:
+                page_indices = list(range(total_pages))
+            elif isinstance(page_range, tuple):
+                start, end = page_range
+                if start < 1 or end > total_pages or start > end:
+                    raise ValueError(
+                        f"Invalid page range: {page_range} "
+                        f"(document has {total_pages} pages)"
+                    )
+                page_indices = list(range(start - 1, end))  # Convert to 0-based
+            elif isinstance(page_range, list):
+                if not page_range:
+                    raise ValueError("Page range list is empty")
+                invalid = [p for p in page_range if p < 1 or p > total_pages]
+                if invalid:
+                    raise ValueError(
+                        f"Invalid page numbers: {invalid} "
+                        f"(document has {total_pages} pages)"
+                    )
+                page_indices = [p - 1 for p in page_range]  # Convert to 0-based
             else:
+                raise ValueError(f"Invalid page_range type: {type(page_range)}")
+            
+            # Body text size: mode of the span font sizes (span cache shared
+            # with StructureExtractor.extract_headings)
+            font_sizes: Counter[float] = Counter()
+            for page_num in page_indices:
+                font_sizes.update(session.page_spans(page_num).font_sizes)
+            body_size = body_font_size(font_sizes)
+            if body_size is None:
                 body_size = 12.0
             
             heading_threshold = body_size * self.HEADING_SIZE_THRESHOLD
@@ -365,8 +392,7 @@ class SectionExtractor:
             prev_block: ContentBlock | None = None
             
             for page_num in page_indices:
-                page = doc.load_page(page_num)
-                text_dict = page.get_text("dict")
+                text_dict = session.page_dict(page_num)
                 
                 page_char_offset = 0
                 
@@ -486,11 +512,15 @@ class SectionExtractor:
                     prev_block = content_block
         
         finally:
-            doc.close()
+            if owns_session:
+                session.close()
         
         # Post-processing: establish parent-child relationships
         blocks = self._establish_hierarchy(blocks)
         
+        if cache_key is not None:
+            cache.put_json(cache_key, [b.to_dict() for b in blocks])
+        
         return blocks
     
     def _detect_block_type(
@@ -1185,6 +1215,133 @@ class ContentFilter:
         return None
 
 
+# =============================================================================
+# BLOCK TEXT INDEX
+# =============================================================================
+
+class BlockTextIndex:
+    """
+    One-time inverted index over the lowered text of content blocks.
+    
+    Concept mapping and evidence lookup ask "which blocks contain keyword k"
+    for many concepts that share keywords. Block texts are lowered once and
+    split into whitespace-delimited tokens with a posting list (block
+    indices) per distinct token. A keyword without whitespace occurs in a
+    block exactly when it is a substring of one of the block's tokens, so it
+    is answered by scanning the (much smaller) vocabulary and merging the
+    postings; phrases are verified against the candidate blocks of their
+    parts. Results are memoized per keyword and match
+    ``keyword in block.text_content.lower()`` exactly.
+    """
+    
+    def __init__(self, blocks: list[ContentBlock]):
+        """
+        Build the index.
+        
+        Args:
+            blocks: Content blocks; results refer to positions in this list
+        """
+        self.blocks = blocks
+        self.texts = [block.text_content.lower() for block in blocks]
+        
+        postings: dict[str, list[int]] = {}
+        for i, text in enumerate(self.texts):
+            for token in set(text.split()):
+                if token in postings:
+                    postings[token].append(i)
+                else:
+                    postings[token] = [i]
+        self._postings = [np.array(p, dtype=np.int64) for p in postings.values()]
+        # Newline-joined vocabulary: a whitespace-free keyword cannot match
+        # across the separator, so each hit lies inside a single token
+        self._vocab = "\n".join(postings)
+        self._vocab_starts: list[int] = []
+        offset = 0
+        for token in postings:
+            self._vocab_starts.append(offset)
+            offset += len(token) + 1
+        
+        self._matches: dict[str, np.ndarray] = {}
+        self._occurrences: dict[str, np.ndarray] = {}
+        self._word_counts: np.ndarray | None = None
+    
+    def __len__(self) -> int:
+        return len(self.blocks)
+    
+    def blocks_containing(self, keyword: str) -> np.ndarray:
+        """Sorted indices of blocks whose lowered text contains keyword."""
+        matches = self._matches.get(keyword)
+        if matches is None:
+            matches = self._lookup(keyword)
+            self._matches[keyword] = matches
+        return matches
+    
+    def mask(self, keyword: str) -> np.ndarray:
+        """Boolean array: whether each block contains keyword."""
+        result = np.zeros(len(self), dtype=bool)
+        result[self.blocks_containing(keyword)] = True
+        return result
+    
+    def keyword_hits(self, keywords: Iterable[str]) -> np.ndarray:
+        """Per block, how many of the keywords it contains."""
+        arrays = [self.blocks_containing(kw) for kw in keywords]
+        if not arrays:
+            return np.zeros(len(self), dtype=np.int64)
+        return np.bincount(np.concatenate(arrays), minlength=len(self))
+    
+    def occurrences(self, keyword: str) -> np.ndarray:
+        """Per block, non-overlapping occurrence count (``str.count``)."""
+        counts = self._occurrences.get(keyword)
+        if counts is None:
+            counts = np.zeros(len(self), dtype=np.int64)
+            for i in self.blocks_containing(keyword).tolist():
+                counts[i] = self.texts[i].count(keyword)
+            self._occurrences[keyword] = counts
+        return counts
+    
+    @property
+    def word_counts(self) -> np.ndarray:
+        """Whitespace-separated word count of each block."""
+        if self._word_counts is None:
+            self._word_counts = np.array(
+                [len(text.split()) for text in self.texts], dtype=np.int64
+            )
+        return self._word_counts
+    
+    def _lookup(self, keyword: str) -> np.ndarray:
+        parts = keyword.split()
+        if parts == [keyword]:
+            return self._token_lookup(keyword)
+        if not parts:
+            # Empty or all-whitespace keyword: test every block directly
+            candidates = range(len(self.texts))
+        else:
+            # Any block containing the phrase contains each of its parts
+            candidates = self.blocks_containing(parts[0])
+            for part in parts[1:]:
+                candidates = np.intersect1d(candidates, self.blocks_containing(part))
+            candidates = candidates.tolist()
+        return np.array(
+            [i for i in candidates if keyword in self.texts[i]], dtype=np.int64
+        )
+    
+    def _token_lookup(self, keyword: str) -> np.ndarray:
+        vocab, starts = self._vocab, self._vocab_starts
+        hits = []
+        pos = vocab.find(keyword)
+        while pos != -1:
+            t = bisect_right(starts, pos) - 1
+            hits.append(self._postings[t])
+            if t + 1 >= len(starts):
+                break
+            pos = vocab.find(keyword, starts[t + 1])
+        if not hits:
+            return np.zeros(0, dtype=np.int64)
+        if len(hits) == 1:
+            return hits[0]
+        return np.unique(np.concatenate(hits))
+
+
 # =============================================================================
 # EVIDENCE TRACKER CLASS
 # =============================================================================
@@ -1207,6 +1364,7 @@ class EvidenceTracker:
         concept_id: str,
         keywords: list[str] | None = None,
         context_window: int = 2,
+        text_index: BlockTextIndex | None = None,
     ) -> list[ContentBlock]:
         """
         Get content blocks that ground a specific concept.
@@ -1219,6 +1377,8 @@ class EvidenceTracker:
             concept_id: Concept identifier (e.g., "sql-joins", "aggregate-functions")
             keywords: Optional list of keywords to match (derived from concept_id if not provided)
             context_window: Number of surrounding blocks to include for context
+            text_index: Prebuilt BlockTextIndex over blocks, reused across
+                concepts (built here if not provided)
             
         Returns:
             List of content blocks that ground the concept
@@ -1230,28 +1390,29 @@ class EvidenceTracker:
         # Normalize keywords
         keywords = [kw.lower().strip() for kw in keywords]
         
-        # Find matching block indices
-        matching_indices: set[int] = set()
+        if text_index is None:
+            text_index = BlockTextIndex(blocks)
         
-        for i, block in enumerate(blocks):
-            block_text = block.text_content.lower()
-            
-            # Check for keyword matches
-            for keyword in keywords:
-                if keyword in block_text:
-                    matching_indices.add(i)
-                    break
+        return [blocks[i] for i in self._span_indices(text_index, keywords, context_window)]
+    
+    def _span_indices(
+        self,
+        text_index: BlockTextIndex,
+        keywords: list[str],
+        context_window: int,
+    ) -> list[int]:
+        """Indices of blocks matching any keyword, expanded by the context window."""
+        # Find matching block indices
+        matching = [text_index.blocks_containing(keyword) for keyword in keywords]
+        if not matching:
+            return []
+        matching_indices = np.unique(np.concatenate(matching))
         
         # Expand with context window
-        expanded_indices: set[int] = set()
-        for idx in matching_indices:
-            for offset in range(-context_window, context_window + 1):
-                context_idx = idx + offset
-                if 0 <= context_idx < len(blocks):
-                    expanded_indices.add(context_idx)
-        
-        # Return blocks in order
-        return [blocks[i] for i in sorted(expanded_indices)]
+        offsets = np.arange(-context_window, context_window + 1)
+        expanded = (matching_indices[:, None] + offsets).ravel()
+        expanded = expanded[(expanded >= 0) & (expanded < len(text_index))]
+        return np.unique(expanded).tolist()
     
     def _derive_keywords(self, concept_id: str) -> list[str]:
         """Derive search keywords from a concept ID."""
@@ -1345,38 +1506,71 @@ class EvidenceTracker:
         self,
         blocks: list[ContentBlock],
         concept_ids: list[str],
+        text_index: BlockTextIndex | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
         """
         Create an evidence map for multiple concepts.
         
+        Block texts are lowered and indexed once for all concepts.
+        
         Args:
             blocks: List of content blocks
             concept_ids: List of concept identifiers
+            text_index: Prebuilt BlockTextIndex over blocks (built if None)
             
         Returns:
             Dictionary mapping concept_id to list of evidence entries
         """
+        if text_index is None:
+            text_index = BlockTextIndex(blocks)
         evidence_map: dict[str, list[dict[str, Any]]] = {}
         
+        structural = np.array([block.is_structural for block in blocks], dtype=bool)
+        code = np.array([block.is_code for block in blocks], dtype=bool)
+        
         for concept_id in concept_ids:
-            relevant_blocks = self.get_spans_for_concept(blocks, concept_id)
+            keywords = [kw.lower().strip() for kw in self._derive_keywords(concept_id)]
+            rows = np.array(
+                self._span_indices(text_index, keywords, context_window=2), dtype=np.int64
+            )
+            scores = self._relevance_scores(text_index, rows, keywords, structural, code)
             
             evidence_map[concept_id] = [
                 {
-                    "block_id": block.block_id,
-                    "block_type": block.block_type.name,
-                    "page_number": block.page_number,
-                    "relevance_score": self.calculate_relevance_score(
-                        block, concept_id
-                    ),
-                    "text_preview": block.text_content[:200] + "..."
-                    if len(block.text_content) > 200
-                    else block.text_content,
+                    "block_id": blocks[i].block_id,
+                    "block_type": blocks[i].block_type.name,
+                    "page_number": blocks[i].page_number,
+                    "relevance_score": score,
+                    "text_preview": blocks[i].text_content[:200] + "..."
+                    if len(blocks[i].text_content) > 200
+                    else blocks[i].text_content,
                 }
-                for block in relevant_blocks
+                for i, score in zip(rows.tolist(), scores)
             ]
         
         return evidence_map
+    
+    @staticmethod
+    def _relevance_scores(
+        text_index: BlockTextIndex,
+        rows: np.ndarray,
+        keywords: list[str],
+        structural: np.ndarray,
+        code: np.ndarray,
+    ) -> list[float]:
+        """calculate_relevance_score for many blocks at once (same arithmetic)."""
+        keyword_count = np.zeros(len(rows), dtype=np.int64)
+        for kw in keywords:
+            keyword_count += text_index.occurrences(kw)[rows]
+        word_count = text_index.word_counts[rows]
+        
+        density = np.zeros(len(rows))
+        np.divide(keyword_count, word_count, out=density, where=word_count > 0)
+        density = np.where(structural[rows], density * 2.0, density)
+        density = np.where(code[rows], density * 1.5, density)
+        scores = np.minimum(1.0, density * 10)
+        scores[word_count == 0] = 0.0
+        return scores.tolist()
 
 
 # =============================================================================
@@ -1556,6 +1750,7 @@ class ChapterDetector:
         self,
         blocks: list[ContentBlock],
         pdf_path: Path | str | None = None,
+        session: PdfSession | None = None,
     ) -> list[ChapterInfo]:
         """
         Detect chapter structure from content blocks.
@@ -1563,6 +1758,7 @@ class ChapterDetector:
         Args:
             blocks: Content blocks from PDF
             pdf_path: Optional path to PDF for bookmark extraction
+            session: Optional open PdfSession to read bookmarks from
             
         Returns:
             List of ChapterInfo objects
@@ -1570,8 +1766,10 @@ class ChapterDetector:
         chapters: list[ChapterInfo] = []
         
         # Try to extract from PDF bookmarks first
-        if pdf_path:
-            bookmark_chapters = self._extract_from_bookmarks(pdf_path)
+        if pdf_path or session is not None:
+            bookmark_chapters = self._extract_from_bookmarks(
+                pdf_path or session.pdf_path, session=session
+            )
             if bookmark_chapters:
                 chapters = bookmark_chapters
         
@@ -1584,15 +1782,19 @@ class ChapterDetector:
         
         return chapters
     
-    def _extract_from_bookmarks(self, pdf_path: Path | str) -> list[ChapterInfo]:
+    def _extract_from_bookmarks(
+        self,
+        pdf_path: Path | str,
+        session: PdfSession | None = None,
+    ) -> list[ChapterInfo]:
         """Extract chapter structure from PDF bookmarks/outline."""
         chapters: list[ChapterInfo] = []
         pdf_path = Path(pdf_path)
         
         try:
-            doc = fitz.open(pdf_path)
+            doc = session.doc if session is not None else fitz.open(pdf_path)
             try:
-                toc = doc.get_toc()
+                toc = session.get_toc() if session is not None else doc.get_toc()
                 
                 for item in toc:
                     level, title, page = item
@@ -1629,7 +1831,8 @@ class ChapterDetector:
                         chapter.end_page = doc.page_count
                         
             finally:
-                doc.close()
+                if session is None:
+                    doc.close()
                 
         except Exception:
             # Silently fail and fall back to heading detection
@@ -1922,6 +2125,7 @@ class ExerciseExtractor:
 def extract_chapter_structure(
     pdf_path: Path | str,
     blocks: list[ContentBlock] | None = None,
+    session: PdfSession | None = None,
 ) -> list[ChapterInfo]:
     """
     Extract chapter structure from PDF.
@@ -1929,6 +2133,7 @@ def extract_chapter_structure(
     Args:
         pdf_path: Path to PDF file
         blocks: Optional pre-extracted content blocks
+        session: Optional open PdfSession for pdf_path
         
     Returns:
         List of ChapterInfo objects
@@ -1938,9 +2143,9 @@ def extract_chapter_structure(
     if blocks is None:
         extractor = SectionExtractor()
         doc_id = Path(pdf_path).stem
-        blocks = extractor.extract_blocks(pdf_path, doc_id)
+        blocks = extractor.extract_blocks(pdf_path, doc_id, session=session)
     
-    return detector.detect_chapters(blocks, pdf_path)
+    return detector.detect_chapters(blocks, pdf_path, session=session)
 
 
 def extract_exercises(
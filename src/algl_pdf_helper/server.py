@@ -1,23 +1,72 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import shutil
 import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel
 
 try:
-    from fastapi import FastAPI, File, UploadFile
+    from fastapi import FastAPI, File, Query, UploadFile
     from fastapi.responses import JSONResponse
 except Exception as e:  # pragma: no cover
     raise RuntimeError(
         "fastapi is not installed. Install with: pip install -e '.[server]'"
     ) from e
 
-from .indexer import build_index
+from .extraction_cache import get_extraction_cache
+from .index_jobs import (
+    DEFAULT_MAX_PENDING_JOBS,
+    IndexJobManager,
+    JobQueueFull,
+    index_response,
+)
 from .models import IndexBuildOptions
+from .search import ChunkSearchIndex, parse_page_range
 
-api = FastAPI(title="algl-pdf-helper")
+# Uploads are copied to disk in pieces of this size
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Loaded search indexes kept open by /v1/search
+SEARCH_CACHE_SIZE = 8
+
+_job_manager: IndexJobManager | None = None
+
+
+def get_job_manager() -> IndexJobManager:
+    """The process pool shared by all indexing requests (created lazily).
+
+    Size it with ALGL_PDF_JOB_WORKERS (default 2) and
+    ALGL_PDF_MAX_PENDING_JOBS (default 16).
+    """
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = IndexJobManager(
+            max_workers=int(os.getenv("ALGL_PDF_JOB_WORKERS", "2")),
+            max_pending=int(os.getenv("ALGL_PDF_MAX_PENDING_JOBS", str(DEFAULT_MAX_PENDING_JOBS))),
+        )
+    return _job_manager
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    with _search_cache_lock:
+        while _search_cache:
+            _search_cache.popitem()[1][1].close()
+    global _job_manager
+    if _job_manager is not None:
+        _job_manager.shutdown(wait=False)
+        _job_manager = None
+
+
+api = FastAPI(title="algl-pdf-helper", lifespan=_lifespan)
 
 
 class IndexResponse(BaseModel):
@@ -26,6 +75,71 @@ class IndexResponse(BaseModel):
     chunks: list[dict]
 
 
+async def _save_upload(pdf: UploadFile, work_dir: Path) -> Path:
+    """Copy an upload to work_dir piece by piece instead of reading it whole."""
+    pdf_path = work_dir / Path(pdf.filename or "upload.pdf").name
+    with open(pdf_path, "wb") as f:
+        while data := await pdf.read(UPLOAD_CHUNK_BYTES):
+            f.write(data)
+    return pdf_path
+
+
+async def _submit_upload(pdf: UploadFile, build_kwargs: dict[str, Any]):
+    work_dir = Path(tempfile.mkdtemp(prefix="algl_pdf_api_"))
+    try:
+        pdf_path = await _save_upload(pdf, work_dir)
+        return get_job_manager().submit(work_dir, pdf_path, build_kwargs)
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+
+
+def get_max_build_workers() -> int:
+    """Largest ``workers`` value a client may request for one index build.
+
+    Set it with ALGL_PDF_MAX_BUILD_WORKERS (default: the CPU count).
+    """
+    return max(1, int(os.getenv("ALGL_PDF_MAX_BUILD_WORKERS", str(os.cpu_count() or 1))))
+
+
+def _workers_error(workers: int) -> JSONResponse | None:
+    """422 response when workers is outside 1..get_max_build_workers()."""
+    limit = get_max_build_workers()
+    if 1 <= workers <= limit:
+        return None
+    return JSONResponse(
+        {"error": f"workers must be between 1 and {limit}, got {workers}"},
+        status_code=422,
+    )
+
+
+def _build_kwargs(
+    *,
+    ocr: bool,
+    auto_ocr: bool,
+    use_aliases: bool,
+    chunk_words: int,
+    overlap_words: int,
+    embedding_dim: int,
+    strip_headers: bool,
+    workers: int,
+    extraction_cache: bool,
+) -> dict[str, Any]:
+    return dict(
+        options=IndexBuildOptions(
+            chunkWords=chunk_words,
+            overlapWords=overlap_words,
+            embeddingDim=embedding_dim,
+        ),
+        ocr=ocr,
+        auto_ocr=auto_ocr,
+        use_aliases=use_aliases,
+        strip_headers=strip_headers,
+        workers=workers,
+        cache=get_extraction_cache() if extraction_cache else None,
+    )
+
+
 @api.post("/v1/index")
 async def index_pdf(
     pdf: UploadFile = File(...),
@@ -36,44 +150,167 @@ async def index_pdf(
     overlap_words: int = 30,
     embedding_dim: int = 24,
     strip_headers: bool = True,
+    workers: int = 1,
+    extraction_cache: bool = True,
 ):
-    tmp_root = Path(tempfile.mkdtemp(prefix="algl_pdf_api_"))
+    """Index a PDF and wait for the result (runs on the job pool)."""
+    if (error := _workers_error(workers)) is not None:
+        return error
     try:
-        pdf_path = tmp_root / (pdf.filename or "upload.pdf")
-        data = await pdf.read()
-        pdf_path.write_bytes(data)
-
-        out_dir = tmp_root / "pdf-index"
-        opts = IndexBuildOptions(
-            chunkWords=chunk_words,
-            overlapWords=overlap_words,
-            embeddingDim=embedding_dim,
+        job = await _submit_upload(
+            pdf,
+            _build_kwargs(
+                ocr=ocr,
+                auto_ocr=auto_ocr,
+                use_aliases=use_aliases,
+                chunk_words=chunk_words,
+                overlap_words=overlap_words,
+                embedding_dim=embedding_dim,
+                strip_headers=strip_headers,
+                workers=workers,
+                extraction_cache=extraction_cache,
+            ),
         )
+        doc = await asyncio.wrap_future(job.future)
+        return JSONResponse(index_response(doc))
+    except JobQueueFull as e:
+        return JSONResponse({"error": str(e)}, status_code=503)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
 
-        doc = build_index(
-            pdf_path,
-            out_dir,
-            options=opts,
-            ocr=ocr,
-            auto_ocr=auto_ocr,
-            use_aliases=use_aliases,
-            strip_headers=strip_headers,
+
+@api.post("/v1/jobs", status_code=202)
+async def create_job(
+    pdf: UploadFile = File(...),
+    ocr: bool = False,
+    auto_ocr: bool = True,
+    use_aliases: bool = False,
+    chunk_words: int = 180,
+    overlap_words: int = 30,
+    embedding_dim: int = 24,
+    strip_headers: bool = True,
+    workers: int = 1,
+    extraction_cache: bool = True,
+):
+    """Queue a PDF for indexing; poll GET /v1/jobs/{job_id} for the result."""
+    if (error := _workers_error(workers)) is not None:
+        return error
+    try:
+        job = await _submit_upload(
+            pdf,
+            _build_kwargs(
+                ocr=ocr,
+                auto_ocr=auto_ocr,
+                use_aliases=use_aliases,
+                chunk_words=chunk_words,
+                overlap_words=overlap_words,
+                embedding_dim=embedding_dim,
+                strip_headers=strip_headers,
+                workers=workers,
+                extraction_cache=extraction_cache,
+            ),
         )
+    except JobQueueFull as e:
+        return JSONResponse({"error": str(e)}, status_code=503)
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return JSONResponse(
+        {**job.to_dict(), "statusUrl": f"/v1/jobs/{job.id}"}, status_code=202
+    )
+
+
+@api.get("/v1/jobs/{job_id}")
+def get_job(job_id: str):
+    """Job status; a succeeded job also carries the index as "result"."""
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return JSONResponse({"error": f"Unknown job: {job_id}"}, status_code=404)
+    data = job.to_dict()
+    if job.document is not None:
+        data["result"] = index_response(job.document)
+    return JSONResponse(data)
+
 
-        manifest = (out_dir / "manifest.json").read_text(encoding="utf-8")
-        chunks = (out_dir / "chunks.json").read_text(encoding="utf-8")
+def get_index_root() -> Path:
+    """Directory /v1/search may read indexes from.
 
+    Set it with ALGL_PDF_INDEX_ROOT (default: the working directory).
+    """
+    return Path(os.getenv("ALGL_PDF_INDEX_ROOT", ".")).resolve()
+
+
+def _resolve_index_dir(index_dir: str) -> Path:
+    """Resolve a client-supplied index_dir inside the index root.
+
+    Raises:
+        FileNotFoundError: If the path lies outside the root
+    """
+    root = get_index_root()
+    path = (root / index_dir).resolve()
+    if not path.is_relative_to(root):
+        raise FileNotFoundError(f"Unknown index: {index_dir}")
+    return path
+
+
+def _index_stamp(index_dir: Path) -> int:
+    """mtime of the file that marks a complete index (changes on rebuild)."""
+    for marker in (index_dir / "index-bin" / "header.json", index_dir / "chunks.json"):
+        if marker.exists():
+            return marker.stat().st_mtime_ns
+    raise FileNotFoundError(f"No chunks.json or index-bin/ found in {index_dir}")
+
+
+_search_cache: OrderedDict[Path, tuple[int, ChunkSearchIndex]] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _load_search_index(index_dir: Path, stamp: int) -> ChunkSearchIndex:
+    """LRU cache of loaded indexes keyed on the resolved in-root path.
+
+    A different stamp means the index was rebuilt, so the entry is reloaded.
+    Replaced and evicted indexes are only dropped, not closed: a search on
+    another thread may still be reading them. Their memory maps are
+    released once the last reference goes; the lifespan closes the rest.
+    """
+    with _search_cache_lock:
+        cached = _search_cache.get(index_dir)
+        if cached is not None and cached[0] == stamp:
+            _search_cache.move_to_end(index_dir)
+            return cached[1]
+        search = ChunkSearchIndex.load(index_dir)
+        _search_cache[index_dir] = (stamp, search)
+        _search_cache.move_to_end(index_dir)
+        while len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+    return search
+
+
+@api.get("/v1/search")
+def search_index(
+    index_dir: str,
+    q: list[str] = Query(...),
+    top_k: int = 5,
+    doc_id: list[str] | None = Query(None),
+    pages: str | None = None,
+):
+    try:
+        path = _resolve_index_dir(index_dir)
+        search = _load_search_index(path, _index_stamp(path))
+        results = search.search_text(
+            q,
+            top_k=top_k,
+            doc_ids=doc_id or None,
+            page_range=parse_page_range(pages) if pages else None,
+        )
         return JSONResponse(
             {
-                "document": doc.model_dump(),
-                "manifest": __import__("json").loads(manifest),
-                "chunks": __import__("json").loads(chunks),
+                "results": [
+                    {"query": query, "hits": [hit.to_dict() for hit in hits]}
+                    for query, hits in zip(q, results)
+                ]
             }
         )
+    except FileNotFoundError as e:
+        return JSONResponse({"error": str(e)}, status_code=404)
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=400)
-    finally:
-        try:
-            shutil.rmtree(tmp_root)
-        except Exception:
-            pass
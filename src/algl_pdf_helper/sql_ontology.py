@@ -19,6 +19,7 @@ Usage:
 
 from __future__ import annotations
 
+from collections import deque
 from typing import Any
 
 
@@ -1026,6 +1027,11 @@ class ConceptOntology:
     Provides methods to query concepts, prerequisites, and error mappings
     for building adaptive learning paths.
     
+    The prerequisite graph is indexed once at construction (edge lists per
+    concept, transitive prerequisites, a topological order), so queries do
+    not rescan PREREQUISITE_DAG. The data is read-only; use get_ontology()
+    to share one instance instead of rebuilding the indexes.
+    
     Example:
         >>> ontology = ConceptOntology()
         >>> concept = ontology.get_concept("select-basic")
@@ -1034,19 +1040,66 @@ class ConceptOntology:
     """
     
     def __init__(self):
-        """Initialize the ontology with concept data."""
+        """Initialize the ontology with concept data.
+        
+        Raises:
+            ValueError: If the prerequisite edges contain a cycle
+        """
         self._concepts = SQL_CONCEPTS
         self._prereqs = PREREQUISITE_DAG
         self._error_map = ERROR_SUBTYPE_TO_CONCEPT_MAPPING
         
-        # Build reverse lookup for downstream concepts
+        # Adjacency lists in edge order: downstream (from -> to) and
+        # prerequisites (to -> from), all and hard only
         self._downstream: dict[str, list[str]] = {}
+        self._prereqs_of: dict[str, list[str]] = {}
+        self._hard_prereqs_of: dict[str, list[str]] = {}
         for edge in self._prereqs:
             from_id = edge["from"]
             to_id = edge["to"]
-            if from_id not in self._downstream:
-                self._downstream[from_id] = []
-            self._downstream[from_id].append(to_id)
+            self._downstream.setdefault(from_id, []).append(to_id)
+            self._prereqs_of.setdefault(to_id, []).append(from_id)
+            if edge["type"] == "hard_prereq":
+                self._hard_prereqs_of.setdefault(to_id, []).append(from_id)
+        
+        self._topological_order = self._build_topological_order()
+        self._topological_index = {
+            cid: i for i, cid in enumerate(self._topological_order)
+        }
+        
+        # Transitive prerequisites known to the ontology; a prerequisite
+        # missing from SQL_CONCEPTS is neither included nor followed
+        self._all_prereqs: dict[str, frozenset[str]] = {}
+        for concept_id in self._topological_order:
+            collected: set[str] = set()
+            for prereq in self._prereqs_of.get(concept_id, []):
+                if prereq in self._concepts:
+                    collected.add(prereq)
+                    collected |= self._all_prereqs[prereq]
+            self._all_prereqs[concept_id] = frozenset(collected)
+        
+        # BFS parent links per start concept, filled by get_learning_path
+        self._path_parents: dict[str, dict[str, str]] = {}
+    
+    def _build_topological_order(self) -> list[str]:
+        """Order every concept and edge endpoint after its prerequisites."""
+        nodes = list(dict.fromkeys(
+            [*self._concepts, *(cid for e in self._prereqs for cid in (e["from"], e["to"]))]
+        ))
+        in_degree = {cid: len(self._prereqs_of.get(cid, [])) for cid in nodes}
+        queue = deque(cid for cid in nodes if in_degree[cid] == 0)
+        order = []
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for next_concept in self._downstream.get(current, []):
+                in_degree[next_concept] -= 1
+                if in_degree[next_concept] == 0:
+                    queue.append(next_concept)
+        if len(order) != len(nodes):
+            cyclic = sorted(cid for cid in nodes if in_degree[cid] > 0)
+            raise ValueError(f"Prerequisite edges contain a cycle through: {cyclic}")
+        return order
     
     def get_concept(self, concept_id: str) -> dict[str, Any] | None:
         """
@@ -1070,11 +1123,7 @@ class ConceptOntology:
         Returns:
             List of prerequisite concept IDs (both hard and soft)
         """
-        prereqs = []
-        for edge in self._prereqs:
-            if edge["to"] == concept_id:
-                prereqs.append(edge["from"])
-        return prereqs
+        return list(self._prereqs_of.get(concept_id, []))
     
     def get_hard_prerequisites(self, concept_id: str) -> list[str]:
         """
@@ -1086,11 +1135,32 @@ class ConceptOntology:
         Returns:
             List of hard prerequisite concept IDs
         """
-        prereqs = []
-        for edge in self._prereqs:
-            if edge["to"] == concept_id and edge["type"] == "hard_prereq":
-                prereqs.append(edge["from"])
-        return prereqs
+        return list(self._hard_prereqs_of.get(concept_id, []))
+    
+    def get_all_prerequisites(self, concept_id: str) -> list[str]:
+        """
+        Get the transitive prerequisites of a concept.
+        
+        Args:
+            concept_id: The concept ID to find prerequisites for
+            
+        Returns:
+            Prerequisite concept IDs (hard and soft, direct and indirect)
+            in topological order, so each comes after its own prerequisites
+        """
+        return sorted(
+            self._all_prereqs.get(concept_id, ()),
+            key=self._topological_index.__getitem__,
+        )
+    
+    def get_topological_order(self) -> list[str]:
+        """
+        Get all concept IDs ordered so prerequisites come first.
+        
+        Returns:
+            List of concept IDs (including IDs only referenced by edges)
+        """
+        return list(self._topological_order)
     
     def get_downstream(self, concept_id: str) -> list[str]:
         """
@@ -1189,26 +1259,27 @@ class ConceptOntology:
         if start_concept == end_concept:
             return [start_concept]
         
-        # BFS to find shortest path
-        from collections import deque
+        # One BFS per start concept records where each reachable concept was
+        # first reached from; every later path is read back from the links
+        parents = self._path_parents.get(start_concept)
+        if parents is None:
+            parents = {}
+            queue = deque([start_concept])
+            while queue:
+                current = queue.popleft()
+                # Get concepts that can be learned after current
+                for next_concept in self._downstream.get(current, []):
+                    if next_concept != start_concept and next_concept not in parents:
+                        parents[next_concept] = current
+                        queue.append(next_concept)
+            self._path_parents[start_concept] = parents
         
-        queue = deque([(start_concept, [start_concept])])
-        visited = {start_concept}
-        
-        while queue:
-            current, path = queue.popleft()
-            
-            # Get concepts that can be learned after current
-            for edge in self._prereqs:
-                if edge["from"] == current:
-                    next_concept = edge["to"]
-                    if next_concept == end_concept:
-                        return path + [next_concept]
-                    if next_concept not in visited:
-                        visited.add(next_concept)
-                        queue.append((next_concept, path + [next_concept]))
-        
-        return []
+        if end_concept not in parents:
+            return []
+        path = [end_concept]
+        while path[-1] != start_concept:
+            path.append(parents[path[-1]])
+        return path[::-1]
     
     def get_recommended_learning_order(self, target_concepts: list[str]) -> list[str]:
         """
@@ -1253,11 +1324,8 @@ class ConceptOntology:
         return result
     
     def _collect_prerequisites(self, concept_id: str, collected: set[str]) -> None:
-        """Recursively collect all prerequisites for a concept."""
-        for prereq in self.get_prerequisites(concept_id):
-            if prereq not in collected and prereq in self._concepts:
-                collected.add(prereq)
-                self._collect_prerequisites(prereq, collected)
+        """Collect all prerequisites for a concept."""
+        collected |= self._all_prereqs.get(concept_id, frozenset())
     
     def list_all_concepts(self) -> list[str]:
         """
@@ -1339,6 +1407,11 @@ class ConceptOntology:
 _ontology = ConceptOntology()
 
 
+def get_ontology() -> ConceptOntology:
+    """Module-level function to get the shared ConceptOntology instance."""
+    return _ontology
+
+
 def get_concept(concept_id: str) -> dict[str, Any] | None:
     """Module-level function to get a concept."""
     return _ontology.get_concept(concept_id)
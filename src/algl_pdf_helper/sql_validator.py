@@ -25,14 +25,21 @@ Usage:
 
 from __future__ import annotations
 
+import copy
 import re
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, ExitStack
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 # Import centralized schema definitions
 from .schemas import PRACTICE_SCHEMAS, FOREIGN_KEY_MAPPINGS
+from .practice_db_pool import checkout_options, get_practice_db_pool, schema_fingerprint
 
 # Optional import for sqlparse - validation features require [validation] extra
 try:
@@ -200,6 +207,36 @@ class PracticeSchemaManager:
         conn.commit()
         return conn
     
+    def pooled_database(
+        self,
+        schema: dict[str, Any] | None = None,
+        *,
+        reuse: bool = True,
+        transaction: bool = True,
+    ) -> AbstractContextManager[sqlite3.Connection]:
+        """Context manager yielding a database equivalent to setup_database().
+        
+        The database is a copy of a template built once per distinct schema
+        (see practice_db_pool), and everything done on it is rolled back
+        on exit, so it must not be used after the with block.
+        
+        Args:
+            schema: Schema dictionary. Uses self.schemas if None.
+            reuse: Whether the copy may be reused afterwards (pass False
+                for statements such as PRAGMA that outlive a rollback)
+            transaction: Whether to run inside the rollback transaction
+                (pass False for BEGIN, VACUUM and the like)
+        
+        See practice_db_pool.checkout_options() for choosing both flags.
+        """
+        schemas_to_use = schema or self.schemas
+        return get_practice_db_pool().connection(
+            schema_fingerprint(schemas_to_use, "practice"),
+            lambda: self.setup_database(schemas_to_use),
+            reuse=reuse,
+            transaction=transaction,
+        )
+    
     def _create_table(
         self,
         cursor: sqlite3.Cursor,
@@ -683,6 +720,11 @@ class SemanticChecker:
 # SQL VALIDATOR
 # =============================================================================
 
+# Below this many distinct statements per worker, a batch is validated
+# in-process (starting worker processes costs more than it saves)
+MIN_STATEMENTS_PER_WORKER = 16
+
+
 class SQLValidator:
     """Main SQL validation class with three-layer validation.
     
@@ -690,21 +732,129 @@ class SQLValidator:
     - Parse validation using sqlparse
     - Execution validation using SQLite in-memory database
     - Semantic validation using semantic analysis
+    - Batch validation (validate_many) with de-duplication, a result cache
+      and optional worker processes
     """
     
     def __init__(
         self,
         schema_manager: PracticeSchemaManager | None = None,
         semantic_checker: SemanticChecker | None = None,
+        cache_size: int = 4096,
     ):
         """Initialize the validator.
         
         Args:
             schema_manager: PracticeSchemaManager for database operations
             semantic_checker: SemanticChecker for semantic analysis
+            cache_size: Results kept by validate_many (0 disables caching)
         """
         self.schema_manager = schema_manager or PracticeSchemaManager()
         self.semantic_checker = semantic_checker or SemanticChecker(self.schema_manager)
+        self.cache_size = cache_size
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self._cache: OrderedDict[tuple, ValidationResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker processes get the validator without its result cache
+        state = self.__dict__.copy()
+        state["_cache"] = OrderedDict()
+        state["_cache_lock"] = None
+        return state
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+    
+    def validate_many(
+        self,
+        sqls: Sequence[str],
+        expected_concept: str | Sequence[str | None] | None = None,
+        schema: dict[str, Any] | None = None,
+        *,
+        workers: int = 1,
+    ) -> list[ValidationResult]:
+        """Validate a batch of SQL statements; results are in input order.
+        
+        Statements that are identical after normalize_sql() (and share a
+        concept and schema) are validated once, and results are cached
+        across calls on this validator. The remaining work is spread over
+        worker processes when workers > 1 and the batch is large enough.
+        Each returned result is an independent copy.
+        
+        Unlike validate(), an exception raised while validating one
+        statement does not abort the batch; it is reported as an
+        "internal" error on that statement's result.
+        
+        Args:
+            sqls: SQL statements to validate
+            expected_concept: One concept ID for every statement, or one
+                per statement (None entries skip the alignment check)
+            schema: Optional schema dictionary (uses default if None)
+            workers: Worker processes for uncached statements
+            
+        Returns:
+            One ValidationResult per statement
+        """
+        if expected_concept is None or isinstance(expected_concept, str):
+            concepts: Sequence[str | None] = [expected_concept] * len(sqls)
+        else:
+            concepts = expected_concept
+            if len(concepts) != len(sqls):
+                raise ValueError("expected_concept must have one entry per SQL statement")
+        
+        schemas_to_use = schema or self.schema_manager.schemas
+        schema_key = schema_fingerprint(schemas_to_use, "practice")
+        keys = [
+            (normalize_sql(sql), concept, schema_key)
+            for sql, concept in zip(sqls, concepts)
+        ]
+        
+        results: dict[tuple, ValidationResult] = {}
+        pending: dict[tuple, tuple[str, str | None]] = {}
+        with self._cache_lock:
+            for key, sql, concept in zip(keys, sqls, concepts):
+                if key in results or key in pending:
+                    continue
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.cache_stats["hits"] += 1
+                    results[key] = cached
+                else:
+                    self.cache_stats["misses"] += 1
+                    pending[key] = (sql, concept)
+        
+        if pending:
+            items = list(pending.values())
+            fresh = self._validate_pending(items, schemas_to_use, workers)
+            results.update(zip(pending, fresh))
+            if self.cache_size > 0:
+                with self._cache_lock:
+                    for key, result in zip(pending, fresh):
+                        self._cache[key] = result
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        
+        return [copy.deepcopy(results[key]) for key in keys]
+    
+    def _validate_pending(
+        self,
+        items: list[tuple[str, str | None]],
+        schema: dict[str, Any],
+        workers: int,
+    ) -> list[ValidationResult]:
+        workers = min(workers, len(items) // MIN_STATEMENTS_PER_WORKER)
+        if workers <= 1:
+            return _validate_batch(self, items, schema)
+        
+        # A few chunks per worker so uneven statements still balance out
+        size = -(-len(items) // (workers * 4))
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_validate_batch, self, chunk, schema) for chunk in chunks]
+            return [result for future in futures for result in future.result()]
     
     def validate(
         self,
@@ -989,9 +1139,13 @@ class SQLValidator:
             "columns": [],
         }
         
-        # Setup database
+        # Setup database: a rolled-back copy of a pre-built template, or a
+        # fresh unwrapped one for transaction control, PRAGMA and the like
+        stack = ExitStack()
         try:
-            conn = self.schema_manager.setup_database(schema)
+            conn = stack.enter_context(self.schema_manager.pooled_database(
+                schema, **checkout_options(sql),
+            ))
         except Exception as e:
             errors.append(ValidationError(
                 error_type="setup",
@@ -1024,13 +1178,10 @@ class SQLValidator:
             else:
                 # For INSERT/UPDATE/DELETE, get row count
                 exec_data["row_count"] = cursor.rowcount
-                conn.commit()
             
-            conn.close()
             return True, errors, exec_data
             
         except sqlite3.OperationalError as e:
-            conn.close()
             error_msg = str(e)
             suggestion = None
             
@@ -1054,12 +1205,14 @@ class SQLValidator:
             return False, errors, exec_data
             
         except Exception as e:
-            conn.close()
             errors.append(ValidationError(
                 error_type="execution",
                 message=f"Unexpected execution error: {str(e)}",
             ))
             return False, errors, exec_data
+        
+        finally:
+            stack.close()
     
     def _validate_semantic(
         self,
@@ -1116,10 +1269,37 @@ class SQLValidator:
         return is_valid, warnings, score
 
 
+def _validate_batch(
+    validator: SQLValidator,
+    items: list[tuple[str, str | None]],
+    schema: dict[str, Any],
+) -> list[ValidationResult]:
+    """Validate (sql, expected_concept) pairs; runs in worker processes."""
+    results = []
+    for sql, concept in items:
+        try:
+            results.append(validator.validate(sql, concept, schema))
+        except Exception as e:
+            result = ValidationResult(is_valid=False, validation_level=ValidationLevel.PARSE)
+            result.add_error("internal", f"Validation failed: {e}")
+            results.append(result)
+    return results
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+def normalize_sql(sql: str) -> str:
+    """Normalize SQL for de-duplication and caching.
+    
+    Only surrounding whitespace is removed: whitespace inside a statement
+    can change its result (SQLite names expression columns after their
+    source text, and string literals are compared verbatim).
+    """
+    return sql.strip() if sql else ""
+
+
 def validate_sql(
     sql: str,
     expected_concept: str | None = None,
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import fitz  # PyMuPDF
-
 from .clean import normalize_text
+from .pdf_session import PdfSession, body_font_size
 
 
 @dataclass
@@ -91,25 +91,40 @@ class StructureExtractor:
     # Pattern for detecting noise/artefacts
     NOISE_PATTERN = re.compile(r'^[^\w]*$|^\d+$|^[-_.]+$|^\(.*\)$')
 
-    def __init__(self):
+    def __init__(self, workers: int = 1):
+        """
+        Args:
+            workers: Worker processes used to decode page layouts for
+                heading detection (see PdfSession.load_page_spans)
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
         self.chapter_regexes = [re.compile(p, re.IGNORECASE) for p in self.CHAPTER_PATTERNS]
         self.section_regexes = [re.compile(p, re.IGNORECASE) for p in self.SECTION_PATTERNS]
 
-    def extract_toc(self, pdf_path: Path) -> list[TOCEntry]:
+    def extract_toc(
+        self,
+        pdf_path: Path,
+        session: PdfSession | None = None,
+    ) -> list[TOCEntry]:
         """Extract table of contents from PDF metadata.
 
         Args:
             pdf_path: Path to the PDF file
+            session: Optional open PdfSession for pdf_path
 
         Returns:
             List of TOC entries with level, title, and page number
         """
-        doc = fitz.open(pdf_path)
+        owns_session = session is None
+        if owns_session:
+            session = PdfSession(pdf_path)
         toc_entries = []
 
         try:
             # Get TOC from PDF metadata
-            toc = doc.get_toc()
+            toc = session.get_toc()
             for level, title, page in toc:
                 toc_entries.append(TOCEntry(
                     level=level,
@@ -117,92 +132,75 @@ class StructureExtractor:
                     page=page
                 ))
         finally:
-            doc.close()
+            if owns_session:
+                session.close()
 
         return toc_entries
 
-    def extract_headings(self, pdf_path: Path) -> list[Heading]:
+    def extract_headings(
+        self,
+        pdf_path: Path,
+        session: PdfSession | None = None,
+    ) -> list[Heading]:
         """Extract headings by analyzing text formatting.
 
         Uses font size, bold formatting, and text patterns to identify
-        chapter and section headings.
+        chapter and section headings. Each page layout is decoded once into
+        the session's span cache (in parallel with workers > 1); the body
+        font size and the heading candidates both come from that cache.
 
         Args:
             pdf_path: Path to the PDF file
+            session: Optional open PdfSession for pdf_path; its span cache
+                is shared with SectionExtractor and later calls
 
         Returns:
             List of detected headings sorted by page
         """
-        doc = fitz.open(pdf_path)
+        owns_session = session is None
+        if owns_session:
+            session = PdfSession(pdf_path)
         headings = []
 
         try:
-            # First pass: collect font statistics
-            font_sizes = []
-            for page_num in range(doc.page_count):
-                page = doc.load_page(page_num)
-                blocks = page.get_text("dict")["blocks"]
-
-                for block in blocks:
-                    if "lines" not in block:
-                        continue
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            font_sizes.append(span["size"])
-
-            if not font_sizes:
+            pages = session.load_page_spans(range(session.page_count), workers=self.workers)
+
+            # Body text size: mode of all span font sizes
+            font_sizes: Counter[float] = Counter()
+            for page in pages:
+                font_sizes.update(page.font_sizes)
+            body_size = body_font_size(font_sizes)
+            if body_size is None:
                 return headings
-
-            # Calculate body text size (mode of font sizes)
-            body_size = max(set(font_sizes), key=font_sizes.count)
             heading_threshold = body_size * self.HEADING_SIZE_THRESHOLD
 
-            # Second pass: detect headings
-            for page_num in range(doc.page_count):
-                page = doc.load_page(page_num)
-                blocks = page.get_text("dict")["blocks"]
-
-                for block in blocks:
-                    if "lines" not in block:
+            for page_num, page in enumerate(pages):
+                for line in page.lines:
+                    line_text = normalize_text(line.text).strip()
+                    if not line_text or len(line_text) > 200:
                         continue
 
-                    for line in block["lines"]:
-                        line_text = ""
-                        max_font_size = 0
-                        is_bold = False
-
-                        for span in line["spans"]:
-                            line_text += span["text"]
-                            max_font_size = max(max_font_size, span["size"])
-                            if span["flags"] & 2**4:  # Bold flag
-                                is_bold = True
-
-                        line_text = normalize_text(line_text).strip()
-                        if not line_text or len(line_text) > 200:
-                            continue
-                        
-                        # Filter out noise
-                        if self._is_noise_text(line_text):
-                            continue
-
-                        # Determine if this is a heading
-                        level, confidence = self._classify_heading(
-                            line_text, max_font_size, is_bold,
-                            heading_threshold, body_size
-                        )
-
-                        if level > 0:
-                            headings.append(Heading(
-                                level=level,
-                                text=line_text,
-                                page=page_num + 1,
-                                font_size=max_font_size,
-                                is_bold=is_bold,
-                                confidence=confidence
-                            ))
+                    # Determine if this is a heading
+                    level, confidence = self._classify_heading(
+                        line_text, line.size, line.is_bold,
+                        heading_threshold, body_size
+                    )
+
+                    # Filter out noise (checked second: classification is
+                    # cheaper and already rejects almost every body line)
+                    if level > 0 and not self._is_noise_text(line_text):
+                        headings.append(Heading(
+                            level=level,
+                            text=line_text,
+                            page=page_num + 1,
+                            font_size=line.size,
+                            is_bold=line.is_bold,
+                            confidence=confidence
+                        ))
 
         finally:
-            doc.close()
+            if owns_session:
+                session.close()
 
         # Sort by page and remove duplicates
         headings = self._deduplicate_headings(headings)
@@ -320,36 +318,52 @@ class StructureExtractor:
 
         return deduplicated
 
-    def extract_chapters(self, pdf_path: Path) -> list[Chapter]:
+    def extract_chapters(
+        self,
+        pdf_path: Path,
+        session: PdfSession | None = None,
+    ) -> list[Chapter]:
         """Extract chapters with their sections from the PDF.
 
         Uses TOC if available, otherwise falls back to heading detection.
 
         Args:
             pdf_path: Path to the PDF file
+            session: Optional open PdfSession for pdf_path
 
         Returns:
             List of chapters with nested sections
         """
-        # Try TOC first
-        toc = self.extract_toc(pdf_path)
-        if toc:
-            return self._chapters_from_toc(toc, pdf_path)
+        owns_session = session is None
+        if owns_session:
+            session = PdfSession(pdf_path)
 
-        # Fall back to heading detection
-        headings = self.extract_headings(pdf_path)
-        return self._chapters_from_headings(headings, pdf_path)
+        try:
+            # Try TOC first
+            toc = self.extract_toc(pdf_path, session=session)
+            if toc:
+                return self._chapters_from_toc(toc, pdf_path, session=session)
+
+            # Fall back to heading detection
+            headings = self.extract_headings(pdf_path, session=session)
+            return self._chapters_from_headings(headings, pdf_path, session=session)
+        finally:
+            if owns_session:
+                session.close()
 
-    def _chapters_from_toc(self, toc: list[TOCEntry], pdf_path: Path) -> list[Chapter]:
+    def _chapters_from_toc(
+        self,
+        toc: list[TOCEntry],
+        pdf_path: Path,
+        session: PdfSession | None = None,
+    ) -> list[Chapter]:
         """Build chapter structure from TOC entries."""
         chapters = []
         current_chapter: Chapter | None = None
         current_section: Section | None = None
 
         # Get total pages for end_page calculation
-        doc = fitz.open(pdf_path)
-        total_pages = doc.page_count
-        doc.close()
+        total_pages = self._page_count(pdf_path, session)
 
         for i, entry in enumerate(toc):
             # Determine end page
@@ -398,16 +412,19 @@ class StructureExtractor:
 
         return chapters
 
-    def _chapters_from_headings(self, headings: list[Heading], pdf_path: Path) -> list[Chapter]:
+    def _chapters_from_headings(
+        self,
+        headings: list[Heading],
+        pdf_path: Path,
+        session: PdfSession | None = None,
+    ) -> list[Chapter]:
         """Build chapter structure from detected headings."""
         chapters = []
         current_chapter: Chapter | None = None
         current_section: Section | None = None
 
         # Get total pages
-        doc = fitz.open(pdf_path)
-        total_pages = doc.page_count
-        doc.close()
+        total_pages = self._page_count(pdf_path, session)
 
         for i, heading in enumerate(headings):
             # Determine end page
@@ -457,21 +474,21 @@ class StructureExtractor:
     def estimate_concept_boundaries(
         self,
         pdf_path: Path,
-        concept_keywords: dict[str, list[str]] | None = None
+        concept_keywords: dict[str, list[str]] | None = None,
+        session: PdfSession | None = None,
     ) -> list[ConceptBoundary]:
         """Estimate concept boundaries based on headings and keywords.
 
         Args:
             pdf_path: Path to the PDF file
             concept_keywords: Optional mapping of concept names to keywords
+            session: Optional open PdfSession for pdf_path
 
         Returns:
             List of estimated concept boundaries with confidence scores
         """
-        headings = self.extract_headings(pdf_path)
-        doc = fitz.open(pdf_path)
-        total_pages = doc.page_count
-        doc.close()
+        headings = self.extract_headings(pdf_path, session=session)
+        total_pages = self._page_count(pdf_path, session)
 
         boundaries = []
 
@@ -500,6 +517,12 @@ class StructureExtractor:
 
         return boundaries
 
+    def _page_count(self, pdf_path: Path, session: PdfSession | None) -> int:
+        if session is not None:
+            return session.page_count
+        with PdfSession(pdf_path) as own_session:
+            return own_session.page_count
+
     def _extract_concept_name(self, heading_text: str) -> str:
         """Extract a clean concept name from heading text."""
         # Remove chapter/section numbers
@@ -545,22 +568,31 @@ class StructureExtractor:
 
         return list(set(keywords))[:8]  # Deduplicate and limit
 
-    def get_structure_summary(self, pdf_path: Path) -> dict[str, Any]:
+    def get_structure_summary(
+        self,
+        pdf_path: Path,
+        session: PdfSession | None = None,
+    ) -> dict[str, Any]:
         """Get a complete summary of document structure.
 
         Args:
             pdf_path: Path to the PDF file
+            session: Optional open PdfSession for pdf_path
 
         Returns:
             Dictionary with TOC, headings, chapters, and statistics
         """
-        doc = fitz.open(pdf_path)
-        total_pages = doc.page_count
-        doc.close()
-
-        toc = self.extract_toc(pdf_path)
-        headings = self.extract_headings(pdf_path)
-        chapters = self.extract_chapters(pdf_path)
+        owns_session = session is None
+        if owns_session:
+            session = PdfSession(pdf_path)
+        try:
+            total_pages = session.page_count
+            toc = self.extract_toc(pdf_path, session=session)
+            headings = self.extract_headings(pdf_path, session=session)
+            chapters = self.extract_chapters(pdf_path, session=session)
+        finally:
+            if owns_session:
+                session.close()
 
         return {
             "total_pages": total_pages,
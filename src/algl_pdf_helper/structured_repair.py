@@ -53,6 +53,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Literal
 
+from algl_pdf_helper.llm_transport import get_transport
+
 try:
     from pydantic import BaseModel, Field, ValidationError
     HAS_PYDANTIC = True
@@ -597,32 +599,11 @@ class OllamaRepairBackend(RepairBackend):
 
     def _check_availability(self) -> bool:
         """Check if Ollama server is reachable."""
-        try:
-            req = urllib.request.Request(
-                f"{self._host}/api/tags",
-                method="GET",
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=3) as response:
-                return response.status == 200
-        except Exception:
-            return False
+        return get_transport(self._host).is_available(timeout=3)
 
     def _list_available_models(self) -> list[str]:
         """List available Ollama models."""
-        try:
-            req = urllib.request.Request(
-                f"{self._host}/api/tags",
-                method="GET",
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    return [m.get("name", "") for m in data.get("models", [])]
-        except Exception:
-            pass
-        return []
+        return get_transport(self._host).model_names(timeout=5)
 
     def _resolve_model(self, requested: str) -> str:
         """Resolve model name, falling back to available models."""
@@ -729,7 +710,7 @@ Generate the repair JSON now:"""
         """Call Ollama API and return response or error."""
         config = self._get_model_config(self.model)
 
-        data = json.dumps({
+        data = {
             "model": self.model,
             "prompt": prompt,
             "stream": False,
@@ -741,23 +722,15 @@ Generate the repair JSON now:"""
                 "top_k": config.get("top_k", 20),
                 "num_ctx": config.get("context_window", 4096),
             }
-        }).encode("utf-8")
-
-        req = urllib.request.Request(
-            f"{self._host}/api/generate",
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        }
 
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                result = json.loads(response.read().decode("utf-8"))
-                # Check response field first, then thinking field (for qwen3.5 models)
-                response_text = result.get("response", "")
-                if not response_text:
-                    response_text = result.get("thinking", "")
-                return response_text, None, None
+            result = get_transport(self._host).post_json("/api/generate", data, timeout=timeout)
+            # Check response field first, then thinking field (for qwen3.5 models)
+            response_text = result.get("response", "")
+            if not response_text:
+                response_text = result.get("thinking", "")
+            return response_text, None, None
         except socket.timeout:
             return None, RepairOutcome.TIMEOUT, f"Timeout calling Ollama after {timeout}s"
         except urllib.error.HTTPError as e:
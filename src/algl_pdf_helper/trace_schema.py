@@ -302,19 +302,28 @@ def save_trace(trace: LearnerTrace, path: Path) -> None:
     trace.save(path)
 
 
-def load_traces_from_directory(dir_path: Path) -> list[LearnerTrace]:
-    """Load all traces from a directory (JSON files only)."""
-    traces = []
+def list_trace_paths(dir_path: Path) -> list[Path]:
+    """List the trace files in a directory (JSON files only), sorted by name."""
     if not dir_path.exists():
-        return traces
+        return []
+    return sorted(dir_path.glob("*.json"))
 
-    for path in dir_path.glob("*.json"):
-        try:
-            trace = load_trace(path)
+
+def load_trace_or_none(path: Path) -> LearnerTrace | None:
+    """Load a trace, or return None if the file is not a valid trace."""
+    try:
+        return load_trace(path)
+    except (json.JSONDecodeError, KeyError):
+        return None
+
+
+def load_traces_from_directory(dir_path: Path) -> list[LearnerTrace]:
+    """Load all traces from a directory (JSON files only), skipping invalid files."""
+    traces = []
+    for path in list_trace_paths(dir_path):
+        trace = load_trace_or_none(path)
+        if trace is not None:
             traces.append(trace)
-        except (json.JSONDecodeError, KeyError) as e:
-            # Skip invalid files
-            continue
 
     return traces
 
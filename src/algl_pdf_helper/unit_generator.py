@@ -38,7 +38,10 @@ from __future__ import annotations
 import json
 import logging
 import re
+import threading
+import time
 import uuid
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -144,6 +147,7 @@ from .pedagogical_generator import (
     FOREIGN_KEY_MAPPINGS,
 )
 from .generation_pipeline import MultiPassGenerator
+from .llm_cache import get_llm_cache
 from .sql_ontology import get_concept
 from .ollama_repair import OllamaRepair, SelectiveRepairPass
 
@@ -273,6 +277,8 @@ class GenerationConfig:
         enable_ollama_repair: Whether to enable Ollama-based selective repair pass
         repair_threshold: Quality score threshold below which to trigger repair (0.0-1.0)
         ollama_model: Ollama model to use for repairs (default: qwen3.5:9b-q8_0)
+        cache_llm_responses: Whether to answer repeated prompts from the
+            persistent LLM response cache (see llm_cache)
     """
     llm_provider: str = "kimi"
     model_name: str = "kimi-k2-5"
@@ -288,6 +294,7 @@ class GenerationConfig:
     enable_ollama_repair: bool = False  # Default to disabled, let caller enable
     repair_threshold: float = 0.6  # Quality threshold for triggering repair
     ollama_model: str = "qwen2.5:3b"  # Default Ollama model for repairs
+    cache_llm_responses: bool = False
     
     def __post_init__(self):
         """Validate configuration."""
@@ -974,6 +981,17 @@ L2_SQL_EXAMPLE_CONCEPTS = {
 L2_CONCEPT_EXAMPLE_CONCEPTS = CONCEPTS_WITHOUT_SQL
 
 
+# Variant stages in output order: (stage, generator method, fallback unit type)
+VARIANT_GENERATORS: list[tuple[str, str, str]] = [
+    ("L1_hint", "generate_L1_hint", "hint"),
+    ("L2_hint_plus_example", "generate_L2_hint_plus_example", "hint"),
+    ("L3_explanation", "generate_L3_explanation", "explanation"),
+    ("L4_reflective_note", "generate_L4_reflective_note", "reflection"),
+    ("reinforcement", "generate_reinforcement_microcheck", "practice"),
+]
+_VARIANT_METHODS = {stage: (method, kind) for stage, method, kind in VARIANT_GENERATORS}
+
+
 class UnitGenerator:
     """
     Generates multiple adaptive-stage variants for each concept.
@@ -1004,6 +1022,12 @@ class UnitGenerator:
         self._ollama_repair: OllamaRepair | None = None
         self._selective_repair: SelectiveRepairPass | None = None
         self._chapters: list[Any] = []  # Chapter structure for provenance tracking
+        # Seconds spent per variant stage, summed over concepts (and threads)
+        self.variant_timings: dict[str, float] = {}
+        self._stats_lock = threading.Lock()
+        self._repair_init_lock = threading.Lock()
+        # Generators by (model, temperature, timeout); they share one pooled transport
+        self._llm_generators: dict[tuple, MultiPassGenerator] = {}
     
     def set_chapters(self, chapters: list[Any]) -> None:
         """
@@ -1039,21 +1063,24 @@ class UnitGenerator:
         
         # Only then proceed with initialization
         
-        if self._ollama_repair is None:
-            # Run preflight check first (without creating instance) to avoid warning when unavailable
-            available, _ = OllamaRepair.run_preflight_check(model=config.ollama_model)
-            if available:
-                self._ollama_repair = OllamaRepair(model=config.ollama_model, skip_preflight=True)
-                self._selective_repair = SelectiveRepairPass(
-                    self._ollama_repair,
-                    repair_threshold=config.repair_threshold,
-                )
-                self.logger.info(f"Ollama repair initialized with model: {config.ollama_model}")
-            else:
-                self.logger.warning("Ollama repair enabled but server not available")
-                self._ollama_repair = None
+        # Generation threads may get here at the same time; run the
+        # preflight check and create the client only once
+        with self._repair_init_lock:
+            if self._ollama_repair is None:
+                # Run preflight check first (without creating instance) to avoid warning when unavailable
+                available, _ = OllamaRepair.run_preflight_check(model=config.ollama_model)
+                if available:
+                    self._ollama_repair = OllamaRepair(model=config.ollama_model, skip_preflight=True)
+                    self._selective_repair = SelectiveRepairPass(
+                        self._ollama_repair,
+                        repair_threshold=config.repair_threshold,
+                    )
+                    self.logger.info(f"Ollama repair initialized with model: {config.ollama_model}")
+                else:
+                    self.logger.warning("Ollama repair enabled but server not available")
+                    self._ollama_repair = None
         
-        return self._ollama_repair is not None
+            return self._ollama_repair is not None
     
     def _apply_selective_repair(
         self,
@@ -1122,7 +1149,8 @@ class UnitGenerator:
                 repair_stats["failed"] += 1
         
         # Store repair stats
-        self._generation_stats["repair_stats"] = repair_stats
+        with self._stats_lock:
+            self._generation_stats["repair_stats"] = repair_stats
         
         if repair_stats["repaired"] > 0:
             self.logger.info(
@@ -1139,6 +1167,7 @@ class UnitGenerator:
         config: GenerationConfig,
         prerequisites: list[str] | None = None,
         error_subtypes: list[str] | None = None,
+        executor: Executor | None = None,
     ) -> dict[str, InstructionalUnit]:
         """
         Generate all 5 adaptive-stage variants for a concept.
@@ -1149,6 +1178,8 @@ class UnitGenerator:
             config: Generation configuration
             prerequisites: Optional list of prerequisite concept IDs
             error_subtypes: Optional list of SQL-Engage error subtype IDs
+            executor: Optional executor to generate the variants concurrently
+                (must not be the pool this call itself runs on)
             
         Returns:
             Dictionary mapping unit types to InstructionalUnit objects:
@@ -1169,59 +1200,48 @@ class UnitGenerator:
         prereqs = prerequisites or []
         subtypes = error_subtypes or []
         
-        # Generate all variants
-        variants: dict[str, InstructionalUnit] = {}
-        
-        try:
-            variants["L1_hint"] = self.generate_L1_hint(
-                concept_id, source_blocks, config, prereqs, subtypes
-            )
-        except Exception as e:
-            variants["L1_hint"] = self._create_fallback_unit(
-                concept_id, "L1_hint", "hint", config, str(e), subtypes
-            )
-        
-        try:
-            variants["L2_hint_plus_example"] = self.generate_L2_hint_plus_example(
-                concept_id, source_blocks, config, prereqs, subtypes
-            )
-        except Exception as e:
-            variants["L2_hint_plus_example"] = self._create_fallback_unit(
-                concept_id, "L2_hint_plus_example", "hint", config, str(e), subtypes
-            )
-        
-        try:
-            variants["L3_explanation"] = self.generate_L3_explanation(
-                concept_id, source_blocks, config, prereqs, subtypes
-            )
-        except Exception as e:
-            variants["L3_explanation"] = self._create_fallback_unit(
-                concept_id, "L3_explanation", "explanation", config, str(e), subtypes
-            )
-        
-        try:
-            variants["L4_reflective_note"] = self.generate_L4_reflective_note(
-                concept_id, source_blocks, config, prereqs, subtypes
-            )
-        except Exception as e:
-            variants["L4_reflective_note"] = self._create_fallback_unit(
-                concept_id, "L4_reflective_note", "reflection", config, str(e), subtypes
-            )
-        
-        try:
-            variants["reinforcement"] = self.generate_reinforcement_microcheck(
-                concept_id, source_blocks, config, prereqs, subtypes
-            )
-        except Exception as e:
-            variants["reinforcement"] = self._create_fallback_unit(
-                concept_id, "reinforcement", "practice", config, str(e), subtypes
-            )
+        # Generate all variants; they are independent of each other, so with
+        # an executor they run concurrently and are collected in stage order
+        args = (concept_id, source_blocks, config, prereqs, subtypes)
+        if executor is None:
+            variants = {
+                stage: self._generate_variant(stage, *args) for stage, _, _ in VARIANT_GENERATORS
+            }
+        else:
+            futures = [
+                (stage, executor.submit(self._generate_variant, stage, *args))
+                for stage, _, _ in VARIANT_GENERATORS
+            ]
+            variants = {stage: future.result() for stage, future in futures}
         
         # Apply selective Ollama repair to weak units
         variants = self._apply_selective_repair(variants, source_blocks, config)
         
         return variants
     
+    def _generate_variant(
+        self,
+        stage: str,
+        concept_id: str,
+        source_blocks: list[ContentBlock],
+        config: GenerationConfig,
+        prereqs: list[str],
+        subtypes: list[str],
+    ) -> InstructionalUnit:
+        """Generate one variant, falling back to a placeholder unit on error."""
+        method_name, fallback_type = _VARIANT_METHODS[stage]
+        start = time.perf_counter()
+        try:
+            return getattr(self, method_name)(concept_id, source_blocks, config, prereqs, subtypes)
+        except Exception as e:
+            return self._create_fallback_unit(
+                concept_id, stage, fallback_type, config, str(e), subtypes
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self.variant_timings[stage] = self.variant_timings.get(stage, 0.0) + elapsed
+    
     # Canonical mapping from BlockType enum to SourceSpan block_type Literal
     _BLOCK_TYPE_CANONICAL_MAP: dict[BlockType, str] = {
         BlockType.HEADING: "heading",
@@ -1383,20 +1403,17 @@ class UnitGenerator:
         try:
             # Use MultiPassGenerator for Ollama provider
             if config.llm_provider == 'ollama':
-                generator = MultiPassGenerator(
-                    model=config.model_name,
-                    temperature=config.temperature,
-                    timeout=config.timeout_seconds,
-                )
+                generator = self._get_llm_generator(config)
                 
-                # Generate with retry
-                response = generator._ollama_chat([
-                    {"role": "user", "content": prompt}
-                ])
+                # Generate with retry; cached only once it parses
+                messages = [{"role": "user", "content": prompt}]
+                response = generator._ollama_chat(messages, store=False)
                 
                 # Parse JSON response
                 if response:
-                    return self._parse_json_response(response)
+                    parsed = self._parse_json_response(response)
+                    generator._store_response(messages, response)
+                    return parsed
                 return {}
             
             # For other providers, return empty to trigger fallback
@@ -1410,6 +1427,20 @@ class UnitGenerator:
                 self._llm_warning_logged = True
             return {}
     
+    def _get_llm_generator(self, config: GenerationConfig) -> MultiPassGenerator:
+        """MultiPassGenerator for config, created once and reused across prompts."""
+        key = (config.model_name, config.temperature, config.timeout_seconds, config.cache_llm_responses)
+        with self._stats_lock:
+            generator = self._llm_generators.get(key)
+            if generator is None:
+                generator = self._llm_generators[key] = MultiPassGenerator(
+                    model=config.model_name,
+                    temperature=config.temperature,
+                    timeout=config.timeout_seconds,
+                    response_cache=get_llm_cache() if config.cache_llm_responses else None,
+                )
+            return generator
+    
     def _parse_json_response(self, response: str) -> dict[str, Any]:
         """Parse JSON from LLM response, handling markdown code blocks."""
         # Try to extract JSON from markdown code blocks
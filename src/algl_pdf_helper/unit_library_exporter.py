@@ -63,7 +63,7 @@ from .pedagogy_models import (
     NavigationIndex,
     PedagogyManifest,
 )
-from .sql_ontology import ConceptOntology, SQL_CONCEPTS, PREREQUISITE_DAG
+from .sql_ontology import ConceptOntology, SQL_CONCEPTS, PREREQUISITE_DAG, get_ontology
 
 
 # =============================================================================
@@ -284,7 +284,7 @@ class UnitLibraryExporter:
     
     def __init__(self):
         """Initialize the exporter."""
-        self._ontology = ConceptOntology()
+        self._ontology = get_ontology()
         self._logger = logging.getLogger(__name__)
         self._pedagogy_data: dict[str, Any] | None = None
     
@@ -1631,7 +1631,7 @@ def convert_legacy_concept_map(
         exporter = UnitLibraryExporter()
         exporter.export(library, ExportConfig(output_dir=Path("./new-output")))
     """
-    ontology = ontology or ConceptOntology()
+    ontology = ontology or get_ontology()
     
     # Extract concepts from old format
     old_concepts = old_concept_map.get("concepts", {})
@@ -4,6 +4,8 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
@@ -15,3 +17,23 @@ if str(SRC) not in sys.path:
 _existing = os.environ.get("PYTHONPATH", "")
 if str(SRC) not in _existing.split(os.pathsep):
     os.environ["PYTHONPATH"] = str(SRC) + (os.pathsep + _existing if _existing else "")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_llm_transports():
+    """Don't let cached LLM server probes leak between tests."""
+    from algl_pdf_helper.llm_transport import reset_transports
+
+    reset_transports()
+    yield
+    reset_transports()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_llm_cache(tmp_path_factory, monkeypatch):
+    """Point the persistent LLM response cache at a per-test file."""
+    from algl_pdf_helper import llm_cache
+
+    path = tmp_path_factory.mktemp("llm-cache") / "responses.sqlite3"
+    monkeypatch.setenv("ALGL_LLM_CACHE_PATH", str(path))
+    monkeypatch.setattr(llm_cache, "_default_cache", None)
@@ -202,6 +202,29 @@ class TestAssetExtractor:
         mock_fitz_open.assert_called_once()
         mock_doc.close.assert_called_once()
     
+    @patch("algl_pdf_helper.asset_extractor.fitz.open")
+    def test_extract_tables_skips_pages_without_graphics(self, mock_fitz_open):
+        """find_tables only runs on pages the candidate scan keeps."""
+        text_page, ruled_page = MagicMock(), MagicMock()
+        text_page.get_cdrawings.return_value = []
+        ruled_page.get_cdrawings.return_value = [{"items": [("l", (0, 0), (100, 0))]}]
+        ruled_page.find_tables.return_value.tables = []
+        mock_doc = MagicMock()
+        mock_doc.page_count = 2
+        mock_doc.load_page.side_effect = [text_page, ruled_page, ruled_page]
+        mock_fitz_open.return_value = mock_doc
+        
+        assets = AssetExtractor().extract_tables(Path("test.pdf"), "doc-123")
+        
+        assert assets == []
+        text_page.find_tables.assert_not_called()
+        ruled_page.find_tables.assert_called_once()
+    
+    def test_invalid_table_scan(self):
+        """Test that an unknown table_scan mode raises."""
+        with pytest.raises(ValueError):
+            AssetExtractor(table_scan="fast")
+    
     def test_markdown_table_to_html(self):
         """Test converting markdown table to HTML."""
         extractor = AssetExtractor()
@@ -1274,5 +1297,206 @@ class TestAssetExtractionIntegration:
         assert len(manifest.get_assets_for_page(2)) == 1
 
 
+def _jpeg_bytes(color: tuple[int, int, int]) -> bytes:
+    from PIL import Image
+    
+    out = io.BytesIO()
+    Image.new("RGB", (120, 80), color).save(out, format="JPEG")
+    return out.getvalue()
+
+
+def _build_image_book(path: Path) -> None:
+    """Two merged 2-page chapters: a logo on every page, one unique figure.
+    
+    Merging gives each chapter its own xref for the logo, so the logo repeats
+    both by xref (within a chapter) and by content (across chapters).
+    """
+    import fitz
+    
+    logo = _jpeg_bytes((200, 30, 30))
+    book = fitz.open()
+    for chapter_num in range(2):
+        chapter = fitz.open()
+        for _ in range(2):
+            page = chapter.new_page()
+            page.insert_image(fitz.Rect(72, 72, 272, 172), stream=logo)
+            page.insert_text((100, 190), "Figure 1: Logo", fontsize=10)
+        if chapter_num == 1:
+            chapter[1].insert_image(fitz.Rect(72, 300, 272, 400), stream=_jpeg_bytes((30, 30, 200)))
+        book.insert_pdf(chapter)
+        chapter.close()
+    book.save(str(path))
+    book.close()
+
+
+def _build_table_book(path: Path, pages: int = 3) -> None:
+    """One ruled 3x3 table per page."""
+    import fitz
+    
+    book = fitz.open()
+    for page_num in range(pages):
+        page = book.new_page()
+        for i in range(4):
+            page.draw_line((72, 100 + 30 * i), (372, 100 + 30 * i))
+            page.draw_line((72 + 100 * i, 100), (72 + 100 * i, 190))
+        for row in range(3):
+            for col in range(3):
+                page.insert_text(
+                    (80 + 100 * col, 120 + 30 * row), f"p{page_num} r{row} c{col}", fontsize=9
+                )
+    book.save(str(path))
+    book.close()
+
+
+class TestImageDeduplication:
+    """Repeated images are converted and stored once."""
+    
+    def test_repeated_images_share_one_file(self, tmp_path):
+        pdf_path = tmp_path / "book.pdf"
+        _build_image_book(pdf_path)
+        extractor = AssetExtractor()
+        
+        images = extractor.extract_images(pdf_path, "book")
+        
+        assert [a.id for a in images] == [
+            "page-001-fig-01",
+            "page-002-fig-01",
+            "page-003-fig-01",
+            "page-004-fig-01",
+            "page-004-fig-02",
+        ]
+        assert len({a.metadata["xref"] for a in images[:4]}) == 2
+        assert [a.duplicate_of for a in images[1:4]] == [images[0]] * 3
+        assert all(a.get_relative_path() == "assets/images/book/page-001-fig-01.png" for a in images[:4])
+        assert all(a.caption == "Figure 1: Logo" for a in images[:4])
+        
+        saved = extractor.save_assets(images, tmp_path / "out")
+        assert sorted(p.name for p in saved) == ["page-001-fig-01.png", "page-004-fig-02.png"]
+        refs = [a.to_asset_reference() for a in images]
+        manifest = AssetManifest(schemaVersion="asset-manifest-v1", docId="book", assets=refs)
+        assert [ref.pageNumber for ref in manifest.assets] == [1, 2, 3, 4, 4]
+        assert all((tmp_path / "out" / ref.path).exists() for ref in manifest.assets)
+    
+    def test_session_layout_and_parallel_conversion_match(self, tmp_path):
+        from algl_pdf_helper.pdf_session import PdfSession
+        
+        pdf_path = tmp_path / "book.pdf"
+        _build_image_book(pdf_path)
+        
+        def summary(assets):
+            return [(a.id, a.bbox, a.caption, a.content, a.get_relative_path()) for a in assets]
+        
+        serial = AssetExtractor().extract_images(pdf_path, "book")
+        with PdfSession(pdf_path) as session:
+            cached = AssetExtractor().extract_images(pdf_path, "book", session=session)
+            assert session.decode_counts["dict"] == 4
+        parallel = AssetExtractor(workers=2).extract_images(pdf_path, "book")
+        
+        assert summary(serial) == summary(cached) == summary(parallel)
+        assert serial[0].content.startswith(b"\x89PNG")
+
+    def test_extract_and_save_assets_passes_workers(self, tmp_path, monkeypatch):
+        from algl_pdf_helper import indexer
+
+        pdf_path = tmp_path / "book.pdf"
+        _build_image_book(pdf_path)
+        built: list[int] = []
+
+        def spy(**kwargs):
+            built.append(kwargs["workers"])
+            return AssetExtractor(**kwargs)
+
+        monkeypatch.setattr(indexer, "AssetExtractor", spy)
+        serial = indexer.extract_and_save_assets(pdf_path, "book", tmp_path / "serial")
+        parallel = indexer.extract_and_save_assets(
+            pdf_path, "book", tmp_path / "parallel", workers=2
+        )
+
+        assert built == [1, 2]
+        assert [a.model_dump() for a in parallel.assets] == [
+            a.model_dump() for a in serial.assets
+        ]
+
+    def test_parallel_build_does_not_nest_asset_pools(self, tmp_path, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from algl_pdf_helper import indexer
+        from algl_pdf_helper.models import IndexBuildOptions
+
+        pdf_dir = tmp_path / "pdfs"
+        pdf_dir.mkdir()
+        _build_image_book(pdf_dir / "book.pdf")
+        asset_workers: list[int] = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                if fn is indexer.extract_and_save_assets:
+                    asset_workers.append(kwargs["workers"])
+                return super().submit(fn, *args, **kwargs)
+
+        monkeypatch.setattr(indexer, "ProcessPoolExecutor", RecordingPool)
+        indexer.build_index(
+            pdf_dir,
+            tmp_path / "out",
+            options=IndexBuildOptions(chunkWords=40, overlapWords=10, embeddingDim=24),
+            workers=3,
+        )
+
+        assert asset_workers == [1]
+
+    def test_caption_from_layout_matches_clipped_text(self, tmp_path):
+        import fitz
+        
+        pdf_path = tmp_path / "book.pdf"
+        _build_image_book(pdf_path)
+        extractor = AssetExtractor()
+        
+        with fitz.open(pdf_path) as doc:
+            page = doc[0]
+            page_dict = page.get_text("dict")
+            for bbox in [(97, 72, 247, 172), (97, 72, 130, 172), (300, 72, 500, 172)]:
+                assert extractor._find_caption(page, bbox, page_dict=page_dict) == (
+                    extractor._find_caption(page, bbox)
+                )
+    
+    def test_parallel_table_search_reads_session_pdf(self, tmp_path, monkeypatch):
+        from algl_pdf_helper import asset_extractor
+        from algl_pdf_helper.pdf_session import PdfSession
+        
+        pdf_path = tmp_path / "book.pdf"
+        _build_table_book(pdf_path)
+        monkeypatch.setattr(asset_extractor, "TABLE_SHARD_PAGES", 1)
+        # Converting real tables needs pandas; report the page searched instead.
+        # Forked workers inherit the patch.
+        monkeypatch.setattr(
+            AssetExtractor,
+            "_find_page_tables",
+            lambda self, page: [{
+                "bbox": (72.0, 100.0, 372.0, 190.0),
+                "html": f"<table>page {page.number}</table>",
+                "caption": "",
+                "rows": 3,
+                "cols": 3,
+            }],
+        )
+        
+        def summary(assets):
+            return [(a.id, a.bbox, a.content) for a in assets]
+        
+        serial = AssetExtractor(table_scan="all").extract_tables(pdf_path, "book")
+        with PdfSession(pdf_path) as session:
+            # The path argument is ignored once a session supplies the document
+            parallel = AssetExtractor(workers=2, table_scan="all").extract_tables(
+                tmp_path / "missing.pdf", "book", session=session
+            )
+        
+        assert len(serial) == 3
+        assert summary(parallel) == summary(serial)
+    
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            AssetExtractor(workers=0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
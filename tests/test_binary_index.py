@@ -0,0 +1,142 @@
+"""Tests for the binary columnar index layout."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import fitz
+import numpy as np
+import pytest
+
+from algl_pdf_helper.binary_index import (
+    BinaryChunkIndex,
+    has_binary_index,
+    write_binary_index,
+)
+from algl_pdf_helper.export_sqladapt import load_chunks
+from algl_pdf_helper.indexer import build_index
+from algl_pdf_helper.models import IndexBuildOptions, PdfIndexChunk
+
+
+@pytest.fixture
+def sample_pdf(tmp_path: Path) -> Path:
+    pdf_path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    for i in range(1, 4):
+        page = doc.new_page()
+        y = 72
+        for line in range(30):
+            page.insert_text(
+                (72, y),
+                f"Rule {i}.{line}: GROUP BY collapses {line * i} rows into groups.",
+                fontsize=11,
+            )
+            y += 16
+    doc.save(str(pdf_path))
+    doc.close()
+    return pdf_path
+
+
+def test_round_trip_matches_json(sample_pdf: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    opts = IndexBuildOptions(chunkWords=60, overlapWords=10, embeddingDim=24)
+    document = build_index(sample_pdf, out, options=opts, extract_assets=False, index_format="both")
+    json_chunks = json.loads((out / "chunks.json").read_text(encoding="utf-8"))
+
+    with BinaryChunkIndex.open(out) as index:
+        assert len(index) == len(json_chunks) == document.chunkCount > 1
+        assert index.index_id == document.indexId
+        assert index.embeddings.shape == (len(json_chunks), 24)
+        assert index.embeddings.dtype == np.float32
+        assert isinstance(index.embeddings, np.memmap)
+        np.testing.assert_array_equal(
+            index.embeddings,
+            np.asarray([c["embedding"] for c in json_chunks], dtype=np.float32),
+        )
+        for i, chunk in enumerate(json_chunks):
+            assert index.chunk_id(i) == chunk["chunkId"]
+            assert index.doc_id(i) == chunk["docId"]
+            assert index.page(i) == chunk["page"]
+            assert index.text(i) == chunk["text"]
+        last = json_chunks[-1]["chunkId"]
+        assert index.index_of(last) == len(json_chunks) - 1
+        with pytest.raises(KeyError):
+            index.index_of("missing")
+
+
+def test_binary_only_layout_feeds_export_loader(sample_pdf: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    opts = IndexBuildOptions(chunkWords=60, overlapWords=10, embeddingDim=24)
+    document = build_index(sample_pdf, out, options=opts, extract_assets=False, index_format="binary")
+
+    assert (out / "manifest.json").exists()
+    assert not (out / "chunks.json").exists()
+    assert not (out / "index.json").exists()
+    assert has_binary_index(out)
+
+    chunks = load_chunks(out / "chunks.json")
+    assert [c["chunkId"] for c in chunks] == [c.chunkId for c in document.chunks]
+    assert [c["text"] for c in chunks] == [c.text for c in document.chunks]
+
+
+def test_unicode_and_multiple_docs(tmp_path: Path) -> None:
+    chunks = [
+        PdfIndexChunk(chunkId="a:p1:c1", docId="a", page=1, text="naïve café — ✓", embedding=[1.0, 0.0]),
+        PdfIndexChunk(chunkId="a:p2:c1", docId="a", page=2, text="", embedding=[0.0, 1.0]),
+        PdfIndexChunk(chunkId="b:p9:c1", docId="b", page=9, text="日本語のテキスト", embedding=[0.6, 0.8]),
+    ]
+    write_binary_index(chunks, tmp_path)
+
+    with BinaryChunkIndex.open(tmp_path) as index:
+        assert index.doc_ids == ["a", "b"]
+        assert list(index.doc_indices) == [0, 0, 1]
+        assert list(index.pages) == [1, 2, 9]
+        assert [c.model_dump() for c in index.iter_chunks()] == [
+            {**c.model_dump(), "embedding": [float(np.float32(v)) for v in c.embedding]}
+            for c in chunks
+        ]
+
+
+def test_empty_index(tmp_path: Path) -> None:
+    write_binary_index([], tmp_path, embedding_dim=24)
+    with BinaryChunkIndex.open(tmp_path) as index:
+        assert len(index) == 0
+        assert index.embeddings.shape == (0, 24)
+        assert index.chunk_dicts() == []
+
+
+def test_mixed_embeddings_rejected(tmp_path: Path) -> None:
+    chunks = [
+        PdfIndexChunk(chunkId="a:p1:c1", docId="a", page=1, text="x", embedding=[1.0]),
+        PdfIndexChunk(chunkId="a:p1:c2", docId="a", page=1, text="y"),
+    ]
+    with pytest.raises(ValueError):
+        write_binary_index(chunks, tmp_path)
+
+
+def test_missing_index(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        BinaryChunkIndex.open(tmp_path)
+
+
+def test_rebuild_in_other_format_removes_old_layout(sample_pdf: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    opts = IndexBuildOptions(chunkWords=60, overlapWords=10, embeddingDim=24)
+    build_index(sample_pdf, out, options=opts, extract_assets=False, index_format="json")
+    build_index(sample_pdf, out, options=opts, extract_assets=False, index_format="binary")
+    assert has_binary_index(out)
+    assert not (out / "chunks.json").exists() and not (out / "index.json").exists()
+
+    build_index(sample_pdf, out, options=opts, extract_assets=False, index_format="json")
+    assert (out / "chunks.json").exists() and (out / "index.json").exists()
+    assert not (out / "index-bin").exists()
+
+
+def test_rewrite_removes_header_until_complete(tmp_path: Path) -> None:
+    chunks = [PdfIndexChunk(chunkId="a:p1:c1", docId="a", page=1, text="x", embedding=[1.0])]
+    write_binary_index(chunks, tmp_path)
+    mixed = chunks + [PdfIndexChunk(chunkId="a:p1:c2", docId="a", page=1, text="y")]
+    with pytest.raises(ValueError):
+        write_binary_index(mixed, tmp_path)
+    assert not has_binary_index(tmp_path)
@@ -0,0 +1,127 @@
+"""Tests for BlockTextIndex and the concept/evidence mapping built on it."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from algl_pdf_helper.instructional_pipeline import InstructionalPipeline, PipelineConfig
+from algl_pdf_helper.section_extractor import (
+    BlockTextIndex,
+    BlockType,
+    ContentBlock,
+    EvidenceTracker,
+)
+from algl_pdf_helper.sql_ontology import ConceptOntology
+
+
+def _block(i: int, text: str, block_type: BlockType = BlockType.EXPLANATORY_PROSE) -> ContentBlock:
+    return ContentBlock(
+        block_id=f"doc:p{i // 4 + 1}:b{i}",
+        block_type=block_type,
+        page_number=i // 4 + 1,
+        char_start=0,
+        char_end=len(text),
+        text_content=text,
+    )
+
+
+@pytest.fixture
+def blocks() -> list[ContentBlock]:
+    rng = random.Random(0)
+    ontology = ConceptOntology()
+    vocab = []
+    for concept_id in ontology.list_all_concepts():
+        concept = ontology.get_concept(concept_id) or {}
+        vocab.extend(concept.get("title", "").split())
+        vocab.extend(concept.get("learning_objectives", [""])[0].split())
+    vocab += ["SELECT", "JOIN", "GROUP BY", "IS NOT NULL", "condition,", "(inner)", "\t", "\n"]
+    types = list(BlockType)
+    result = []
+    for i in range(400):
+        text = " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 30)))
+        result.append(_block(i, text, rng.choice(types)))
+    return result
+
+
+def test_matches_substring_containment(blocks: list[ContentBlock]) -> None:
+    index = BlockTextIndex(blocks)
+    keywords = [
+        "on", "select", "group by", "is not null", "inner", "(inner)", "ion,",
+        "n, ", "sql", "missing-term", "", " ", "by\n", "the data",
+    ]
+    for keyword in keywords:
+        expected = [i for i, b in enumerate(blocks) if keyword in b.text_content.lower()]
+        assert index.blocks_containing(keyword).tolist() == expected, keyword
+        assert index.occurrences(keyword).tolist() == [
+            b.text_content.lower().count(keyword) for b in blocks
+        ]
+    assert index.keyword_hits(["on", "select", "on"]).tolist() == [
+        ("on" in t) * 2 + ("select" in t) for t in index.texts
+    ]
+
+
+def test_evidence_map_matches_per_block_scoring(blocks: list[ContentBlock]) -> None:
+    tracker = EvidenceTracker()
+    concept_ids = ["select-basic", "inner-join", "null-handling", "group-by"]
+    evidence = tracker.create_evidence_map(blocks, concept_ids)
+
+    for concept_id in concept_ids:
+        keywords = tracker._derive_keywords(concept_id)
+        matching = {
+            i for i, b in enumerate(blocks)
+            if any(kw in b.text_content.lower() for kw in keywords)
+        }
+        expected = sorted({
+            j for i in matching for j in range(i - 2, i + 3) if 0 <= j < len(blocks)
+        })
+        entries = evidence[concept_id]
+        assert [e["block_id"] for e in entries] == [blocks[i].block_id for i in expected]
+        assert [e["relevance_score"] for e in entries] == [
+            tracker.calculate_relevance_score(blocks[i], concept_id) for i in expected
+        ]
+        assert tracker.get_spans_for_concept(blocks, concept_id) == [blocks[i] for i in expected]
+
+
+def test_map_to_concepts_matches_reference(blocks: list[ContentBlock], tmp_path: Path) -> None:
+    pdf_path = tmp_path / "book.pdf"
+    pdf_path.touch()
+    pipeline = InstructionalPipeline(PipelineConfig(pdf_path=pdf_path, output_dir=tmp_path))
+    mapped = pipeline._map_to_concepts(blocks)
+
+    weights = {
+        BlockType.HEADING: 2.0,
+        BlockType.SUBHEADING: 1.5,
+        BlockType.SQL_CODE: 1.3,
+        BlockType.EXPLANATORY_PROSE: 1.0,
+        BlockType.FIGURE: 0.8,
+        BlockType.SIDEBAR: 0.6,
+        BlockType.ADMIN_TEXT: 0.0,
+        BlockType.UNKNOWN: 0.3,
+    }
+    ontology = ConceptOntology()
+    expected = {}
+    for concept_id in ontology.list_all_concepts():
+        keywords = pipeline._extract_concept_keywords(ontology.get_concept(concept_id))
+        scored = []
+        for block in blocks:
+            if block.block_type == BlockType.ADMIN_TEXT:
+                continue
+            text = block.text_content.lower()
+            score = sum(1 for kw in keywords if kw in text) / max(len(keywords), 1)
+            if block.block_type in (BlockType.HEADING, BlockType.SUBHEADING):
+                if any(kw in text for kw in keywords):
+                    score *= 2.0
+            if block.block_type == BlockType.SQL_CODE and concept_id.lower() in text:
+                score *= 1.5
+            score *= weights.get(block.block_type, 0.5)
+            if score > 0.3:
+                scored.append((block, score))
+        scored.sort(key=lambda x: x[1], reverse=True)
+        if scored:
+            expected[concept_id] = [b.block_id for b, _ in scored[:15]]
+
+    assert expected
+    assert {k: [b.block_id for b in v] for k, v in mapped.items()} == expected
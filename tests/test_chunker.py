@@ -38,3 +38,92 @@ def test_chunk_ids_and_overlap():
         second_chunk_words = set(chunks[1][1].split())
         overlap = first_chunk_words & second_chunk_words
         assert len(overlap) > 0, "Expected overlap between chunks"
+
+
+def _legacy_chunks(text, chunk_words, overlap_words, preserve_sentences=True):
+    """chunk_page_words_with_provenance before PageWords, as (id, text, start, end)."""
+    from algl_pdf_helper.chunker import find_sentence_boundary
+
+    words = text.split()
+    chunk_words = max(chunk_words, MIN_CHUNK_WORDS)
+    step = max(1, chunk_words - overlap_words)
+    out, start = [], 0
+    while start < len(words):
+        slice_words = words[start : start + chunk_words]
+        chunk_text = " ".join(slice_words)
+        actual_step = step
+        if preserve_sentences and len(slice_words) == chunk_words:
+            boundary_pos = find_sentence_boundary(chunk_text, len(chunk_text) - 20)
+            if boundary_pos < len(chunk_text) - 10:
+                actual_step = max(1, len(chunk_text[:boundary_pos].strip().split()) - overlap_words)
+        char_start = len(" ".join(words[:start])) + (1 if start > 0 else 0)
+        out.append((f"d:p1:c{len(out) + 1}", chunk_text, char_start, char_start + len(chunk_text)))
+        if start + chunk_words >= len(words):
+            break
+        start += actual_step
+    return out
+
+
+def test_chunking_matches_legacy_algorithm():
+    """Bisect-based sentence snapping reproduces the character scan exactly."""
+    import random
+
+    from algl_pdf_helper.chunker import chunk_page_words_with_provenance
+
+    rng = random.Random(7)
+    vocab = ["a", "join", "rows", "SELECT", "x.", "end!", "why?", "表。", "好！", "吗？", "...", "e.g.", "?!"]
+    for trial in range(300):
+        text = "\n".join(
+            " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 15)))
+            for _ in range(rng.randint(0, 60))
+        )
+        chunk_words = rng.choice([5, 20, 25, 40, 150])
+        overlap_words = rng.choice([0, 5, 19, 30, 200])
+        for preserve in (True, False):
+            new = [
+                (r.chunk_id, r.text, r.char_offset_start, r.char_offset_end)
+                for r in chunk_page_words_with_provenance(
+                    doc_id="d", page=1, text=text, chunk_words=chunk_words,
+                    overlap_words=overlap_words, preserve_sentences=preserve,
+                )
+            ]
+            assert new == _legacy_chunks(text, chunk_words, overlap_words, preserve), trial
+
+
+def test_chunk_offsets_index_normalized_text():
+    from algl_pdf_helper.chunker import chunk_page_words_with_provenance
+
+    text = "  ".join(f"Sentence {i} ends here." for i in range(100))
+    joined = " ".join(text.split())
+    for r in chunk_page_words_with_provenance(
+        doc_id="d", page=1, text=text, chunk_words=30, overlap_words=5
+    ):
+        assert joined[r.char_offset_start : r.char_offset_end] == r.text
+
+
+def test_chunk_document_matches_per_page_chunking():
+    from algl_pdf_helper.chunker import PageText, chunk_document, chunk_page_words_with_provenance
+
+    pages = [(n, " ".join(f"p{n}w{i}." if i % 9 == 0 else f"p{n}w{i}" for i in range(n * 40)))
+             for n in range(1, 6)]
+    expected = [
+        r
+        for n, text in pages
+        for r in chunk_page_words_with_provenance(
+            doc_id="doc", page=n, text=text, chunk_words=50, overlap_words=10
+        )
+    ]
+    assert chunk_document(doc_id="doc", pages=pages, chunk_words=50, overlap_words=10) == expected
+    assert chunk_document(
+        doc_id="doc", pages=[PageText(n, t) for n, t in pages], chunk_words=50, overlap_words=10
+    ) == expected
+
+
+def test_chunk_results_record_their_page():
+    from algl_pdf_helper.chunker import chunk_document
+
+    pages = [(3, "alpha beta. " * 40), (7, ""), (8, "gamma delta. " * 10)]
+    results = chunk_document(doc_id="doc", pages=pages, chunk_words=30, overlap_words=5)
+
+    assert [r.page for r in results] == [int(r.chunk_id.split(":p")[1].split(":")[0]) for r in results]
+    assert {r.page for r in results} == {3, 8}
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from algl_pdf_helper.embedding import build_hash_embedding
+import numpy as np
+
+from algl_pdf_helper.embedding import build_hash_embedding, build_hash_embeddings
 
 
 def test_hash_embedding_matches_expected_vector():
@@ -38,3 +40,24 @@ def test_hash_embedding_matches_expected_vector():
     assert len(vec) == len(expected)
     for got, exp in zip(vec, expected):
         assert abs(got - exp) < 1e-12
+
+
+def test_batched_embeddings_match_scalar_bit_for_bit():
+    texts = [
+        "select from where join group by having order",
+        "",
+        "a b c",  # all tokens too short -> zero vector
+        "SELECT name, COUNT(*) FROM students GROUP BY name HAVING COUNT(*) > 2;",
+        "Übung: das Café serves naïve résumé data-base rows " * 20,
+    ]
+    for dim in (1, 7, 24, 256):
+        exact = build_hash_embeddings(texts, dim, dtype=np.float64)
+        assert exact.tolist() == [build_hash_embedding(t, dim) for t in texts]
+
+        matrix = build_hash_embeddings(texts, dim)
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (len(texts), dim)
+        assert matrix.flags["C_CONTIGUOUS"]
+        assert np.array_equal(matrix, exact.astype(np.float32))
+
+    assert build_hash_embeddings([], 24).shape == (0, 24)
@@ -0,0 +1,217 @@
+"""Tests for the content-addressed extraction cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import fitz
+import pytest
+from typer.testing import CliRunner
+
+from algl_pdf_helper import cli
+from algl_pdf_helper.extract import (
+    OCR_PIPELINE_VERSION,
+    OCRMYPDF_OPTIONS,
+    TEXT_EXTRACTOR_VERSION,
+    cleanup_temp_pdf,
+    extract_pages_fitz,
+    maybe_ocr_pdf,
+    sha256_file,
+)
+from algl_pdf_helper.extraction_cache import ExtractionCache
+from algl_pdf_helper.indexer import build_index
+from algl_pdf_helper.models import IndexBuildOptions
+from algl_pdf_helper.pdf_session import PdfSession
+from algl_pdf_helper.section_extractor import SectionExtractor
+
+
+@pytest.fixture
+def sample_pdf(tmp_path: Path) -> Path:
+    pdf_path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    for i in range(1, 4):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Chapter {i} Joining Tables", fontsize=20)
+        body = (
+            "An INNER JOIN returns rows that have matching values in both tables. "
+            "A LEFT JOIN keeps every row from the left table. "
+        )
+        y = 120
+        for _ in range(25):
+            page.insert_text((72, y), body[:90], fontsize=11)
+            y += 16
+    doc.save(str(pdf_path))
+    doc.close()
+    return pdf_path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ExtractionCache:
+    return ExtractionCache(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def no_decode(monkeypatch: pytest.MonkeyPatch):
+    """Fail the test if any page is decoded."""
+    def fail(*args, **kwargs):
+        raise AssertionError("page decoded despite cache hit")
+
+    def arm() -> None:
+        monkeypatch.setattr(PdfSession, "page_text", fail)
+        monkeypatch.setattr(PdfSession, "page_dict", fail)
+
+    return arm
+
+
+def test_key_covers_all_inputs() -> None:
+    base = ExtractionCache.make_key("pages", "a" * 64, "v1")
+    assert base == ExtractionCache.make_key("pages", "a" * 64, "v1")
+    assert base != ExtractionCache.make_key("pages", "b" * 64, "v1")
+    assert base != ExtractionCache.make_key("pages", "a" * 64, "v2")
+    assert base != ExtractionCache.make_key("pages", "a" * 64, "v1", (1, 2))
+    assert ExtractionCache.make_key("pages", "a" * 64, "v1", (1, 2)) != (
+        ExtractionCache.make_key("pages", "a" * 64, "v1", [1, 2])
+    )
+    assert base != ExtractionCache.make_key(
+        "pages", "a" * 64, "v1", ocr_settings={"deskew": True}
+    )
+    with pytest.raises(ValueError):
+        ExtractionCache.make_key("images", "a" * 64, "v1")
+
+
+def test_pages_served_from_cache(sample_pdf: Path, cache: ExtractionCache, no_decode) -> None:
+    pages = extract_pages_fitz(sample_pdf, cache=cache)
+    ranged = extract_pages_fitz(sample_pdf, (2, 3), cache=cache)
+    assert cache.misses == 2
+
+    no_decode()
+    assert extract_pages_fitz(sample_pdf, cache=cache) == pages
+    assert extract_pages_fitz(sample_pdf, (2, 3), cache=cache) == ranged
+    assert cache.hits == 2
+
+
+def test_cache_follows_content_not_path(
+    sample_pdf: Path, cache: ExtractionCache, tmp_path: Path
+) -> None:
+    pages = extract_pages_fitz(sample_pdf, cache=cache)
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(sample_pdf.read_bytes())
+    assert extract_pages_fitz(copy, cache=cache) == pages
+    assert cache.hits == 1
+
+
+def test_blocks_round_trip(sample_pdf: Path, cache: ExtractionCache, no_decode) -> None:
+    extractor = SectionExtractor()
+    fresh = extractor.extract_blocks(sample_pdf, "book", cache=cache)
+
+    no_decode()
+    cached = extractor.extract_blocks(sample_pdf, "book", cache=cache)
+    assert [b.to_dict() for b in cached] == [b.to_dict() for b in fresh]
+    assert all(isinstance(b.metadata["bbox"], tuple) for b in cached)
+
+    # A different doc_id changes block IDs, so it must not share the entry
+    with pytest.raises(AssertionError):
+        extractor.extract_blocks(sample_pdf, "other", cache=cache)
+
+
+def test_cached_ocr_output_skips_ocr(
+    sample_pdf: Path, cache: ExtractionCache, tmp_path: Path
+) -> None:
+    # A text-less scan needs OCR; its "OCR output" is already in the cache
+    scan = tmp_path / "scan.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(str(scan))
+    doc.close()
+    ocr_output = sample_pdf
+    key = cache.make_key(
+        "ocr", sha256_file(scan), OCR_PIPELINE_VERSION, ocr_settings=OCRMYPDF_OPTIONS
+    )
+    cache.put_file(key, ocr_output)
+
+    out_path, did_ocr = maybe_ocr_pdf(scan, force=False, auto=True, cache=cache)
+    try:
+        assert did_ocr
+        assert out_path.parent.name.startswith("algl_pdf_")
+        assert out_path.read_bytes() == ocr_output.read_bytes()
+    finally:
+        cleanup_temp_pdf(out_path)
+    assert not out_path.exists()
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    cache = ExtractionCache(cache_dir=tmp_path / "cache", max_bytes=10**9)
+    keys = [cache.make_key("pages", f"{i:064x}", TEXT_EXTRACTOR_VERSION) for i in range(3)]
+    for i, key in enumerate(keys):
+        path = cache.put_json(key, [[1, os.urandom(2000).hex()]])
+        os.utime(path, (1000 + i, 1000 + i))
+
+    # Touch the oldest entry so the middle one becomes least recently used
+    assert cache.get_json(keys[0]) is not None
+    entry_size = max(e.size_bytes for e in cache.entries())
+    removed = cache.prune(max_bytes=2 * entry_size)
+
+    assert removed == 1
+    assert cache.get_json(keys[1]) is None
+    assert cache.get_json(keys[0]) is not None
+    assert cache.get_json(keys[2]) is not None
+    assert cache.clear_cache() == 2
+    assert cache.entries() == []
+
+
+def test_writes_scan_the_cache_only_to_evict(tmp_path: Path, monkeypatch) -> None:
+    cache = ExtractionCache(cache_dir=tmp_path / "cache", max_bytes=10**9)
+    keys = [cache.make_key("pages", f"{i:064x}", TEXT_EXTRACTOR_VERSION) for i in range(4)]
+    oldest = cache.put_json(keys[0], [[1, os.urandom(2000).hex()]])
+    os.utime(oldest, (1000, 1000))
+    entry_size = cache.entries()[0].size_bytes
+
+    scans: list[int] = []
+    real_entries = ExtractionCache.entries
+    monkeypatch.setattr(
+        ExtractionCache, "entries", lambda self: scans.append(1) or real_entries(self)
+    )
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    cache.put_json(keys[1], [[1, os.urandom(2000).hex()]])
+    cache.put_json(keys[1], [[1, os.urandom(2000).hex()]])  # replacing does not grow the total
+    assert scans == []
+
+    cache.put_json(keys[2], [[1, os.urandom(2000).hex()]])
+    assert scans == [1]
+    assert len(real_entries(cache)) == 2
+    assert cache.get_json(keys[0]) is None
+
+
+def test_reindex_skips_extraction(
+    sample_pdf: Path, cache: ExtractionCache, tmp_path: Path, no_decode
+) -> None:
+    opts = IndexBuildOptions(chunkWords=120, overlapWords=20, embeddingDim=24)
+    first = build_index(
+        sample_pdf, tmp_path / "out1", options=opts, extract_assets=False, cache=cache
+    )
+
+    no_decode()
+    second = build_index(
+        sample_pdf, tmp_path / "out2", options=opts, extract_assets=False, cache=cache
+    )
+    assert second.indexId == first.indexId
+    assert [c.text for c in second.chunks] == [c.text for c in first.chunks]
+
+
+def test_cache_cli_inspect_and_prune(
+    sample_pdf: Path, cache: ExtractionCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cli, "get_extraction_cache", lambda: cache)
+    extract_pages_fitz(sample_pdf, cache=cache)
+    runner = CliRunner()
+
+    result = runner.invoke(cli.app, ["cache", "inspect"])
+    assert result.exit_code == 0, result.output
+    assert "1 entries" in result.output
+    assert "pages" in result.output
+
+    result = runner.invoke(cli.app, ["cache", "prune", "--max-size-mb", "0"])
+    assert result.exit_code == 0, result.output
+    assert "Evicted 1 extraction cache entries" in result.output
+    assert cache.entries() == []
@@ -18,6 +18,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from algl_pdf_helper.llm_transport import LLMTransport
 from algl_pdf_helper.glm_ocr_client import (
     GLMOCRClient,
     GLMOCResult,
@@ -82,14 +83,8 @@ class TestGLMOCRClientAvailability:
             ]
         }
         
-        with patch('urllib.request.urlopen') as mock_urlopen:
-            mock_cm = Mock()
-            mock_cm.__enter__ = Mock(return_value=Mock(
-                status=200,
-                read=Mock(return_value=json.dumps(mock_response).encode())
-            ))
-            mock_cm.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_cm
+        with patch.object(LLMTransport, "_send") as mock_send:
+            mock_send.return_value = (200, "OK", json.dumps(mock_response).encode())
             
             client = GLMOCRClient()
             assert client.available is True
@@ -102,23 +97,17 @@ class TestGLMOCRClientAvailability:
             ]
         }
         
-        with patch('urllib.request.urlopen') as mock_urlopen:
-            mock_cm = Mock()
-            mock_cm.__enter__ = Mock(return_value=Mock(
-                status=200,
-                read=Mock(return_value=json.dumps(mock_response).encode())
-            ))
-            mock_cm.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_cm
+        with patch.object(LLMTransport, "_send") as mock_send:
+            mock_send.return_value = (200, "OK", json.dumps(mock_response).encode())
             
             client = GLMOCRClient()
             assert client.available is False
     
     def test_not_available_when_ollama_down(self):
         """Test availability check when Ollama is not running."""
-        with patch('urllib.request.urlopen') as mock_urlopen:
+        with patch.object(LLMTransport, "_send") as mock_send:
             from urllib.error import URLError
-            mock_urlopen.side_effect = URLError("Connection refused")
+            mock_send.side_effect = URLError("Connection refused")
             
             client = GLMOCRClient()
             assert client.available is False
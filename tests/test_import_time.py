@@ -0,0 +1,88 @@
+"""Import-time budget for the package and the ``algl-pdf`` CLI.
+
+Every CLI invocation (the scheduler runs one per request) pays the import
+cost of ``algl_pdf_helper.cli``; heavy modules must only be imported by the
+commands that use them.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import typing
+
+import pytest
+from typer.testing import CliRunner
+
+# Cumulative `python -X importtime` budget in microseconds. Measured around
+# 0.15 s on a development machine (it was ~0.85 s with eager imports); the
+# margin absorbs slow CI runners. Override with ALGL_IMPORT_BUDGET_US.
+IMPORT_BUDGET_US = int(os.environ.get("ALGL_IMPORT_BUDGET_US", 600_000))
+
+HEAVY_MODULES = [
+    "fitz",
+    "pymupdf",
+    "numpy",
+    "algl_pdf_helper.models",
+    "algl_pdf_helper.indexer",
+    "algl_pdf_helper.extract",
+    "algl_pdf_helper.pedagogical_generator",
+    "algl_pdf_helper.generation_pipeline",
+    "algl_pdf_helper.cli_unit_library",
+    "algl_pdf_helper.unit_generator",
+    "algl_pdf_helper.misconception_bank",
+    "algl_pdf_helper.learning_quality_gates",
+]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time (us) per module when importing ``module`` fresh."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ["algl_pdf_helper", "algl_pdf_helper.cli"])
+def test_import_stays_light(module: str) -> None:
+    times = _import_times(module)
+    assert [name for name in HEAVY_MODULES if name in times] == []
+    assert times[module] < IMPORT_BUDGET_US, (
+        f"importing {module} took {times[module] / 1e6:.2f}s "
+        f"(budget {IMPORT_BUDGET_US / 1e6:.2f}s)"
+    )
+
+
+def test_package_reexports_resolve_lazily() -> None:
+    import algl_pdf_helper
+    from algl_pdf_helper import prompts
+    from algl_pdf_helper.quality_gates import QualityGate
+
+    assert algl_pdf_helper.QualityGate is QualityGate
+    assert algl_pdf_helper.PROMPT_PRACTICE_SCHEMAS is prompts.PRACTICE_SCHEMAS
+    assert algl_pdf_helper.indexer.__name__ == "algl_pdf_helper.indexer"
+    assert "MultiPassGenerator" in dir(algl_pdf_helper)
+    with pytest.raises(AttributeError):
+        algl_pdf_helper.no_such_name
+
+
+def test_cli_help_for_every_command() -> None:
+    from algl_pdf_helper import cli, preflight
+
+    assert typing.get_args(cli.ExtractionStrategy) == typing.get_args(preflight.ExtractionStrategy)
+    runner = CliRunner()
+    names = [c.name or c.callback.__name__.replace("_", "-") for c in cli.app.registered_commands]
+    assert {"index", "process", "validate", "cache", "replay"} <= set(names)
+    for name in [*names, "edu generate"]:
+        result = runner.invoke(cli.app, [*name.split(), "--help"])
+        assert result.exit_code == 0, (name, result.output)
@@ -0,0 +1,205 @@
+"""Tests for incremental re-indexing (build_index(..., incremental=True))."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import fitz
+import pytest
+
+from algl_pdf_helper import indexer
+from algl_pdf_helper.incremental import PAGE_HASHES_FILENAME
+from algl_pdf_helper.indexer import build_index
+from algl_pdf_helper.models import IndexBuildOptions
+
+OPTS = IndexBuildOptions(chunkWords=60, overlapWords=10, embeddingDim=24)
+
+
+def _write_pdf(path: Path, topic: str, pages: int = 4, edited_page: int | None = None) -> None:
+    doc = fitz.open()
+    for i in range(1, pages + 1):
+        page = doc.new_page()
+        y = 72
+        for line in range(25):
+            word = "REVISED" if i == edited_page else topic
+            page.insert_text(
+                (72, y),
+                f"{word} rule {i}.{line}: rows {line * i} are filtered by the predicate.",
+                fontsize=11,
+            )
+            y += 18
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def pdf_dir(tmp_path: Path) -> Path:
+    src = tmp_path / "pdfs"
+    src.mkdir()
+    _write_pdf(src / "joins.pdf", "JOIN")
+    _write_pdf(src / "groups.pdf", "GROUP")
+    return src
+
+
+def _build(pdf_dir: Path, out: Path, **kwargs):
+    return build_index(pdf_dir, out, options=OPTS, extract_assets=False, **kwargs)
+
+
+def _outputs(out: Path) -> tuple[dict, list]:
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    manifest.pop("createdAt")
+    return manifest, json.loads((out / "chunks.json").read_text(encoding="utf-8"))
+
+
+def _spy_chunking(monkeypatch) -> list[tuple[str, list[int]]]:
+    calls: list[tuple[str, list[int]]] = []
+    real = indexer._chunk_pages
+
+    def spy(doc_id, pages, **kwargs):
+        calls.append((doc_id, [p for p, _ in pages]))
+        return real(doc_id, pages, **kwargs)
+
+    monkeypatch.setattr(indexer, "_chunk_pages", spy)
+    return calls
+
+
+def test_unchanged_docs_and_pages_are_reused(pdf_dir: Path, tmp_path: Path, monkeypatch) -> None:
+    out = tmp_path / "out"
+    _build(pdf_dir, out)
+    assert (out / PAGE_HASHES_FILENAME).exists()
+
+    _write_pdf(pdf_dir / "joins.pdf", "JOIN", edited_page=3)
+    extracted: list[str] = []
+    real_extract = indexer._extract_pdf_pages
+    monkeypatch.setattr(
+        indexer,
+        "_extract_pdf_pages",
+        lambda pdf_path, **kw: extracted.append(pdf_path.name) or real_extract(pdf_path, **kw),
+    )
+    chunked = _spy_chunking(monkeypatch)
+
+    incremental = _build(pdf_dir, out, incremental=True)
+
+    assert extracted == ["joins.pdf"]
+    assert [pages for _, pages in chunked] == [[3]]
+
+    clean_out = tmp_path / "clean"
+    monkeypatch.undo()
+    clean = _build(pdf_dir, clean_out)
+    assert incremental.indexId == clean.indexId
+    assert _outputs(out) == _outputs(clean_out)
+
+
+def test_parallel_incremental_matches_clean(pdf_dir: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    _build(pdf_dir, out, use_aliases=True)
+    _write_pdf(pdf_dir / "groups.pdf", "GROUP", edited_page=1)
+    _write_pdf(pdf_dir / "views.pdf", "VIEW")
+    (pdf_dir / "joins.pdf").unlink()
+
+    incremental = _build(pdf_dir, out, use_aliases=True, incremental=True, workers=2)
+    clean_out = tmp_path / "clean"
+    clean = _build(pdf_dir, clean_out, use_aliases=True)
+
+    assert incremental.indexId == clean.indexId
+    assert _outputs(out) == _outputs(clean_out)
+
+
+def test_settings_change_forces_full_build(pdf_dir: Path, tmp_path: Path, monkeypatch) -> None:
+    out = tmp_path / "out"
+    _build(pdf_dir, out)
+    chunked = _spy_chunking(monkeypatch)
+
+    build_index(
+        pdf_dir,
+        out,
+        options=IndexBuildOptions(chunkWords=50, overlapWords=10, embeddingDim=24),
+        extract_assets=False,
+        incremental=True,
+    )
+    assert sorted(pages for _, pages in chunked) == [[1, 2, 3, 4], [1, 2, 3, 4]]
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        ({"extract_assets": True}, {"extract_assets": False}),
+        ({"extract_assets": True}, {"extract_assets": True, "asset_backend": "marker"}),
+    ],
+)
+def test_asset_settings_change_forces_full_build(
+    pdf_dir: Path, tmp_path: Path, monkeypatch, first: dict, second: dict
+) -> None:
+    out = tmp_path / "out"
+    build_index(pdf_dir, out, options=OPTS, **first)
+    chunked = _spy_chunking(monkeypatch)
+
+    build_index(pdf_dir, out, options=OPTS, incremental=True, **second)
+    assert sorted(pages for _, pages in chunked) == [[1, 2, 3, 4], [1, 2, 3, 4]]
+
+
+def test_binary_previous_build_reuses_exact_embeddings(pdf_dir: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    _build(pdf_dir, out, index_format="binary")
+    _write_pdf(pdf_dir / "joins.pdf", "JOIN", edited_page=2)
+
+    incremental = _build(pdf_dir, out, incremental=True, index_format="both")
+    clean_out = tmp_path / "clean"
+    clean = _build(pdf_dir, clean_out)
+
+    assert incremental.indexId == clean.indexId
+    assert [c.model_dump() for c in incremental.chunks] == [c.model_dump() for c in clean.chunks]
+
+
+def test_missing_previous_build_falls_back(pdf_dir: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    first = _build(pdf_dir, out, incremental=True)
+    shutil.rmtree(out)
+    assert _build(pdf_dir, out).indexId == first.indexId
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_scan_json_array_reports_byte_spans(tmp_path: Path, monkeypatch, indent, ensure_ascii) -> None:
+    from algl_pdf_helper import incremental
+
+    monkeypatch.setattr(incremental, "_SCAN_BLOCK_CHARS", 7)
+    items = [{"docId": f"d{i % 2}", "text": "naïve “quoted” ✓ " * i, "n": [i, 1.5]} for i in range(6)]
+    path = tmp_path / "chunks.json"
+    path.write_text(json.dumps(items, indent=indent, ensure_ascii=ensure_ascii), encoding="utf-8")
+    data = path.read_bytes()
+
+    scanned = list(incremental._scan_json_array(path))
+
+    assert [item for _, _, item in scanned] == items
+    assert [json.loads(data[start:end]) for start, end, _ in scanned] == items
+
+
+@pytest.mark.parametrize("index_format", ["json", "binary"])
+def test_previous_chunks_are_read_only_when_reused(
+    pdf_dir: Path, tmp_path: Path, monkeypatch, index_format: str
+) -> None:
+    from algl_pdf_helper import incremental
+
+    out = tmp_path / "out"
+    _build(pdf_dir, out, index_format=index_format)
+    clean = _build(pdf_dir, tmp_path / "clean")
+    expected: dict[str, list[dict]] = {}
+    for c in clean.chunks:
+        expected.setdefault(c.docId, []).append(c.model_dump())
+
+    reads: list[str] = []
+    reader = "_read_json_chunks" if index_format == "json" else "_read_binary_chunks"
+    real = getattr(incremental, reader)
+    monkeypatch.setattr(
+        incremental, reader, lambda path, spans: reads.append(path) or real(path, spans)
+    )
+    fingerprint = json.loads((out / PAGE_HASHES_FILENAME).read_text(encoding="utf-8"))["settings"]
+    previous = incremental.PreviousIndex.load(out, fingerprint)
+
+    assert reads == []
+    for doc in previous.docs:
+        assert [c.model_dump() for c in doc.load_chunks()] == expected[doc.source.docId]
+    assert len(reads) == len(previous.docs) == 2
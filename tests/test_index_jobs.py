@@ -0,0 +1,148 @@
+"""Tests for background indexing jobs (index_jobs + /v1/jobs handlers)."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import fitz
+import pytest
+
+from algl_pdf_helper.index_jobs import IndexJobManager, JobQueueFull, index_response
+from algl_pdf_helper.indexer import build_index
+from algl_pdf_helper.models import IndexBuildOptions
+
+OPTS = IndexBuildOptions(chunkWords=40, overlapWords=10, embeddingDim=24)
+
+
+def _pdf_bytes(pages: int = 3) -> bytes:
+    doc = fitz.open()
+    for i in range(1, pages + 1):
+        page = doc.new_page()
+        for line in range(15):
+            page.insert_text((72, 72 + line * 18), f"Page {i} line {line}: SELECT {line * i} rows.")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _work_dir(tmp_path: Path, name: str, data: bytes) -> tuple[Path, Path]:
+    work_dir = tmp_path / name
+    work_dir.mkdir()
+    pdf_path = work_dir / "book.pdf"
+    pdf_path.write_bytes(data)
+    return work_dir, pdf_path
+
+
+@pytest.fixture
+def manager():
+    manager = IndexJobManager(max_workers=1)
+    yield manager
+    manager.shutdown()
+
+
+def test_job_result_matches_written_index(manager: IndexJobManager, tmp_path: Path) -> None:
+    data = _pdf_bytes()
+    work_dir, pdf_path = _work_dir(tmp_path, "job", data)
+    kwargs = dict(options=OPTS, extract_assets=False)
+    job = manager.submit(work_dir, pdf_path, kwargs)
+    assert job.status in ("queued", "running")
+
+    document = job.future.result(timeout=60)
+    assert manager.get(job.id).status == "succeeded"
+    assert not work_dir.exists()
+
+    # The job's work_dir is gone; build the same bytes the regular way
+    reference_pdf = tmp_path / "book.pdf"
+    reference_pdf.write_bytes(data)
+    out = tmp_path / "reference"
+    build_index(reference_pdf, out, **kwargs)
+    payload = index_response(document)
+    assert payload["chunks"] == json.loads((out / "chunks.json").read_text(encoding="utf-8"))
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    assert payload["manifest"].keys() == manifest.keys()
+    assert payload["manifest"]["indexId"] == manifest["indexId"]
+
+
+def test_failed_job_reports_error(manager: IndexJobManager, tmp_path: Path) -> None:
+    work_dir, pdf_path = _work_dir(tmp_path, "bad", b"not a pdf")
+    job = manager.submit(work_dir, pdf_path, dict(options=OPTS, extract_assets=False))
+    with pytest.raises(Exception):
+        job.future.result(timeout=60)
+    job = manager.get(job.id)
+    assert job.status == "failed"
+    assert job.error
+    assert not work_dir.exists()
+
+
+def test_queue_limit(tmp_path: Path) -> None:
+    release = threading.Event()
+    manager = IndexJobManager(
+        max_workers=1, max_pending=1, executor_factory=lambda n: ThreadPoolExecutor(n)
+    )
+    try:
+        work_dir, pdf_path = _work_dir(tmp_path, "slow", b"")
+        job = manager.submit(work_dir, pdf_path, {}, runner=lambda *a: release.wait())
+        other_dir, other_pdf = _work_dir(tmp_path, "rejected", b"")
+        with pytest.raises(JobQueueFull):
+            manager.submit(other_dir, other_pdf, {}, runner=lambda *a: None)
+        release.set()
+        job.future.result(timeout=10)
+        manager.submit(other_dir, other_pdf, {}, runner=lambda *a: None).future.result(timeout=10)
+    finally:
+        release.set()
+        manager.shutdown()
+
+
+def test_jobs_endpoints(monkeypatch, tmp_path: Path) -> None:
+    from starlette.datastructures import UploadFile
+
+    from algl_pdf_helper import server
+
+    monkeypatch.setattr(server, "_job_manager", IndexJobManager(max_workers=1))
+    monkeypatch.setattr(server, "UPLOAD_CHUNK_BYTES", 1024)
+    params = dict(
+        ocr=False, auto_ocr=False, use_aliases=False, chunk_words=40, overlap_words=10,
+        embedding_dim=24, strip_headers=True, workers=1, extraction_cache=False,
+    )
+    try:
+        upload = UploadFile(file=io.BytesIO(_pdf_bytes()), filename="../../book.pdf")
+        response = asyncio.run(server.create_job(pdf=upload, **params))
+        assert response.status_code == 202
+        created = json.loads(response.body)
+
+        job = server.get_job_manager().get(created["jobId"])
+        job.future.result(timeout=60)
+        polled = json.loads(server.get_job(created["jobId"]).body)
+        assert polled["status"] == "succeeded"
+        assert polled["filename"] == "book.pdf"
+        assert polled["result"]["document"]["chunkCount"] == len(polled["result"]["chunks"]) > 0
+
+        assert server.get_job("missing").status_code == 404
+    finally:
+        server.get_job_manager().shutdown()
+
+
+@pytest.mark.parametrize("workers", [0, 5])
+def test_jobs_endpoints_reject_workers_outside_limit(monkeypatch, workers: int) -> None:
+    from starlette.datastructures import UploadFile
+
+    from algl_pdf_helper import server
+
+    monkeypatch.setenv("ALGL_PDF_MAX_BUILD_WORKERS", "4")
+    monkeypatch.setattr(server, "_job_manager", None)
+    params = dict(
+        ocr=False, auto_ocr=False, use_aliases=False, chunk_words=40, overlap_words=10,
+        embedding_dim=24, strip_headers=True, workers=workers, extraction_cache=False,
+    )
+    for route in (server.create_job, server.index_pdf):
+        upload = UploadFile(file=io.BytesIO(_pdf_bytes()), filename="book.pdf")
+        response = asyncio.run(route(pdf=upload, **params))
+        assert response.status_code == 422
+        assert "between 1 and 4" in json.loads(response.body)["error"]
+    # Rejected before any job pool was started
+    assert server._job_manager is None
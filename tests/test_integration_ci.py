@@ -499,6 +499,40 @@ def test_pipeline_output_valid_json(
                 pytest.fail(f"{filename} is not valid JSON: {e}")
 
 
+def test_parallel_index_matches_serial(
+    golden_pdf_path: Path,
+    temp_output_dir: Path,
+) -> None:
+    """--workers N should produce the same chunks and index ID as a serial build."""
+    opts = IndexBuildOptions()
+    common = dict(
+        options=opts,
+        ocr=False,
+        auto_ocr=False,
+        use_aliases=True,
+        strip_headers=True,
+        extract_assets=False,
+    )
+
+    serial = build_index(golden_pdf_path, temp_output_dir / "serial", **common)
+    # A tiny shard size forces the single golden PDF to be split into page ranges
+    parallel = build_index(
+        golden_pdf_path,
+        temp_output_dir / "parallel",
+        workers=2,
+        shard_pages=1,
+        **common,
+    )
+
+    assert parallel.indexId == serial.indexId
+    assert [c.model_dump() for c in parallel.chunks] == [
+        c.model_dump() for c in serial.chunks
+    ]
+    assert (temp_output_dir / "parallel" / "chunks.json").read_bytes() == (
+        temp_output_dir / "serial" / "chunks.json"
+    ).read_bytes()
+
+
 # ============================================================================
 # Regression Tests
 # ============================================================================
@@ -0,0 +1,139 @@
+"""Tests for the persistent LLM response cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from algl_pdf_helper import cli
+from algl_pdf_helper.generation_pipeline import MultiPassGenerator
+from algl_pdf_helper.llm_cache import LLMResponseCache, get_llm_cache
+from algl_pdf_helper.llm_transport import LLMTransport
+from algl_pdf_helper.unit_generator import GenerationConfig, UnitGenerator
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LLMResponseCache:
+    return LLMResponseCache(tmp_path / "llm.sqlite3")
+
+
+def test_key_covers_model_options_prompt_and_version() -> None:
+    messages = [{"role": "user", "content": "Explain JOIN"}]
+    key = LLMResponseCache.make_key("qwen2.5:3b", messages, {"temperature": 0.3})
+    assert key == LLMResponseCache.make_key("qwen2.5:3b", messages, {"temperature": 0.3})
+    assert len({
+        key,
+        LLMResponseCache.make_key("phi4", messages, {"temperature": 0.3}),
+        LLMResponseCache.make_key("qwen2.5:3b", messages, {"temperature": 0.7}),
+        LLMResponseCache.make_key("qwen2.5:3b", "Explain JOIN", {"temperature": 0.3}),
+        LLMResponseCache.make_key("qwen2.5:3b", messages, {"temperature": 0.3}, prompt_version="0"),
+    }) == 5
+
+
+def test_get_put_and_lifetime_counters(cache: LLMResponseCache) -> None:
+    key = cache.make_key("m", "prompt")
+    assert cache.get(key) is None
+    cache.put(key, '{"definition": "é"}', model="m")
+    assert cache.get(key) == '{"definition": "é"}'
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+    reopened = LLMResponseCache(cache.path)
+    assert reopened.get(key) == '{"definition": "é"}'
+    stats = reopened.get_cache_stats()
+    assert stats["entries"] == 1
+    assert stats["entries_by_model"] == {"m": 1}
+    assert (stats["hits"], stats["misses"]) == (1, 0)
+    assert (stats["lifetime_hits"], stats["lifetime_misses"]) == (2, 1)
+    assert stats["lifetime_hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_bytes=3 * (64 + 1000))
+    keys = [cache.make_key("m", f"prompt {i}") for i in range(3)]
+    for key in keys:
+        cache.put(key, "x" * 1000, model="m")
+    assert cache.get(keys[0]) is not None  # keys[1] is now least recently used
+
+    cache.put(cache.make_key("m", "prompt 3"), "x" * 1000, model="m")
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get_cache_stats()["total_size_bytes"] <= cache.max_bytes
+
+    assert cache.prune(max_bytes=0) == 3
+    assert cache.get_cache_stats()["total_size_bytes"] == 0
+
+
+def test_generator_answers_repeated_prompts_from_cache(cache: LLMResponseCache) -> None:
+    reply = {"message": {"content": '{"answer": 1}'}}
+    with patch.object(LLMTransport, "post_json", return_value=reply) as post:
+        generator = MultiPassGenerator(model="qwen2.5:3b", response_cache=cache)
+        messages = [{"role": "user", "content": "Explain GROUP BY"}]
+        assert generator._ollama_chat(messages) == '{"answer": 1}'
+        assert generator._ollama_chat(messages) == '{"answer": 1}'
+        assert post.call_count == 1
+
+        # A different temperature is a different request
+        generator._ollama_chat(messages, temperature=0.9)
+        assert post.call_count == 2
+
+        # Another run (new generator, same cache file) is served from disk
+        rerun = MultiPassGenerator(model="qwen2.5:3b", response_cache=LLMResponseCache(cache.path))
+        assert rerun._ollama_chat(messages) == '{"answer": 1}'
+        assert post.call_count == 2
+
+
+def test_unit_generator_uses_shared_cache_when_enabled() -> None:
+    reply = {"message": {"content": '{"hint": "Use GROUP BY"}'}}
+    with patch.object(LLMTransport, "post_json", return_value=reply) as post:
+        config = GenerationConfig(llm_provider="ollama", model_name="qwen2.5:3b")
+        UnitGenerator()._call_llm("prompt", config)
+        UnitGenerator()._call_llm("prompt", config)
+        assert post.call_count == 2
+
+        config.cache_llm_responses = True
+        UnitGenerator()._call_llm("prompt", config)
+        assert UnitGenerator()._call_llm("prompt", config) == {"hint": "Use GROUP BY"}
+        assert post.call_count == 3
+    assert get_llm_cache().get_cache_stats()["hits"] == 1
+
+
+def test_unparseable_responses_are_not_cached(cache: LLMResponseCache) -> None:
+    bad = {"message": {"content": "Sure! Here is the JSON you asked for"}}
+    good = {"message": {"content": '{"hint": "Use GROUP BY"}'}}
+    generator = MultiPassGenerator(model="qwen2.5:3b", response_cache=cache, max_attempts=1)
+    unit_generator = UnitGenerator()
+    config = GenerationConfig(llm_provider="ollama", model_name="qwen2.5:3b")
+    unit_generator._llm_generators[
+        (config.model_name, config.temperature, config.timeout_seconds, config.cache_llm_responses)
+    ] = generator
+
+    with patch.object(LLMTransport, "post_json", return_value=bad) as post:
+        assert unit_generator._call_llm("prompt", config) == {}
+        assert not generator.generate_with_validation("c", "Concept", "text").success
+        assert generator.generate_common_mistakes("Concept") == []
+        assert post.call_count == 3
+    assert cache.get_cache_stats()["entries"] == 0
+
+    with patch.object(LLMTransport, "post_json", return_value=good) as post:
+        assert unit_generator._call_llm("prompt", config) == {"hint": "Use GROUP BY"}
+        assert unit_generator._call_llm("prompt", config) == {"hint": "Use GROUP BY"}
+        assert post.call_count == 1
+
+
+def test_cache_cli_reports_llm_hit_rate() -> None:
+    cache = get_llm_cache()
+    key = cache.make_key("qwen2.5:3b", "prompt")
+    cache.get(key)
+    cache.put(key, "response", model="qwen2.5:3b")
+    cache.get(key)
+    cache.get(key)
+
+    result = CliRunner().invoke(cli.app, ["cache", "stats"])
+    assert result.exit_code == 0, result.output
+    assert "LLM Response Cache" in result.output
+    assert "qwen2.5:3b: 1" in result.output
+    assert "Hit rate: 66.7%" in result.output
@@ -0,0 +1,163 @@
+"""Tests for the shared keep-alive LLM transport."""
+
+from __future__ import annotations
+
+import json
+import threading
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from algl_pdf_helper.generation_pipeline import MultiPassGenerator, list_available_models
+from algl_pdf_helper.llm_transport import LLMTransport, get_transport, transport_stats
+from algl_pdf_helper.ollama_repair import OllamaRepair
+from algl_pdf_helper.unit_generator import GenerationConfig, UnitGenerator
+
+
+class FakeOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+    connections: set[tuple] = set()
+    requests: list[str] = []
+
+    def do_GET(self) -> None:
+        self._reply(200, {"models": [{"name": "qwen2.5:3b"}, {"name": "glm-ocr:latest"}]})
+
+    def do_POST(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if payload.get("model") == "missing":
+            self._reply(404, {"error": "model not found"})
+        elif self.path == "/api/chat":
+            self._reply(200, {"message": {"content": '{"echo": "%s"}' % payload["messages"][-1]["content"]}})
+        else:
+            self._reply(200, {"response": payload["prompt"].upper()})
+
+    def _reply(self, status: int, body: dict) -> None:
+        type(self).connections.add(self.client_address)
+        type(self).requests.append(f"{self.command} {self.path}")
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url():
+    FakeOllama.connections = set()
+    FakeOllama.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllama)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_connections(server_url: str) -> None:
+    transport = get_transport(server_url + "/")
+    assert transport is get_transport(server_url)
+
+    for i in range(5):
+        result = transport.post_json("/api/generate", {"prompt": f"p{i}"}, timeout=5)
+        assert result == {"response": f"P{i}"}
+
+    stats = transport.stats()
+    assert len(FakeOllama.connections) == 1
+    assert stats["requests"] == 5
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 4
+    assert stats["endpoints"]["/api/generate"]["requests"] == 5
+    assert transport_stats()[server_url]["requests"] == 5
+
+
+def test_concurrent_requests_use_separate_connections(server_url: str) -> None:
+    transport = get_transport(server_url)
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(
+            lambda i: transport.post_json("/api/generate", {"prompt": f"p{i}"}, timeout=5),
+            range(40),
+        ))
+    assert [r["response"] for r in results] == [f"P{i}" for i in range(40)]
+    assert transport.stats()["connections_opened"] <= 4
+
+
+def test_probe_is_cached_and_shared(server_url: str) -> None:
+    repair = OllamaRepair(model="qwen2.5:3b", host=server_url)
+    assert repair.available
+    assert repair._list_available_models() == ["qwen2.5:3b", "glm-ocr:latest"]
+    assert [m["name"] for m in list_available_models(server_url)] == repair._list_available_models()
+    assert FakeOllama.requests.count("GET /api/tags") == 1
+
+    transport = get_transport(server_url)
+    assert transport.stats()["probe_hits"] >= 2
+    transport.list_models(refresh=True)
+    assert FakeOllama.requests.count("GET /api/tags") == 2
+
+
+def test_unreachable_server_is_cached_as_unavailable(server_url: str) -> None:
+    transport = LLMTransport("http://127.0.0.1:9", probe_ttl=60)
+    assert transport.is_available(timeout=1) is False
+    assert transport.list_models() == []
+    assert transport.stats()["probe_misses"] == 1
+    with pytest.raises(urllib.error.URLError):
+        transport.get_json("/api/tags", timeout=1)
+
+
+def test_http_errors_raise_http_error(server_url: str) -> None:
+    transport = get_transport(server_url)
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        transport.post_json("/api/generate", {"model": "missing", "prompt": "x"}, timeout=5)
+    assert excinfo.value.code == 404
+    assert json.loads(excinfo.value.read()) == {"error": "model not found"}
+    assert transport.stats()["errors"] == 1
+    # The connection is still usable after an error response
+    assert transport.post_json("/api/generate", {"prompt": "ok"}, timeout=5) == {"response": "OK"}
+    assert len(FakeOllama.connections) == 1
+
+
+def test_unit_generator_reuses_generator_and_connection(monkeypatch, server_url: str) -> None:
+    monkeypatch.setenv("OLLAMA_HOST", server_url)
+    generator = UnitGenerator()
+    config = GenerationConfig(llm_provider="ollama", model_name="qwen2.5:3b")
+    assert generator._call_llm("first", config) == {"echo": "first"}
+    assert generator._call_llm("second", config) == {"echo": "second"}
+
+    assert len(generator._llm_generators) == 1
+    assert isinstance(next(iter(generator._llm_generators.values())), MultiPassGenerator)
+    assert len(FakeOllama.connections) == 1
+
+
+@pytest.mark.parametrize("host, expected", [
+    ("localhost:11434", "http://localhost:11434"),
+    ("127.0.0.1:8080/", "http://127.0.0.1:8080"),
+    ("example.com", "http://example.com:11434"),
+    (":11434", "http://127.0.0.1:11434"),
+    ("https://ollama.example.com/", "https://ollama.example.com"),
+])
+def test_host_without_scheme_is_normalized(host: str, expected: str) -> None:
+    from algl_pdf_helper.llm_transport import normalize_base_url
+
+    assert normalize_base_url(host) == expected
+    assert LLMTransport(host).base_url == expected
+
+
+def test_scheme_less_ollama_host_reaches_server(monkeypatch, server_url: str) -> None:
+    monkeypatch.setenv("OLLAMA_HOST", server_url.removeprefix("http://"))
+    transport = get_transport()
+    assert transport.base_url == server_url
+    assert transport.is_available(timeout=5)
+
+
+def test_preflight_reports_probe_error(monkeypatch) -> None:
+    transport = LLMTransport("http://127.0.0.1:9", probe_ttl=60)
+    monkeypatch.setattr("algl_pdf_helper.ollama_repair.get_transport", lambda host: transport)
+    ok, message = OllamaRepair.run_preflight_check()
+    assert not ok
+    assert message.startswith("Ollama not reachable at http://localhost:11434: ")
+    assert transport.probe_error and transport.probe_error in message
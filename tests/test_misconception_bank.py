@@ -17,3 +17,114 @@ class TestMisconceptionBankPrereqValidation:
             if pattern.likely_prereq_failure:
                 assert ontology.validate_concept_id(pattern.likely_prereq_failure), \
                     f"Invalid prereq reference: {pattern.likely_prereq_failure} in {pattern.pattern_id}"
+
+
+class TestCompiledMisconceptionDetector:
+    """Tests for precompiled, keyword-prefiltered misconception detection."""
+
+    @staticmethod
+    def _scan(patterns, sql, concept_id=None):
+        """Reference result: run every pattern's regex, as the bank used to."""
+        import re
+
+        matches = []
+        for pattern in patterns:
+            if concept_id and pattern.concept_id != concept_id:
+                continue
+            try:
+                regex = re.compile(pattern.sql_pattern, re.IGNORECASE | re.MULTILINE)
+            except re.error:
+                continue
+            if regex.search(sql):
+                matches.append(pattern)
+        matches.sort(key=lambda p: p.remediation_order)
+        return [p.pattern_id for p in matches]
+
+    def test_required_literals_skip_optional_parts(self):
+        from algl_pdf_helper.misconception_bank import required_literals
+
+        assert required_literals(r"SELECT\s+\w+\s+\w+\s+FROM") == ("select", "from")
+        assert required_literals(r"HAVING\b(?!.*GROUP\s+BY)") == ("having",)
+        assert required_literals(r"(!=|<>)\s*NULL\b") == ("null",)
+        assert required_literals(r"(?:ORDER\s+BY)+ x?yz") == ("order", "by", " ", "yz")
+        assert required_literals(r"INSERT|UPDATE") == ()
+        assert required_literals(r"(") == ()
+
+    def test_matches_full_scan_for_every_concept(self):
+        from algl_pdf_helper.misconception_bank import COMMON_MISCONCEPTIONS, MisconceptionBank
+
+        bank = MisconceptionBank.load_default()
+        submissions = [
+            sql
+            for pattern in COMMON_MISCONCEPTIONS
+            for sql in (pattern.example_bad_sql, pattern.example_good_sql)
+        ] + ["ſelect a b from t", "select\na\nb\nfrom t;", ""]
+        concepts = [None, "nope", *sorted({p.concept_id for p in COMMON_MISCONCEPTIONS})]
+        for sql in submissions:
+            for concept_id in concepts:
+                found = [p.pattern_id for p in bank.detect_in_student_code(sql, concept_id)]
+                assert found == self._scan(COMMON_MISCONCEPTIONS, sql, concept_id), (sql, concept_id)
+
+    def test_non_ascii_input_bypasses_prefilter(self):
+        from algl_pdf_helper.misconception_bank import detect_misconceptions
+
+        # IGNORECASE matches "ſ" (long s) against "S"; str.lower() does not
+        found = [p.pattern_id for p in detect_misconceptions("ſelect a b from t", "select-basic")]
+        assert "missing_comma_select_v1" in found
+
+    def test_detect_many(self):
+        from algl_pdf_helper.misconception_bank import MisconceptionBank
+
+        bank = MisconceptionBank.load_default()
+        sqls = ["SELECT a b FROM t", "SELECT * FROM t WHERE x = NULL", "SELECT a b FROM t"]
+        results = bank.detect_many(sqls)
+        assert results == [bank.detect_in_student_code(sql) for sql in sqls]
+        results[0].clear()
+        assert results[2]
+
+        per_concept = bank.detect_many(sqls[:2], ["select-basic", "where-clause"])
+        assert per_concept[1] and per_concept == [
+            bank.detect_in_student_code(sqls[0], "select-basic"),
+            bank.detect_in_student_code(sqls[1], "where-clause"),
+        ]
+        with pytest.raises(ValueError):
+            bank.detect_many(sqls, ["select-basic"])
+
+    def test_invalid_regex_and_added_patterns(self):
+        from algl_pdf_helper.misconception_bank import MisconceptionBank, MisconceptionPattern
+
+        def pattern(pattern_id, sql_pattern, order=1):
+            return MisconceptionPattern(
+                pattern_id=pattern_id, error_subtype_id=pattern_id, concept_id="c",
+                pattern_name=pattern_id, learner_symptom="", likely_prereq_failure=None,
+                sql_pattern=sql_pattern, remediation_order=order,
+            )
+
+        bank = MisconceptionBank([pattern("broken", r"FROM\s+(\w+"), pattern("late", "FROM", 2)])
+        assert bank.get_pattern("broken").get_compiled_regex() is None
+        assert [p.pattern_id for p in bank.detect_in_student_code("select x from t")] == ["late"]
+
+        bank.add_pattern(pattern("early", r"SELECT\s+x"))
+        assert [p.pattern_id for p in bank.detect_in_student_code("select x from t", "c")] == ["early", "late"]
+
+    def test_default_bank_is_shared(self):
+        from algl_pdf_helper.misconception_bank import get_default_misconception_bank
+
+        assert get_default_misconception_bank() is get_default_misconception_bank()
+
+    @pytest.mark.parametrize("loaded", [False, True])
+    def test_bank_compiles_detector_once(self, monkeypatch, loaded):
+        from algl_pdf_helper import misconception_bank
+        from algl_pdf_helper.misconception_bank import MisconceptionBank
+
+        built = []
+
+        class CountingDetector(misconception_bank.CompiledMisconceptionDetector):
+            def __init__(self, patterns):
+                built.append(len(patterns))
+                super().__init__(patterns)
+
+        monkeypatch.setattr(misconception_bank, "CompiledMisconceptionDetector", CountingDetector)
+        bank = MisconceptionBank.load_default() if loaded else MisconceptionBank()
+        assert built == [len(misconception_bank.COMMON_MISCONCEPTIONS) if loaded else 0]
+        assert bool(bank.detect_in_student_code("SELECT a b FROM t")) == loaded
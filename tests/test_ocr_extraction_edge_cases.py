@@ -27,6 +27,9 @@ from algl_pdf_helper.extract import (
     extract_pages_fitz,
     extract_pages_with_page_map,
     extract_with_strategy,
+    maybe_ocr_pdf,
+    cleanup_temp_pdf,
+    select_pages_for_ocr,
 )
 from algl_pdf_helper.clean import (
     normalize_text,
@@ -907,6 +910,149 @@ class TestExtractionStrategies:
             temp_path.unlink(missing_ok=True)
 
 
+# =============================================================================
+# 13. Page-Level OCR Tests
+# =============================================================================
+
+def _build_mixed_pdf(path: Path, scanned: set[int], pages: int = 6) -> None:
+    """Digital text pages plus image-only "scanned" pages (1-based numbers)."""
+    import io
+
+    import fitz
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.new("RGB", (400, 500), (240, 240, 240)).save(buf, format="JPEG")
+    doc = fitz.open()
+    for page_num in range(1, pages + 1):
+        page = doc.new_page()
+        if page_num in scanned:
+            page.insert_image(fitz.Rect(72, 72, 472, 572), stream=buf.getvalue())
+        else:
+            for line in range(8):
+                page.insert_text(
+                    (72, 72 + line * 16),
+                    f"Page {page_num}: the WHERE clause filters rows before grouping.",
+                    fontsize=10,
+                )
+    doc.save(str(path))
+    doc.close()
+
+
+class _FakeOcrmypdf:
+    """Stands in for ocrmypdf: writes a text layer naming each input page."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+        self.options: list[dict[str, Any]] = []
+
+    def ocr(self, input_file: str, output_file: str, **kwargs: Any) -> None:
+        import fitz
+
+        with fitz.open(input_file) as doc:
+            self.calls.append(doc.page_count)
+            self.options.append(kwargs)
+            for i, page in enumerate(doc):
+                page.insert_text((72, 700), f"OCR text of sub-document page {i + 1} " * 3, fontsize=8)
+            doc.save(output_file)
+
+
+class TestPageLevelOcr:
+    """OCR only the pages without usable text and keep page numbers stable."""
+
+    def test_select_pages_for_ocr(self) -> None:
+        pages = [
+            (1, PERFECT_DIGITAL_TEXT),
+            (2, ""),
+            (3, "Chapter 3"),
+            (4, VERY_POOR_SCAN_TEXT),
+            (5, SQL_CODE_SAMPLES[1] * 3),
+        ]
+
+        assert select_pages_for_ocr(pages) == [2, 3, 4]
+
+    def test_only_failing_pages_are_ocred(self, tmp_path: Path, monkeypatch) -> None:
+        import sys
+
+        pdf_path = tmp_path / "mixed.pdf"
+        _build_mixed_pdf(pdf_path, scanned={2, 5})
+        fake = _FakeOcrmypdf()
+        monkeypatch.setitem(sys.modules, "ocrmypdf", fake)
+
+        out_path, did_ocr = maybe_ocr_pdf(pdf_path, force=False, auto=True, ocr_mode="pages")
+        try:
+            assert did_ocr and out_path != pdf_path
+            assert fake.calls == [2]
+            before = extract_pages_fitz(pdf_path)
+            after = extract_pages_fitz(out_path)
+            assert [n for n, _ in after] == [1, 2, 3, 4, 5, 6]
+            for (page_num, old), (_, new) in zip(before, after):
+                if page_num == 2:
+                    assert "sub-document page 1" in new
+                elif page_num == 5:
+                    assert "sub-document page 2" in new
+                else:
+                    assert new == old
+        finally:
+            cleanup_temp_pdf(out_path)
+
+    def test_no_ocr_when_every_page_has_text(self, tmp_path: Path, monkeypatch) -> None:
+        import sys
+
+        pdf_path = tmp_path / "digital.pdf"
+        _build_mixed_pdf(pdf_path, scanned=set())
+        fake = _FakeOcrmypdf()
+        monkeypatch.setitem(sys.modules, "ocrmypdf", fake)
+
+        assert maybe_ocr_pdf(pdf_path, force=True, auto=True, ocr_mode="pages") == (pdf_path, False)
+        assert fake.calls == []
+
+    def test_whole_document_ocr_uses_shared_options(self, tmp_path: Path, monkeypatch) -> None:
+        import sys
+
+        from algl_pdf_helper.extract import OCRMYPDF_OPTIONS, ocr_pdf_with_validation
+
+        pdf_path = tmp_path / "scanned.pdf"
+        _build_mixed_pdf(pdf_path, scanned={1, 2, 3, 4, 5, 6})
+        fake = _FakeOcrmypdf()
+        monkeypatch.setitem(sys.modules, "ocrmypdf", fake)
+
+        out_path, _ = ocr_pdf_with_validation(pdf_path, min_coverage=0.0, smart_skip_threshold=1.1)
+        try:
+            assert fake.calls == [6]
+            assert fake.options == [{"progress_bar": False, **OCRMYPDF_OPTIONS}]
+        finally:
+            cleanup_temp_pdf(out_path)
+
+    def test_outline_and_links_survive_page_ocr(self, tmp_path: Path, monkeypatch) -> None:
+        import sys
+
+        import fitz
+
+        from algl_pdf_helper.extract import ocr_pdf_pages
+
+        pdf_path = tmp_path / "outlined.pdf"
+        _build_mixed_pdf(pdf_path, scanned={2}, pages=4)
+        with fitz.open(pdf_path) as doc:
+            doc.set_toc([[1, "A", 1], [1, "B", 2], [2, "B.1", 2], [1, "C", 3], [1, "D", 4]])
+            doc[0].insert_link({"kind": fitz.LINK_GOTO, "from": fitz.Rect(72, 60, 200, 80),
+                                "page": 1, "to": fitz.Point(0, 0)})
+            doc[1].insert_link({"kind": fitz.LINK_GOTO, "from": fitz.Rect(72, 60, 200, 80),
+                                "page": 3, "to": fitz.Point(0, 0)})
+            doc.saveIncr()
+        monkeypatch.setitem(sys.modules, "ocrmypdf", _FakeOcrmypdf())
+
+        out_path = tmp_path / "out.pdf"
+        ocr_pdf_pages(pdf_path, out_path, [2])
+        with fitz.open(pdf_path) as before, fitz.open(out_path) as after:
+            assert after.page_count == before.page_count == 4
+            assert after.get_toc() == before.get_toc()
+            assert [
+                [(link["page"], tuple(link["from"])) for link in page.get_links()]
+                for page in after
+            ] == [[(1, (72, 60, 200, 80))], [(3, (72, 60, 200, 80))], [], []]
+
+
 # =============================================================================
 # Summary and Helper Functions
 # =============================================================================
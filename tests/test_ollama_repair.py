@@ -16,6 +16,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from algl_pdf_helper.llm_transport import LLMTransport
 from algl_pdf_helper.ollama_repair import (
     OllamaRepair,
     RepairResult,
@@ -95,23 +96,17 @@ class TestOllamaRepairAvailability:
         """Test availability when Ollama is running."""
         mock_response = {"models": [{"name": "qwen3.5:9b"}]}
         
-        with patch('urllib.request.urlopen') as mock_urlopen:
-            mock_cm = Mock()
-            mock_cm.__enter__ = Mock(return_value=Mock(
-                status=200,
-                read=Mock(return_value=json.dumps(mock_response).encode())
-            ))
-            mock_cm.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_cm
+        with patch.object(LLMTransport, "_send") as mock_send:
+            mock_send.return_value = (200, "OK", json.dumps(mock_response).encode())
             
             repair = OllamaRepair()
             assert repair.available is True
     
     def test_not_available_when_ollama_down(self):
         """Test availability when Ollama is not running."""
-        with patch('urllib.request.urlopen') as mock_urlopen:
+        with patch.object(LLMTransport, "_send") as mock_send:
             from urllib.error import URLError
-            mock_urlopen.side_effect = URLError("Connection refused")
+            mock_send.side_effect = URLError("Connection refused")
             
             repair = OllamaRepair()
             assert repair.available is False
@@ -0,0 +1,155 @@
+"""Tests for the shared single-open PdfSession."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from pathlib import Path
+
+import fitz
+import pytest
+
+from algl_pdf_helper import pdf_session
+from algl_pdf_helper.extract import extract_pages_fitz, maybe_ocr_pdf
+from algl_pdf_helper.pdf_session import PdfSession, body_font_size, summarize_page_dict
+from algl_pdf_helper.section_extractor import SectionExtractor
+from algl_pdf_helper.structure_extractor import StructureExtractor
+
+
+@pytest.fixture
+def sample_pdf(tmp_path: Path) -> Path:
+    pdf_path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    for i in range(1, 6):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Chapter {i} Selecting Data", fontsize=20)
+        body = (
+            "The SELECT statement retrieves rows from one or more tables. "
+            "Use WHERE to filter the rows that are returned. "
+        )
+        y = 120
+        for _ in range(8):
+            page.insert_text((72, y), body[:90], fontsize=11)
+            y += 16
+    doc.save(str(pdf_path))
+    doc.close()
+    return pdf_path
+
+
+def test_session_matches_standalone_extraction(sample_pdf: Path) -> None:
+    standalone_pages = extract_pages_fitz(sample_pdf)
+    standalone_blocks = SectionExtractor().extract_blocks(sample_pdf, "book")
+    standalone_headings = StructureExtractor().extract_headings(sample_pdf)
+
+    with PdfSession(sample_pdf) as session:
+        assert extract_pages_fitz(sample_pdf, session=session) == standalone_pages
+        blocks = SectionExtractor().extract_blocks(sample_pdf, "book", session=session)
+        headings = StructureExtractor().extract_headings(sample_pdf, session=session)
+
+    assert [b.to_dict() for b in blocks] == [b.to_dict() for b in standalone_blocks]
+    assert headings == standalone_headings
+
+
+def test_each_page_decoded_at_most_once(sample_pdf: Path) -> None:
+    with PdfSession(sample_pdf) as session:
+        maybe_ocr_pdf(sample_pdf, force=False, auto=True, session=session)
+        extract_pages_fitz(sample_pdf, session=session)
+        extract_pages_fitz(sample_pdf, (2, 3), session=session)
+        SectionExtractor().extract_blocks(sample_pdf, "book", session=session)
+        StructureExtractor().extract_headings(sample_pdf, session=session)
+
+        assert session.decode_counts["text"] == 5
+        assert session.decode_counts["dict"] == 5
+        assert len(session.sha256) == 64
+
+
+def test_layout_dict_cache_is_bounded(sample_pdf: Path) -> None:
+    with PdfSession(sample_pdf, dict_cache_pages=2) as session:
+        first = session.page_dict(0)
+        session.page_dict(1)
+        assert session.page_dict(0) is first
+        session.page_dict(2)  # evicts page 1, the least recently used
+
+        assert list(session._dicts) == [0, 2]
+        assert session.page_spans(0) == summarize_page_dict(first)
+        session.page_dict(1)
+        assert session.decode_counts["dict"] == 4
+
+        # Span summaries and text outlive the dicts they were built from
+        spans = session.load_page_spans(range(5))
+        assert spans == [summarize_page_dict(session.page_dict(i)) for i in range(5)]
+        assert len(session._dicts) == 2
+
+    with pytest.raises(ValueError):
+        PdfSession(sample_pdf, dict_cache_pages=0)
+
+
+def test_session_page_range_validation(sample_pdf: Path) -> None:
+    with PdfSession(sample_pdf) as session:
+        assert [p for p, _ in session.extract_pages([4, 2])] == [4, 2]
+        with pytest.raises(ValueError):
+            session.extract_pages((0, 2))
+        with pytest.raises(ValueError):
+            session.extract_pages([9])
+
+
+def test_closed_session_rejects_access(sample_pdf: Path) -> None:
+    session = PdfSession(sample_pdf)
+    session.close()
+    with pytest.raises(RuntimeError):
+        session.page_text(0)
+
+
+def test_missing_file_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        PdfSession(tmp_path / "missing.pdf")
+
+
+def test_body_font_size_matches_list_mode() -> None:
+    rng = random.Random(0)
+    for _ in range(200):
+        sizes = [rng.choice([9.0, 10.0, 10.5, 11.0, 12.0, 14.0, 20.0]) for _ in range(rng.randint(1, 40))]
+        pages = [sizes[i:i + 7] for i in range(0, len(sizes), 7)]
+        counts: Counter[float] = Counter()
+        for page in pages:
+            counts.update(Counter(page))
+        assert body_font_size(counts) == max(set(sizes), key=sizes.count)
+    assert body_font_size(Counter()) is None
+
+
+def test_page_spans_summarize_layout(sample_pdf: Path) -> None:
+    with PdfSession(sample_pdf) as session:
+        spans = session.page_spans(0)
+        assert spans is session.page_spans(0)
+        assert spans == summarize_page_dict(session.page_dict(0))
+        assert spans.lines[0].text == "Chapter 1 Selecting Data"
+        assert spans.lines[0].size > 19 and not spans.lines[0].is_bold
+        assert spans.font_sizes.most_common(1)[0][1] == 8
+        assert session.decode_counts["dict"] == 1
+
+
+def test_parallel_heading_detection_matches_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pdf_path = tmp_path / "sections.pdf"
+    doc = fitz.open()
+    for i in range(1, 6):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"1.{i} Joining Tables", fontsize=16)
+        page.insert_text((72, 100), "Inner And Outer Joins", fontsize=12.5, fontname="hebo")
+        for line in range(8):
+            page.insert_text((72, 130 + 16 * line), "Rows from both tables are combined.", fontsize=11)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    monkeypatch.setattr(pdf_session, "SPAN_SHARD_PAGES", 2)
+    serial = StructureExtractor().extract_headings(pdf_path)
+    with PdfSession(pdf_path) as session:
+        parallel = StructureExtractor(workers=2).extract_headings(pdf_path, session=session)
+        assert session.decode_counts["dict"] == 5
+        assert session._dicts == {}  # only span summaries came back
+    assert parallel == serial
+    assert [(h.level, h.text) for h in serial][:2] == [(2, "1.1 Joining Tables"), (3, "Inner And Outer Joins")]
+
+    with pytest.raises(ValueError):
+        StructureExtractor(workers=0)
@@ -0,0 +1,149 @@
+"""Tests for the pooled practice databases used by SQL validation."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from algl_pdf_helper.learning_quality_gates import LearningQualityGates
+from algl_pdf_helper.practice_db_pool import PracticeDatabasePool, checkout_options, schema_fingerprint
+from algl_pdf_helper.sql_validator import PracticeSchemaManager, SQLValidator
+
+
+def build_numbers() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE numbers (n INTEGER)")
+    conn.executemany("INSERT INTO numbers VALUES (?)", [(i,) for i in range(5)])
+    conn.commit()
+    return conn
+
+
+class FreshSchemaManager(PracticeSchemaManager):
+    """Builds a new database per query, as validation did before pooling."""
+
+    def pooled_database(self, schema=None, *, reuse=True, transaction=True):
+        return closing(self.setup_database(schema))
+
+
+@pytest.fixture
+def pool() -> PracticeDatabasePool:
+    pool = PracticeDatabasePool(max_templates=2, max_idle=2)
+    yield pool
+    pool.clear()
+
+
+def count(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COUNT(*) FROM numbers").fetchone()[0]
+
+
+def test_changes_are_rolled_back_and_copy_reused(pool: PracticeDatabasePool) -> None:
+    with pool.connection("numbers", build_numbers) as conn:
+        conn.execute("INSERT INTO numbers VALUES (99)")
+        conn.execute("DELETE FROM numbers WHERE n < 3")
+        assert count(conn) == 3
+    with pool.connection("numbers", build_numbers) as conn:
+        conn.execute("DROP TABLE numbers")
+    with pool.connection("numbers", build_numbers) as conn:
+        assert count(conn) == 5
+
+    assert pool.stats == {"templates_built": 1, "copies_made": 1, "copies_reused": 2, "copies_discarded": 0}
+
+
+def test_committed_copy_is_discarded(pool: PracticeDatabasePool) -> None:
+    with pool.connection("numbers", build_numbers) as conn:
+        conn.execute("COMMIT")
+        conn.execute("DELETE FROM numbers")
+    with pool.connection("numbers", build_numbers) as conn:
+        assert count(conn) == 5
+    assert pool.stats["copies_discarded"] == 1
+
+
+def test_least_recently_used_template_is_evicted(pool: PracticeDatabasePool) -> None:
+    for key in ("a", "b", "a", "c"):
+        with pool.connection(key, build_numbers):
+            pass
+    assert list(pool._templates) == ["a", "c"]
+    assert pool.stats["templates_built"] == 3
+
+
+def test_schema_fingerprint_is_order_independent() -> None:
+    assert schema_fingerprint({"a": [1], "b": [2]}) == schema_fingerprint({"b": [2], "a": [1]})
+    assert schema_fingerprint({"a": [1]}, "x") != schema_fingerprint({"a": [1]}, "y")
+
+
+def test_concurrent_checkouts(pool: PracticeDatabasePool) -> None:
+    def run(i: int) -> int:
+        with pool.connection("numbers", build_numbers) as conn:
+            conn.execute("INSERT INTO numbers VALUES (?)", (i,))
+            return count(conn)
+
+    with ThreadPoolExecutor(8) as executor:
+        assert set(executor.map(run, range(200))) == {6}
+    assert pool.stats["templates_built"] == 1
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT * FROM users WHERE age > 25;",
+    "SELECT u.name, o.amount FROM users u JOIN orders o ON u.id = o.user_id;",
+    "UPDATE users SET age = age + 1;",
+    "DELETE FROM orders;",
+    "DROP TABLE users;",
+    "SELECT no_such_column FROM users;",
+    "SELECT * FROM missing_table;",
+    "PRAGMA foreign_keys = OFF;",
+    "BEGIN TRANSACTION;",
+    "COMMIT;",
+    "ROLLBACK;",
+    "SAVEPOINT sp;",
+    "RELEASE sp;",
+    "VACUUM;",
+    "ATTACH DATABASE ':memory:' AS other;",
+    "DETACH DATABASE other;",
+    "  -- transactions\n  BEGIN;",
+])
+def test_validator_matches_fresh_database(sql: str) -> None:
+    fresh = SQLValidator(schema_manager=FreshSchemaManager())
+    pooled = SQLValidator()
+    for _ in range(2):  # second round runs on reused copies
+        expected = fresh._validate_execution(sql, fresh.schema_manager.schemas)
+        actual = pooled._validate_execution(sql, pooled.schema_manager.schemas)
+        assert actual[0] == expected[0]
+        assert [e.message for e in actual[1]] == [e.message for e in expected[1]]
+        assert actual[2] == expected[2]
+
+
+def test_quality_gate_uses_schema_and_reports_errors() -> None:
+    gates = LearningQualityGates()
+    schema = {"users": {"columns": [("id", "INTEGER"), ("name", "TEXT")]}}
+
+    assert gates.validate_sql_executable("DELETE FROM users;", schema).passed
+    assert gates.validate_sql_executable("SELECT id, name FROM users;", schema).passed
+    failed = gates.validate_sql_executable("SELECT email FROM users;", schema)
+    assert not failed.passed
+    assert "no such column" in failed.message
+
+
+def test_checkout_options() -> None:
+    wrapped = {"reuse": True, "transaction": True}
+    unwrapped = {"reuse": False, "transaction": False}
+    assert checkout_options("SELECT 1") == wrapped
+    assert checkout_options("  begin transaction;") == unwrapped
+    assert checkout_options("\n  PRAGMA foreign_keys = OFF") == unwrapped
+    assert checkout_options("/* setup */ VACUUM") == unwrapped
+    assert checkout_options("-- end of chapter\nSELECT 1") == wrapped
+
+
+def test_unwrapped_statement_copy_is_not_reused(pool: PracticeDatabasePool) -> None:
+    with pool.connection("numbers", build_numbers, **checkout_options("BEGIN")) as conn:
+        conn.execute("BEGIN")
+        conn.execute("DELETE FROM numbers")
+    with pool.connection("numbers", build_numbers, **checkout_options("VACUUM")) as conn:
+        conn.execute("VACUUM")
+    with pool.connection("numbers", build_numbers) as conn:
+        assert count(conn) == 5
+    assert pool.stats["copies_discarded"] == 2
+    assert pool.stats["copies_reused"] == 0
+
@@ -17,6 +17,7 @@ from algl_pdf_helper.preflight import (
     calculate_text_coverage,
     determine_strategy,
     run_preflight,
+    scan_table_candidates,
 )
 from algl_pdf_helper.quality_metrics import QualityThresholds
 
@@ -692,3 +693,44 @@ class TestTablesAndFiguresDetection:
         
         # Should detect at least one figure
         assert len(figures) >= 1
+
+
+def _build_table_scan_doc():
+    """Pages: prose, aligned columns without rules, a header rule, a grid table."""
+    import fitz
+    
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Plain prose about joins.", fontsize=10)
+    page = doc.new_page()
+    for row in range(4):
+        for col in range(3):
+            page.insert_text((72 + col * 120, 72 + row * 20), f"r{row}c{col}", fontsize=10)
+    page = doc.new_page()
+    page.insert_text((72, 72), "Chapter 2", fontsize=18)
+    page.draw_line((72, 80), (540, 80))
+    page = doc.new_page()
+    for row in range(4):
+        page.draw_line((70, 60 + row * 20), (430, 60 + row * 20))
+        for col in range(3):
+            page.insert_text((75 + col * 120, 75 + row * 20), f"r{row}c{col}", fontsize=10)
+    for col in range(4):
+        page.draw_line((70 + col * 120, 60), (70 + col * 120, 120))
+    return doc
+
+
+class TestTableCandidateScan:
+    """Tests for the per-page table candidate scan."""
+    
+    def test_modes(self):
+        doc = _build_table_scan_doc()
+        
+        assert scan_table_candidates(doc, "all") == [0, 1, 2, 3]
+        assert scan_table_candidates(doc, "recall") == [2, 3]
+        assert scan_table_candidates(doc, "speed") == [3]
+    
+    def test_recall_keeps_every_page_find_tables_finds(self):
+        doc = _build_table_scan_doc()
+        found = [i for i, page in enumerate(doc) if page.find_tables().tables]
+        
+        assert found == [3]
+        assert set(found) <= set(scan_table_candidates(doc, "recall"))
@@ -18,6 +18,7 @@ from __future__ import annotations
 import csv
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -40,6 +41,7 @@ from algl_pdf_helper.policies import (
     get_default_policies,
     get_policy_by_id,
     compute_learner_state,
+    LearnerStateAccumulator,
     FAST_ESCALATOR,
     SLOW_ESCALATOR,
     ADAPTIVE_ESCALATOR,
@@ -58,6 +60,7 @@ from algl_pdf_helper.replay_metrics import (
     SimulatedCoverageScoreMetric,
     TimeToSuccessMetric,
     RQSMetric,
+    MetricsAggregate,
     compute_all_metrics,
 )
 from algl_pdf_helper.replay import (
@@ -258,6 +261,44 @@ class TestPolicies:
         assert state.total_errors == 1
         assert state.consecutive_errors == 1
 
+    def test_accumulator_matches_compute_learner_state(self):
+        """Test incremental learner state equals a full rescan at every event."""
+        trace = make_synthetic_trace("acc_test", "test", num_problems=12, error_rate=0.7)
+        trace.events[3].event_type = EventType.EXPLANATION_SHOWN.value
+        trace.events[5].event_type = EventType.HINT_SHOWN.value
+        trace.events[6].time_stuck = 45.0
+        flags = {"enforce_prerequisites": True}
+
+        accumulator = LearnerStateAccumulator(flags)
+        states = [accumulator.advance(event) for event in trace.events]
+
+        for i, state in enumerate(states):
+            assert state == compute_learner_state(trace.events, i, flags)
+
+    def test_accumulator_states_share_error_history(self):
+        """Test states keep their own error history and concepts without copying them."""
+        trace = make_synthetic_trace("hist_test", "test", num_problems=6, error_rate=0.9)
+        accumulator = LearnerStateAccumulator()
+        states = [accumulator.advance(event) for event in trace.events]
+
+        expected: list[str] = []
+        concepts: set[str] = set()
+        for event, state in zip(trace.events, states):
+            if event.error_subtype:
+                expected.append(event.error_subtype)
+            if event.concept_id:
+                concepts.add(event.concept_id)
+            assert state.concepts_attempted == concepts
+            assert set(state.concepts_attempted) == concepts
+            assert len(state.concepts_attempted) == len(concepts)
+            assert state.error_subtypes_seen == expected
+            assert list(state.error_subtypes_seen) == expected
+            assert state.error_subtypes_seen[-3:] == expected[-3:]
+        assert len(expected) > 3
+        assert states[-1].error_subtypes_seen[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            states[0].error_subtypes_seen[len(states[0].error_subtypes_seen)]
+
 
 # =============================================================================
 # Experiment Flags Tests
@@ -497,6 +538,109 @@ class TestReplayIntegration:
         assert policy_ids == {"fast_escalator", "slow_escalator", "adaptive_escalator"}
 
 
+class TestStreamingReplay:
+    """Test parallel replay and streamed artifact export."""
+
+    @staticmethod
+    def _make_cohort(trace_dir: Path, count: int) -> None:
+        trace_dir.mkdir()
+        for i in range(count):
+            trace = make_synthetic_trace(f"cohort_{i:02d}", "test", num_problems=2 + i % 4, error_rate=0.6)
+            save_trace(trace, trace_dir / f"cohort_{i:02d}.json")
+
+    @staticmethod
+    def _read_artifacts(artifacts: dict[str, Path]) -> dict[str, Any]:
+        """Artifact contents without wall-clock timestamps."""
+        contents: dict[str, Any] = {}
+        for name, path in artifacts.items():
+            if path.suffix == ".json":
+                data = json.loads(path.read_text(encoding="utf-8"))
+                data.pop("generated_at")
+            elif path.suffix == ".jsonl":
+                data = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+            else:
+                with open(path, newline="", encoding="utf-8") as f:
+                    data = list(csv.DictReader(f))
+                for row in data:
+                    row.pop("replay_started", None)
+                    row.pop("replay_completed", None)
+            contents[name] = data
+        return contents
+
+    def test_parallel_replay_matches_serial(self, tmp_path: Path, monkeypatch):
+        """Test artifacts are identical for any number of workers."""
+        from algl_pdf_helper import replay
+
+        monkeypatch.setattr(replay, "REPLAY_SHARD_SIZE", 2)
+        trace_dir = tmp_path / "traces"
+        self._make_cohort(trace_dir, 7)
+        (trace_dir / "broken.json").write_text("{not json", encoding="utf-8")
+
+        serial = run_replay(trace_dir, tmp_path / "serial", run_id="r", export_decisions=True)
+        parallel = run_replay(trace_dir, tmp_path / "parallel", run_id="r", workers=3, export_decisions=True)
+
+        assert len(serial) == 6
+        assert self._read_artifacts(serial) == self._read_artifacts(parallel)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_no_valid_traces_writes_nothing(self, tmp_path: Path, workers: int):
+        """Test a directory of invalid traces fails before any artifact exists."""
+        trace_dir = tmp_path / "traces"
+        trace_dir.mkdir()
+        (trace_dir / "a.json").write_text("{not json", encoding="utf-8")
+        (trace_dir / "b.json").write_text("", encoding="utf-8")
+        out_dir = tmp_path / "out"
+
+        with pytest.raises(ValueError, match="No traces found"):
+            run_replay(trace_dir, out_dir, workers=workers)
+
+        assert not out_dir.exists() or not any(out_dir.iterdir())
+
+    def test_streamed_export_matches_engine_export(self, tmp_path: Path):
+        """Test run_replay writes what ReplayEngine.export_results writes."""
+        trace_dir = tmp_path / "traces"
+        self._make_cohort(trace_dir, 3)
+        streamed = run_replay(trace_dir, tmp_path / "streamed", run_id="r")
+
+        engine = ReplayEngine()
+        for path in sorted(trace_dir.glob("*.json")):
+            engine.replay_trace(load_trace(path))
+        exported = engine.export_results(tmp_path / "engine", run_id="r")
+
+        assert self._read_artifacts(streamed) == self._read_artifacts(exported)
+
+    def test_decision_points_are_streamed(self, tmp_path: Path):
+        """Test every decision point lands in the JSONL and CSV files."""
+        trace = make_synthetic_trace("dp_test", "test", num_problems=4, error_rate=0.8)
+        trace_file = tmp_path / "trace.json"
+        save_trace(trace, trace_file)
+
+        artifacts = run_replay(trace_file, tmp_path / "out", run_id="dp", export_decisions=True)
+        expected = sum(len(r.decision_points) for r in ReplayEngine().replay_trace(trace))
+
+        lines = artifacts["decision_points_jsonl"].read_text(encoding="utf-8").splitlines()
+        assert len(lines) == expected > 0
+        first = json.loads(lines[0])
+        assert first["run_id"] == "dp"
+        assert first["trace_id"] == "dp_test"
+        with open(artifacts["decision_points_csv"], newline="", encoding="utf-8") as f:
+            assert len(list(csv.DictReader(f))) == expected
+
+    def test_metrics_aggregate(self):
+        """Test streaming metric averages."""
+        trace = make_synthetic_trace("agg_test", "test", num_problems=3, error_rate=0.5)
+        metrics = compute_all_metrics(trace)
+        aggregate = MetricsAggregate()
+        aggregate.add(metrics)
+        aggregate.add(metrics)
+        aggregate.add(None)
+
+        assert aggregate.results == 3
+        assert aggregate.mean("hdi") == pytest.approx(metrics.hdi.value)
+        assert aggregate.mean("hdi", over_results=True) == pytest.approx(metrics.hdi.value * 2 / 3)
+        assert MetricsAggregate().mean("csi") == 0.0
+
+
 # =============================================================================
 # Fixture Tests
 # =============================================================================
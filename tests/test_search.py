@@ -0,0 +1,190 @@
+"""Tests for the top-k chunk search index."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from algl_pdf_helper.binary_index import write_binary_index
+from algl_pdf_helper.cli import app
+from algl_pdf_helper.embedding import build_hash_embedding
+from algl_pdf_helper.metrics import RetrievalSanityMetric, concept_retrieval_queries
+from algl_pdf_helper.models import ConceptInfo, ConceptManifest, ConceptSection, PdfIndexChunk
+from algl_pdf_helper.search import ChunkSearchIndex, parse_page_range
+
+WORDS = "select from where join group having order table index view null key".split()
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = sum(x * x for x in a) ** 0.5
+    norm_b = sum(x * x for x in b) ** 0.5
+    return 0.0 if not norm_a or not norm_b else dot / (norm_a * norm_b)
+
+
+@pytest.fixture
+def chunks() -> list[PdfIndexChunk]:
+    rng = random.Random(0)
+    result = []
+    for i in range(300):
+        doc = "a" if i < 150 else "b"
+        text = " ".join(rng.choices(WORDS, k=8))
+        result.append(
+            PdfIndexChunk(
+                chunkId=f"{doc}:p{i // 3 + 1}:c{i % 3 + 1}",
+                docId=doc,
+                page=i // 3 + 1,
+                text=text,
+                embedding=build_hash_embedding(text, 24),
+            )
+        )
+    return result
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_matches_brute_force_ranking(chunks: list[PdfIndexChunk], dtype) -> None:
+    index = ChunkSearchIndex.from_chunks(chunks, dtype=dtype)
+    rng = random.Random(1)
+    queries = [" ".join(rng.choices(WORDS, k=rng.randint(1, 3))) for _ in range(60)]
+    vectors = [build_hash_embedding(q, 24) for q in queries]
+
+    for top_k in (1, 5, 20):
+        results = index.search(vectors, top_k=top_k)
+        for vector, hits in zip(vectors, results):
+            # Cosine descending, exact ties in chunk order
+            expected = sorted(
+                range(len(chunks)),
+                key=lambda i: (-round(_cosine(vector, chunks[i].embedding), 9), i),
+            )[:top_k]
+            assert [hit.row for hit in hits] == expected
+            assert hits[0].score == pytest.approx(_cosine(vector, chunks[expected[0]].embedding), abs=1e-6)
+
+
+def test_filters(chunks: list[PdfIndexChunk]) -> None:
+    index = ChunkSearchIndex.from_chunks(chunks)
+
+    hits = index.search_text(["join table"], top_k=10, doc_ids=["b"])[0]
+    assert len(hits) == 10
+    assert {hit.docId for hit in hits} == {"b"}
+
+    hits = index.search_text(["join table"], top_k=50, page_range=(10, 12))[0]
+    assert len(hits) == 9
+    assert all(10 <= hit.page <= 12 for hit in hits)
+
+    assert index.search_text(["join"], doc_ids=["missing"]) == [[]]
+
+
+def test_binary_index_matches_json(chunks: list[PdfIndexChunk], tmp_path: Path) -> None:
+    (tmp_path / "chunks.json").write_text(
+        json.dumps([c.model_dump() for c in chunks]), encoding="utf-8"
+    )
+    from_json = ChunkSearchIndex.load(tmp_path)
+    write_binary_index(chunks, tmp_path)
+    from_binary = ChunkSearchIndex.load(tmp_path)
+
+    queries = ["group by having", "null key"]
+    for a, b in zip(from_json.search_text(queries), from_binary.search_text(queries)):
+        assert [(h.chunkId, h.docId, h.page, h.text) for h in a] == [
+            (h.chunkId, h.docId, h.page, h.text) for h in b
+        ]
+
+
+def test_empty_index_and_bad_dimension(chunks: list[PdfIndexChunk]) -> None:
+    assert ChunkSearchIndex.from_chunks([]).search_text(["select"]) == [[]]
+    with pytest.raises(ValueError):
+        ChunkSearchIndex.from_chunks(chunks).search([[1.0, 0.0]])
+
+
+def test_parse_page_range() -> None:
+    assert parse_page_range("7") == (7, 7)
+    assert parse_page_range("10-20") == (10, 20)
+    for bad in ("x", "5-2", "1-"):
+        with pytest.raises(ValueError):
+            parse_page_range(bad)
+
+
+def test_retrieval_metric_accepts_concept_pages(chunks: list[PdfIndexChunk]) -> None:
+    manifest = ConceptManifest(
+        sourceDocId="a",
+        createdAt="2024-01-01T00:00:00Z",
+        conceptCount=2,
+        concepts={
+            "first": ConceptInfo(
+                id="first",
+                title=chunks[0].text,
+                sections={"definition": ConceptSection(pageNumbers=[chunks[0].page])},
+            ),
+            "unpaged": ConceptInfo(id="unpaged", title="No pages"),
+        },
+    )
+    queries = concept_retrieval_queries(manifest)
+    assert queries == [{"query": chunks[0].text, "expected_pages": [1]}]
+
+    metric = RetrievalSanityMetric(test_queries=queries)
+    metric.run_tests(chunks, lambda text: build_hash_embedding(text, 24))
+    assert metric.results[0]["found"]
+    assert metric.results[0]["top_score"] == 1.0
+
+
+def test_search_cli(chunks: list[PdfIndexChunk], tmp_path: Path) -> None:
+    write_binary_index(chunks, tmp_path)
+    result = CliRunner().invoke(
+        app,
+        ["search", str(tmp_path), chunks[4].text, "--top-k", "3", "--pages", "1-5", "--json"],
+    )
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    assert payload[0]["hits"][0]["chunkId"] == chunks[4].chunkId
+    assert len(payload[0]["hits"]) == 3
+
+
+def test_search_endpoint_confines_index_dir(chunks: list[PdfIndexChunk], tmp_path: Path, monkeypatch) -> None:
+    from collections import OrderedDict
+
+    from algl_pdf_helper import server
+
+    root = tmp_path / "indexes"
+    write_binary_index(chunks, root / "book")
+    outside = tmp_path / "private"
+    write_binary_index(chunks, outside)
+    monkeypatch.setenv("ALGL_PDF_INDEX_ROOT", str(root))
+    monkeypatch.setattr(server, "_search_cache", OrderedDict())
+
+    response = server.search_index("book", q=[chunks[4].text], top_k=1, doc_id=None, pages=None)
+    assert response.status_code == 200
+    assert json.loads(response.body)["results"][0]["hits"][0]["chunkId"] == chunks[4].chunkId
+
+    for index_dir in ("../private", str(outside), "book/../../private"):
+        assert server.search_index(index_dir, q=["select"], doc_id=None, pages=None).status_code == 404
+    assert list(server._search_cache) == [(root / "book").resolve()]
+
+
+def test_search_cache_keeps_dropped_indexes_usable(
+    chunks: list[PdfIndexChunk], tmp_path: Path, monkeypatch
+) -> None:
+    from collections import OrderedDict
+
+    from algl_pdf_helper import server
+
+    monkeypatch.setattr(server, "_search_cache", OrderedDict())
+    monkeypatch.setattr(server, "SEARCH_CACHE_SIZE", 1)
+    first, second = tmp_path / "first", tmp_path / "second"
+    write_binary_index(chunks, first)
+    write_binary_index(chunks, second)
+
+    old = server._load_search_index(first, 1)
+    assert server._load_search_index(first, 1) is old
+    rebuilt = server._load_search_index(first, 2)
+    assert rebuilt is not old
+    server._load_search_index(second, 1)
+    assert list(server._search_cache) == [second]
+
+    # A request still holding a replaced or evicted index can finish its search
+    for search in (old, rebuilt):
+        hits = search.search_text([chunks[4].text], top_k=1)[0]
+        assert hits[0].chunkId == chunks[4].chunkId
@@ -0,0 +1,89 @@
+"""Tests for the indexed ConceptOntology queries."""
+
+from collections import deque
+
+import pytest
+
+from algl_pdf_helper import sql_ontology
+from algl_pdf_helper.sql_ontology import PREREQUISITE_DAG, SQL_CONCEPTS, ConceptOntology, get_ontology
+
+
+def _scan_prerequisites(concept_id, hard_only=False):
+    """Reference result: scan every edge, as the ontology used to."""
+    return [
+        e["from"] for e in PREREQUISITE_DAG
+        if e["to"] == concept_id and (not hard_only or e["type"] == "hard_prereq")
+    ]
+
+
+def _scan_learning_path(start, end):
+    """Reference result: the edge-rescanning BFS with copied paths."""
+    if start not in SQL_CONCEPTS or end not in SQL_CONCEPTS:
+        return []
+    if start == end:
+        return [start]
+    queue = deque([(start, [start])])
+    visited = {start}
+    while queue:
+        current, path = queue.popleft()
+        for edge in PREREQUISITE_DAG:
+            if edge["from"] == current:
+                if edge["to"] == end:
+                    return path + [end]
+                if edge["to"] not in visited:
+                    visited.add(edge["to"])
+                    queue.append((edge["to"], path + [edge["to"]]))
+    return []
+
+
+def _scan_all_prerequisites(concept_id, collected):
+    for prereq in _scan_prerequisites(concept_id):
+        if prereq not in collected and prereq in SQL_CONCEPTS:
+            collected.add(prereq)
+            _scan_all_prerequisites(prereq, collected)
+    return collected
+
+
+class TestIndexedOntology:
+    """The adjacency indexes answer exactly what the edge scans did."""
+
+    def test_prerequisites_match_edge_scan(self):
+        ontology = ConceptOntology()
+        for concept_id in [*SQL_CONCEPTS, "unknown-concept"]:
+            assert ontology.get_prerequisites(concept_id) == _scan_prerequisites(concept_id)
+            assert ontology.get_hard_prerequisites(concept_id) == _scan_prerequisites(
+                concept_id, hard_only=True
+            )
+
+    def test_learning_paths_match_bfs(self):
+        ontology = ConceptOntology()
+        ids = [*SQL_CONCEPTS, "unknown-concept"]
+        for start in ids:
+            for end in ids:
+                assert ontology.get_learning_path(start, end) == _scan_learning_path(start, end)
+
+    def test_transitive_prerequisites_are_topologically_ordered(self):
+        ontology = ConceptOntology()
+        order = ontology.get_topological_order()
+        position = {cid: i for i, cid in enumerate(order)}
+        assert set(SQL_CONCEPTS) <= set(order)
+        for edge in PREREQUISITE_DAG:
+            assert position[edge["from"]] < position[edge["to"]]
+        for concept_id in SQL_CONCEPTS:
+            prereqs = ontology.get_all_prerequisites(concept_id)
+            assert set(prereqs) == _scan_all_prerequisites(concept_id, set())
+            assert prereqs == sorted(prereqs, key=position.__getitem__)
+
+    def test_returned_lists_do_not_alias_indexes(self):
+        ontology = ConceptOntology()
+        ontology.get_prerequisites("group-by").append("bogus")
+        assert "bogus" not in ontology.get_prerequisites("group-by")
+
+    def test_cycle_is_rejected(self, monkeypatch):
+        cyclic = PREREQUISITE_DAG + [{"from": "where-clause", "to": "select-basic", "type": "soft_prereq"}]
+        monkeypatch.setattr(sql_ontology, "PREREQUISITE_DAG", cyclic)
+        with pytest.raises(ValueError, match="cycle"):
+            ConceptOntology()
+
+    def test_get_ontology_is_shared(self):
+        assert get_ontology() is get_ontology()
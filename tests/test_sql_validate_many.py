@@ -0,0 +1,136 @@
+"""Tests for batch SQL validation (SQLValidator.validate_many)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+from algl_pdf_helper import sql_validator
+from algl_pdf_helper.instructional_pipeline import InstructionalPipeline, PipelineConfig
+from algl_pdf_helper.sql_validator import SQLValidator
+
+STATEMENTS = [
+    "SELECT * FROM users WHERE age > 25;",
+    "SELECT u.name, o.amount FROM users u JOIN orders o ON u.id = o.user_id;",
+    "  SELECT * FROM users WHERE age > 25;\n",
+    "SELECT no_such_column FROM users;",
+    "SELECT  age  +  1 FROM users;",
+    "",
+    "UPDATE users SET age = age + 1;",
+    "SELECT * FROM users WHERE age > 25;",
+]
+
+
+def test_results_match_validate_in_input_order() -> None:
+    validator = SQLValidator()
+    results = validator.validate_many(STATEMENTS, expected_concept="joins")
+
+    assert len(results) == len(STATEMENTS)
+    for sql, result in zip(STATEMENTS, results):
+        assert result.to_dict() == SQLValidator().validate(sql, "joins").to_dict()
+
+
+def test_duplicates_are_validated_once_and_cached(monkeypatch) -> None:
+    calls: list[str] = []
+    original = SQLValidator.validate
+
+    def counting(self, sql, expected_concept=None, schema=None):
+        calls.append(sql)
+        return original(self, sql, expected_concept, schema)
+
+    monkeypatch.setattr(SQLValidator, "validate", counting)
+    validator = SQLValidator()
+    validator.validate_many(STATEMENTS)
+    assert len(calls) == 6  # the three "age > 25" variants share one result
+    assert validator.cache_stats == {"hits": 0, "misses": 6}
+
+    validator.validate_many(STATEMENTS[:2])
+    assert len(calls) == 6
+    assert validator.cache_stats["hits"] == 2
+
+
+def test_cache_key_includes_concept_and_schema() -> None:
+    validator = SQLValidator()
+    sql = "SELECT * FROM users;"
+    validator.validate_many([sql, sql], expected_concept=["joins", "select-basic"])
+    validator.validate_many([sql], schema={"users": {"columns": [("id", "INTEGER")]}})
+    assert validator.cache_stats == {"hits": 0, "misses": 3}
+
+
+def test_results_are_independent_copies() -> None:
+    validator = SQLValidator()
+    first, second = validator.validate_many(["SELECT * FROM users;"] * 2)
+    first.add_warning("changed")
+    assert "changed" not in second.warnings
+    assert "changed" not in validator.validate_many(["SELECT * FROM users;"])[0].warnings
+
+
+def test_cache_is_bounded() -> None:
+    validator = SQLValidator(cache_size=2)
+    validator.validate_many([f"SELECT {i} FROM users;" for i in range(5)])
+    assert len(validator._cache) == 2
+
+
+def test_concepts_must_match_statements() -> None:
+    with pytest.raises(ValueError):
+        SQLValidator().validate_many(["SELECT 1;", "SELECT 2;"], expected_concept=["joins"])
+
+
+def test_exception_is_reported_per_statement(monkeypatch) -> None:
+    original = SQLValidator.validate
+
+    def flaky(self, sql, expected_concept=None, schema=None):
+        if "boom" in sql:
+            raise RuntimeError("boom")
+        return original(self, sql, expected_concept, schema)
+
+    monkeypatch.setattr(SQLValidator, "validate", flaky)
+    ok, failed = SQLValidator().validate_many(["SELECT * FROM users;", "SELECT boom FROM users;"])
+    assert ok.is_valid
+    assert not failed.is_valid
+    assert failed.errors[0].error_type == "internal"
+
+
+def test_worker_processes_give_same_results(monkeypatch) -> None:
+    monkeypatch.setattr(sql_validator, "MIN_STATEMENTS_PER_WORKER", 1)
+    statements = [f"SELECT name FROM users WHERE age > {i};" for i in range(6)] + STATEMENTS
+    expected = [r.to_dict() for r in SQLValidator().validate_many(statements)]
+    assert [r.to_dict() for r in SQLValidator().validate_many(statements, workers=2)] == expected
+
+
+def test_pipeline_validates_examples_as_one_batch(tmp_path: Path, monkeypatch) -> None:
+    pdf_path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "SELECT name FROM users;")
+    doc.save(str(pdf_path))
+    doc.close()
+    pipeline = InstructionalPipeline(PipelineConfig(pdf_path=pdf_path, output_dir=tmp_path / "out"))
+
+    batches: list[list[str]] = []
+    original = SQLValidator.validate_many
+
+    def recording(self, sqls, *args, **kwargs):
+        batches.append(list(sqls))
+        return original(self, sqls, *args, **kwargs)
+
+    monkeypatch.setattr(SQLValidator, "validate_many", recording)
+    units = [
+        SimpleNamespace(unit_id="u1", concept_id="select-basic", content={"examples": [
+            {"sql": "SELECT * FROM users;"}, {"sql": "SELECT nope FROM users;"},
+        ]}),
+        SimpleNamespace(unit_id="u2", concept_id="select-basic", content={"examples": []}),
+        SimpleNamespace(unit_id="u3", concept_id="select-basic", content={"examples": [
+            {"sql": "SELECT * FROM users;"},
+        ]}),
+    ]
+    results = pipeline._validate_sql_examples(units)
+
+    assert batches == [["SELECT * FROM users;", "SELECT nope FROM users;", "SELECT * FROM users;"]]
+    assert results["validated_units"] == 2
+    assert results["valid_units"] == 2
+    assert results["invalid_units"] == 1
+    assert list(results["details"]) == ["u1", "u3"]
+    assert results["details"]["u1"][1]["errors"]
@@ -0,0 +1,156 @@
+"""Tests for streaming index builds (build_index(..., streaming=True))."""
+
+from __future__ import annotations
+
+import filecmp
+import io
+import json
+import re
+from pathlib import Path
+
+import fitz
+import pytest
+
+from algl_pdf_helper import optimized_indexer
+from algl_pdf_helper.binary_index import BINARY_INDEX_DIRNAME
+from algl_pdf_helper.chunk_store import ChunkRunStore
+from algl_pdf_helper.indexer import build_index
+from algl_pdf_helper.models import IndexBuildOptions, PdfIndexChunk
+from algl_pdf_helper.optimized_indexer import (
+    StreamingJsonArray,
+    fast_json_dumps,
+    open_json_object_array,
+    streaming_json_write,
+)
+
+OPTS = IndexBuildOptions(chunkWords=40, overlapWords=10, embeddingDim=24)
+
+
+def _write_pdf(path: Path, topic: str, pages: int) -> None:
+    doc = fitz.open()
+    for i in range(1, pages + 1):
+        page = doc.new_page()
+        y = 72
+        for line in range(20):
+            page.insert_text(
+                (72, y),
+                f"{topic} note {i}.{line}: the query returns {line * i} rows.",
+                fontsize=11,
+            )
+            y += 18
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def pdf_dir(tmp_path: Path) -> Path:
+    src = tmp_path / "pdfs"
+    src.mkdir()
+    _write_pdf(src / "b-joins.pdf", "JOIN", pages=5)
+    _write_pdf(src / "a-groups.pdf", "GROUP", pages=3)
+    return src
+
+
+def _index_files(out: Path) -> list[str]:
+    names = ["chunks.json", "index.json"]
+    bin_dir = out / BINARY_INDEX_DIRNAME
+    if bin_dir.exists():
+        names += [f"{BINARY_INDEX_DIRNAME}/{p.name}" for p in sorted(bin_dir.iterdir())]
+    return [n for n in names if (out / n).exists()]
+
+
+def _same_files(a: Path, b: Path) -> None:
+    files = _index_files(a)
+    assert files == _index_files(b)
+    for name in files:
+        left, right = ((d / name).read_text(encoding="utf-8", errors="replace") for d in (a, b))
+        if name in ("index.json", f"{BINARY_INDEX_DIRNAME}/header.json"):
+            # createdAt differs between builds
+            left, right = (re.sub(r'"createdAt": "[^"]*"', "", t) for t in (left, right))
+            assert left == right, name
+        else:
+            assert filecmp.cmp(a / name, b / name, shallow=False), name
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_streaming_build_matches_in_memory(pdf_dir: Path, tmp_path: Path, workers: int) -> None:
+    kwargs = dict(options=OPTS, extract_assets=False, use_aliases=True, index_format="both")
+    regular = build_index(pdf_dir, tmp_path / "regular", **kwargs)
+    streamed = build_index(
+        pdf_dir, tmp_path / "streamed", workers=workers, shard_pages=2, streaming=True, **kwargs
+    )
+
+    assert streamed.indexId == regular.indexId
+    assert streamed.chunkCount == regular.chunkCount > 0
+    assert streamed.chunks == []
+    _same_files(tmp_path / "regular", tmp_path / "streamed")
+    assert not list((tmp_path / "streamed").glob(".chunk-runs-*"))
+
+
+def test_streaming_incremental_rebuild(pdf_dir: Path, tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    build_index(pdf_dir, out, options=OPTS, extract_assets=False, streaming=True)
+    _write_pdf(pdf_dir / "b-joins.pdf", "JOIN", pages=6)
+
+    rebuilt = build_index(
+        pdf_dir, out, options=OPTS, extract_assets=False, streaming=True, incremental=True
+    )
+    clean = build_index(pdf_dir, tmp_path / "clean", options=OPTS, extract_assets=False)
+    assert rebuilt.indexId == clean.indexId
+    assert (out / "chunks.json").read_bytes() == (tmp_path / "clean" / "chunks.json").read_bytes()
+
+
+def test_run_store_merges_in_index_order(tmp_path: Path) -> None:
+    def chunk(doc: str, page: int, n: int) -> PdfIndexChunk:
+        return PdfIndexChunk(
+            chunkId=f"{doc}:p{page}:c{n}", docId=doc, page=page, text="x\ty", embedding=[0.5]
+        )
+
+    batches = [
+        [chunk("b", 2, 0), chunk("b", 1, 10), chunk("b", 1, 2)],
+        [chunk("a", 3, 0), chunk("b", 1, 1)],
+        [],
+        [chunk("a", 1, 0)],
+    ]
+    expected = sorted(
+        (c for batch in batches for c in batch), key=lambda c: (c.docId, c.page, c.chunkId)
+    )
+    with ChunkRunStore(tmp_path) as store:
+        for batch in batches:
+            store.extend(batch)
+        assert len(store) == len(expected)
+        assert store.doc_ids == ["a", "b"]
+        assert list(store.iter_chunks()) == expected
+        assert list(store.iter_chunks("b")) == [c for c in expected if c.docId == "b"]
+        run_dir = store.run_dir
+    assert not run_dir.exists()
+
+
+@pytest.mark.parametrize("orjson", [True, False])
+@pytest.mark.parametrize("indent", [True, False])
+def test_streaming_json_matches_fast_json_dumps(monkeypatch, orjson: bool, indent: bool) -> None:
+    if orjson and not optimized_indexer.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(optimized_indexer, "HAS_ORJSON", orjson)
+    header = {"indexId": "x", "sourceDocs": [{"docId": "d", "pageCount": 2}], "empty": []}
+    for items in ([{"a": 1, "b": [0.1, "é\n"], "c": {}}, {"d": []}], []):
+        out = io.StringIO()
+        array = StreamingJsonArray(out, indent=indent)
+        for item in items:
+            array.write(item)
+        array.close()
+        assert out.getvalue() == fast_json_dumps(items, indent=indent)
+
+        out = io.StringIO()
+        array = open_json_object_array(out, header, "chunks", indent=indent)
+        for item in items:
+            array.write(item)
+        array.close()
+        assert out.getvalue() == fast_json_dumps({**header, "chunks": items}, indent=indent)
+
+
+def test_streaming_json_write_accepts_generators(tmp_path: Path) -> None:
+    path = tmp_path / "chunks.json"
+    count = streaming_json_write(({"i": i} for i in range(5)), path, batch_size=2, indent=True)
+    assert count == 5
+    assert json.loads(path.read_text(encoding="utf-8")) == [{"i": i} for i in range(5)]
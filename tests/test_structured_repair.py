@@ -19,6 +19,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from algl_pdf_helper.llm_transport import LLMTransport
 from algl_pdf_helper.structured_repair import (
     TolerantJsonParser,
     RepairOutcome,
@@ -337,22 +338,20 @@ class TestFailureLogger:
 class TestBackendAvailability:
     """Test backend availability checking."""
 
-    @patch("urllib.request.urlopen")
-    def test_ollama_available_when_server_responds(self, mock_urlopen):
+    @patch.object(LLMTransport, "_send")
+    def test_ollama_available_when_server_responds(self, mock_send):
         """Ollama backend available when server responds to /api/tags."""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        mock_send.return_value = (200, "OK", b'{"models": []}')
 
         backend = OllamaRepairBackend()
         backend._available = None  # Reset cached value
 
         assert backend.is_available() is True
 
-    @patch("urllib.request.urlopen")
-    def test_ollama_not_available_when_server_fails(self, mock_urlopen):
+    @patch.object(LLMTransport, "_send")
+    def test_ollama_not_available_when_server_fails(self, mock_send):
         """Ollama backend not available when server doesn't respond."""
-        mock_urlopen.side_effect = Exception("Connection refused")
+        mock_send.side_effect = Exception("Connection refused")
 
         backend = OllamaRepairBackend()
         backend._available = None  # Reset cached value
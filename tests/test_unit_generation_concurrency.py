@@ -0,0 +1,137 @@
+"""Tests for concurrent unit generation (PipelineConfig.llm_concurrency)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import fitz
+import pytest
+
+from algl_pdf_helper.instructional_pipeline import (
+    InstructionalPipeline,
+    PipelineConfig,
+    PipelineProgressTracker,
+    PipelineStage,
+)
+from algl_pdf_helper.section_extractor import BlockType, ContentBlock
+from algl_pdf_helper.unit_generator import VARIANT_GENERATORS, UnitGenerator
+
+CONCEPTS = ["select-basic", "where-clause", "inner-join", "group-by", "order-by", "null-handling"]
+LLM_DELAY = 0.02
+
+
+@pytest.fixture
+def pdf_path(tmp_path: Path) -> Path:
+    path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "SELECT name FROM users;")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def concept_blocks() -> dict[str, list[ContentBlock]]:
+    result = {}
+    for n, concept_id in enumerate(CONCEPTS):
+        text = (
+            f"The {concept_id.replace('-', ' ')} concept filters rows. "
+            f"Example: SELECT name FROM users WHERE id = {n};"
+        )
+        result[concept_id] = [
+            ContentBlock(
+                block_id=f"doc:p{n + 1}:b0",
+                block_type=BlockType.EXPLANATORY_PROSE,
+                page_number=n + 1,
+                char_start=0,
+                char_end=len(text),
+                text_content=text,
+            )
+        ]
+    result["empty-concept"] = []
+    return result
+
+
+@pytest.fixture
+def slow_generator(monkeypatch) -> list[str]:
+    """Make every variant generator wait like an LLM round trip; record threads."""
+    threads: list[str] = []
+    for _, method_name, _ in VARIANT_GENERATORS:
+        original = getattr(UnitGenerator, method_name)
+
+        def slow(self, *args, _original=original, **kwargs):
+            threads.append(threading.current_thread().name)
+            time.sleep(LLM_DELAY)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(UnitGenerator, method_name, slow)
+    return threads
+
+
+def _run(pdf_path: Path, tmp_path: Path, blocks, concurrency: int):
+    config = PipelineConfig(
+        pdf_path=pdf_path,
+        output_dir=tmp_path / f"out-{concurrency}",
+        llm_provider="grounded",
+        use_ollama_repair=False,
+        llm_concurrency=concurrency,
+    )
+    pipeline = InstructionalPipeline(config)
+    start = time.perf_counter()
+    units = pipeline._generate_units(blocks)
+    return pipeline, units, time.perf_counter() - start
+
+
+def _signature(units) -> list[tuple]:
+    return [(u.concept_id, u.target_stage, u.unit_type, u.content) for u in units]
+
+
+def test_concurrent_generation_preserves_order(
+    pdf_path: Path, tmp_path: Path, concept_blocks, slow_generator: list[str]
+) -> None:
+    _, serial, serial_seconds = _run(pdf_path, tmp_path, concept_blocks, 1)
+    assert len(set(slow_generator)) == 1
+    slow_generator.clear()
+
+    pipeline, parallel, parallel_seconds = _run(pdf_path, tmp_path, concept_blocks, 4)
+
+    assert len(serial) == len(CONCEPTS) * len(VARIANT_GENERATORS)
+    assert _signature(parallel) == _signature(serial)
+    assert [u.concept_id for u in parallel[:: len(VARIANT_GENERATORS)]] == CONCEPTS
+    assert all(name.startswith("unit-variant") for name in slow_generator)
+    assert parallel_seconds < serial_seconds
+
+    timings = pipeline.progress.get_substage_durations()
+    for stage, _, _ in VARIANT_GENERATORS:
+        assert timings[f"UNIT_GENERATION.variant.{stage}"] >= LLM_DELAY * len(CONCEPTS)
+    assert "UNIT_GENERATION.concepts" in timings
+    assert "UNIT_GENERATION.curated_l3" in timings
+
+
+def test_generation_failures_fall_back_in_place(
+    monkeypatch, pdf_path: Path, tmp_path: Path, concept_blocks
+) -> None:
+    def fail(self, concept_id, *args, **kwargs):
+        raise RuntimeError(f"timeout for {concept_id}")
+
+    monkeypatch.setattr(UnitGenerator, "generate_L4_reflective_note", fail)
+    _, units, _ = _run(pdf_path, tmp_path, concept_blocks, 3)
+
+    l4 = [u for u in units if u.target_stage == "L4_reflective_note"]
+    assert [u.concept_id for u in l4] == CONCEPTS
+    assert all(u.content["_metadata"]["is_fallback"] for u in l4)
+
+
+def test_llm_concurrency_must_be_positive(pdf_path: Path) -> None:
+    with pytest.raises(ValueError):
+        PipelineConfig(pdf_path=pdf_path, llm_concurrency=0)
+
+
+def test_substage_timings_accumulate() -> None:
+    tracker = PipelineProgressTracker()
+    tracker.record_substage(PipelineStage.UNIT_GENERATION, "variant.L1_hint", 1.5)
+    tracker.record_substage(PipelineStage.UNIT_GENERATION, "variant.L1_hint", 0.5)
+    assert tracker.get_substage_durations() == {"UNIT_GENERATION.variant.L1_hint": 2.0}
+    assert "UNIT_GENERATION.variant.L1_hint: 2.00s" in tracker.get_progress_report()